@@ -0,0 +1 @@
+"""asv benchmarks of icclim, see ``icclim.bench``."""
@@ -0,0 +1,100 @@
+"""asv entry points of the ``icclim.bench`` cases.
+
+Each case is timed (``time_*``) and its peak memory measured (``peakmem_*``)
+for the numpy and dask backends and the standard and noleap calendars. The
+size of the synthetic data is taken from ``ICCLIM_BENCH_SIZE`` (default
+"small"), see ``icclim.bench.synthetic.BENCH_SIZES``.
+
+Run them with ``asv run`` from the repository root, or without asv with
+``python -m icclim.bench run``.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+
+from icclim.bench.cases import BenchInputs, get_cases
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+
+_SIZE = os.environ.get("ICCLIM_BENCH_SIZE", "small")
+
+
+class _CaseBenchmarks:
+    timeout = 600
+    param_names = ("case", "backend", "calendar")
+
+    def setup(self, case: str, backend: str, calendar: str) -> None:
+        (self.case,) = get_cases(pattern=case)
+        config = BenchConfig.from_size(_SIZE, backend=backend, calendar=calendar)
+        self.resources = ExitStack()
+        workdir = self.resources.enter_context(
+            tempfile.TemporaryDirectory(prefix="icclim-asv-"),
+        )
+        self.resources.enter_context(self.case.environment())
+        inputs = BenchInputs(
+            config=config,
+            dataset=synthetic_dataset(config, self.case.variables),
+            workdir=Path(workdir),
+        )
+        self.func = self.case.prepare(inputs)
+        # Compile the kernels before timing.
+        self.func()
+
+    def teardown(self, *_: str) -> None:
+        self.resources.close()
+
+    def time_case(self, *_: str) -> None:
+        self.func()
+
+    def peakmem_case(self, *_: str) -> None:
+        self.func()
+
+
+def _params(group: str) -> tuple[list[str], list[str], list[str]]:
+    names = [case.name for case in get_cases(groups=(group,))]
+    return names, ["numpy", "dask"], ["standard", "noleap"]
+
+
+class ECADIndices(_CaseBenchmarks):
+    """Every ECA&D index."""
+
+    params = _params("ecad")
+
+
+class GenericIndicators(_CaseBenchmarks):
+    """Every generic indicator."""
+
+    params = _params("generic")
+
+
+class BootstrapPaths(_CaseBenchmarks):
+    """Each bootstrap execution kind of day of year percentiles."""
+
+    params = _params("bootstrap")
+
+
+class AllIndices(_CaseBenchmarks):
+    """``icclim.indices("all")`` on every synthetic variable."""
+
+    params = _params("indices")
+
+
+class GraphOptimization(_CaseBenchmarks):
+    """Dask graphs computed with and without the graph optimization pass."""
+
+    params = (_params("graph")[0], ["dask"], ["standard"])
+
+
+class InputOutput(_CaseBenchmarks):
+    """Reading inputs from and writing outputs to files."""
+
+    params = _params("io")
+
+
+class MetadataTemplating(_CaseBenchmarks):
+    """Lazy ``index()`` calls with and without the compiled template cache."""
+
+    params = (_params("metadata")[0], ["dask"], ["standard"])
@@ -8,38 +8,56 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 from icclim import dcsc, ecad, generic
+from icclim._core.warmup import configure_numba_cache
 from icclim._generated._ecad import *  # noqa: F403
 from icclim._generated._generic import *  # noqa: F403
 
+# Before the kernels are compiled, so that they are cached in
+# ICCLIM_NUMBA_CACHE_DIR when it is set.
+configure_numba_cache()
+
 __all__ = [
+    # -- Execution plan of index computations
+    "ExecutionPlan",  # noqa: F405
+    # -- Profiling of index computations
+    "Profile",  # noqa: F405
+    # -- Progress reporting of index computations
+    "ProgressEvent",  # noqa: F405
     # -- Threshold factory function
     "build_threshold",  # noqa: F405
     # -- Base functions
     "dcsc",
     "ecad",
+    "explain",  # noqa: F405
     "generic",
     "index",  # noqa: F405
     "indice",  # noqa: F405 (deprecated)
     "indices",  # noqa: F405
+    # -- Compilation of the kernels
+    "warmup",  # noqa: F405
 ]
 
 __version__ = "7.1.7"
 
 
+# Public names imported on first access, to keep ``import icclim`` light.
+_LAZY_ATTRIBUTES = {
+    "ExecutionPlan": "icclim._core.explain",
+    "Profile": "icclim._core.profiling",
+    "ProgressEvent": "icclim._core.progress",
+    "build_threshold": "icclim.threshold.factory",
+    "explain": "icclim.main",
+    "index": "icclim.main",
+    "indice": "icclim.main",
+    "indices": "icclim.main",
+    "warmup": "icclim._core.warmup",
+}
+
+
 def __getattr__(name: str) -> Callable:
-    if name in ["index", "indice", "indices"]:
-        from icclim.main import index as index_mod  # noqa: PLC0415
-        from icclim.main import indice as indice_mod  # noqa: PLC0415
-        from icclim.main import indices as indices_mod  # noqa: PLC0415
-
-        if name == "index":
-            return index_mod
-        if name == "indice":
-            return indice_mod
-        return indices_mod
-    if name == "build_threshold":
-        from icclim.threshold.factory import build_threshold  # noqa: PLC0415
-
-        return build_threshold
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module  # noqa: PLC0415
+
+        return getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
     msg = f"module {__name__} has no attribute {name}"
     raise AttributeError(msg)
@@ -0,0 +1,101 @@
+"""Command line interface of icclim: ``python -m icclim``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the icclim command line, return its exit code."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    return args.command(args)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m icclim",
+        description="Compute climate indices.",
+    )
+    commands = parser.add_subparsers(required=True)
+    warmup_parser = commands.add_parser(
+        "warmup",
+        help="Compile the kernels of icclim into the numba cache.",
+        description=(
+            "Compile the kernels of icclim for every signature icclim calls"
+            " them with, so that jobs load them from the numba cache instead"
+            " of compiling them."
+        ),
+    )
+    warmup_parser.add_argument(
+        "--cache-dir",
+        help="Cache directory to fill (default: ICCLIM_NUMBA_CACHE_DIR, or else"
+        " numba's default directory). Jobs load the kernels from it when"
+        " ICCLIM_NUMBA_CACHE_DIR is set to it.",
+    )
+    warmup_parser.set_defaults(command=_warmup)
+    batch_parser = commands.add_parser(
+        "batch",
+        help="Compute the jobs of a job file over a pool of processes.",
+        description=(
+            "Compute the jobs of a YAML or JSON job file, grouping the jobs"
+            " reading the same inputs and skipping those whose output is up"
+            " to date. See icclim._core.batch for the job file format."
+        ),
+    )
+    batch_parser.add_argument("job_file", help="The YAML or JSON job file.")
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, the jobs are computed by"
+        " the command itself).",
+    )
+    batch_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Compute the jobs whose output is up to date as well.",
+    )
+    batch_parser.add_argument(
+        "--report",
+        help="Path of the JSON run report, with the timing of each job.",
+    )
+    batch_parser.set_defaults(command=_batch)
+    return parser
+
+
+def _warmup(args: argparse.Namespace) -> int:
+    from icclim._core.warmup import numba_available, warmup  # noqa: PLC0415
+
+    if not numba_available():
+        print("numba is not installed, there is nothing to compile.", file=sys.stderr)  # noqa: T201
+        return 2
+    print(warmup(args.cache_dir).report())  # noqa: T201
+    return 0
+
+
+def _batch(args: argparse.Namespace) -> int:
+    from pathlib import Path  # noqa: PLC0415
+
+    from icclim._core.batch import load_jobs, run_batch  # noqa: PLC0415
+    from icclim.exception import InvalidIcclimArgumentError  # noqa: PLC0415
+
+    try:
+        jobs = load_jobs(args.job_file)
+    except (OSError, InvalidIcclimArgumentError) as e:
+        print(e, file=sys.stderr)  # noqa: T201
+        return 2
+    report = run_batch(jobs, args.workers, force=args.force)
+    if args.report is not None:
+        Path(args.report).write_text(report.to_json())
+    print(report.report())  # noqa: T201
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
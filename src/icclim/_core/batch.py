@@ -0,0 +1,465 @@
+"""Batch runs of the icclim jobs declared in a job file.
+
+``python -m icclim batch jobs.yaml`` computes every job of a job file over a
+pool of local processes. A job file holds a list of jobs, either at its top
+level or under a ``jobs`` key along with ``defaults`` shared by every job::
+
+    defaults:
+      base_period_time_range: ["1961-01-01", "1990-12-31"]
+    jobs:
+      - name: cnrm-rcp85
+        in_files: ["tasmax_cnrm_rcp85_*.nc"]
+        indices: [SU, TX90p]
+        slice_modes: [year, JJA]
+        out_file: "out/cnrm_rcp85_{slice_mode}.nc"
+      - in_files: ["tasmax_cnrm_rcp85_*.nc"]
+        indices: [TXx]
+        out_file: out/cnrm_rcp85_txx.nc
+
+Each job lists its inputs (``in_files``, paths or glob patterns), its indices
+(anything ``icclim.indices`` accepts as ``index_group``), its output
+(``out_file``) and, optionally, several ``slice_modes``: the job is then run
+once per slice mode, and ``{slice_mode}`` in ``out_file`` is replaced by the
+slice mode. Every other key, such as ``slice_mode``, ``time_range`` or
+``base_period_time_range``, is an ``icclim.index`` parameter. Relative paths
+are relative to the job file. The job file is read as JSON when its suffix is
+".json", as YAML otherwise, which requires PyYAML.
+
+Jobs reading the same inputs with the same parameters are grouped: their
+indices are computed by a single ``icclim.indices`` call, which reads the
+inputs once and shares the threshold computations of the group, and each job
+writes its own indices to its output. The groups are scheduled over the
+process pool; each worker process imports icclim and loads the compiled
+kernels and templates once, for all the groups it runs. Set
+``ICCLIM_NUMBA_CACHE_DIR`` to a cache filled by ``python -m icclim warmup``
+for the workers to load the kernels instead of compiling them.
+
+A job is skipped when its output is up to date: the output is newer than
+every input and was written with the same parameters, as recorded by the
+hash of the job in the ``icclim_batch_hash`` attribute of the output.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from icclim.exception import InvalidIcclimArgumentError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+BATCH_HASH_ATTR = "icclim_batch_hash"
+_SLICE_MODE_FIELD = "{slice_mode}"
+JobStatus = Literal["computed", "up_to_date", "failed"]
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """
+    One job of a job file: indices computed from inputs into an output file.
+
+    Parameters
+    ----------
+    name : str
+        The name of the job, in the run report.
+    in_files : tuple[str, ...]
+        The input paths or glob patterns.
+    indices : tuple[str, ...]
+        The short names of the indices of the job.
+    out_file : str
+        The output path.
+    parameters : dict[str, Any]
+        The other ``icclim.index`` parameters of the job.
+    """
+
+    name: str
+    in_files: tuple[str, ...]
+    indices: tuple[str, ...]
+    out_file: str
+    parameters: dict[str, Any] = field(default_factory=dict)
+
+    def group_key(self) -> str:
+        """Return the key shared by the jobs which can be computed together."""
+        return json.dumps(
+            {"in_files": self.in_files, "parameters": self.parameters},
+            sort_keys=True,
+            default=str,
+        )
+
+    def parameter_hash(self) -> str:
+        """Return the hash of everything the output of the job depends on."""
+        from icclim import __version__  # noqa: PLC0415
+
+        description = json.dumps(
+            {
+                "icclim": __version__,
+                "in_files": self.in_files,
+                "indices": self.indices,
+                "parameters": self.parameters,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def input_paths(self) -> list[Path]:
+        """Return the input files matched by ``in_files``."""
+        return [
+            Path(path)
+            for pattern in self.in_files
+            for path in sorted(glob.glob(pattern))  # noqa: PTH207
+        ]
+
+    def is_up_to_date(self) -> bool:
+        """Return whether the output is newer than the inputs and has the same hash."""
+        output = Path(self.out_file)
+        inputs = self.input_paths()
+        if not output.exists() or not inputs:
+            return False
+        if output.stat().st_mtime < max(path.stat().st_mtime for path in inputs):
+            return False
+        import xarray as xr  # noqa: PLC0415
+
+        try:
+            with xr.open_dataset(output, decode_cf=False) as ds:
+                return ds.attrs.get(BATCH_HASH_ATTR) == self.parameter_hash()
+        except (OSError, ValueError):
+            return False
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """
+    The outcome of one job of a batch run.
+
+    Parameters
+    ----------
+    name : str
+        The name of the job.
+    out_file : str
+        The output path.
+    status : "computed" | "up_to_date" | "failed"
+        Whether the output was written, skipped as up to date, or failed.
+    group : int | None
+        The group of jobs the job was computed with, None when skipped.
+    group_time : float
+        The wall time, in seconds, of the ``indices()`` computation of the
+        group, shared by its jobs.
+    write_time : float
+        The wall time, in seconds, of writing the output of the job.
+    error : str | None
+        The error of a failed job.
+    """
+
+    name: str
+    out_file: str
+    status: JobStatus
+    group: int | None = None
+    group_time: float = 0.0
+    write_time: float = 0.0
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    """
+    The report of a batch run.
+
+    Parameters
+    ----------
+    jobs : list[JobResult]
+        The outcome of each job, in the order of the job file.
+    wall_time : float
+        The wall time of the run, in seconds.
+    workers : int
+        The number of worker processes.
+    """
+
+    jobs: list[JobResult]
+    wall_time: float
+    workers: int
+
+    @property
+    def failed(self) -> list[JobResult]:
+        """The jobs which failed."""
+        return [job for job in self.jobs if job.status == "failed"]
+
+    def to_json(self) -> str:
+        """Export the report as JSON."""
+        return json.dumps(asdict(self), indent=2)
+
+    def report(self) -> str:
+        """Describe the run as human readable text."""
+        counts = {
+            status: sum(job.status == status for job in self.jobs)
+            for status in ("computed", "up_to_date", "failed")
+        }
+        lines = [
+            (
+                f"{len(self.jobs)} jobs in {self.wall_time:.1f}s on"
+                f" {self.workers} workers: {counts['computed']} computed,"
+                f" {counts['up_to_date']} up to date, {counts['failed']} failed."
+            ),
+        ]
+        for job in self.jobs:
+            line = f"  {job.name}: {job.status}"
+            if job.status != "up_to_date":
+                line += (
+                    f" (group {job.group}, {job.group_time:.2f}s computing,"
+                    f" {job.write_time:.2f}s writing)"
+                )
+            if job.error is not None:
+                line += f" {job.error}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def load_jobs(path: str | os.PathLike) -> list[BatchJob]:
+    """
+    Read the jobs of a job file.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        The job file, JSON when its suffix is ".json", YAML otherwise.
+
+    Returns
+    -------
+    list[BatchJob]
+        The jobs, one per slice mode of the jobs listing several.
+    """
+    path = Path(path)
+    content = _read_job_file(path)
+    defaults: dict[str, Any] = {}
+    if isinstance(content, dict):
+        defaults = content.get("defaults") or {}
+        content = content.get("jobs")
+    if not isinstance(content, list) or not all(
+        isinstance(job, dict) for job in content
+    ):
+        msg = f"The job file {path} must hold a list of jobs."
+        raise InvalidIcclimArgumentError(msg)
+    jobs = [
+        job
+        for position, entry in enumerate(content)
+        for job in _build_jobs({**defaults, **entry}, position, path.parent)
+    ]
+    out_files = [job.out_file for job in jobs]
+    duplicates = sorted({out for out in out_files if out_files.count(out) > 1})
+    if duplicates:
+        msg = f"Several jobs write to {', '.join(duplicates)}."
+        raise InvalidIcclimArgumentError(msg)
+    return jobs
+
+
+def run_batch(
+    jobs: Sequence[BatchJob],
+    workers: int = 1,
+    *,
+    force: bool = False,
+) -> BatchReport:
+    """
+    Compute the jobs, grouping those which share their inputs.
+
+    Parameters
+    ----------
+    jobs : Sequence[BatchJob]
+        The jobs, see ``load_jobs``.
+    workers : int
+        The number of worker processes. With 1, the jobs are computed by the
+        calling process.
+    force : bool
+        Whether to compute the jobs whose output is up to date.
+
+    Returns
+    -------
+    BatchReport
+        The outcome and timings of each job.
+    """
+    start = time.perf_counter()
+    results: dict[str, JobResult] = {}
+    groups: dict[str, list[BatchJob]] = {}
+    for job in jobs:
+        if not force and job.is_up_to_date():
+            results[job.out_file] = JobResult(job.name, job.out_file, "up_to_date")
+        else:
+            groups.setdefault(job.group_key(), []).append(job)
+    workers = max(1, min(workers, len(groups)))
+    if workers == 1:
+        group_results = [
+            _run_group(group_jobs, group)
+            for group, group_jobs in enumerate(groups.values())
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            # Forking a process running dask threads may deadlock.
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(workers,),
+        ) as pool:
+            group_results = list(
+                pool.map(_run_group, groups.values(), range(len(groups))),
+            )
+    for group_result in group_results:
+        results.update((result.out_file, result) for result in group_result)
+    return BatchReport(
+        jobs=[results[job.out_file] for job in jobs],
+        wall_time=time.perf_counter() - start,
+        workers=workers,
+    )
+
+
+def _read_job_file(path: Path) -> Any:  # noqa: ANN401
+    text = path.read_text()
+    if path.suffix == ".json":
+        return json.loads(text)
+    try:
+        import yaml  # noqa: PLC0415
+    except ImportError as e:
+        msg = (
+            f"Reading the job file {path} requires PyYAML. Install it, or write"
+            " the jobs as JSON in a .json file."
+        )
+        raise InvalidIcclimArgumentError(msg) from e
+    return yaml.safe_load(text)
+
+
+def _build_jobs(entry: dict[str, Any], position: int, root: Path) -> list[BatchJob]:
+    from icclim.main import _get_ecad_indices_of_group  # noqa: PLC0415
+
+    parameters = dict(entry)
+    name = str(parameters.pop("name", f"job{position}"))
+    missing = [
+        key
+        for key in ("in_files", "indices", "out_file")
+        if parameters.get(key) is None
+    ]
+    if missing:
+        msg = f"The job {name} has no {', '.join(missing)}."
+        raise InvalidIcclimArgumentError(msg)
+    in_files = parameters.pop("in_files")
+    in_files = [in_files] if isinstance(in_files, str) else in_files
+    in_files = tuple(_resolve(root, in_file) for in_file in in_files)
+    indices = tuple(
+        index.short_name
+        for index in _get_ecad_indices_of_group(parameters.pop("indices"))
+    )
+    out_file = _resolve(root, parameters.pop("out_file"))
+    slice_modes = parameters.pop("slice_modes", None)
+    if slice_modes is None:
+        return [BatchJob(name, in_files, indices, out_file, parameters)]
+    if len(slice_modes) > 1 and _SLICE_MODE_FIELD not in out_file:
+        msg = (
+            f"The job {name} has several slice_modes, its out_file must contain"
+            f" {_SLICE_MODE_FIELD}."
+        )
+        raise InvalidIcclimArgumentError(msg)
+    return [
+        BatchJob(
+            name=f"{name}[{_slice_mode_label(slice_mode)}]",
+            in_files=in_files,
+            indices=indices,
+            out_file=out_file.replace(
+                _SLICE_MODE_FIELD,
+                _slice_mode_label(slice_mode),
+            ),
+            parameters={**parameters, "slice_mode": slice_mode},
+        )
+        for slice_mode in slice_modes
+    ]
+
+
+def _resolve(root: Path, path: str) -> str:
+    if "://" in path:
+        return path
+    return str(root / Path(path).expanduser())
+
+
+def _slice_mode_label(slice_mode: str | list) -> str:
+    # e.g. ["season", [12, 1, 2]] -> "season_12-1-2"
+    if isinstance(slice_mode, str):
+        return slice_mode
+    return "_".join(
+        "-".join(map(str, part)) if isinstance(part, list) else str(part)
+        for part in slice_mode
+    )
+
+
+def _init_worker(workers: int) -> None:
+    import dask  # noqa: PLC0415
+
+    # The workers share the cores of the machine.
+    dask.config.set(num_workers=max(1, (os.cpu_count() or 1) // workers))
+
+
+def _run_group(jobs: list[BatchJob], group: int) -> list[JobResult]:
+    import icclim  # noqa: PLC0415
+    from icclim._core.model.netcdf_version import (  # noqa: PLC0415
+        NetcdfVersionRegistry,
+    )
+    from icclim.main import _write_output_file  # noqa: PLC0415
+
+    start = time.perf_counter()
+    first = jobs[0]
+    # Glob patterns are expanded here, remote inputs are given as they are.
+    in_files = [str(path) for path in first.input_paths()] or list(first.in_files)
+    try:
+        ds = icclim.indices(
+            index_group=list(dict.fromkeys(i for job in jobs for i in job.indices)),
+            in_files=in_files[0] if len(in_files) == 1 else in_files,
+            **{"logs_verbosity": "SILENT", **first.parameters},
+        ).compute()
+    except Exception as e:  # noqa: BLE001
+        group_time = time.perf_counter() - start
+        return [
+            JobResult(
+                job.name, job.out_file, "failed", group, group_time, error=repr(e)
+            )
+            for job in jobs
+        ]
+    group_time = time.perf_counter() - start
+    netcdf_version = NetcdfVersionRegistry.lookup(
+        first.parameters.get("netcdf_version", "NETCDF4"),
+    )
+    results = []
+    for job in jobs:
+        write_start = time.perf_counter()
+        try:
+            result = ds.drop_vars(
+                [name for name in ds.data_vars if name not in job.indices],
+            )
+            result.attrs[BATCH_HASH_ATTR] = job.parameter_hash()
+            Path(job.out_file).parent.mkdir(parents=True, exist_ok=True)
+            _write_output_file(
+                result_ds=result,
+                input_time_encoding=ds.time.encoding,
+                netcdf_version=netcdf_version,
+                file_path=job.out_file,
+            )
+        except Exception as e:  # noqa: BLE001
+            status: JobStatus = "failed"
+            error: str | None = repr(e)
+        else:
+            status, error = "computed", None
+        results.append(
+            JobResult(
+                job.name,
+                job.out_file,
+                status,
+                group,
+                group_time,
+                time.perf_counter() - write_start,
+                error,
+            ),
+        )
+    return results
@@ -8,7 +8,7 @@ A climate index may require one or more climate variables to be computed.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -23,6 +23,8 @@ from icclim._core.input_parsing import (
     guess_standard_variable,
     read_dataset,
 )
+from icclim._core.profiling import profile_count, profile_phase
+from icclim._core.resample_plan import ResamplePlan
 from icclim.exception import InvalidIcclimArgumentError
 from icclim.frequency import Frequency, FrequencyRegistry
 from icclim.threshold.factory import build_threshold
@@ -74,6 +76,38 @@ class ClimateVariable:
     reference_period: Sequence[datetime | str] | None = None
     is_reference: bool = False
     bootstrap: bool | None = None
+    _resample_plans: dict[str, ResamplePlan] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def resample_plan(self, freq: Frequency | str) -> ResamplePlan:
+        """
+        Get the resampling plan of ``studied_data`` at ``freq``.
+
+        The plan is built on first use and shared by every step of the index
+        computation. It is rebuilt when ``studied_data`` is replaced.
+
+        Parameters
+        ----------
+        freq : Frequency | str
+            The resampling frequency, or its pandas alias.
+
+        Returns
+        -------
+        ResamplePlan
+            The resampling groups, source frequency and valid counts of
+            ``studied_data``.
+        """
+        if isinstance(freq, Frequency):
+            freq = freq.pandas_freq
+        plan = self._resample_plans.get(freq)
+        if plan is None or plan.data is not self.studied_data:
+            plan = ResamplePlan(self.studied_data, freq)
+            self._resample_plans[freq] = plan
+        return plan
 
     def build_indicator_metadata(
         self,
@@ -289,31 +323,35 @@ def build_climate_var(
     ...     climate_var_name, climate_var_data, ignore_feb29th, time_range, standard_var
     ... )
     """
-    study_ds, climate_var_thresh = _read_study_dataset_and_threshold(
-        climate_var_data,
-        standard_var,
-        climate_var_name,
-    )
+    with profile_phase("open_input"):
+        study_ds, climate_var_thresh = _read_study_dataset_and_threshold(
+            climate_var_data,
+            standard_var,
+            climate_var_name,
+        )
     standard_var = standard_var or guess_standard_variable(study_ds[climate_var_name])
-    studied_data = build_studied_data(
-        study_ds[climate_var_name],
-        time_range,
-        ignore_feb29th,
-        standard_var.default_units if standard_var else None,
-        standard_var=standard_var,
-    )
-    if climate_var_thresh is not None:
-        threshold_prepare_data = _build_threshold_prepare_data(
-            original_data=study_ds[climate_var_name],
-            studied_data=studied_data,
-            ignore_feb29th=ignore_feb29th,
+    with profile_phase("build_studied_data"):
+        studied_data = build_studied_data(
+            study_ds[climate_var_name],
+            time_range,
+            ignore_feb29th,
+            standard_var.default_units if standard_var else None,
             standard_var=standard_var,
         )
-        climate_var_thresh = _prepare_climate_variable_threshold(
-            climate_var_thresh=climate_var_thresh,
-            original_data=threshold_prepare_data,
-            conversion_unit=studied_data.attrs[UNITS_KEY],
-        )
+        profile_count("studied_data_bytes", studied_data.nbytes)
+    if climate_var_thresh is not None:
+        with profile_phase("threshold_prepare"):
+            threshold_prepare_data = _build_threshold_prepare_data(
+                original_data=study_ds[climate_var_name],
+                studied_data=studied_data,
+                ignore_feb29th=ignore_feb29th,
+                standard_var=standard_var,
+            )
+            climate_var_thresh = _prepare_climate_variable_threshold(
+                climate_var_thresh=climate_var_thresh,
+                original_data=threshold_prepare_data,
+                conversion_unit=studied_data.attrs[UNITS_KEY],
+            )
     _set_source_frequency_metadata(studied_data)
     return ClimateVariable(
         name=climate_var_name,
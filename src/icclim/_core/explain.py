@@ -0,0 +1,327 @@
+"""Execution plan of an ``index()`` call, built without computing it.
+
+``icclim.explain`` builds the configuration of an ``index()`` call and
+reports, for each threshold leaf, the bootstrap path icclim will take and the
+reason code of that choice, together with the estimates needed to size a
+batch job: the spatial tiles of the tiled bootstrap, the bytes read from the
+inputs, the peak memory, the number of dask tasks and the caches the call
+will hit.
+
+The peak memory is a coarse upper estimate: the largest of the memory of a
+bootstrap tile, of the whole reference bootstrap, and of the chunks processed
+concurrently by the dask workers, each chunk being counted with a few working
+copies. It does not account for the memory of the dask scheduler itself.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from icclim._core.generic.bootstrap_capability import (
+    BootstrapCapability,
+    BootstrapComputationFamily,
+    BootstrapExecutionKind,
+    classify_generic_indicator_bootstrap,
+    classify_threshold_leaf,
+    iter_threshold_leaves,
+)
+from icclim._core.generic.indicator import GenericIndicator
+from icclim._core.memory import WORKING_COPIES, concurrent_working_set
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from xarray import DataArray, Dataset
+
+    from icclim._core.generic.bootstrap_capability import BootstrapLeafCapability
+    from icclim._core.generic.bootstrap_tiling import BootstrapTileEstimate
+    from icclim._core.model.index_config import IndexConfig
+
+_TILED_KINDS = (
+    BootstrapExecutionKind.OPTIMIZED_BOOTSTRAP,
+    BootstrapExecutionKind.EXACT_TILED_BOOTSTRAP,
+)
+
+
+class _ComputeAttemptedError(RuntimeError):
+    """Raised by the scheduler of ``explain`` when building the graph computes."""
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    How icclim would compute an index, estimated without computing it.
+
+    Parameters
+    ----------
+    index_name : str
+        The name of the output variable.
+    indicator : str
+        The name of the indicator computing it.
+    frequency : str
+        The pandas frequency of the output.
+    backend : str
+        "dask" when an input is a dask array, "numpy" otherwise.
+    execution_paths : dict[str, str]
+        The path chosen at each step, e.g. the bootstrap execution kind and the
+        resampling backend.
+    bootstrap_reason_code : str
+        The reason code of the bootstrap path of the whole computation.
+    leaves : tuple[BootstrapLeafCapability, ...]
+        The bootstrap path and reason code of each threshold leaf.
+    tiles : dict[str, BootstrapTileEstimate]
+        The planned tiles of the tiled bootstrap, per climate variable.
+    bytes_to_read : int
+        The size of the studied data of every climate variable.
+    estimated_peak_memory : int
+        The estimated peak memory of the computation, in bytes.
+    input_tasks : int | None
+        The number of dask tasks of the inputs, None for numpy inputs.
+    graph_tasks : int | None
+        The number of dask tasks of the result graph. None for numpy inputs and
+        when building the graph already computes, as the tiled bootstrap does.
+    cache_hits : dict[str, bool]
+        Whether each cache the computation uses already holds its entry.
+    """
+
+    index_name: str
+    indicator: str
+    frequency: str
+    backend: str
+    execution_paths: dict[str, str]
+    bootstrap_reason_code: str
+    leaves: tuple[BootstrapLeafCapability, ...]
+    tiles: dict[str, BootstrapTileEstimate] = field(default_factory=dict)
+    bytes_to_read: int = 0
+    estimated_peak_memory: int = 0
+    input_tasks: int | None = None
+    graph_tasks: int | None = None
+    cache_hits: dict[str, bool] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the plan as JSON serializable values."""
+        plan = asdict(self)
+        plan["leaves"] = [
+            {
+                **asdict(leaf),
+                "threshold_kind": leaf.threshold_kind.value,
+                "execution_kind": leaf.execution_kind.value,
+            }
+            for leaf in self.leaves
+        ]
+        for name, tile in self.tiles.items():
+            plan["tiles"][name]["tile_peak_bytes"] = tile.tile_peak_bytes
+        return plan
+
+    def report(self) -> str:
+        """Describe the plan as human readable text."""
+        lines = [
+            (
+                f"{self.index_name} ({self.indicator}), frequency {self.frequency},"
+                f" {self.backend} inputs."
+            ),
+            "Execution paths: "
+            + ", ".join(f"{step}={path}" for step, path in self.execution_paths.items())
+            + f" ({self.bootstrap_reason_code}).",
+            "Threshold leaves:",
+        ]
+        lines.extend(
+            f"  {leaf.variable} {leaf.threshold_query or leaf.threshold_kind.value}:"
+            f" {leaf.execution_kind.value} ({leaf.reason_code})"
+            for leaf in self.leaves
+        )
+        for name, tile in self.tiles.items():
+            lines.append(
+                f"Bootstrap tiles of {name}: {tile.tile_count} {tile.kind} tiles"
+                f" of {tile.tile_cells} cells, {_mib(tile.tile_peak_bytes)} each"
+                f" ({tile.memory_model} memory model).",
+            )
+        lines.append(f"Bytes to read: {_mib(self.bytes_to_read)}.")
+        lines.append(f"Estimated peak memory: {_mib(self.estimated_peak_memory)}.")
+        if self.input_tasks is not None:
+            graph = "unknown" if self.graph_tasks is None else self.graph_tasks
+            lines.append(f"Dask tasks: {self.input_tasks} input, {graph} total.")
+        if self.cache_hits:
+            lines.append(
+                "Cache hits: "
+                + ", ".join(
+                    f"{cache}={'hit' if hit else 'miss'}"
+                    for cache, hit in self.cache_hits.items()
+                )
+                + ".",
+            )
+        return "\n".join(lines)
+
+
+def build_execution_plan(
+    config: IndexConfig,
+    build_graph: Callable[[IndexConfig], Dataset],
+) -> ExecutionPlan:
+    """
+    Estimate how ``config`` would be computed.
+
+    Parameters
+    ----------
+    config : IndexConfig
+        The configuration of the ``index()`` call.
+    build_graph : Callable[[IndexConfig], Dataset]
+        Builds the lazy result of ``config``, used to count the dask tasks.
+
+    Returns
+    -------
+    ExecutionPlan
+        The plan of the computation.
+    """
+    from icclim._core.generic.functions import (  # noqa: PLC0415
+        estimate_bootstrap_tiles,
+        estimate_reference_bootstrap_bytes,
+    )
+    from icclim._core.resampling import resample_backend_enabled  # noqa: PLC0415
+
+    climate_vars = config.climate_variables
+    capability = _classify_bootstrap(config)
+    leaves = []
+    tiles: dict[str, BootstrapTileEstimate] = {}
+    reference_bytes = 0
+    for climate_var in climate_vars:
+        if climate_var.threshold is None:
+            continue
+        for threshold in iter_threshold_leaves(climate_var.threshold):
+            leaf = classify_threshold_leaf(climate_var, threshold, capability)
+            leaves.append(leaf)
+            if leaf.execution_kind == BootstrapExecutionKind.REFERENCE_BOOTSTRAP:
+                reference_bytes += estimate_reference_bootstrap_bytes(
+                    climate_var.studied_data,
+                    threshold,
+                    config.frequency,
+                )
+            elif (
+                leaf.execution_kind in _TILED_KINDS
+                and climate_var.name not in tiles
+                and (
+                    tile := estimate_bootstrap_tiles(
+                        climate_var.studied_data,
+                        threshold,
+                        config.frequency,
+                        leaf.execution_kind,
+                    )
+                )
+                is not None
+            ):
+                tiles[climate_var.name] = tile
+    inputs = [climate_var.studied_data for climate_var in climate_vars]
+    is_dask = any(study.chunks is not None for study in inputs)
+    # Before building the graph, which fills the caches.
+    cache_hits = _cache_hits(config, tiles)
+    return ExecutionPlan(
+        index_name=config.rename or config.indicator.name,
+        indicator=config.indicator.name,
+        frequency=config.frequency.pandas_freq,
+        backend="dask" if is_dask else "numpy",
+        execution_paths={
+            "bootstrap": capability.execution_kind.value,
+            "resample": "group_index" if resample_backend_enabled() else "xarray",
+        },
+        bootstrap_reason_code=capability.reason_code,
+        leaves=tuple(leaves),
+        tiles=tiles,
+        bytes_to_read=sum(study.nbytes for study in inputs),
+        estimated_peak_memory=max(
+            reference_bytes,
+            *(tile.tile_peak_bytes for tile in tiles.values()),
+            *(_working_bytes(study) for study in inputs),
+        ),
+        input_tasks=_input_tasks(inputs) if is_dask else None,
+        graph_tasks=(
+            _graph_tasks(config, build_graph)
+            if is_dask and capability.execution_kind not in _TILED_KINDS
+            else None
+        ),
+        cache_hits=cache_hits,
+    )
+
+
+def _classify_bootstrap(config: IndexConfig) -> BootstrapCapability:
+    if not isinstance(config.indicator, GenericIndicator):
+        return BootstrapCapability(
+            family=BootstrapComputationFamily.NOT_APPLICABLE,
+            execution_kind=BootstrapExecutionKind.NOT_REQUIRED,
+            bootstrap_required=False,
+            reason_code="indicator_has_no_bootstrap_family",
+        )
+    return classify_generic_indicator_bootstrap(
+        indicator_name=config.indicator.name,
+        climate_vars=config.climate_variables,
+        resample_frequency=config.frequency,
+        date_event=config.date_event,
+    )
+
+
+def _cache_hits(
+    config: IndexConfig,
+    tiles: dict[str, BootstrapTileEstimate],
+) -> dict[str, bool]:
+    from icclim._core.resampling import has_cached_resample_groups  # noqa: PLC0415
+    from icclim._core.spi import has_cached_spi_monthly  # noqa: PLC0415
+    from icclim.ecad.binding import (  # noqa: PLC0415
+        StandardizedPrecipitationIndex3,
+        StandardizedPrecipitationIndex6,
+    )
+
+    study = config.climate_variables[0].studied_data
+    hits = {}
+    if "time" in study.indexes:
+        hits["resample_groups"] = has_cached_resample_groups(
+            study.indexes["time"],
+            config.frequency.pandas_freq,
+        )
+    if isinstance(
+        config.indicator,
+        (StandardizedPrecipitationIndex3, StandardizedPrecipitationIndex6),
+    ):
+        hits["spi_monthly"] = has_cached_spi_monthly(study)
+    if tiles:
+        hits["bootstrap_memory_model"] = all(
+            tile.memory_model == "learned" for tile in tiles.values()
+        )
+    return hits
+
+
+def _working_bytes(study: DataArray) -> int:
+    if study.chunks is None:
+        return study.nbytes * WORKING_COPIES
+    chunk_bytes = math.prod(max(sizes) for sizes in study.chunks)
+    chunk_count = math.prod(len(sizes) for sizes in study.chunks)
+    return concurrent_working_set(chunk_bytes * study.dtype.itemsize, chunk_count)
+
+
+def _input_tasks(inputs: list[DataArray]) -> int:
+    keys = set()
+    for study in inputs:
+        if study.chunks is not None:
+            keys.update(study.data.__dask_graph__().keys())
+    return len(keys)
+
+
+def _graph_tasks(
+    config: IndexConfig,
+    build_graph: Callable[[IndexConfig], Dataset],
+) -> int | None:
+    import dask  # noqa: PLC0415
+
+    def _refuse(*_args: object, **_kwargs: object) -> None:
+        raise _ComputeAttemptedError
+
+    try:
+        with dask.config.set(scheduler=_refuse):
+            result = build_graph(config)
+    except _ComputeAttemptedError:
+        return None
+    graph = result.__dask_graph__()
+    return 0 if graph is None else len(graph)
+
+
+def _mib(size: int) -> str:
+    return f"{size / 2**20:.1f} MiB"
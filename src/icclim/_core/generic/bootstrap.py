@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -13,15 +14,17 @@ from icclim._core.generic.bootstrap_capability import (
 )
 from icclim._core.generic.bootstrap_primitives import (
     BootstrapPreparedInputs,
-    build_bootstrap_array_inputs,
+    _materialize_bootstrap_study,
+    bootstrap_time_blocks,
     build_bootstrap_output,
     build_bootstrap_prepared_inputs,
-    build_bootstrap_reference_sample,
-    build_bootstrap_temporal_indexing,
+    build_out_of_base_prepared_inputs,
 )
 from icclim._core.model.operator import Operator
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from xarray import DataArray
 
     from icclim._core.generic.threshold.percentile import PercentileThreshold
@@ -34,18 +37,22 @@ def compute_doy_percentile_bootstrap_count(
     study: DataArray,
     threshold: PercentileThreshold,
     freq: str,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Compute percentile bootstrap counts without building a huge dask graph."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_bootstrap_count,
+            study,
+            threshold,
+            freq,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_count_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -87,18 +94,22 @@ def compute_doy_percentile_bootstrap_exceedance_sum(
     study: DataArray,
     threshold: PercentileThreshold,
     freq: str,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Compute bootstrap sums of exceedance-day values with the optimized path."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_bootstrap_exceedance_sum,
+            study,
+            threshold,
+            freq,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_sum_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -141,18 +152,22 @@ def compute_doy_percentile_bootstrap_union_exceedance_count(
     study: DataArray,
     threshold: PercentileThreshold,
     freq: str,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Count union exceedance days for thresholded bootstrap mean reducers."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_bootstrap_union_exceedance_count,
+            study,
+            threshold,
+            freq,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_union_count_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -203,11 +218,11 @@ def compute_doy_percentile_bootstrap_union_exceedance_mask(
     import xarray as xr  # noqa: PLC0415
 
     if prepared_inputs is None:
-        prepared_inputs = build_bootstrap_prepared_inputs(
+        return _compute_by_time_blocks(
+            compute_doy_percentile_bootstrap_union_exceedance_mask,
             study,
             threshold,
             freq,
-            dtype=np.float32,
         )
     reference_sample = prepared_inputs.reference_sample
     temporal_indexing = prepared_inputs.temporal_indexing
@@ -251,18 +266,22 @@ def compute_doy_percentile_bootstrap_exceedance_average(
     study: DataArray,
     threshold: PercentileThreshold,
     freq: str,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Compute bootstrap averages of exceedance-day values with the optimized path."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_bootstrap_exceedance_average,
+            study,
+            threshold,
+            freq,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_average_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -305,18 +324,22 @@ def compute_doy_percentile_bootstrap_fraction_of_total(
     study: DataArray,
     threshold: PercentileThreshold,
     freq: str,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Compute bootstrap fractions of total with the optimized path."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_bootstrap_fraction_of_total,
+            study,
+            threshold,
+            freq,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_fraction_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -362,18 +385,25 @@ def compute_doy_percentile_scalar_bounded_bootstrap_count(
     scalar_bound: float,
     scalar_op_code: int,
     logical_link_code: int,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Compute bounded bootstrap counts for one percentile and one scalar guard."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_scalar_bounded_bootstrap_count,
+            study,
+            threshold,
+            freq,
+            scalar_bound,
+            scalar_op_code,
+            logical_link_code,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_bounded_count_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -421,18 +451,25 @@ def compute_doy_percentile_scalar_bounded_bootstrap_exceedance_sum(
     scalar_bound: float,
     scalar_op_code: int,
     logical_link_code: int,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Compute bounded bootstrap sums for one percentile and one scalar guard."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_scalar_bounded_bootstrap_exceedance_sum,
+            study,
+            threshold,
+            freq,
+            scalar_bound,
+            scalar_op_code,
+            logical_link_code,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_bounded_sum_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -481,18 +518,25 @@ def compute_doy_percentile_scalar_bounded_bootstrap_exceedance_average(
     scalar_bound: float,
     scalar_op_code: int,
     logical_link_code: int,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Compute bounded bootstrap averages for one percentile and one scalar guard."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_scalar_bounded_bootstrap_exceedance_average,
+            study,
+            threshold,
+            freq,
+            scalar_bound,
+            scalar_op_code,
+            logical_link_code,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_bounded_average_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -541,18 +585,25 @@ def compute_doy_percentile_scalar_bounded_bootstrap_fraction_of_total(
     scalar_bound: float,
     scalar_op_code: int,
     logical_link_code: int,
+    *,
+    prepared_inputs: BootstrapPreparedInputs | None = None,
 ) -> DataArray | None:
     """Compute bounded bootstrap fractions for one percentile and one scalar guard."""
     if not _can_compute_optimized_bootstrap(study, threshold, freq):
         return None
-    reference_sample = build_bootstrap_reference_sample(study, threshold)
-    temporal_indexing = build_bootstrap_temporal_indexing(
-        reference_sample.study,
-        reference_sample.reference_sample,
-        freq,
-        doy_window_width=threshold.doy_window_width,
-    )
-    array_inputs = build_bootstrap_array_inputs(reference_sample, dtype=np.float32)
+    if prepared_inputs is None:
+        return _compute_by_time_blocks(
+            compute_doy_percentile_scalar_bounded_bootstrap_fraction_of_total,
+            study,
+            threshold,
+            freq,
+            scalar_bound,
+            scalar_op_code,
+            logical_link_code,
+        )
+    reference_sample = prepared_inputs.reference_sample
+    temporal_indexing = prepared_inputs.temporal_indexing
+    array_inputs = prepared_inputs.array_inputs
     result = _bootstrap_bounded_fraction_kernel(
         array_inputs.flat_reference_raw,
         array_inputs.flat_reference_filtered,
@@ -594,6 +645,128 @@ def compute_doy_percentile_scalar_bounded_bootstrap_fraction_of_total(
     return out.assign_coords(percentiles=threshold.percentile_coord().item())
 
 
+def _compute_by_time_blocks(
+    compute: Callable[..., DataArray | None],
+    study: DataArray,
+    threshold: PercentileThreshold,
+    freq: str,
+    *args: object,
+) -> DataArray | None:
+    """
+    Run the bootstrap ``compute`` on ``study``, by time blocks when possible.
+
+    ``compute`` is one of the public bootstrap functions of this module, called
+    with ``args`` after ``freq`` and the prepared inputs of the whole study or
+    of each time block.
+    """
+
+    def compute_block(
+        block_study: DataArray,
+        prepared_inputs: BootstrapPreparedInputs,
+    ) -> DataArray | None:
+        return compute(
+            block_study,
+            threshold,
+            freq,
+            *args,
+            prepared_inputs=prepared_inputs,
+        )
+
+    time_blocked = _compute_time_blocked_bootstrap(
+        study,
+        threshold,
+        freq,
+        compute_block,
+    )
+    if time_blocked is not None:
+        return time_blocked
+    return compute_block(
+        study,
+        build_bootstrap_prepared_inputs(study, threshold, freq, dtype=np.float32),
+    )
+
+
+def _compute_time_blocked_bootstrap(
+    study: DataArray,
+    threshold: PercentileThreshold,
+    freq: str,
+    compute_block: Callable[..., DataArray | None],
+) -> DataArray | None:
+    """
+    Evaluate in-base and out-of-base study years as separate time blocks.
+
+    Only the in-base years need the replica thresholds of the bootstrap. The
+    out-of-base years are compared to one day-of-year threshold computed once
+    per cell, and are loaded block by block so the working set of a cell is
+    bounded by the reference period length rather than the study length.
+    Returns ``None`` when the study cannot be split.
+    """
+    if not _time_blocked_bootstrap_enabled():
+        return None
+    time_blocks = bootstrap_time_blocks(
+        study,
+        threshold.climatology_bounds(study),
+        freq,
+    )
+    if time_blocks is None:
+        return None
+    import xarray as xr  # noqa: PLC0415
+
+    in_base_block = next(block for block in time_blocks if block.in_base)
+    reference_inputs = build_bootstrap_prepared_inputs(
+        study.isel(time=in_base_block.time_slice),
+        threshold,
+        freq,
+        dtype=np.float32,
+    )
+    reference_sample = reference_inputs.reference_sample
+    reference_thresholds = _bootstrap_reference_thresholds_kernel(
+        reference_inputs.array_inputs.flat_reference_filtered,
+        reference_inputs.temporal_indexing.sample_indices_by_day_of_year,
+        reference_inputs.temporal_indexing.reference_index_year,
+        reference_inputs.temporal_indexing.reference_index_position,
+        reference_inputs.temporal_indexing.substitute_alignment,
+        float(threshold.percentile_coord().item()) / 100.0,
+        float(threshold.interpolation.alpha),
+        float(threshold.interpolation.beta),
+        (
+            np.nan
+            if reference_sample.threshold_floor_in_reference_units is None
+            else float(reference_sample.threshold_floor_in_reference_units)
+        ),
+    )
+    block_results = []
+    for block in time_blocks:
+        if block.in_base:
+            block_results.append(
+                compute_block(reference_sample.study, prepared_inputs=reference_inputs)
+            )
+            continue
+        block_study = _materialize_bootstrap_study(study.isel(time=block.time_slice))
+        block_results.append(
+            compute_block(
+                block_study,
+                prepared_inputs=build_out_of_base_prepared_inputs(
+                    block_study,
+                    reference_inputs,
+                    reference_thresholds,
+                    freq,
+                    doy_window_width=threshold.doy_window_width,
+                ),
+            )
+        )
+    return xr.concat(block_results, dim="time", combine_attrs="override")
+
+
+def _time_blocked_bootstrap_enabled() -> bool:
+    return os.environ.get("ICCLIM_BOOTSTRAP_TIME_BLOCKS", "1").lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
 def _can_compute_optimized_bootstrap(
     study: DataArray,
     threshold: PercentileThreshold,
@@ -1787,6 +1960,40 @@ if njit is not None:
             thresholds[doy_i] = threshold_value
         return thresholds
 
+    @njit(parallel=True, cache=True)
+    def _bootstrap_reference_thresholds_kernel(
+        flat_ref_masked,
+        sample_indices,
+        index_year,
+        index_pos,
+        substitute_aligned,
+        quantile,
+        alpha,
+        beta,
+        min_threshold,
+    ):
+        """Compute the out-of-base day-of-year thresholds of every cell."""
+        n_cells = flat_ref_masked.shape[1]
+        out = np.empty((NON_LEAP_YEAR_DAY_COUNT, n_cells), dtype=np.float64)
+        max_samples = sample_indices.shape[1]
+        for cell in prange(n_cells):
+            out[:, cell] = _build_bootstrap_threshold_series_for_cell(
+                flat_ref_masked,
+                sample_indices,
+                index_year,
+                index_pos,
+                substitute_aligned,
+                -1,
+                -1,
+                cell,
+                max_samples,
+                quantile,
+                alpha,
+                beta,
+                min_threshold,
+            )
+        return out
+
     @njit(cache=True)
     def _quantile_for_doy_cell(
         flat_ref,
@@ -2490,3 +2697,6 @@ else:
 
     def _bootstrap_bounded_fraction_kernel(*args, **kwargs):  # noqa: ARG001
         return None
+
+    def _bootstrap_reference_thresholds_kernel(*args, **kwargs):  # noqa: ARG001
+        return None
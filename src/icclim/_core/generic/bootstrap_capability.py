@@ -121,6 +121,68 @@ class BootstrapCapability:
         return self.execution_kind == BootstrapExecutionKind.REFERENCE_BOOTSTRAP
 
 
+@dataclass(frozen=True)
+class BootstrapLeafCapability:
+    """Describe the bootstrap routing of one threshold leaf of a computation."""
+
+    variable: str
+    threshold_query: str | None
+    threshold_kind: BootstrapThresholdKind
+    execution_kind: BootstrapExecutionKind
+    bootstrap_required: bool
+    reason_code: str
+
+
+def iter_threshold_leaves(
+    threshold_spec: Threshold | None,
+) -> tuple[Threshold | None, ...]:
+    """Return the leaves of a threshold, the bounds of bounded thresholds."""
+    if isinstance(threshold_spec, BoundedThreshold):
+        return (
+            *iter_threshold_leaves(threshold_spec.left_threshold),
+            *iter_threshold_leaves(threshold_spec.right_threshold),
+        )
+    return (threshold_spec,)
+
+
+def classify_threshold_leaf(
+    climate_var: ClimateVariable,
+    leaf: Threshold | None,
+    capability: BootstrapCapability,
+) -> BootstrapLeafCapability:
+    """
+    Break the routing decision of a computation down to one threshold leaf.
+
+    A leaf needing a bootstrap follows ``capability``, the path of the whole
+    computation, while the other leaves give the reason they are not
+    bootstrapped.
+    """
+    threshold_kind = classify_threshold_kind(leaf)
+    reason_code = _count_bootstrap_not_required_reason(threshold_kind)
+    if reason_code is None:
+        if must_run_bootstrap(climate_var.studied_data, leaf, climate_var.bootstrap):
+            return BootstrapLeafCapability(
+                variable=climate_var.name,
+                threshold_query=leaf.initial_query,
+                threshold_kind=threshold_kind,
+                execution_kind=capability.execution_kind,
+                bootstrap_required=True,
+                reason_code=capability.reason_code,
+            )
+        if climate_var.bootstrap is False:
+            reason_code = "bootstrap_disabled_by_user"
+        else:
+            reason_code = "bootstrap_not_needed_for_overlap"
+    return BootstrapLeafCapability(
+        variable=climate_var.name,
+        threshold_query=leaf.initial_query if leaf is not None else None,
+        threshold_kind=threshold_kind,
+        execution_kind=BootstrapExecutionKind.NOT_REQUIRED,
+        bootstrap_required=False,
+        reason_code=reason_code,
+    )
+
+
 def classify_doy_percentile_count_bootstrap(
     climate_var: ClimateVariable,
     resample_frequency: Frequency,
@@ -0,0 +1,261 @@
+"""Distributed execution of tiled percentile bootstrap.
+
+By default the tiled bootstrap paths compute each spatial tile in the driver
+process. When a ``dask.distributed`` client is active, the tiles are instead
+submitted as futures so the numba kernels run on the workers. File-backed
+tiles are shipped as a description of their source files and coordinates, so
+each worker opens and reads its own slice rather than receiving the data from
+the driver.
+
+Set ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` to keep the in-process tile loop
+even when a distributed client is active.
+
+Set ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` to wrap the tile computation in
+``dask.array.map_blocks`` instead. Each spatial chunk of a dask-backed input is
+then computed as one block with its whole time axis, and the bootstrap result
+stays lazy so it can be computed or written together with other outputs.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from icclim._core.generic.bootstrap_primitives import (
+    _file_backed_bootstrap_sources,
+    _open_file_backed_bootstrap_sources,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from distributed import Client, Future
+    from xarray import DataArray
+
+    from icclim._core.generic.threshold.percentile import PercentileThreshold
+
+_TILE_EXECUTOR_ENV = "ICCLIM_BOOTSTRAP_TILE_EXECUTOR"
+
+
+@dataclass(frozen=True)
+class FileBackedTileSource:
+    """
+    Description of a file-backed tile that a worker can open by itself.
+
+    ``template`` is a lazy array holding only the tile coordinates, attributes
+    and encoding, so sending it to a worker does not move any data.
+    """
+
+    source_files: list[str]
+    variable_name: str
+    template: DataArray
+
+    def open(self) -> DataArray:
+        """Open the tile from its source files."""
+        return _open_file_backed_bootstrap_sources(
+            self.source_files,
+            self.variable_name,
+            self.template,
+        )
+
+
+class DistributedTileExecutor:
+    """Submit bootstrap tiles to a ``dask.distributed`` client and gather them."""
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self._futures: list[Future] = []
+
+    def submit(
+        self,
+        tile_fn: Callable[..., DataArray | None],
+        tile_study: DataArray,
+        *tile_args: object,
+    ) -> None:
+        """Schedule ``tile_fn(tile_study, *tile_args)`` on a worker."""
+        self._futures.append(
+            self.client.submit(
+                _run_bootstrap_tile_task,
+                tile_fn,
+                bootstrap_tile_source(tile_study),
+                *tile_args,
+                pure=False,
+            )
+        )
+
+    def gather(self) -> list[DataArray | None]:
+        """Wait for every submitted tile and return the results in order."""
+        futures, self._futures = self._futures, []
+        return self.client.gather(futures)
+
+
+def get_bootstrap_tile_executor() -> DistributedTileExecutor | None:
+    """Return a distributed tile executor when a distributed client is active."""
+    if os.environ.get(_TILE_EXECUTOR_ENV, "auto").lower() in {"local", "lazy"}:
+        return None
+    client = _active_distributed_client()
+    if client is None:
+        return None
+    return DistributedTileExecutor(client)
+
+
+def lazy_bootstrap_tiles_enabled(study: DataArray) -> bool:
+    """Return whether ``study`` should be bootstrapped with ``map_blocks``."""
+    return os.environ.get(_TILE_EXECUTOR_ENV, "auto").lower() == "lazy" and hasattr(
+        study.data, "chunks"
+    )
+
+
+def map_bootstrap_blocks(
+    study: DataArray,
+    threshold: PercentileThreshold,
+    tile_lengths: dict[str, int],
+    slice_threshold: Callable[
+        [PercentileThreshold, dict[str, slice]], PercentileThreshold
+    ],
+    tile_fn: Callable[..., DataArray | None],
+    *tile_args: object,
+) -> DataArray | None:
+    """
+    Build a lazy bootstrap result with one ``map_blocks`` task per spatial chunk.
+
+    The time axis is kept whole in every block and spatial chunks larger than
+    ``tile_lengths`` are split further. A one-cell probe is computed eagerly to
+    learn the output time axis, dtype and attributes, and ``None`` is returned
+    when ``tile_fn`` does not support the input. A block for which ``tile_fn``
+    returns ``None`` raises a ``RuntimeError`` when it is computed, as the
+    lazy result cannot fall back to another bootstrap path.
+    """
+    import dask.array as da  # noqa: PLC0415
+    import xarray as xr  # noqa: PLC0415
+
+    study = study.transpose("time", ...)
+    spatial_dims = list(study.dims[1:])
+    block_cells = np.prod([max(chunks) for chunks in study.chunks[1:]], dtype=int)
+    max_cells = np.prod(list(tile_lengths.values()), dtype=int)
+    study = study.chunk(
+        {"time": -1, **(tile_lengths if block_cells > max_cells else {})}
+    )
+    probe_indexers = {dim: slice(0, 1) for dim in spatial_dims}
+    probe = tile_fn(
+        study.isel(probe_indexers),
+        slice_threshold(threshold, probe_indexers),
+        *tile_args,
+    )
+    if probe is None:
+        return None
+    probe = probe.transpose(*study.dims).load()
+    study_coords = study.coords.to_dataset()
+    study_attrs = dict(study.attrs)
+
+    def _bootstrap_block(block: np.ndarray, block_info: dict) -> np.ndarray:
+        location = block_info[0]["array-location"]
+        tile_indexers = {
+            dim: slice(*location[axis + 1]) for axis, dim in enumerate(spatial_dims)
+        }
+        tile_study = xr.DataArray(
+            block,
+            dims=study.dims,
+            coords=study_coords.isel(tile_indexers).coords,
+            attrs=study_attrs,
+        )
+        tile_result = tile_fn(
+            tile_study,
+            slice_threshold(threshold, tile_indexers),
+            *tile_args,
+        )
+        if tile_result is None:
+            msg = (
+                f"The bootstrap of the tile {tile_indexers} is not supported by"
+                " the lazy tile executor, although the probe tile was. Unset"
+                f" {_TILE_EXECUTOR_ENV} to run the bootstrap eagerly."
+            )
+            raise RuntimeError(msg)
+        return np.asarray(
+            tile_result.transpose(*study.dims).data,
+            dtype=probe.dtype,
+        )
+
+    data = da.map_blocks(
+        _bootstrap_block,
+        study.data,
+        dtype=probe.dtype,
+        chunks=((probe.sizes["time"],), *study.chunks[1:]),
+        name=f"icclim-bootstrap-{uuid.uuid4().hex}",
+    )
+    result = xr.DataArray(
+        data,
+        dims=study.dims,
+        coords={
+            name: coord
+            for name, coord in study.coords.items()
+            if "time" not in coord.dims
+        },
+        attrs=probe.attrs,
+    )
+    return result.assign_coords(
+        {
+            name: coord
+            for name, coord in probe.coords.items()
+            if name == "time" or (coord.ndim == 0 and name not in result.coords)
+        }
+    )
+
+
+def bootstrap_tile_source(tile_study: DataArray) -> DataArray | FileBackedTileSource:
+    """Describe ``tile_study`` by its source files when workers can reopen them."""
+    if not hasattr(tile_study.data, "chunks"):
+        return tile_study
+    if any(dim not in tile_study.indexes for dim in tile_study.dims):
+        return tile_study
+    source_files, variable_name = _file_backed_bootstrap_sources(tile_study)
+    if not source_files or variable_name is None:
+        return tile_study
+    import xarray as xr  # noqa: PLC0415
+
+    template = xr.zeros_like(tile_study)
+    template.encoding = dict(tile_study.encoding)
+    return FileBackedTileSource(
+        source_files=source_files,
+        variable_name=variable_name,
+        template=template,
+    )
+
+
+def _run_bootstrap_tile_task(
+    tile_fn: Callable[..., DataArray | None],
+    source: DataArray | FileBackedTileSource,
+    *tile_args: object,
+) -> DataArray | None:
+    import dask  # noqa: PLC0415
+
+    # Reads of the tile happen inside the worker task, not as nested graphs
+    # submitted back to the scheduler.
+    with dask.config.set(scheduler="synchronous"):
+        tile_study = (
+            source.open() if isinstance(source, FileBackedTileSource) else source
+        )
+        result = tile_fn(tile_study, *tile_args)
+        return None if result is None else result.load()
+
+
+def _active_distributed_client() -> Client | None:
+    try:
+        from distributed import Client, get_worker  # noqa: PLC0415
+    except ImportError:
+        return None
+    try:
+        get_worker()
+    except ValueError:
+        pass
+    else:
+        # Already running inside a worker task: tiles stay in that task.
+        return None
+    try:
+        return Client.current()
+    except ValueError:
+        return None
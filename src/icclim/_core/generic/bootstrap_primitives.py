@@ -9,7 +9,7 @@ These helpers keep bootstrap workflow steps visible in domain language:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -80,6 +80,14 @@ class BootstrapPreparedInputs:
     array_inputs: BootstrapArrayInputs
 
 
+@dataclass(frozen=True)
+class BootstrapTimeBlock:
+    """Contiguous study years evaluated together by the time-blocked bootstrap."""
+
+    time_slice: slice
+    in_base: bool
+
+
 def build_bootstrap_output(
     *,
     flat_result: np.ndarray,
@@ -193,6 +201,15 @@ def _reopen_file_backed_study(study: DataArray) -> DataArray | None:
     source_files, variable_name = _file_backed_bootstrap_sources(study)
     if not source_files or variable_name is None:
         return None
+    return _open_file_backed_bootstrap_sources(source_files, variable_name, study)
+
+
+def _open_file_backed_bootstrap_sources(
+    source_files: list[str],
+    variable_name: str,
+    study: DataArray,
+) -> DataArray:
+    """Open ``variable_name`` from ``source_files`` with the layout of ``study``."""
     import xarray as xr  # noqa: PLC0415
 
     reopened = xr.open_mfdataset(
@@ -423,6 +440,94 @@ def build_bootstrap_temporal_indexing(
     )
 
 
+def bootstrap_time_blocks(
+    study: DataArray,
+    climatology_bounds: tuple[str, str],
+    freq: str,
+) -> list[BootstrapTimeBlock] | None:
+    """
+    Split the study years into in-base and bounded out-of-base blocks.
+
+    In-base years, which overlap the reference period, form one block. The
+    out-of-base years are grouped in blocks of at most as many years as the
+    reference period. ``None`` is returned when there is nothing to split or
+    when output groups may span two calendar years.
+    """
+    if freq not in {"MS", "YS"}:
+        return None
+    study_time = study.indexes["time"]
+    study_years = study_time.year.to_numpy()
+    reference_time = study_time[study_time.slice_indexer(*climatology_bounds)]
+    reference_years = set(np.unique(reference_time.year).tolist())
+    if not reference_years or reference_years.issuperset(study_years.tolist()):
+        return None
+    year_values, year_starts = np.unique(study_years, return_index=True)
+    year_stops = np.append(year_starts[1:], len(study_years))
+    blocks: list[BootstrapTimeBlock] = []
+    block_year_count = 0
+    for year, start, stop in zip(year_values, year_starts, year_stops, strict=True):
+        in_base = int(year) in reference_years
+        if (
+            blocks
+            and blocks[-1].in_base == in_base
+            and (in_base or block_year_count < len(reference_years))
+        ):
+            blocks[-1] = BootstrapTimeBlock(
+                slice(blocks[-1].time_slice.start, int(stop)),
+                in_base,
+            )
+            block_year_count += 1
+            continue
+        blocks.append(BootstrapTimeBlock(slice(int(start), int(stop)), in_base))
+        block_year_count = 1
+    return blocks
+
+
+def build_out_of_base_prepared_inputs(
+    study: DataArray,
+    reference_inputs: BootstrapPreparedInputs,
+    reference_thresholds: np.ndarray,
+    freq: str,
+    *,
+    doy_window_width: int,
+    dtype: np.dtype = np.float32,
+) -> BootstrapPreparedInputs:
+    """
+    Build kernel inputs comparing out-of-base years to precomputed thresholds.
+
+    ``reference_thresholds`` holds one threshold per day of year and cell. It is
+    passed in place of the reference sample with a single sample per day of
+    year, so the kernels select each threshold back unchanged instead of
+    recomputing the reference quantiles for every out-of-base year.
+    """
+    temporal_indexing = build_bootstrap_temporal_indexing(
+        study,
+        reference_inputs.reference_sample.reference_sample,
+        freq,
+        doy_window_width=doy_window_width,
+    )
+    temporal_indexing = replace(
+        temporal_indexing,
+        sample_indices_by_day_of_year=np.arange(
+            reference_thresholds.shape[0],
+            dtype=np.int64,
+        ).reshape(-1, 1),
+    )
+    return BootstrapPreparedInputs(
+        reference_sample=replace(reference_inputs.reference_sample, study=study),
+        temporal_indexing=temporal_indexing,
+        array_inputs=BootstrapArrayInputs(
+            flat_study=np.asarray(study.data, dtype=dtype).reshape(
+                study.sizes["time"],
+                -1,
+            ),
+            flat_reference_raw=reference_thresholds,
+            flat_reference_filtered=reference_thresholds,
+            spatial_shape=study.shape[1:],
+        ),
+    )
+
+
 def indices_by_year(time: pd.DatetimeIndex) -> dict[int, np.ndarray]:
     return {int(year): np.where(time.year == year)[0] for year in np.unique(time.year)}
 
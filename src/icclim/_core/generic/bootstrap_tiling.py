@@ -0,0 +1,353 @@
+"""Spatial tile planning for tiled percentile bootstrap.
+
+Tiled bootstrap paths split the spatial grid into tiles whose size is derived
+from a memory budget and an estimated number of bytes needed per grid cell.
+The estimate is only a starting point: ``BootstrapTileController`` measures the
+peak allocation of the first tiles, refits the bytes-per-cell factor and resizes
+the following tiles so they fill the configured budget. A refit never grows the
+tiles beyond a few times their initial size, as a measured tile may be
+unrepresentative, for instance when it includes one-off allocations.
+
+Learned factors are kept in an in-process memory model keyed by the bootstrap
+path and the input shape, so later runs on the same shape start from the
+measured value. A factor is only recorded once the first measured tiles agree
+on it. Set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to persist
+that model across processes.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from xarray import DataArray
+
+MemoryModelKey = tuple[str, int, str]
+
+_MEMORY_MODEL_ENV = "ICCLIM_BOOTSTRAP_MEMORY_MODEL"
+_ADAPTIVE_TILES_ENV = "ICCLIM_BOOTSTRAP_ADAPTIVE_TILES"
+_LEARNED_BYTES_PER_CELL: dict[MemoryModelKey, int] = {}
+_LOADED_MEMORY_MODEL_FILES: set[str] = set()
+# Largest growth of the tile size over the initial estimate allowed by a refit.
+_MAX_REFIT_GROWTH = 4
+# Number of measured tiles which must agree on the bytes-per-cell factor, within
+# the relative tolerance, before the factor is recorded in the memory model.
+_AGREEING_TILES = 3
+_AGREEMENT_TOLERANCE = 0.25
+
+
+def memory_model_key(kind: str, study: DataArray) -> MemoryModelKey:
+    """Build the memory model key of one bootstrap path for one input shape."""
+    return (kind, int(study.sizes["time"]), str(study.dtype))
+
+
+def get_learned_bytes_per_cell(key: MemoryModelKey) -> int | None:
+    """Return the measured bytes-per-cell factor for ``key``, if any."""
+    if not adaptive_tiles_enabled():
+        return None
+    _load_memory_model_file()
+    return _LEARNED_BYTES_PER_CELL.get(key)
+
+
+def record_learned_bytes_per_cell(key: MemoryModelKey, bytes_per_cell: int) -> None:
+    """Store a measured bytes-per-cell factor for later runs on the same shape."""
+    _load_memory_model_file()
+    _LEARNED_BYTES_PER_CELL[key] = max(1, int(bytes_per_cell))
+    _save_memory_model_file()
+
+
+def reset_bootstrap_memory_model() -> None:
+    """Forget every learned bytes-per-cell factor of the current process."""
+    _LEARNED_BYTES_PER_CELL.clear()
+    _LOADED_MEMORY_MODEL_FILES.clear()
+
+
+def adaptive_tiles_enabled() -> bool:
+    """Return whether tile sizes may be refitted from measured memory."""
+    return os.environ.get(_ADAPTIVE_TILES_ENV, "1").lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
+def spatial_tile_lengths(da: DataArray, max_cells: int) -> dict[str, int]:
+    """Halve the longest spatial dimension until one tile fits ``max_cells``."""
+    spatial_dims = [dim for dim in da.dims if dim != "time"]
+    tile_lengths = {dim: da.sizes[dim] for dim in spatial_dims}
+    product = 1
+    for dim in spatial_dims:
+        product *= tile_lengths[dim]
+    while product > max_cells:
+        dim = max(tile_lengths, key=tile_lengths.get)
+        old = tile_lengths[dim]
+        tile_lengths[dim] = max(1, old // 2)
+        product = 1
+        for value in tile_lengths.values():
+            product *= value
+        if tile_lengths[dim] == old:
+            break
+    return tile_lengths
+
+
+@dataclass(frozen=True)
+class BootstrapTileEstimate:
+    """
+    The planned spatial tiles of a tiled bootstrap, before running it.
+
+    Parameters
+    ----------
+    kind : str
+        The tiled path, "optimized" or "safe".
+    max_tile_cells : int
+        The maximum number of spatial cells of a tile.
+    tile_cells : int
+        The number of spatial cells of the first tile.
+    tile_count : int
+        The number of tiles, before adaptive tiles are resized.
+    bytes_per_cell : int
+        The working memory of one cell.
+    memory_model : str
+        Where ``bytes_per_cell`` comes from: "learned" from a measured tile,
+        "estimated" from the input shape, or "override" when the tile size is
+        set with an environment variable.
+    """
+
+    kind: str
+    max_tile_cells: int
+    tile_cells: int
+    tile_count: int
+    bytes_per_cell: int
+    memory_model: str
+
+    @property
+    def tile_peak_bytes(self) -> int:
+        """The estimated peak memory of one tile, in bytes."""
+        return self.tile_cells * self.bytes_per_cell
+
+
+def estimate_tiles(
+    da: DataArray,
+    kind: str,
+    max_cells: int,
+    bytes_per_cell: int,
+    memory_model: str,
+) -> BootstrapTileEstimate:
+    """Plan the tiles of ``da`` holding at most ``max_cells`` spatial cells."""
+    tile_lengths = spatial_tile_lengths(da, max_cells)
+    return BootstrapTileEstimate(
+        kind=kind,
+        max_tile_cells=max_cells,
+        tile_cells=math.prod(tile_lengths.values()),
+        tile_count=math.prod(
+            math.ceil(da.sizes[dim] / length) for dim, length in tile_lengths.items()
+        ),
+        bytes_per_cell=bytes_per_cell,
+        memory_model=memory_model,
+    )
+
+
+class BootstrapTileController:
+    """
+    Yield spatial bootstrap tiles and resize them from the first measured tiles.
+
+    Tiles are emitted band by band along the first spatial dimension.
+    Every band uses the same split of the remaining spatial dimensions, so the
+    tile results always form a hypercube that ``xr.combine_by_coords`` can
+    assemble. Once a tile has been measured, only the height of the following
+    bands changes, and it grows to at most ``_MAX_REFIT_GROWTH`` times the
+    initial tile size. The largest factor measured on the first
+    ``_AGREEING_TILES`` tiles is used, and it is recorded in the memory model
+    only when these tiles agree on it.
+
+    Parameters
+    ----------
+    da : DataArray
+        The studied data to tile.
+    max_cells : int
+        The initial number of spatial cells per tile.
+    memory_budget : int | None
+        The memory budget of one tile in bytes. When ``None`` tiles are never
+        resized.
+    model_key : MemoryModelKey | None
+        Key under which the measured bytes-per-cell factor is recorded.
+    """
+
+    def __init__(
+        self,
+        da: DataArray,
+        max_cells: int,
+        *,
+        memory_budget: int | None = None,
+        model_key: MemoryModelKey | None = None,
+    ) -> None:
+        self.initial_max_cells = max(1, int(max_cells))
+        self.max_cells = self.initial_max_cells
+        self.memory_budget = memory_budget
+        self.model_key = model_key
+        self.measured_peak_bytes: int | None = None
+        self.learned_bytes_per_cell: int | None = None
+        self.tile_count = 0
+        self._measured_bytes_per_cell: list[int] = []
+        self._spatial_dims = [dim for dim in da.dims if dim != "time"]
+        self._sizes = {dim: da.sizes[dim] for dim in self._spatial_dims}
+        self._tile_lengths = spatial_tile_lengths(da, self.initial_max_cells)
+        self._band_height = (
+            self._tile_lengths[self._spatial_dims[0]] if self._spatial_dims else 1
+        )
+
+    @property
+    def is_adaptive(self) -> bool:
+        """Whether tile sizes are refitted after the first tiles."""
+        return self.memory_budget is not None
+
+    def __iter__(self) -> Iterator[dict[str, slice]]:
+        """Yield tile indexers, reading the latest band height for each band."""
+        if not self._spatial_dims:
+            self.tile_count += 1
+            yield {}
+            return
+        band_dim, *inner_dims = self._spatial_dims
+        inner_tiles: list[dict[str, slice]] = [{}]
+        for dim in inner_dims:
+            dim_tiles = [
+                slice(start, min(start + self._tile_lengths[dim], self._sizes[dim]))
+                for start in range(0, self._sizes[dim], self._tile_lengths[dim])
+            ]
+            inner_tiles = [
+                {**prefix, dim: dim_tile}
+                for prefix in inner_tiles
+                for dim_tile in dim_tiles
+            ]
+        band_start = 0
+        while band_start < self._sizes[band_dim]:
+            band_stop = min(band_start + self._band_height, self._sizes[band_dim])
+            for inner_tile in inner_tiles:
+                self.tile_count += 1
+                yield {band_dim: slice(band_start, band_stop), **inner_tile}
+            band_start = band_stop
+
+    @contextmanager
+    def measure(self, tile_indexers: dict[str, slice]) -> Iterator[None]:
+        """Measure the peak allocation of the first tiles and refit tile sizes."""
+        if (
+            not self.is_adaptive
+            or len(self._measured_bytes_per_cell) >= _AGREEING_TILES
+        ):
+            yield
+            return
+        with _traced_peak_bytes() as peak:
+            yield
+        if peak[0] is not None:
+            self._refit(tile_indexers, peak[0])
+
+    def _refit(self, tile_indexers: dict[str, slice], peak_bytes: int) -> None:
+        self.measured_peak_bytes = max(self.measured_peak_bytes or 0, peak_bytes)
+        tile_cells = _tile_cell_count(tile_indexers)
+        self._measured_bytes_per_cell.append(max(1, peak_bytes // tile_cells))
+        self.learned_bytes_per_cell = max(self._measured_bytes_per_cell)
+        if self.model_key is not None and self._measurements_agree():
+            record_learned_bytes_per_cell(
+                self.model_key,
+                self.learned_bytes_per_cell,
+            )
+        if self.memory_budget is None or not self._spatial_dims:
+            return
+        self.max_cells = max(
+            1,
+            min(
+                self.memory_budget // self.learned_bytes_per_cell,
+                self.initial_max_cells * _MAX_REFIT_GROWTH,
+            ),
+        )
+        inner_cells = 1
+        for dim in self._spatial_dims[1:]:
+            inner_cells *= self._tile_lengths[dim]
+        self._band_height = max(1, self.max_cells // inner_cells)
+
+    def _measurements_agree(self) -> bool:
+        measured = self._measured_bytes_per_cell
+        if len(measured) != _AGREEING_TILES:
+            return False
+        return max(measured) <= min(measured) * (1 + _AGREEMENT_TOLERANCE)
+
+
+@contextmanager
+def _traced_peak_bytes() -> Iterator[list[int | None]]:
+    """
+    Yield a one-item list filled with the peak traced allocation in bytes.
+
+    When tracemalloc is already tracing, e.g. for a benchmark, its peak is
+    left untouched. The peak of the block is then only known when the block
+    raises the outer peak, otherwise the list holds None and the tile keeps
+    the static memory model.
+    """
+    peak: list[int | None] = [0]
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        baseline, outer_peak = tracemalloc.get_traced_memory()
+    else:
+        baseline, outer_peak = 0, -1
+        tracemalloc.start()
+    try:
+        yield peak
+    finally:
+        block_peak = tracemalloc.get_traced_memory()[1]
+        if not was_tracing:
+            tracemalloc.stop()
+        peak[0] = max(0, block_peak - baseline) if block_peak > outer_peak else None
+
+
+def _tile_cell_count(tile_indexers: dict[str, slice]) -> int:
+    cells = 1
+    for indexer in tile_indexers.values():
+        cells *= max(1, indexer.stop - indexer.start)
+    return cells
+
+
+def _load_memory_model_file() -> None:
+    path = os.environ.get(_MEMORY_MODEL_ENV)
+    if not path or path in _LOADED_MEMORY_MODEL_FILES:
+        return
+    _LOADED_MEMORY_MODEL_FILES.add(path)
+    model_file = Path(path)
+    if not model_file.is_file():
+        return
+    try:
+        entries = json.loads(model_file.read_text())
+    except (OSError, ValueError):
+        return
+    for entry in entries:
+        key = (str(entry["kind"]), int(entry["time"]), str(entry["dtype"]))
+        _LEARNED_BYTES_PER_CELL.setdefault(key, int(entry["bytes_per_cell"]))
+
+
+def _save_memory_model_file() -> None:
+    path = os.environ.get(_MEMORY_MODEL_ENV)
+    if not path:
+        return
+    entries = [
+        {
+            "kind": kind,
+            "time": time_length,
+            "dtype": dtype,
+            "bytes_per_cell": bytes_per_cell,
+        }
+        for (kind, time_length, dtype), bytes_per_cell in sorted(
+            _LEARNED_BYTES_PER_CELL.items()
+        )
+    ]
+    try:
+        Path(path).write_text(json.dumps(entries, indent=2))
+    except OSError:
+        return
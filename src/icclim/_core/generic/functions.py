@@ -17,15 +17,16 @@ The `DataArray` instance is the result of the computation of the generic index.
 
 from __future__ import annotations
 
+import math
 import operator
 import os
+import threading
 import warnings
 from collections.abc import Callable
 from copy import copy
 from dataclasses import replace
-from functools import partial
 from time import perf_counter
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 from warnings import warn
 
 import numpy as np
@@ -57,9 +58,38 @@ from icclim._core.generic.bootstrap_capability import (
     classify_generic_indicator_bootstrap,
     get_optimized_scalar_bounded_bootstrap_spec,
 )
+from icclim._core.generic.bootstrap_executor import (
+    DistributedTileExecutor,
+    get_bootstrap_tile_executor,
+    lazy_bootstrap_tiles_enabled,
+    map_bootstrap_blocks,
+)
+from icclim._core.generic.bootstrap_tiling import (
+    BootstrapTileController,
+    BootstrapTileEstimate,
+    adaptive_tiles_enabled,
+    estimate_tiles,
+    get_learned_bytes_per_cell,
+    memory_model_key,
+    spatial_tile_lengths,
+)
+from icclim._core.generic.fused_reducer import (
+    FusedStatistic,
+    fused_statistic,
+    get_active_fused_reducer,
+)
 from icclim._core.input_parsing import PercentileDataArray
+from icclim._core.memory import (
+    active_memory_budget,
+    exceeds_memory_budget,
+    memory_stage,
+    parse_byte_size,
+)
 from icclim._core.model.cf_calendar import CfCalendarRegistry
 from icclim._core.model.operator import Operator, OperatorRegistry
+from icclim._core.profiling import active_profile, profile_count, profile_path
+from icclim._core.progress import TileProgress, report_progress
+from icclim._core.resampling import resample_backend_enabled
 from icclim.exception import InvalidIcclimArgumentError
 from icclim.frequency import RUN_INDEXER, Frequency, FrequencyRegistry
 
@@ -68,21 +98,33 @@ if TYPE_CHECKING:
     from datetime import timedelta
 
     from pint import Quantity
-    from xarray.computation.rolling import DataArrayRolling
     from xarray.core.groupby import DataArrayGroupBy
 
     from icclim._core.climate_variable import ClimateVariable
     from icclim._core.generic.bootstrap_primitives import BootstrapPreparedInputs
     from icclim._core.generic.threshold.percentile import PercentileThreshold
+    from icclim._core.generic.threshold_sums import ThresholdSum
     from icclim._core.model.logical_link import LogicalLink
+    from icclim._core.model.quantile_interpolation import QuantileInterpolation
     from icclim._core.model.threshold import Threshold
+    from icclim._core.resampling import ResampleGroups
 
 
 _BOOTSTRAP_PROFILE: dict[str, float | int | str] = {}
+_BOOTSTRAP_PROFILE_LOCK = threading.Lock()
 _DEFAULT_BOOTSTRAP_SAFE_TILE_MEMORY = "2GB"
 _DEFAULT_BOOTSTRAP_FAST_TILE_MEMORY = "2GB"
 _BOOTSTRAP_SAFE_MEMORY_FACTOR = 12
 _BOOTSTRAP_FAST_MEMORY_FACTOR = 4
+# Resample reducers that the Frequency group-index backend can run directly.
+_RESAMPLE_REDUCTIONS = {
+    DataArrayResample.sum: "sum",
+    DataArrayResample.mean: "mean",
+    DataArrayResample.max: "max",
+    DataArrayResample.min: "min",
+    DataArrayResample.std: "std",
+    DataArrayResample.count: "count",
+}
 
 
 def _get_scalar_bounded_bootstrap_spec(
@@ -116,27 +158,40 @@ def _bootstrap_logical_link_code(logical_link: str) -> int:
 
 
 def reset_bootstrap_profile() -> None:
-    _BOOTSTRAP_PROFILE.clear()
+    with _BOOTSTRAP_PROFILE_LOCK:
+        _BOOTSTRAP_PROFILE.clear()
 
 
 def get_bootstrap_profile() -> dict[str, float | int | str]:
-    return dict(_BOOTSTRAP_PROFILE)
+    with _BOOTSTRAP_PROFILE_LOCK:
+        return dict(_BOOTSTRAP_PROFILE)
 
 
+# The bootstrap entries are also recorded, prefixed, in the active profile.
 def _profile_bootstrap_add(name: str, seconds: float) -> None:
-    _BOOTSTRAP_PROFILE[name] = float(_BOOTSTRAP_PROFILE.get(name, 0.0)) + seconds
+    with _BOOTSTRAP_PROFILE_LOCK:
+        _BOOTSTRAP_PROFILE[name] = float(_BOOTSTRAP_PROFILE.get(name, 0.0)) + seconds
+    profile_count(f"bootstrap.{name}", seconds)
 
 
 def _profile_bootstrap_inc(name: str, count: int = 1) -> None:
-    _BOOTSTRAP_PROFILE[name] = int(_BOOTSTRAP_PROFILE.get(name, 0)) + count
+    with _BOOTSTRAP_PROFILE_LOCK:
+        _BOOTSTRAP_PROFILE[name] = int(_BOOTSTRAP_PROFILE.get(name, 0)) + count
+    profile_count(f"bootstrap.{name}", count)
 
 
 def _profile_bootstrap_set(name: str, value: float) -> None:
-    _BOOTSTRAP_PROFILE[name] = value
+    with _BOOTSTRAP_PROFILE_LOCK:
+        _BOOTSTRAP_PROFILE[name] = value
+    profile = active_profile()
+    if profile is not None:
+        profile.set_value(f"bootstrap.{name}", value)
 
 
 def _profile_bootstrap_note(name: str, value: str) -> None:
-    _BOOTSTRAP_PROFILE[name] = value
+    with _BOOTSTRAP_PROFILE_LOCK:
+        _BOOTSTRAP_PROFILE[name] = value
+    profile_path(f"bootstrap.{name}", value)
 
 
 def count_occurrences(
@@ -226,7 +281,7 @@ def count_occurrences(
                     )
                     optimized_bounded_count.attrs[UNITS_KEY] = "%"
                     return optimized_bounded_count
-                freq = check_freq(climate_vars[0].studied_data, dim="time")
+                freq = climate_vars[0].resample_plan(resample_freq).source_frequency
                 return _safe_to_agg_units(
                     optimized_bounded_count,
                     climate_vars[0].studied_data,
@@ -243,7 +298,7 @@ def count_occurrences(
                 safe_bootstrapped = _to_percent(safe_bootstrapped, resample_freq)
                 safe_bootstrapped.attrs[UNITS_KEY] = "%"
                 return safe_bootstrapped
-            freq = check_freq(climate_vars[0].studied_data, dim="time")
+            freq = climate_vars[0].resample_plan(resample_freq).source_frequency
             return _safe_to_agg_units(
                 safe_bootstrapped,
                 climate_vars[0].studied_data,
@@ -251,23 +306,26 @@ def count_occurrences(
                 deffreq=freq,
             )
 
-    if date_event:
-        reducer_op = _count_occurrences_with_date
-    else:
-        reducer_op = partial(DataArrayResample.sum, dim="time")
     combined_exceedance_mask = _compute_combined_exceedance_mask(
         climate_vars,
         resample_freq,
         logical_link,
     )
-    result = reducer_op(
-        combined_exceedance_mask.resample(time=resample_freq.pandas_freq)
-    )
+    if date_event:
+        result = _count_occurrences_with_date(
+            combined_exceedance_mask.resample(time=resample_freq.pandas_freq)
+        )
+    else:
+        result = _count_exceedances(
+            combined_exceedance_mask,
+            climate_vars,
+            resample_freq,
+        )
     if to_percent:
         result = _to_percent(result, resample_freq)
         result.attrs[UNITS_KEY] = "%"
         return result
-    freq = check_freq(climate_vars[0].studied_data, dim="time")
+    freq = climate_vars[0].resample_plan(resample_freq).source_frequency
     return _safe_to_agg_units(
         result, climate_vars[0].studied_data, "count", deffreq=freq
     )
@@ -346,11 +404,9 @@ def max_consecutive_occurrence(
                 dim="time",
                 index=kwargs.get("run_index", "first"),
             )
-            result = spell_run_lengths.resample(time=resample_freq.pandas_freq).max(
-                dim="time"
-            )
+            result = resample_freq.reduce(spell_run_lengths, "max")
             result = _transpose_like_study(result, climate_vars[0].studied_data)
-            freq = check_freq(climate_vars[0].studied_data, dim="time")
+            freq = climate_vars[0].resample_plan(resample_freq).source_frequency
             return _safe_to_agg_units(
                 result,
                 climate_vars[0].studied_data,
@@ -369,14 +425,15 @@ def max_consecutive_occurrence(
         dim="time",
         index=kwargs.get("run_index", "first"),
     )
-    resampled = rle.resample(time=resample_freq.pandas_freq)
     if date_event:
         result = _consecutive_occurrences_with_dates(
-            resampled, source_freq_delta, kwargs.get("run_index", "first")
+            rle.resample(time=resample_freq.pandas_freq),
+            source_freq_delta,
+            kwargs.get("run_index", "first"),
         )
     else:
-        result = resampled.max(dim="time")
-    freq = check_freq(climate_vars[0].studied_data, dim="time")
+        result = resample_freq.reduce(rle, "max")
+    freq = climate_vars[0].resample_plan(resample_freq).source_frequency
     return _safe_to_agg_units(
         result, climate_vars[0].studied_data, "count", deffreq=freq
     )
@@ -436,11 +493,9 @@ def sum_of_spell_lengths(
                 spell_run_lengths >= min_spell_length,
                 other=0,
             )
-            result = cropped_run_lengths.resample(time=resample_freq.pandas_freq).sum(
-                dim="time"
-            )
+            result = resample_freq.reduce(cropped_run_lengths, "sum")
             result = _transpose_like_study(result, climate_vars[0].studied_data)
-            freq = check_freq(climate_vars[0].studied_data, dim="time")
+            freq = climate_vars[0].resample_plan(resample_freq).source_frequency
             return _safe_to_agg_units(
                 result,
                 climate_vars[0].studied_data,
@@ -460,8 +515,8 @@ def sum_of_spell_lengths(
         index=kwargs.get("run_index", "first"),
     )
     cropped_rle = rle.where(rle >= min_spell_length, other=0)
-    result = cropped_rle.resample(time=resample_freq.pandas_freq).sum(dim="time")
-    freq = check_freq(climate_vars[0].studied_data, dim="time")
+    result = resample_freq.reduce(cropped_rle, "sum")
+    freq = climate_vars[0].resample_plan(resample_freq).source_frequency
     return _safe_to_agg_units(
         result, climate_vars[0].studied_data, "count", deffreq=freq
     )
@@ -505,12 +560,12 @@ def excess(
     if threshold.operator != OperatorRegistry.REACH:
         msg = "Excess can only be computed with 'reach' operator."
         raise InvalidIcclimArgumentError(msg)
-    excesses = threshold.compute(study, override_op=operator.sub)
-    res = (
-        (excesses).clip(min=0).resample(time=resample_freq.pandas_freq).sum(dim="time")
-    )
+    res = _compute_compiled_threshold_sum(study, threshold, resample_freq, "excess")
+    if res is None:
+        excesses = threshold.compute(study, override_op=operator.sub)
+        res = resample_freq.reduce(excesses.clip(min=0), "sum")
     res = res.assign_attrs(units=f"delta_{res.attrs['units']}")
-    freq = check_freq(study, dim="time")
+    freq = climate_vars[0].resample_plan(resample_freq).source_frequency
     return _safe_to_agg_units(res, study, "integral", deffreq=freq)
 
 
@@ -547,10 +602,12 @@ def deficit(
     if threshold is None:
         msg = "No threshold found"
         raise InvalidIcclimArgumentError(msg)
-    deficit = threshold.compute(study, override_op=lambda da, th: th - da)
-    res = deficit.clip(min=0).resample(time=resample_freq.pandas_freq).sum(dim="time")
+    res = _compute_compiled_threshold_sum(study, threshold, resample_freq, "deficit")
+    if res is None:
+        deficit = threshold.compute(study, override_op=lambda da, th: th - da)
+        res = resample_freq.reduce(deficit.clip(min=0), "sum")
     res = res.assign_attrs(units=f"delta_{res.attrs['units']}")
-    freq = check_freq(study, dim="time")
+    freq = climate_vars[0].resample_plan(resample_freq).source_frequency
     return _safe_to_agg_units(res, study, "integral", deffreq=freq)
 
 
@@ -612,6 +669,15 @@ def fraction_of_total(
             optimized_fraction,
             to_percent=to_percent,
         )
+    if not must_run_bootstrap(study, threshold, climate_vars[0].bootstrap):
+        compiled_fraction = _compute_compiled_threshold_sum(
+            study, threshold, resample_freq, "fraction"
+        )
+        if compiled_fraction is not None:
+            return _format_fraction_of_total_result(
+                compiled_fraction,
+                to_percent=to_percent,
+            )
     study = _materialize_study_for_optimized_compound_value_aggregate(
         study=study,
         threshold=threshold,
@@ -627,24 +693,16 @@ def fraction_of_total(
             if isinstance(threshold.operator, Operator)
             else OperatorRegistry.lookup(threshold.operator)
         )
-        total = (
-            study.where(op(study, min_val))
-            .resample(time=resample_freq.pandas_freq)
-            .sum(dim="time")
-        )
+        total = resample_freq.reduce(study.where(op(study, min_val)), "sum")
     else:
-        total = study.resample(time=resample_freq.pandas_freq).sum(dim="time")
+        total = resample_freq.reduce(study, "sum")
     exceedance_mask = _compute_threshold_exceedance_mask(
         climate_var=climate_vars[0],
         threshold=threshold,
         resample_freq=resample_freq,
         prepared_inputs_cache={},
     ).squeeze()
-    over = (
-        study.where(exceedance_mask, 0)
-        .resample(time=resample_freq.pandas_freq)
-        .sum(dim="time")
-    )
+    over = resample_freq.reduce(study.where(exceedance_mask, 0), "sum")
     res = over / total
     return _format_fraction_of_total_result(res, to_percent=to_percent)
 
@@ -1025,6 +1083,85 @@ def _compute_optimized_fraction_of_total(
     )
 
 
+def _compute_compiled_threshold_sum(
+    study: DataArray,
+    threshold: Threshold,
+    resample_freq: Frequency,
+    how: ThresholdSum,
+) -> DataArray | None:
+    """
+    Run ``how`` as a single compiled pass, or return None when it cannot be.
+
+    The non-compiled fallbacks threshold, mask and resample the data in
+    separate steps.
+    """
+    from icclim._core.generic.threshold_sums import (  # noqa: PLC0415
+        segmented_threshold_sum,
+        threshold_sums_available,
+        threshold_table,
+    )
+
+    if (
+        not resample_backend_enabled()
+        or not threshold_sums_available()
+        or not np.issubdtype(study.dtype, np.number)
+    ):
+        return None
+    kernel_kwargs = {}
+    if how == "fraction":
+        op_code = _bootstrap_operator_code(threshold.operator)
+        if op_code < 0:
+            return None
+        kernel_kwargs["op_code"] = op_code
+        if threshold.threshold_min_value is not None:
+            from xclim.core.units import convert_units_to  # noqa: PLC0415
+
+            kernel_kwargs["min_value"] = convert_units_to(
+                threshold.threshold_min_value, study, context="hydro"
+            )
+            kernel_kwargs["min_op_code"] = op_code
+    groups = resample_freq.resample_groups(study)
+    if groups is None:
+        return None
+    table = threshold_table(threshold, study)
+    if table is None:
+        return None
+    result = segmented_threshold_sum(study, groups, *table, how, **kernel_kwargs)
+    # The non-compiled result is laid out by the broadcasting of the study with
+    # its threshold, which a single time step reproduces cheaply.
+    first_step = study.isel(time=slice(0, 1))
+    threshold_value = threshold.value
+    if "dayofyear" in threshold_value.dims:
+        threshold_value = (
+            threshold_value.isel(dayofyear=[0])
+            .rename(dayofyear="time")
+            .assign_coords(time=first_step.time)
+        )
+    if how == "excess":
+        layout = first_step - threshold_value
+    elif how == "deficit":
+        layout = threshold_value - first_step
+    else:
+        op = (
+            threshold.operator
+            if isinstance(threshold.operator, Operator)
+            else OperatorRegistry.lookup(threshold.operator)
+        )
+        mask = op(first_step, threshold_value)
+        layout = first_step.where(mask.squeeze(), 0)
+    result = result.expand_dims(
+        {dim: layout.sizes[dim] for dim in layout.dims if dim not in result.dims}
+    ).transpose(*layout.dims)
+    result = result.assign_coords(
+        {
+            name: coord
+            for name, coord in layout.coords.items()
+            if "time" not in coord.dims and name not in result.coords
+        }
+    )
+    return result.assign_attrs(layout.attrs)
+
+
 def _materialize_study_for_optimized_compound_value_aggregate(
     *,
     study: DataArray,
@@ -1137,8 +1274,8 @@ def max_of_rolling_sum(
         climate_vars=climate_vars,
         resample_freq=resample_freq,
         rolling_window_width=rolling_window_width,
-        rolling_op=lambda x: x.sum(),
-        resampled_op=lambda x: x.max(),
+        rolling_op="sum",
+        resampled_op=DataArrayResample.max,
         date_event=date_event,
         source_freq_delta=source_freq_delta,
     )
@@ -1185,8 +1322,8 @@ def min_of_rolling_sum(
         climate_vars=climate_vars,
         resample_freq=resample_freq,
         rolling_window_width=rolling_window_width,
-        rolling_op=lambda x: x.sum(),
-        resampled_op=lambda x: x.min(),
+        rolling_op="sum",
+        resampled_op=DataArrayResample.min,
         date_event=date_event,
         source_freq_delta=source_freq_delta,
     )
@@ -1234,8 +1371,8 @@ def min_of_rolling_average(
         climate_vars=climate_vars,
         resample_freq=resample_freq,
         rolling_window_width=rolling_window_width,
-        rolling_op=lambda x: x.mean(),
-        resampled_op=lambda x: x.min(),
+        rolling_op="mean",
+        resampled_op=DataArrayResample.min,
         date_event=date_event,
         source_freq_delta=source_freq_delta,
     )
@@ -1283,8 +1420,8 @@ def max_of_rolling_average(
         climate_vars=climate_vars,
         resample_freq=resample_freq,
         rolling_window_width=rolling_window_width,
-        rolling_op=lambda x: x.mean(),
-        resampled_op=lambda x: x.max(),
+        rolling_op="mean",
+        resampled_op=DataArrayResample.max,
         date_event=date_event,
         source_freq_delta=source_freq_delta,
     )
@@ -1322,7 +1459,7 @@ def mean_of_difference(
     This is a generification of ECAD's DTR climate index.
     """
     study, ref = get_couple_of_var(climate_vars, "mean_of_difference")
-    mean_of_diff = (study - ref).resample(time=resample_freq.pandas_freq).mean()
+    mean_of_diff = resample_freq.reduce(study - ref, "mean")
     mean_of_diff.attrs["units"] = study.attrs["units"]
     return mean_of_diff
 
@@ -1361,8 +1498,8 @@ def difference_of_extremes(
     This is a generification of ECAD's ETR climate index.
     """
     study, ref = get_couple_of_var(climate_vars, "difference_of_extremes")
-    max_study = study.resample(time=resample_freq.pandas_freq).max()
-    min_ref = ref.resample(time=resample_freq.pandas_freq).min()
+    max_study = resample_freq.reduce(study, "max")
+    min_ref = resample_freq.reduce(ref, "min")
     diff_of_extremes = max_study - min_ref
     diff_of_extremes.attrs["units"] = study.attrs["units"]
     return diff_of_extremes
@@ -1405,7 +1542,7 @@ def mean_of_absolute_one_time_step_difference(
         "mean_of_absolute_one_time_step_difference",
     )
     one_time_step_diff = (study - ref).diff(dim="time")
-    res = abs(one_time_step_diff).resample(time=resample_freq.pandas_freq).mean()
+    res = resample_freq.reduce(abs(one_time_step_diff), "mean")
     res.attrs["units"] = study.attrs["units"]
     return res
 
@@ -1511,10 +1648,20 @@ def percentile(
         msg = "PercentileThreshold must have a value"
         raise InvalidIcclimArgumentError(msg)
     quantile = percentile_threshold.initial_value[0] * 0.01
-    method = cast("Any", percentile_threshold.interpolation.name)
-    result = study.resample(time=resample_freq.pandas_freq).quantile(
-        quantile, method=method
-    )
+    groups = (
+        resample_freq.resample_groups(study)
+        if percentile_threshold.quantile_method == "sketch"
+        else None
+    )
+    if groups is None:
+        method = cast("Any", percentile_threshold.interpolation.name)
+        result = study.resample(time=resample_freq.pandas_freq).quantile(
+            quantile, method=method
+        )
+    else:
+        result = _sketch_resample_quantile(
+            study, groups, quantile, percentile_threshold.interpolation
+        )
     result.coords["quantile"] = result.coords["quantile"] * 100
     result = result.rename(quantile="percentiles")
     from xclim.core.calendar import build_climatology_bounds  # noqa: PLC0415
@@ -1525,6 +1672,36 @@ def percentile(
     )
 
 
+def _sketch_resample_quantile(
+    study: DataArray,
+    groups: ResampleGroups,
+    quantile: float,
+    interpolation: QuantileInterpolation,
+) -> DataArray:
+    from icclim._core.quantile_sketch import sketch_quantiles  # noqa: PLC0415
+
+    data = sketch_quantiles(
+        study.data,
+        groups.lengths,
+        np.array([quantile]),
+        interpolation.alpha,
+        interpolation.beta,
+        axis=study.get_axis_num("time"),
+    )[..., 0]
+    coords = {
+        name: coord for name, coord in study.coords.items() if "time" not in coord.dims
+    }
+    coords["time"] = groups.labels
+    coords["quantile"] = quantile
+    return DataArray(
+        data.astype(study.dtype if study.dtype.kind == "f" else np.float64),
+        dims=study.dims,
+        coords=coords,
+        attrs=dict(study.attrs),
+        name=study.name,
+    )
+
+
 def _reduce_and_diff(
     study: DataArray,
     ref: DataArray,
@@ -1755,37 +1932,15 @@ def _compute_safe_tiled_count_occurrences_with_max_cells(
     max_cells: int,
     safe_start: float,
 ) -> DataArray:
-    tile_results: list[DataArray] = []
-    for tile_indexers in _iter_spatial_tiles(climate_var.studied_data, max_cells):
-        tile_start = perf_counter()
-        tile_study = climate_var.studied_data.isel(tile_indexers)
-        tile_threshold = _slice_threshold_for_tile(threshold, tile_indexers)
-        tile_exceedance_mask = _compute_exceedance_mask(
-            tile_study,
-            tile_threshold,
-            freq=resample_freq.pandas_freq,
-            bootstrap=True,
-        )
-        tile_result = tile_exceedance_mask.resample(time=resample_freq.pandas_freq).sum(
-            dim="time"
-        )
-        if "percentiles" in tile_result.dims:
-            tile_result = tile_result.squeeze("percentiles")
-        tile_results.append(tile_result.load())
-        _profile_bootstrap_inc("bootstrap_safe_tile_count")
-        _profile_bootstrap_add(
-            "bootstrap_safe_tile_seconds",
-            perf_counter() - tile_start,
-        )
-
-    if len(tile_results) == 1:
-        result = tile_results[0]
-    else:
-        result = xr.combine_by_coords(
-            [tile.to_dataset(name="__icclim_bootstrap_tile") for tile in tile_results],
-            combine_attrs="override",
-        )["__icclim_bootstrap_tile"]
-    result.attrs.update(tile_results[-1].attrs)
+    tile_results = _bootstrap_tile_results(
+        climate_var.studied_data,
+        threshold,
+        max_cells,
+        "safe",
+        _safe_bootstrap_count_tile,
+        resample_freq.pandas_freq,
+    )
+    result = _combine_bootstrap_tile_results(tile_results)
     _profile_bootstrap_add(
         "bootstrap_safe_total_seconds",
         perf_counter() - safe_start,
@@ -1803,33 +1958,13 @@ def _compute_fast_tiled_count_occurrences(
         compute_doy_percentile_bootstrap_count,
     )
 
-    fast_start = perf_counter()
-    tile_results: list[DataArray] = []
-    for tile_indexers in _iter_spatial_tiles(climate_var.studied_data, max_cells):
-        tile_study = climate_var.studied_data.isel(tile_indexers)
-        tile_threshold = _slice_threshold_for_tile(threshold, tile_indexers)
-        tile_result = compute_doy_percentile_bootstrap_count(
-            tile_study,
-            tile_threshold,
-            resample_freq.pandas_freq,
-        )
-        if tile_result is None:
-            return None
-        tile_results.append(tile_result)
-        _profile_bootstrap_inc("bootstrap_optimized_tile_count")
-    if len(tile_results) == 1:
-        result = tile_results[0]
-    else:
-        result = xr.combine_by_coords(
-            [tile.to_dataset(name="__icclim_bootstrap_tile") for tile in tile_results],
-            combine_attrs="override",
-        )["__icclim_bootstrap_tile"]
-    result.attrs.update(tile_results[-1].attrs)
-    _profile_bootstrap_add(
-        "bootstrap_optimized_total_seconds",
-        perf_counter() - fast_start,
+    return _compute_fast_tiled_bootstrap_reducer(
+        climate_var,
+        compute_doy_percentile_bootstrap_count,
+        threshold,
+        resample_freq,
+        max_cells,
     )
-    return result
 
 
 def _compute_fast_tiled_bootstrap_exceedance_sum(
@@ -1997,27 +2132,17 @@ def _compute_fast_tiled_bootstrap_reducer(
     max_cells: int,
 ) -> DataArray | None:
     optimized_start = perf_counter()
-    tile_results: list[DataArray] = []
-    for tile_indexers in _iter_spatial_tiles(climate_var.studied_data, max_cells):
-        tile_study = climate_var.studied_data.isel(tile_indexers)
-        tile_threshold = _slice_threshold_for_tile(threshold, tile_indexers)
-        tile_result = reducer(
-            tile_study,
-            tile_threshold,
-            resample_freq.pandas_freq,
-        )
-        if tile_result is None:
-            return None
-        tile_results.append(tile_result)
-        _profile_bootstrap_inc("bootstrap_optimized_tile_count")
-    if len(tile_results) == 1:
-        result = tile_results[0]
-    else:
-        result = xr.combine_by_coords(
-            [tile.to_dataset(name="__icclim_bootstrap_tile") for tile in tile_results],
-            combine_attrs="override",
-        )["__icclim_bootstrap_tile"]
-    result.attrs.update(tile_results[-1].attrs)
+    tile_results = _bootstrap_tile_results(
+        climate_var.studied_data,
+        threshold,
+        max_cells,
+        "optimized",
+        reducer,
+        resample_freq.pandas_freq,
+    )
+    if tile_results is None:
+        return None
+    result = _combine_bootstrap_tile_results(tile_results)
     _profile_bootstrap_add(
         "bootstrap_optimized_total_seconds",
         perf_counter() - optimized_start,
@@ -2038,30 +2163,20 @@ def _compute_fast_tiled_scalar_bounded_bootstrap_reducer(
     max_cells: int,
 ) -> DataArray | None:
     optimized_start = perf_counter()
-    tile_results: list[DataArray] = []
-    for tile_indexers in _iter_spatial_tiles(climate_var.studied_data, max_cells):
-        tile_study = climate_var.studied_data.isel(tile_indexers)
-        tile_threshold = _slice_threshold_for_tile(threshold, tile_indexers)
-        tile_result = reducer(
-            tile_study,
-            tile_threshold,
-            resample_freq.pandas_freq,
-            scalar_bound,
-            scalar_op_code,
-            logical_link_code,
-        )
-        if tile_result is None:
-            return None
-        tile_results.append(tile_result)
-        _profile_bootstrap_inc("bootstrap_optimized_tile_count")
-    if len(tile_results) == 1:
-        result = tile_results[0]
-    else:
-        result = xr.combine_by_coords(
-            [tile.to_dataset(name="__icclim_bootstrap_tile") for tile in tile_results],
-            combine_attrs="override",
-        )["__icclim_bootstrap_tile"]
-    result.attrs.update(tile_results[-1].attrs)
+    tile_results = _bootstrap_tile_results(
+        climate_var.studied_data,
+        threshold,
+        max_cells,
+        "optimized",
+        reducer,
+        resample_freq.pandas_freq,
+        scalar_bound,
+        scalar_op_code,
+        logical_link_code,
+    )
+    if tile_results is None:
+        return None
+    result = _combine_bootstrap_tile_results(tile_results)
     _profile_bootstrap_add(
         "bootstrap_optimized_total_seconds",
         perf_counter() - optimized_start,
@@ -2106,60 +2221,88 @@ def _compute_fast_tiled_bootstrap_spell_mask(
     )
 
     optimized_start = perf_counter()
-    tile_results: list[DataArray] = []
     threshold = climate_var.threshold
     if threshold is None:
         return None
-    for tile_indexers in _iter_spatial_tiles(climate_var.studied_data, max_cells):
-        tile_study = climate_var.studied_data.isel(tile_indexers)
-        tile_threshold = _slice_threshold_for_tile(threshold, tile_indexers)
-        prepared_inputs = None
-        if prepared_inputs_cache is not None:
-            cache_key = _bootstrap_tile_preparation_cache_key(
-                tile_indexers,
-                tile_threshold,
-                resample_freq.pandas_freq,
-            )
-            prepared_inputs = prepared_inputs_cache.get(cache_key)
-            if prepared_inputs is None:
-                prepared_inputs = build_bootstrap_prepared_inputs(
-                    tile_study,
+    if (
+        lazy_bootstrap_tiles_enabled(climate_var.studied_data)
+        or get_bootstrap_tile_executor() is not None
+    ):
+        # The prepared inputs cache only lives in the driver process.
+        offloaded_results = _bootstrap_tile_results(
+            climate_var.studied_data,
+            threshold,
+            max_cells,
+            "optimized",
+            compute_doy_percentile_bootstrap_union_exceedance_mask,
+            resample_freq.pandas_freq,
+        )
+        if offloaded_results is None:
+            return None
+        return _finalize_tiled_bootstrap_spell_mask(
+            _combine_bootstrap_tile_results(offloaded_results),
+            climate_var.studied_data,
+            optimized_start,
+        )
+    tile_results: list[DataArray] = []
+    tiles = _bootstrap_tile_controller(climate_var.studied_data, max_cells, "optimized")
+    progress = TileProgress(climate_var.studied_data, "optimized bootstrap")
+    for tile_indexers in tiles:
+        with (
+            progress.tile(tile_indexers),
+            tiles.measure(tile_indexers),
+            memory_stage("bootstrap_tiles"),
+        ):
+            tile_study = climate_var.studied_data.isel(tile_indexers)
+            tile_threshold = _slice_threshold_for_tile(threshold, tile_indexers)
+            prepared_inputs = None
+            if prepared_inputs_cache is not None:
+                cache_key = _bootstrap_tile_preparation_cache_key(
+                    tile_indexers,
                     tile_threshold,
                     resample_freq.pandas_freq,
-                    dtype=np.float32,
-                    prefer_file_reopen=True,
                 )
-                prepared_inputs_cache[cache_key] = prepared_inputs
-        tile_result = compute_doy_percentile_bootstrap_union_exceedance_mask(
-            tile_study,
-            tile_threshold,
-            resample_freq.pandas_freq,
-            prepared_inputs=prepared_inputs,
-        )
+                prepared_inputs = prepared_inputs_cache.get(cache_key)
+                if prepared_inputs is None:
+                    prepared_inputs = build_bootstrap_prepared_inputs(
+                        tile_study,
+                        tile_threshold,
+                        resample_freq.pandas_freq,
+                        dtype=np.float32,
+                        prefer_file_reopen=True,
+                    )
+                    prepared_inputs_cache[cache_key] = prepared_inputs
+            tile_result = compute_doy_percentile_bootstrap_union_exceedance_mask(
+                tile_study,
+                tile_threshold,
+                resample_freq.pandas_freq,
+                prepared_inputs=prepared_inputs,
+            )
         if tile_result is None:
             return None
         tile_results.append(tile_result)
         _profile_bootstrap_inc("bootstrap_optimized_tile_count")
-    if len(tile_results) == 1:
-        result = tile_results[0]
-    else:
-        result = xr.combine_by_coords(
-            [tile.to_dataset(name="__icclim_bootstrap_tile") for tile in tile_results],
-            combine_attrs="override",
-        )["__icclim_bootstrap_tile"]
-    result.attrs.update(tile_results[-1].attrs)
+    _profile_bootstrap_tile_controller(tiles, "optimized")
+    return _finalize_tiled_bootstrap_spell_mask(
+        _combine_bootstrap_tile_results(tile_results),
+        climate_var.studied_data,
+        optimized_start,
+    )
+
+
+def _finalize_tiled_bootstrap_spell_mask(
+    result: DataArray,
+    study: DataArray,
+    optimized_start: float,
+) -> DataArray:
     _profile_bootstrap_add(
         "bootstrap_optimized_total_seconds",
         perf_counter() - optimized_start,
     )
-    result = result.transpose(*climate_var.studied_data.dims)
+    result = result.transpose(*study.dims)
     if "percentiles" in result.dims:
         result = result.squeeze("percentiles")
-    if all(
-        climate_var.studied_data.sizes[dim] == 1
-        for dim in climate_var.studied_data.dims
-        if dim != "time"
-    ):
+    if all(study.sizes[dim] == 1 for dim in study.dims if dim != "time"):
         result = result.squeeze(drop=False)
     return result
 
@@ -2199,38 +2342,15 @@ def _compute_exact_tiled_bootstrap_spell_mask(
         resample_freq,
     )
     _profile_bootstrap_set("bootstrap_safe_max_tile_cells", max_cells)
-    tile_results: list[DataArray] = []
-    for tile_indexers in _iter_spatial_tiles(climate_var.studied_data, max_cells):
-        tile_start = perf_counter()
-        tile_study = climate_var.studied_data.isel(tile_indexers).load()
-        tile_climate_var = _slice_climate_var_for_tile(
-            climate_var,
-            tile_indexers,
-            tile_study=tile_study,
-        )
-        tile_exceedance_mask = _compute_exceedance_mask(
-            study=tile_climate_var.studied_data,
-            threshold=tile_climate_var.threshold,
-            freq=resample_freq.pandas_freq,
-            bootstrap=True,
-        )
-        if "percentiles" in tile_exceedance_mask.dims:
-            tile_exceedance_mask = tile_exceedance_mask.squeeze("percentiles")
-        tile_results.append(tile_exceedance_mask.load())
-        _profile_bootstrap_inc("bootstrap_safe_tile_count")
-        _profile_bootstrap_add(
-            "bootstrap_safe_tile_seconds",
-            perf_counter() - tile_start,
-        )
-
-    if len(tile_results) == 1:
-        result = tile_results[0]
-    else:
-        result = xr.combine_by_coords(
-            [tile.to_dataset(name="__icclim_bootstrap_tile") for tile in tile_results],
-            combine_attrs="override",
-        )["__icclim_bootstrap_tile"]
-    result.attrs.update(tile_results[-1].attrs)
+    tile_results = _bootstrap_tile_results(
+        climate_var.studied_data,
+        threshold,
+        max_cells,
+        "safe",
+        _exact_bootstrap_spell_mask_tile,
+        resample_freq.pandas_freq,
+    )
+    result = _combine_bootstrap_tile_results(tile_results)
     result = result.transpose(*climate_var.studied_data.dims)
     if all(
         climate_var.studied_data.sizes[dim] == 1
@@ -2248,15 +2368,9 @@ def _compute_exact_tiled_bootstrap_spell_mask(
 def _get_fast_bootstrap_max_cells(study: DataArray) -> int:
     if max_cells := os.environ.get("ICCLIM_BOOTSTRAP_FAST_TILE_CELLS"):
         return max(1, int(max_cells))
-    max_mem = _parse_byte_size(
-        os.environ.get(
-            "ICCLIM_BOOTSTRAP_FAST_TILE_MEMORY",
-            _DEFAULT_BOOTSTRAP_FAST_TILE_MEMORY,
-        )
-    )
-    itemsize = getattr(study.dtype, "itemsize", 8)
-    bytes_per_cell = max(1, study.sizes["time"]) * itemsize
-    bytes_per_cell *= _BOOTSTRAP_FAST_MEMORY_FACTOR
+    max_mem = _bootstrap_tile_memory("optimized")
+    bytes_per_cell, memory_model = _fast_bootstrap_bytes_per_cell(study)
+    _profile_bootstrap_note("bootstrap_optimized_memory_model", memory_model)
     _profile_bootstrap_set("bootstrap_optimized_tile_memory_bytes", max_mem)
     _profile_bootstrap_set(
         "bootstrap_optimized_estimated_bytes_per_cell",
@@ -2274,20 +2388,118 @@ def _get_safe_bootstrap_max_cells(
 ) -> int:
     if max_cells := os.environ.get("ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS"):
         return max(1, int(max_cells))
-    max_mem = _parse_byte_size(
-        os.environ.get(
+    max_mem = _bootstrap_tile_memory("safe")
+    bytes_per_cell, memory_model = _safe_bootstrap_bytes_per_cell(
+        study,
+        threshold,
+        resample_freq,
+    )
+    _profile_bootstrap_note("bootstrap_safe_memory_model", memory_model)
+    _profile_bootstrap_set("bootstrap_safe_tile_memory_bytes", max_mem)
+    _profile_bootstrap_set("bootstrap_safe_estimated_bytes_per_cell", bytes_per_cell)
+    return max(1, max_mem // bytes_per_cell)
+
+
+def _bootstrap_tile_memory(kind: str) -> int:
+    if kind == "optimized":
+        tile_memory = os.environ.get(
+            "ICCLIM_BOOTSTRAP_FAST_TILE_MEMORY",
+            _DEFAULT_BOOTSTRAP_FAST_TILE_MEMORY,
+        )
+    else:
+        tile_memory = os.environ.get(
             "ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY",
             _DEFAULT_BOOTSTRAP_SAFE_TILE_MEMORY,
         )
-    )
+    max_mem = parse_byte_size(tile_memory)
+    budget = active_memory_budget()
+    # A tile must fit in the memory budget of the whole computation.
+    if budget is not None and exceeds_memory_budget(
+        "bootstrap_tiles", max_mem, "tiled"
+    ):
+        return budget.limit
+    return max_mem
+
+
+def _fast_bootstrap_bytes_per_cell(study: DataArray) -> tuple[int, str]:
+    bytes_per_cell = get_learned_bytes_per_cell(memory_model_key("optimized", study))
+    if bytes_per_cell is not None:
+        return bytes_per_cell, "learned"
+    itemsize = getattr(study.dtype, "itemsize", 8)
+    bytes_per_cell = max(1, study.sizes["time"]) * itemsize
+    return bytes_per_cell * _BOOTSTRAP_FAST_MEMORY_FACTOR, "estimated"
+
+
+def _safe_bootstrap_bytes_per_cell(
+    study: DataArray,
+    threshold: PercentileThreshold,
+    resample_freq: Frequency,
+) -> tuple[int, str]:
+    bytes_per_cell = get_learned_bytes_per_cell(memory_model_key("safe", study))
+    if bytes_per_cell is not None:
+        return bytes_per_cell, "learned"
     bytes_per_cell = _estimate_bootstrap_working_bytes_per_cell(
         study,
         threshold,
         resample_freq,
     )
-    _profile_bootstrap_set("bootstrap_safe_tile_memory_bytes", max_mem)
-    _profile_bootstrap_set("bootstrap_safe_estimated_bytes_per_cell", bytes_per_cell)
-    return max(1, max_mem // bytes_per_cell)
+    return bytes_per_cell, "estimated"
+
+
+def estimate_reference_bootstrap_bytes(
+    study: DataArray,
+    threshold: PercentileThreshold,
+    resample_freq: Frequency,
+) -> int:
+    """Estimate the working memory of the reference bootstrap of ``study``."""
+    bytes_per_cell, _ = _safe_bootstrap_bytes_per_cell(study, threshold, resample_freq)
+    return bytes_per_cell * math.prod(
+        size for dim, size in study.sizes.items() if dim != "time"
+    )
+
+
+def estimate_bootstrap_tiles(
+    study: DataArray,
+    threshold: PercentileThreshold,
+    resample_freq: Frequency,
+    execution_kind: BootstrapExecutionKind,
+) -> BootstrapTileEstimate | None:
+    """
+    Plan the spatial tiles of the tiled bootstrap of ``study``, without running it.
+
+    Parameters
+    ----------
+    study : DataArray
+        The studied data.
+    threshold : PercentileThreshold
+        The day of year percentile threshold to bootstrap.
+    resample_freq : Frequency
+        The output frequency.
+    execution_kind : BootstrapExecutionKind
+        The bootstrap path, see ``classify_generic_indicator_bootstrap``.
+
+    Returns
+    -------
+    BootstrapTileEstimate | None
+        The tiles, or None when the path is not tiled.
+    """
+    if execution_kind == BootstrapExecutionKind.OPTIMIZED_BOOTSTRAP:
+        kind, env_prefix = "optimized", "ICCLIM_BOOTSTRAP_FAST"
+        max_cells = _get_fast_bootstrap_max_cells(study)
+        bytes_per_cell, memory_model = _fast_bootstrap_bytes_per_cell(study)
+    elif execution_kind == BootstrapExecutionKind.EXACT_TILED_BOOTSTRAP:
+        kind, env_prefix = "safe", "ICCLIM_BOOTSTRAP_SAFE"
+        max_cells = _get_safe_bootstrap_max_cells(study, threshold, resample_freq)
+        bytes_per_cell, memory_model = _safe_bootstrap_bytes_per_cell(
+            study,
+            threshold,
+            resample_freq,
+        )
+    else:
+        return None
+    if os.environ.get(f"{env_prefix}_TILE_CELLS"):
+        memory_model = "override"
+    return estimate_tiles(study, kind, max_cells, bytes_per_cell, memory_model)
 
 
 def _estimate_bootstrap_working_bytes_per_cell(
@@ -2316,25 +2528,6 @@ def _get_bootstrap_freq(freq: str) -> str:
     return bfreq
 
 
-def _parse_byte_size(value: str) -> int:
-    normalized = value.strip().lower().replace(" ", "")
-    units = {
-        "b": 1,
-        "kb": 1000,
-        "kib": 1024,
-        "mb": 1000**2,
-        "mib": 1024**2,
-        "gb": 1000**3,
-        "gib": 1024**3,
-    }
-    for unit, multiplier in sorted(
-        units.items(), key=lambda item: len(item[0]), reverse=True
-    ):
-        if normalized.endswith(unit):
-            return max(1, int(float(normalized.removesuffix(unit)) * multiplier))
-    return max(1, int(float(normalized)))
-
-
 def _iter_spatial_tiles(
     da: DataArray,
     max_cells: int,
@@ -2343,20 +2536,7 @@ def _iter_spatial_tiles(
     if not spatial_dims:
         return [{}]
 
-    tile_lengths = {dim: da.sizes[dim] for dim in spatial_dims}
-    product = 1
-    for dim in spatial_dims:
-        product *= tile_lengths[dim]
-    while product > max_cells:
-        dim = max(tile_lengths, key=tile_lengths.get)
-        old = tile_lengths[dim]
-        tile_lengths[dim] = max(1, old // 2)
-        product = 1
-        for value in tile_lengths.values():
-            product *= value
-        if tile_lengths[dim] == old:
-            break
-
+    tile_lengths = spatial_tile_lengths(da, max_cells)
     tiles: list[dict[str, slice]] = [{}]
     for dim in spatial_dims:
         dim_tiles = [
@@ -2369,6 +2549,203 @@ def _iter_spatial_tiles(
     return tiles
 
 
+def _bootstrap_tile_controller(
+    study: DataArray,
+    max_cells: int,
+    kind: str,
+) -> BootstrapTileController:
+    env_prefix = (
+        "ICCLIM_BOOTSTRAP_FAST" if kind == "optimized" else "ICCLIM_BOOTSTRAP_SAFE"
+    )
+    if os.environ.get(f"{env_prefix}_TILE_CELLS") or not adaptive_tiles_enabled():
+        return BootstrapTileController(study, max_cells)
+    return BootstrapTileController(
+        study,
+        max_cells,
+        memory_budget=_bootstrap_tile_memory(kind),
+        model_key=memory_model_key(kind, study),
+    )
+
+
+def _profile_bootstrap_tile_controller(
+    tiles: BootstrapTileController,
+    kind: str,
+) -> None:
+    if tiles.measured_peak_bytes is None or tiles.learned_bytes_per_cell is None:
+        return
+    _profile_bootstrap_set(
+        f"bootstrap_{kind}_measured_tile_peak_bytes",
+        tiles.measured_peak_bytes,
+    )
+    _profile_bootstrap_set(
+        f"bootstrap_{kind}_learned_bytes_per_cell",
+        tiles.learned_bytes_per_cell,
+    )
+    _profile_bootstrap_set(f"bootstrap_{kind}_adapted_max_tile_cells", tiles.max_cells)
+
+
+def _bootstrap_tile_results(
+    study: DataArray,
+    threshold: PercentileThreshold,
+    max_cells: int,
+    kind: str,
+    tile_fn: Callable[..., DataArray | None],
+    *tile_args: object,
+) -> list[DataArray] | None:
+    if lazy_bootstrap_tiles_enabled(study):
+        return _lazy_bootstrap_tile_results(
+            study,
+            threshold,
+            max_cells,
+            kind,
+            tile_fn,
+            *tile_args,
+        )
+    if (executor := get_bootstrap_tile_executor()) is not None:
+        return _distributed_bootstrap_tile_results(
+            executor,
+            study,
+            threshold,
+            max_cells,
+            kind,
+            tile_fn,
+            *tile_args,
+        )
+    _profile_bootstrap_note("bootstrap_tile_executor", "local")
+    tile_results: list[DataArray] = []
+    tiles = _bootstrap_tile_controller(study, max_cells, kind)
+    progress = TileProgress(study, f"{kind} bootstrap")
+    for tile_indexers in tiles:
+        tile_start = perf_counter()
+        with (
+            progress.tile(tile_indexers),
+            tiles.measure(tile_indexers),
+            memory_stage("bootstrap_tiles"),
+        ):
+            tile_result = tile_fn(
+                study.isel(tile_indexers),
+                _slice_threshold_for_tile(threshold, tile_indexers),
+                *tile_args,
+            )
+            if tile_result is None:
+                return None
+            tile_results.append(tile_result.load())
+        _profile_bootstrap_inc(f"bootstrap_{kind}_tile_count")
+        _profile_bootstrap_add(
+            f"bootstrap_{kind}_tile_seconds",
+            perf_counter() - tile_start,
+        )
+    _profile_bootstrap_tile_controller(tiles, kind)
+    return tile_results
+
+
+def _lazy_bootstrap_tile_results(
+    study: DataArray,
+    threshold: PercentileThreshold,
+    max_cells: int,
+    kind: str,
+    tile_fn: Callable[..., DataArray | None],
+    *tile_args: object,
+) -> list[DataArray] | None:
+    _profile_bootstrap_note("bootstrap_tile_executor", "lazy")
+    result = map_bootstrap_blocks(
+        study,
+        threshold,
+        spatial_tile_lengths(study, max_cells),
+        _slice_threshold_for_tile,
+        tile_fn,
+        *tile_args,
+    )
+    if result is None:
+        return None
+    _profile_bootstrap_set(f"bootstrap_{kind}_tile_count", result.data.npartitions)
+    return [result]
+
+
+def _distributed_bootstrap_tile_results(
+    executor: DistributedTileExecutor,
+    study: DataArray,
+    threshold: PercentileThreshold,
+    max_cells: int,
+    kind: str,
+    tile_fn: Callable[..., DataArray | None],
+    *tile_args: object,
+) -> list[DataArray] | None:
+    _profile_bootstrap_note("bootstrap_tile_executor", "distributed")
+    distributed_start = perf_counter()
+    for tile_indexers in _iter_spatial_tiles(study, max_cells):
+        executor.submit(
+            tile_fn,
+            study.isel(tile_indexers),
+            _slice_threshold_for_tile(threshold, tile_indexers),
+            *tile_args,
+        )
+        _profile_bootstrap_inc(f"bootstrap_{kind}_tile_count")
+    tile_results = executor.gather()
+    _profile_bootstrap_add(
+        f"bootstrap_{kind}_distributed_seconds",
+        perf_counter() - distributed_start,
+    )
+    report_progress(
+        "bootstrap_tiles",
+        len(tile_results),
+        len(tile_results),
+        label=f"{kind} bootstrap",
+    )
+    if any(tile_result is None for tile_result in tile_results):
+        return None
+    return tile_results
+
+
+def _safe_bootstrap_count_tile(
+    tile_study: DataArray,
+    tile_threshold: PercentileThreshold,
+    freq: str,
+) -> DataArray:
+    tile_exceedance_mask = _compute_exceedance_mask(
+        tile_study,
+        tile_threshold,
+        freq=freq,
+        bootstrap=True,
+    )
+    tile_result = tile_exceedance_mask.resample(time=freq).sum(dim="time")
+    if "percentiles" in tile_result.dims:
+        tile_result = tile_result.squeeze("percentiles")
+    return tile_result
+
+
+def _exact_bootstrap_spell_mask_tile(
+    tile_study: DataArray,
+    tile_threshold: PercentileThreshold,
+    freq: str,
+) -> DataArray:
+    tile_study = tile_study.load()
+    if not tile_threshold.is_ready:
+        prepare_unit = getattr(tile_threshold, "_prepare_output_unit", None)
+        tile_threshold.set_prepare_context(tile_study, prepare_unit)
+    tile_exceedance_mask = _compute_exceedance_mask(
+        study=tile_study,
+        threshold=tile_threshold,
+        freq=freq,
+        bootstrap=True,
+    )
+    if "percentiles" in tile_exceedance_mask.dims:
+        tile_exceedance_mask = tile_exceedance_mask.squeeze("percentiles")
+    return tile_exceedance_mask
+
+
+def _combine_bootstrap_tile_results(tile_results: list[DataArray]) -> DataArray:
+    if len(tile_results) == 1:
+        result = tile_results[0]
+    else:
+        result = xr.combine_by_coords(
+            [tile.to_dataset(name="__icclim_bootstrap_tile") for tile in tile_results],
+            combine_attrs="override",
+        )["__icclim_bootstrap_tile"]
+    result.attrs.update(tile_results[-1].attrs)
+    return result
+
+
 def _slice_threshold_for_tile(
     threshold: PercentileThreshold,
     tile_indexers: dict[str, slice],
@@ -2392,36 +2769,6 @@ def _slice_threshold_for_tile(
     return sliced
 
 
-def _slice_climate_var_for_tile(
-    climate_var: ClimateVariable,
-    tile_indexers: dict[str, slice],
-    *,
-    tile_study: DataArray | None = None,
-) -> ClimateVariable:
-    if tile_study is None:
-        tile_study = climate_var.studied_data.isel(tile_indexers)
-    threshold = climate_var.threshold
-    if threshold is None:
-        sliced_threshold = None
-    else:
-        from icclim._core.generic.threshold.percentile import (  # noqa: PLC0415
-            PercentileThreshold,
-        )
-
-        if not isinstance(threshold, PercentileThreshold):
-            msg = "Exact tiled spell bootstrap currently supports one percentile threshold"
-            raise NotImplementedError(msg)
-        sliced_threshold = _slice_threshold_for_tile(threshold, tile_indexers)
-        if not sliced_threshold.is_ready:
-            prepare_unit = getattr(sliced_threshold, "_prepare_output_unit", None)
-            sliced_threshold.set_prepare_context(tile_study, prepare_unit)
-    return replace(
-        climate_var,
-        studied_data=tile_study,
-        threshold=sliced_threshold,
-    )
-
-
 def _transpose_like_study(result: DataArray, study: DataArray) -> DataArray:
     ordered_dims = tuple(dim for dim in study.dims if dim in result.dims)
     return result.transpose(*ordered_dims)
@@ -2509,7 +2856,7 @@ def _run_rolling_reducer(
     climate_vars: list[ClimateVariable],
     resample_freq: Frequency,
     rolling_window_width: int,
-    rolling_op: Callable[[DataArrayRolling], DataArray],  # sum | mean
+    rolling_op: Literal["sum", "mean"],
     resampled_op: Callable[[DataArrayResample], DataArray],  # max | min
     date_event: bool,
     source_freq_delta: timedelta,
@@ -2523,16 +2870,38 @@ def _run_rolling_reducer(
             bootstrap=must_run_bootstrap(study, threshold, climate_vars[0].bootstrap),
         ).squeeze()
         study = study.where(exceedance_mask)
-    study = rolling_op(study.rolling(time=rolling_window_width))
-    resampled = study.resample(time=resample_freq.pandas_freq)
+    how = _RESAMPLE_REDUCTIONS.get(resampled_op)
+    if (
+        how in ("max", "min")
+        and resample_backend_enabled()
+        and np.issubdtype(study.dtype, np.number)
+    ):
+        from icclim._core.generic.rolling import (  # noqa: PLC0415
+            rolling_extremum_available,
+            rolling_window_extremum,
+        )
+
+        groups = resample_freq.resample_groups(study)
+        if groups is not None and rolling_extremum_available():
+            return rolling_window_extremum(
+                study,
+                groups,
+                rolling_window_width,
+                rolling_op,
+                how,
+                date_event=date_event,
+            )
+    study = getattr(study.rolling(time=rolling_window_width), rolling_op)()
     if date_event:
         return _reduce_with_date_event(
-            resampled=resampled,
+            resampled=study.resample(time=resample_freq.pandas_freq),
             reducer=resampled_op,
             window=rolling_window_width,
             source_delta=source_freq_delta,
         )
-    return resampled_op(resampled)
+    if how is None:
+        return resampled_op(study.resample(time=resample_freq.pandas_freq))
+    return resample_freq.reduce(study, how)
 
 
 def _run_simple_reducer(
@@ -2578,27 +2947,114 @@ def _run_simple_reducer(
         filtered_study = study.where(exceedance_mask)
     else:
         filtered_study = study
+    amount_scale: float | None = 1.0
     if must_convert_rate and _is_rate(filtered_study):
         from xclim.core.units import rate2amount  # noqa: PLC0415
 
         src_freq = check_freq(filtered_study, dim="time", strict=False)
         if src_freq == "D":
             filtered_study = _rate_to_amount_for_daily_subseries(filtered_study)
+            amount_scale = _daily_rate_to_amount_scale(study)
         else:
             if src_freq is not None:
                 filtered_study = filtered_study.resample(time=src_freq).asfreq()
             filtered_study = rate2amount(filtered_study)
+            amount_scale = None
     if date_event:
         return _reduce_with_date_event(
             resampled=filtered_study.resample(time=resample_freq.pandas_freq),
             reducer=reducer_op,
         )
-    return reducer_op(
-        filtered_study.resample(time=resample_freq.pandas_freq),
-        dim="time",
+    how = _RESAMPLE_REDUCTIONS.get(reducer_op)
+    if how is None:
+        return reducer_op(
+            filtered_study.resample(time=resample_freq.pandas_freq),
+            dim="time",
+        )
+    result = resample_freq.reduce(filtered_study, how)
+    if amount_scale is None:
+        return result
+    return _fused_resample_statistic(
+        result,
+        study,
+        resample_freq,
+        how,
+        threshold,
+        scale=amount_scale,
     )
 
 
+def _count_exceedances(
+    exceedance_mask: DataArray,
+    climate_vars: list[ClimateVariable],
+    resample_freq: Frequency,
+) -> DataArray:
+    result = resample_freq.reduce(exceedance_mask, "sum")
+    if len(climate_vars) != 1:
+        return result
+    return _fused_resample_statistic(
+        result,
+        climate_vars[0].studied_data,
+        resample_freq,
+        "count",
+        climate_vars[0].threshold,
+    )
+
+
+def _fused_resample_statistic(
+    result: DataArray,
+    study: DataArray,
+    resample_freq: Frequency,
+    how: str,
+    threshold: Threshold | None,
+    scale: float = 1.0,
+) -> DataArray:
+    """Compute ``result`` in the shared chunk pass of ``fused_reductions()``."""
+    if get_active_fused_reducer() is None:
+        return result
+    operand = threshold_value = None
+    if threshold is not None:
+        scalar_threshold = _get_scalar_basic_threshold(threshold)
+        if scalar_threshold is None:
+            return result
+        operand, threshold_value = scalar_threshold
+    return fused_statistic(
+        result,
+        study,
+        resample_freq.resample_groups(study),
+        resample_freq.pandas_freq,
+        FusedStatistic(how, operand, threshold_value, scale),
+    )
+
+
+def _get_scalar_basic_threshold(
+    threshold: Threshold,
+) -> tuple[str, float] | None:
+    from icclim._core.generic.threshold.basic import BasicThreshold  # noqa: PLC0415
+
+    if type(threshold) is not BasicThreshold:
+        return None
+    value = threshold.value
+    if not isinstance(value, DataArray) or value.size != 1:
+        return None
+    op = (
+        threshold.operator
+        if isinstance(threshold.operator, Operator)
+        else OperatorRegistry.lookup(threshold.operator)
+    )
+    return op.operand, float(value.to_numpy().item())
+
+
+def _daily_rate_to_amount_scale(study: DataArray) -> float:
+    probe = xr.DataArray(
+        np.ones(3),
+        dims=["time"],
+        coords={"time": study.time.to_numpy()[:3]},
+        attrs=dict(study.attrs),
+    )
+    return float(_rate_to_amount_for_daily_subseries(probe).to_numpy()[0])
+
+
 def get_single_var(
     climate_vars: list[ClimateVariable],
 ) -> tuple[DataArray, Threshold | None]:
@@ -2654,19 +3110,27 @@ def _compute_combined_exceedance_mask(
     logical_link: LogicalLink,
 ) -> DataArray:
     exceedance_masks = []
-    for climate_var in climate_vars:
-        if climate_var.threshold is None:
-            msg = "No threshold found"
-            raise InvalidIcclimArgumentError(msg)
-        exceedance_masks.append(
-            _compute_threshold_exceedance_mask(
+    with memory_stage("combined_exceedance_mask"):
+        for climate_var in climate_vars:
+            if climate_var.threshold is None:
+                msg = "No threshold found"
+                raise InvalidIcclimArgumentError(msg)
+            mask = _compute_threshold_exceedance_mask(
                 climate_var=climate_var,
                 threshold=climate_var.threshold,
                 resample_freq=resample_freq,
                 prepared_inputs_cache={},
             ).squeeze()
-        )
-    return logical_link(exceedance_masks)
+            # The masks are all alive until they are linked, keep them as
+            # booleans rather than as float masks of the bootstrap.
+            if mask.dtype != bool and exceeds_memory_budget(
+                "combined_exceedance_mask",
+                mask.nbytes * len(climate_vars),
+                "compacted",
+            ):
+                mask = mask.fillna(False).astype(bool)
+            exceedance_masks.append(mask)
+        return logical_link(exceedance_masks)
 
 
 def _compute_threshold_exceedance_mask(
@@ -2792,29 +3256,33 @@ def _reduce_with_date_event(
     else:
         msg = f"Can't compute `date_event` due to unknown reducer: '{reducer}'"
         raise NotImplementedError(msg)
-    for label, sample in resampled:
-        reduced_result = sample.isel(time=group_reducer(sample, dim="time"))
-        if window is not None:
-            result = _add_date_coords(
-                original_sample=sample,
-                result=sample.sum(dim="time"),
-                start_time=reduced_result.time,
-                end_time=(
-                    reduced_result.time + window * source_delta
-                    if window is not None and source_delta is not None
-                    else reduced_result.time
-                ),
-                label=label,
-            )
-        else:
-            result = _add_date_coords(
-                original_sample=sample,
-                result=sample.sum(dim="time"),
-                event_date=reduced_result.time,
-                label=label,
+    with memory_stage("date_event_reduce"):
+        for label, sample in resampled:
+            reduced_result = sample.isel(
+                time=group_reducer(sample, dim="time").compute()
             )
-        acc.append(result)
-    return xr.concat(acc, "time")
+            if window is not None:
+                # Rolling windows are labelled by their last time step.
+                result = _add_date_coords(
+                    original_sample=sample,
+                    result=reduced_result.drop_vars("time"),
+                    start_time=(
+                        reduced_result.time - (window - 1) * source_delta
+                        if source_delta is not None
+                        else reduced_result.time
+                    ),
+                    end_time=reduced_result.time,
+                    label=label,
+                )
+            else:
+                result = _add_date_coords(
+                    original_sample=sample,
+                    result=sample.sum(dim="time"),
+                    event_date=reduced_result.time,
+                    label=label,
+                )
+            acc.append(result)
+        return xr.concat(acc, "time")
 
 
 def _count_occurrences_with_date(resampled: DataArrayResample) -> DataArray:
@@ -0,0 +1,306 @@
+"""Fused multi-statistic reduction for indices sharing the same input.
+
+Many standard indices reduce the same variable over the same resampling
+groups: TX, TXx and TXn all read ``tasmax`` by year, and PRCPTOT, SDII, RR1,
+R10mm and R20mm all read ``pr``. Inside ``fused_reductions()``, every plain
+resampling statistic requested on a dask-backed input is registered on one
+``FusedReductionStage`` for that input and frequency. The stage is a single
+``map_blocks`` layer which, for each chunk, builds every threshold mask once
+and computes every registered statistic from it. Each index result then only
+selects its own statistic from the stage blocks, so computing all the results
+together reads and scans each input chunk once.
+
+Statistics are registered while the indices are being built and computed
+later, so a stage computes every statistic requested on its input, whichever
+result triggers the computation. A stage is frozen when its scope ends, or as
+soon as its blocks are computed, pickled or tokenized: a statistic requested
+after that starts a new stage, so a graph always computes the statistics it
+was built with.
+
+The active reducer is held in a context variable, so that concurrent scopes
+never share their stages.
+"""
+
+from __future__ import annotations
+
+import operator
+import threading
+import uuid
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from icclim._core.resampling import _group_aligned_blocks, _segmented_reduce
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    from xarray import DataArray
+
+    from icclim._core.resampling import ResampleGroups, ResampleReduction
+
+_FUSED_OPERATORS: dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+}
+_ACTIVE_FUSED_REDUCER: ContextVar[FusedReducer | None] = ContextVar(
+    "icclim_fused_reducer",
+    default=None,
+)
+
+
+@dataclass(frozen=True)
+class FusedStatistic:
+    """
+    One segmented statistic computed by a fused stage.
+
+    Parameters
+    ----------
+    how : str
+        The reduction, one of {"sum", "mean", "max", "min", "std", "count"}.
+    operand : str | None
+        The comparison operand of the threshold filtering the values, if any.
+    threshold : float | None
+        The threshold value, in the units of the input.
+    scale : float
+        A factor applied to the values after thresholding, such as a rate to
+        amount conversion factor.
+    """
+
+    how: ResampleReduction
+    operand: str | None = None
+    threshold: float | None = None
+    scale: float = 1.0
+
+
+class FusedReductionStage:
+    """
+    Compute every statistic registered on one input in a single chunk pass.
+
+    Parameters
+    ----------
+    data : dask.array.Array
+        The input data.
+    groups : ResampleGroups
+        The resampling groups of the input time axis.
+    axis : int
+        The position of the time axis.
+    """
+
+    def __init__(self, data: object, groups: ResampleGroups, axis: int) -> None:
+        self.axis = axis
+        self._statistics: dict[FusedStatistic, np.dtype] = {}
+        self._frozen = False
+        self._lock = threading.Lock()
+        self.block_lengths = _group_aligned_blocks(
+            groups.lengths,
+            max(data.chunks[axis]),
+        )
+        time_chunks = tuple(int(lengths.sum()) for lengths in self.block_lengths)
+        if data.chunks[axis] != time_chunks:
+            data = data.rechunk({axis: time_chunks})
+        out_chunks = list(data.chunks)
+        out_chunks[axis] = tuple(len(lengths) for lengths in self.block_lengths)
+        self.out_chunks = tuple(out_chunks)
+        self.blocks = data.map_blocks(
+            self,
+            dtype=object,
+            chunks=self.out_chunks,
+            meta=np.empty((0,) * data.ndim, dtype=object),
+            # Stages of different scopes register different statistics, so
+            # their keys must never collide when their results are merged.
+            name=f"icclim-fused-reduction-{uuid.uuid4().hex}",
+        )
+
+    @property
+    def statistics(self) -> Mapping[FusedStatistic, np.dtype]:
+        """The registered statistics and the dtype of their result."""
+        return MappingProxyType(self._statistics)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether statistics can no longer be registered."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Stop accepting statistics, the blocks compute the registered ones."""
+        with self._lock:
+            self._frozen = True
+
+    def register(self, statistic: FusedStatistic, dtype: np.dtype) -> object | None:
+        """Register ``statistic`` and return its lazy result, None once frozen."""
+        with self._lock:
+            if self._frozen:
+                return None
+            self._statistics[statistic] = np.dtype(dtype)
+        return self.blocks.map_blocks(
+            _select_statistic,
+            statistic,
+            dtype=dtype,
+            chunks=self.out_chunks,
+            meta=np.empty((0,) * self.blocks.ndim, dtype=dtype),
+        )
+
+    def __call__(
+        self,
+        block: np.ndarray,
+        block_info: dict,
+    ) -> dict[FusedStatistic, np.ndarray]:
+        """Compute every registered statistic of one chunk."""
+        self.freeze()
+        lengths = self.block_lengths[block_info[0]["chunk-location"][self.axis]]
+        filtered_blocks: dict[tuple[str | None, float | None, float], np.ndarray] = {}
+        results = {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            for statistic, dtype in self._statistics.items():
+                filter_key = (statistic.operand, statistic.threshold, statistic.scale)
+                values = filtered_blocks.get(filter_key)
+                if values is None:
+                    values = _filter_block(block, statistic)
+                    filtered_blocks[filter_key] = values
+                results[statistic] = _segmented_reduce(
+                    values,
+                    lengths,
+                    statistic.how,
+                    self.axis,
+                    dtype,
+                )
+        return results
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Freeze the stage before it is sent to another process."""
+        self.freeze()
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled stage."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __dask_tokenize__(self) -> tuple:
+        """Freeze the stage, its token covers the statistics it computes."""
+        self.freeze()
+        return (self.blocks.name, tuple(self._statistics))
+
+
+class FusedReducer:
+    """The fused stages of one ``fused_reductions()`` scope, one per input."""
+
+    def __init__(self) -> None:
+        self.stages: dict[tuple, FusedReductionStage] = {}
+
+    def register(
+        self,
+        data: object,
+        groups: ResampleGroups,
+        axis: int,
+        freq: str,
+        statistic: FusedStatistic,
+        dtype: np.dtype,
+    ) -> object:
+        """
+        Register ``statistic`` on the stage of ``data`` at ``freq``.
+
+        A new stage is created when there is none yet, or when the current one
+        is frozen. The lazy result of the statistic is returned.
+        """
+        key = (data.name, freq, axis)
+        stage = self.stages.get(key)
+        result = None if stage is None else stage.register(statistic, dtype)
+        if result is None:
+            stage = FusedReductionStage(data, groups, axis)
+            self.stages[key] = stage
+            result = stage.register(statistic, dtype)
+        return result
+
+    def freeze(self) -> None:
+        """Freeze every stage of the scope."""
+        for stage in self.stages.values():
+            stage.freeze()
+
+
+@contextmanager
+def fused_reductions() -> Iterator[FusedReducer]:
+    """Share one chunk pass between the statistics requested in this scope."""
+    active = _ACTIVE_FUSED_REDUCER.get()
+    if active is not None:
+        yield active
+        return
+    reducer = FusedReducer()
+    token = _ACTIVE_FUSED_REDUCER.set(reducer)
+    try:
+        yield reducer
+    finally:
+        _ACTIVE_FUSED_REDUCER.reset(token)
+        reducer.freeze()
+
+
+def get_active_fused_reducer() -> FusedReducer | None:
+    """Return the reducer of the enclosing ``fused_reductions()`` scope."""
+    return _ACTIVE_FUSED_REDUCER.get()
+
+
+def fused_statistic(
+    result: DataArray,
+    study: DataArray,
+    groups: ResampleGroups | None,
+    freq: str,
+    statistic: FusedStatistic,
+) -> DataArray:
+    """
+    Replace the data of a lazy ``result`` by the fused computation of ``statistic``.
+
+    ``result`` must be the plain resampling of ``study`` filtered by the
+    statistic threshold. Its metadata is kept and only its values are computed
+    by the fused stage of ``study``. ``result`` is returned as is when no
+    ``fused_reductions()`` scope is active or when the inputs are not lazy.
+    """
+    reducer = get_active_fused_reducer()
+    if (
+        reducer is None
+        or groups is None
+        or not hasattr(study.data, "chunks")
+        or not hasattr(result.data, "chunks")
+        or (statistic.operand is not None and statistic.operand not in _FUSED_OPERATORS)
+        or result.dims != study.dims
+        or result.sizes["time"] != len(groups)
+    ):
+        return result
+    return result.copy(
+        data=reducer.register(
+            study.data,
+            groups,
+            study.get_axis_num("time"),
+            freq,
+            statistic,
+            result.dtype,
+        ),
+    )
+
+
+def _filter_block(block: np.ndarray, statistic: FusedStatistic) -> np.ndarray:
+    values = block
+    if statistic.operand is not None:
+        mask = _FUSED_OPERATORS[statistic.operand](block, statistic.threshold)
+        values = np.where(mask, block, np.nan)
+    if statistic.scale != 1.0:
+        values = values * statistic.scale
+    return values
+
+
+def _select_statistic(
+    blocks: dict[FusedStatistic, np.ndarray],
+    statistic: FusedStatistic,
+) -> np.ndarray:
+    return blocks[statistic]
@@ -11,7 +11,6 @@ from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import xarray as xr
-from jinja2 import Environment
 from pint.errors import DimensionalityError, UndefinedUnitError
 from xarray import DataArray
 
@@ -20,7 +19,9 @@ from icclim._core.climate_variable import must_run_bootstrap
 from icclim._core.constants import MIN_LEN_FOR_FREQ_INFERENCE, RESAMPLE_METHOD
 from icclim._core.generic.functions import check_freq
 from icclim._core.generic.generic_templates import INDICATORS_TEMPLATES_EN
+from icclim._core.generic.templating import jinja_env, render_template
 from icclim._core.model.indicator import Indicator
+from icclim._core.profiling import profile_path, profile_phase
 from icclim.exception import InvalidIcclimArgumentError
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,7 @@ if TYPE_CHECKING:
 
     from icclim._core.climate_variable import ClimateVariable
     from icclim._core.model.index_config import IndexConfig
+    from icclim._core.resample_plan import ResamplePlan
     from icclim.frequency import Frequency
 
 
@@ -65,9 +67,6 @@ def _get_ureg() -> Any:  # noqa: ANN401
     return ureg
 
 
-jinja_env = Environment(autoescape=True)
-
-
 class GenericIndicator(Indicator):
     """
     GenericIndicator are climate indicators wich are not specific to a particular domain.
@@ -251,7 +250,8 @@ class GenericIndicator(Indicator):
             _apply_seasonal_mask(climate_vars, output_frequency.seasonal_bounds)
         _check_data(climate_vars, src_freq.pandas_freq)
         _check_cf(climate_vars)
-        self._format_template(jinja_scope=jinja_scope)
+        with profile_phase("metadata_templating"):
+            self._format_template(jinja_scope=jinja_scope)
         return climate_vars
 
     def _apply_transforms(
@@ -369,8 +369,8 @@ class GenericIndicator(Indicator):
         if self.missing != "skip" and indexer is not None:
             # reference variable is a subset of the studied variable,
             # so no need to check it.
-            it = filter(lambda cv: not cv.is_reference, climate_vars)
-            das = [cv.studied_data for cv in it]
+            studied_vars = [cv for cv in climate_vars if not cv.is_reference]
+            das = [cv.studied_data for cv in studied_vars]
             if "time" in result.dims:
                 # If src_freq cannot be inferred by xclim, fall back to universal check_freq
                 if src_freq is None:
@@ -386,6 +386,7 @@ class GenericIndicator(Indicator):
                     src_freq=src_freq,
                     indexer=indexer,
                     allow_partial_seasons=allow_partial_seasons,
+                    plans=[cv.resample_plan(output_freq) for cv in studied_vars],
                 )
 
         for prop in self.templated_properties:
@@ -420,12 +421,13 @@ class GenericIndicator(Indicator):
             "output_freq": config.frequency,
             "source_freq": src_freq,
         }
-        climate_vars_meta = _get_climate_vars_metadata(
-            config.climate_variables,
-            src_freq,
-            base_jinja_scope,
-            jinja_env,
-        )
+        with profile_phase("metadata_templating"):
+            climate_vars_meta = _get_climate_vars_metadata(
+                config.climate_variables,
+                src_freq,
+                base_jinja_scope,
+                jinja_env,
+            )
         jinja_scope: dict[str, Any] = {
             "min_spell_length": config.min_spell_length,
             "rolling_window_width": config.rolling_window_width,
@@ -457,15 +459,16 @@ class GenericIndicator(Indicator):
             sampling_method=config.sampling_method,
             run_index=config.run_index,
         )
-        return self.postprocess(
-            result,
-            climate_vars=climate_vars,
-            output_freq=config.frequency.pandas_freq,
-            src_freq=src_freq.pandas_freq,
-            indexer=config.frequency.indexer,
-            out_unit=config.out_unit,
-            allow_partial_seasons=config.allow_partial_seasons,
-        )
+        with profile_phase("postprocess"):
+            return self.postprocess(
+                result,
+                climate_vars=climate_vars,
+                output_freq=config.frequency.pandas_freq,
+                src_freq=src_freq.pandas_freq,
+                indexer=config.frequency.indexer,
+                out_unit=config.out_unit,
+                allow_partial_seasons=config.allow_partial_seasons,
+            )
 
     def __eq__(self, other: object) -> bool:
         """
@@ -522,11 +525,11 @@ class GenericIndicator(Indicator):
 
     def _format_template(self, jinja_scope: dict) -> None:
         for templated_property in self.templated_properties:
-            template = jinja_env.from_string(
-                getattr(self, templated_property),
-                globals=jinja_scope,
+            setattr(
+                self,
+                templated_property,
+                render_template(getattr(self, templated_property), jinja_scope),
             )
-            setattr(self, templated_property, template.render())
 
     def _handle_missing_values(
         self,
@@ -536,6 +539,7 @@ class GenericIndicator(Indicator):
         src_freq: str | None = None,
         indexer: dict[Any, Any] | None = None,
         allow_partial_seasons: bool | Literal["start", "end"] = False,
+        plans: Sequence[ResamplePlan] | None = None,
     ) -> DataArray:
         """
         Handle missing values in climate index computations.
@@ -552,21 +556,41 @@ class GenericIndicator(Indicator):
             Source timestep frequency (e.g. "D").
         indexer : dict, optional
             Extra arguments used by some missing value methods.
+        plans : list[ResamplePlan], optional
+            The resampling plans of ``in_data`` at ``resample_freq``. When
+            given, the masks of the methods counting valid values are derived
+            from their cached valid counts.
         """
         from xclim.core.missing import MISSING_METHODS  # noqa: PLC0415
 
         missing_class = MISSING_METHODS[self.missing]
-
-        # We flag periods according to the missing method. Skip variables without a time coordinate.
-        miss = (
-            self._compute_missing_mask(
+        in_data = in_data if isinstance(in_data, Sequence) else [in_data]
+        if plans is None:
+            plans = [None] * len(in_data)
+        try:
+            missing_obj = missing_class(**(self.missing_options or {}))
+        except TypeError:
+            missing_obj = None
+
+        def _missing_mask(da: DataArray, plan: ResamplePlan | None) -> DataArray:
+            if plan is not None and missing_obj is not None:
+                mask = plan.missing_mask(missing_obj, src_freq, indexer)
+                if mask is not None:
+                    profile_path("missing_values", "valid_counts")
+                    return mask
+            profile_path("missing_values", "xclim")
+            return self._compute_missing_mask(
                 missing_class,
                 da,
                 resample_freq,
                 src_freq,
                 indexer or {},
             )
-            for da in (in_data if isinstance(in_data, Sequence) else [in_data])
+
+        # We flag periods according to the missing method. Skip variables without a time coordinate.
+        miss = (
+            _missing_mask(da, plan)
+            for da, plan in zip(in_data, plans, strict=True)
             if "time" in da.coords
         )
 
@@ -0,0 +1,51 @@
+"""Start numba's parallel thread pool from the main thread.
+
+The compiled kernels of icclim are ``parallel=True`` and, on dask inputs,
+are called from the dask worker threads. When the first parallel kernel of a
+process is launched from such a thread, the TBB threading layer ties its pool
+to that thread and the interpreter then hangs at exit. Launching a trivial
+parallel kernel once from the main thread, while the dask graph is built,
+avoids it.
+"""
+
+# ruff: noqa: ANN001, ANN202
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except Exception:  # noqa: BLE001
+    njit = None
+    prange = range
+
+_STARTED = False
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _parallel_probe(values):
+        for i in prange(len(values)):
+            values[i] = i
+
+else:
+
+    def _parallel_probe(*args, **kwargs):  # noqa: ARG001
+        return None
+
+
+def start_numba_threads() -> None:
+    """Launch numba's thread pool from the main thread, once per process."""
+    global _STARTED  # noqa: PLW0603
+    if (
+        _STARTED
+        or njit is None
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        return
+    _parallel_probe(np.zeros(2))
+    _STARTED = True
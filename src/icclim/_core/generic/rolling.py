@@ -0,0 +1,264 @@
+"""Single-pass extremum of rolling sums and means per resampling period.
+
+``max_of_rolling_sum`` and its siblings used to build the full rolling sum
+with ``DataArray.rolling`` before resampling it. On dask inputs that creates
+overlapping-chunk graphs and a full-size intermediate array. This module
+instead runs one compiled pass per cell: a running window sum with a count of
+missing values slides along the time axis, and the extremum of every complete
+window is kept per resampling period, together with the position of the last
+time step of that window.
+
+Dask inputs are rechunked so that no period straddles two time chunks, then
+each chunk is given a halo of ``window - 1`` time steps from the previous
+chunk, so windows crossing a chunk boundary are complete. Only one value and
+one position per period are produced for each chunk, which keeps the
+computation lazy and its memory footprint flat.
+
+As with ``rolling(time=window)``, a window containing a missing value has no
+value and each window is labelled by its last time step. The kernel needs
+numba; without it the callers keep the xarray implementation.
+"""
+
+# ruff: noqa: ANN001, ANN202
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import xarray as xr
+
+from icclim._core.generic.numba_threads import start_numba_threads
+from icclim._core.resampling import _group_aligned_blocks
+
+if TYPE_CHECKING:
+    from xarray import DataArray
+
+    from icclim._core.resampling import ResampleGroups
+
+RollingReduction = Literal["sum", "mean"]
+RollingExtremum = Literal["max", "min"]
+
+try:
+    from numba import njit, prange
+except Exception:  # noqa: BLE001
+    njit = None
+    prange = range
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _rolling_extremum_kernel(values, group_lengths, halo, window, is_max):
+        """Find the extremum of the complete window sums of each group."""
+        n_time, n_cells = values.shape
+        n_groups = len(group_lengths)
+        out = np.full((n_groups, n_cells), np.nan)
+        out_end = np.full((n_groups, n_cells), -1, dtype=np.int64)
+        for cell in prange(n_cells):
+            running = 0.0
+            missing = 0
+            group = 0
+            group_end = halo + group_lengths[0] if n_groups > 0 else n_time
+            for i in range(n_time):
+                value = values[i, cell]
+                if np.isnan(value):
+                    missing += 1
+                else:
+                    running += value
+                if i >= window:
+                    dropped = values[i - window, cell]
+                    if np.isnan(dropped):
+                        missing -= 1
+                    else:
+                        running -= dropped
+                if i < halo:
+                    continue
+                while i >= group_end:
+                    group += 1
+                    group_end += group_lengths[group]
+                if i < window - 1 or missing > 0:
+                    continue
+                if (
+                    out_end[group, cell] < 0
+                    or (is_max and running > out[group, cell])
+                    or (not is_max and running < out[group, cell])
+                ):
+                    out[group, cell] = running
+                    out_end[group, cell] = i - halo
+        return out, out_end
+
+else:
+
+    def _rolling_extremum_kernel(*args, **kwargs):  # noqa: ARG001
+        return None
+
+
+def rolling_extremum_available() -> bool:
+    """Return whether the compiled rolling kernel can be used."""
+    return njit is not None
+
+
+def rolling_window_extremum(
+    study: DataArray,
+    groups: ResampleGroups,
+    window: int,
+    rolling_op: RollingReduction,
+    extremum: RollingExtremum,
+    date_event: bool = False,
+) -> DataArray:
+    """
+    Compute the per-period ``extremum`` of the rolling ``rolling_op`` of ``study``.
+
+    The result matches
+    ``study.rolling(time=window).<rolling_op>().resample(time=freq).<extremum>()``
+    for the ``freq`` of ``groups``. With ``date_event``, the
+    ``event_date_start`` and ``event_date_end`` coordinates hold the first and
+    last time steps of the window reaching the extremum.
+    """
+    axis = study.get_axis_num("time")
+    if hasattr(study.data, "chunks"):
+        values, ends = _dask_rolling_extremum(
+            study.data, groups, window, extremum, axis
+        )
+    else:
+        values, ends = _rolling_extremum_block(
+            np.asarray(study.data),
+            groups.lengths,
+            0,
+            window,
+            extremum,
+            axis,
+        )
+    if rolling_op == "mean":
+        values = values / window
+    if np.issubdtype(study.dtype, np.floating):
+        values = values.astype(study.dtype, copy=False)
+    coords = {
+        name: coord for name, coord in study.coords.items() if "time" not in coord.dims
+    }
+    coords["time"] = groups.labels
+    if date_event:
+        times = study.indexes["time"].to_numpy()
+        group_starts = np.expand_dims(
+            groups.starts, tuple(i for i in range(study.ndim) if i != axis)
+        )
+        ends = ends + np.where(ends >= 0, group_starts, 0)
+        coords["event_date_start"] = (
+            study.dims,
+            _positions_to_times(ends, times, offset=1 - window),
+        )
+        coords["event_date_end"] = (study.dims, _positions_to_times(ends, times))
+    return xr.DataArray(
+        values,
+        dims=study.dims,
+        coords=coords,
+        attrs=dict(study.attrs),
+        name=study.name,
+    )
+
+
+def _rolling_extremum_block(
+    block: np.ndarray,
+    lengths: np.ndarray,
+    halo: int,
+    window: int,
+    extremum: RollingExtremum,
+    axis: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the group extrema and their window end offsets within each group."""
+    moved = np.moveaxis(block, axis, 0)
+    cell_shape = moved.shape[1:]
+    flat = np.ascontiguousarray(moved.reshape(moved.shape[0], -1), dtype=np.float64)
+    values, ends = _rolling_extremum_kernel(
+        flat,
+        np.asarray(lengths, dtype=np.int64),
+        halo,
+        window,
+        extremum == "max",
+    )
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+    ends = np.where(ends >= 0, ends - starts[:, np.newaxis], -1)
+    shape = (len(lengths), *cell_shape)
+    return (
+        np.moveaxis(values.reshape(shape), 0, axis),
+        np.moveaxis(ends.reshape(shape), 0, axis),
+    )
+
+
+def _dask_rolling_extremum(
+    data: object,
+    groups: ResampleGroups,
+    window: int,
+    extremum: RollingExtremum,
+    axis: int,
+) -> tuple[object, object]:
+    import dask.array as dsa  # noqa: PLC0415
+
+    start_numba_threads()
+    halo = window - 1
+    block_lengths = _group_aligned_blocks(
+        groups.lengths,
+        max(*data.chunks[axis], window),
+    )
+    time_chunks = tuple(int(lengths.sum()) for lengths in block_lengths)
+    if halo > 0 and min(time_chunks[:-1], default=halo) < halo:
+        # Halos are taken from the previous chunk only, which must be long enough.
+        block_lengths = [groups.lengths]
+        time_chunks = (int(groups.lengths.sum()),)
+    if data.chunks[axis] != time_chunks:
+        data = data.rechunk({axis: time_chunks})
+    if halo > 0 and len(time_chunks) > 1:
+        data = dsa.overlap.overlap(data, depth={axis: (halo, 0)}, boundary="none")
+
+    def _reduce_block(block: np.ndarray, block_info: dict) -> dict[str, np.ndarray]:
+        location = block_info[0]["chunk-location"][axis]
+        lengths = block_lengths[location]
+        block_halo = block.shape[axis] - int(lengths.sum())
+        values, ends = _rolling_extremum_block(
+            block, lengths, block_halo, window, extremum, axis
+        )
+        return {"values": values, "ends": ends}
+
+    out_chunks = list(data.chunks)
+    out_chunks[axis] = tuple(len(lengths) for lengths in block_lengths)
+    blocks = data.map_blocks(
+        _reduce_block,
+        dtype=object,
+        chunks=tuple(out_chunks),
+        meta=np.empty((0,) * data.ndim, dtype=object),
+    )
+    return tuple(
+        blocks.map_blocks(
+            _select_output,
+            key,
+            dtype=dtype,
+            chunks=tuple(out_chunks),
+            meta=np.empty((0,) * data.ndim, dtype=dtype),
+        )
+        for key, dtype in (("values", np.float64), ("ends", np.int64))
+    )
+
+
+def _select_output(blocks: dict[str, np.ndarray], key: str) -> np.ndarray:
+    return blocks[key]
+
+
+def _positions_to_times(
+    positions: object,
+    times: np.ndarray,
+    offset: int = 0,
+) -> object:
+    fill = np.datetime64("NaT") if times.dtype.kind == "M" else None
+
+    def _take(block: np.ndarray) -> np.ndarray:
+        picked = times[np.clip(block + offset, 0, len(times) - 1)]
+        return np.where(block >= 0, picked, fill)
+
+    if hasattr(positions, "map_blocks"):
+        return positions.map_blocks(
+            _take,
+            dtype=times.dtype,
+            meta=np.empty((0,) * positions.ndim, dtype=times.dtype),
+        )
+    return _take(positions)
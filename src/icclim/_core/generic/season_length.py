@@ -0,0 +1,237 @@
+"""Single-pass growing season length per resampling period.
+
+``xclim.atmos.growing_season_length`` builds the threshold condition, masks it
+around the mid date and then runs separate run-length passes to find the start
+and the end of the season of each period. Here one compiled pass per cell
+scans each period once: it tracks the first run of ``window`` days meeting the
+threshold that starts before the mid date, then the first run of ``window``
+days failing it that starts on or after both the mid date and the season
+start.
+
+The lengths follow ``xclim.indices.run_length.season``: 0 when no season
+starts, the number of days from the start to the end of the period when no
+season end is found, and the number of days from the start to the end
+otherwise. A missing value fails the threshold.
+
+Dask inputs are rechunked so that no period straddles two time chunks and each
+chunk is reduced on its own. The kernel needs numba; without it the callers
+keep the xclim implementation.
+"""
+
+# ruff: noqa: ANN001, ANN202
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import xarray as xr
+
+from icclim._core.generic.numba_threads import start_numba_threads
+from icclim._core.resampling import _group_aligned_blocks
+
+if TYPE_CHECKING:
+    from xarray import DataArray
+
+    from icclim._core.resampling import ResampleGroups
+
+try:
+    from numba import njit, prange
+except Exception:  # noqa: BLE001
+    njit = None
+    prange = range
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _first_run(values, cell, start, first, stop, threshold, window, above):
+        """Return the offset of the first run of ``window`` days in [first, stop)."""
+        run = 0
+        for i in range(first, stop):
+            if (values[start + i, cell] >= threshold) == above:
+                run += 1
+                if run >= window:
+                    return i - window + 1
+            else:
+                run = 0
+        return -1
+
+    @njit(parallel=True, cache=True)
+    def _season_length_kernel(values, threshold, group_lengths, mid_offsets, window):
+        """Measure the season of each group, for values at or above ``threshold``."""
+        n_cells = values.shape[1]
+        n_groups = len(group_lengths)
+        group_starts = np.zeros(n_groups, dtype=np.int64)
+        for group in range(1, n_groups):
+            group_starts[group] = group_starts[group - 1] + group_lengths[group - 1]
+        out = np.full((n_groups, n_cells), np.nan)
+        for cell in prange(n_cells):
+            for group in range(n_groups):
+                length = group_lengths[group]
+                mid = mid_offsets[group]
+                start = group_starts[group]
+                if length == 0:
+                    continue
+                out[group, cell] = 0.0
+                if mid < 0:
+                    continue
+                # The start run must end before mid + window - 1.
+                stop = min(mid + window - 1, length)
+                begin = _first_run(
+                    values, cell, start, 0, stop, threshold, window, True
+                )
+                if begin < 0:
+                    continue
+                end = _first_run(
+                    values,
+                    cell,
+                    start,
+                    max(begin, mid),
+                    length,
+                    threshold,
+                    window,
+                    False,
+                )
+                out[group, cell] = length - begin if end < 0 else end - begin
+        return out
+
+else:
+
+    def _season_length_kernel(*args, **kwargs):  # noqa: ARG001
+        return None
+
+
+def season_length_available() -> bool:
+    """Return whether the compiled season length kernel can be used."""
+    return njit is not None
+
+
+def mid_date_offsets(
+    time_index: object,
+    groups: ResampleGroups,
+    mid_date: str,
+) -> np.ndarray:
+    """
+    Return the offset of ``mid_date`` ("MM-DD") within each group, -1 if absent.
+
+    Only the first occurrence of the date in a group is considered.
+    """
+    month, day = (int(part) for part in mid_date.split("-"))
+    matches = np.flatnonzero(
+        (np.asarray(time_index.month) == month) & (np.asarray(time_index.day) == day),
+    )
+    first = np.searchsorted(matches, groups.starts)
+    position = np.append(matches, np.iinfo(np.int64).max)[first]
+    found = position < groups.starts + groups.lengths
+    return np.where(found, position - groups.starts, -1).astype(np.int64)
+
+
+def season_length(
+    study: DataArray,
+    groups: ResampleGroups,
+    threshold: float,
+    window: int,
+    mid_date: str,
+) -> DataArray:
+    """
+    Compute the length of the season of each group of ``study``.
+
+    A season starts with the first ``window`` consecutive values at or above
+    ``threshold`` and must start before ``mid_date``. It ends with the first
+    ``window`` consecutive values below it, starting on or after ``mid_date``.
+
+    Parameters
+    ----------
+    study : DataArray
+        The daily studied data.
+    groups : ResampleGroups
+        The resampling groups of the time axis of ``study``.
+    threshold : float
+        The threshold, in the units of ``study``.
+    window : int
+        The number of consecutive days starting and ending a season.
+    mid_date : str
+        The "MM-DD" date the season must include.
+
+    Returns
+    -------
+    DataArray
+        The season lengths, in number of time steps, with the non-time
+        coordinates of ``study`` and one time step per group.
+    """
+    axis = study.get_axis_num("time")
+    mid_offsets = mid_date_offsets(study.indexes["time"], groups, mid_date)
+    kernel_args = (float(threshold), window)
+    if hasattr(study.data, "chunks"):
+        lengths = _dask_season_length(
+            study.data, groups, mid_offsets, axis, kernel_args
+        )
+    else:
+        lengths = _season_length_block(
+            np.asarray(study.data),
+            groups.lengths,
+            mid_offsets,
+            axis,
+            kernel_args,
+        )
+    coords = {
+        name: coord for name, coord in study.coords.items() if "time" not in coord.dims
+    }
+    coords["time"] = groups.labels
+    return xr.DataArray(lengths, dims=study.dims, coords=coords)
+
+
+def _season_length_block(
+    block: np.ndarray,
+    lengths: np.ndarray,
+    mid_offsets: np.ndarray,
+    axis: int,
+    kernel_args: tuple,
+) -> np.ndarray:
+    moved = np.moveaxis(block, axis, 0)
+    cell_shape = moved.shape[1:]
+    flat = np.ascontiguousarray(moved.reshape(moved.shape[0], -1), dtype=np.float64)
+    threshold, window = kernel_args
+    out = _season_length_kernel(
+        flat,
+        threshold,
+        np.asarray(lengths, dtype=np.int64),
+        mid_offsets,
+        window,
+    )
+    return np.moveaxis(out.reshape(len(lengths), *cell_shape), 0, axis)
+
+
+def _dask_season_length(
+    data: object,
+    groups: ResampleGroups,
+    mid_offsets: np.ndarray,
+    axis: int,
+    kernel_args: tuple,
+) -> object:
+    start_numba_threads()
+    block_lengths = _group_aligned_blocks(groups.lengths, max(data.chunks[axis]))
+    time_chunks = tuple(int(lengths.sum()) for lengths in block_lengths)
+    if data.chunks[axis] != time_chunks:
+        data = data.rechunk({axis: time_chunks})
+    block_groups = np.cumsum([0, *(len(lengths) for lengths in block_lengths)])
+
+    def _reduce_block(block: np.ndarray, block_info: dict) -> np.ndarray:
+        location = block_info[0]["chunk-location"][axis]
+        return _season_length_block(
+            block,
+            block_lengths[location],
+            mid_offsets[block_groups[location] : block_groups[location + 1]],
+            axis,
+            kernel_args,
+        )
+
+    out_chunks = list(data.chunks)
+    out_chunks[axis] = tuple(len(lengths) for lengths in block_lengths)
+    return data.map_blocks(
+        _reduce_block,
+        dtype=np.float64,
+        chunks=tuple(out_chunks),
+        meta=np.empty((0,) * data.ndim, dtype=np.float64),
+    )
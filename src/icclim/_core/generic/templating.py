@@ -0,0 +1,140 @@
+"""Compilation of the jinja templates of the indicator and threshold metadata.
+
+The long names, standard names and cell methods of generic indicators and of
+thresholds are jinja templates rendered on every ``index()`` call. Compiling
+a template costs about a millisecond, rendering it a few microseconds, so the
+compiled templates are cached, keyed by their environment and their source.
+The templates shipped with icclim, ``EN_THRESHOLD_TEMPLATE`` and
+``INDICATORS_TEMPLATES_EN``, can be compiled ahead of time with
+``precompile_templates``, which ``icclim.warmup`` calls.
+
+When a profile is active, the templates compiled during a call are reported
+as the ``template_compilations`` counter.
+
+Set ``ICCLIM_TEMPLATE_CACHE=off`` to compile the templates on every render.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from jinja2 import Environment
+
+from icclim._core.profiling import profile_count
+
+if TYPE_CHECKING:
+    import jinja2
+
+_TEMPLATE_CACHE_ENV = "ICCLIM_TEMPLATE_CACHE"
+# Templates of user given metadata are cached as well, the cache is bounded
+# so that long running processes do not accumulate them.
+_TEMPLATE_CACHE_SIZE = 1024
+
+jinja_env = Environment(autoescape=True)
+
+
+def template_cache_enabled() -> bool:
+    """Return whether compiled templates are cached."""
+    return os.environ.get(_TEMPLATE_CACHE_ENV, "on").lower() not in (
+        "off",
+        "false",
+        "0",
+    )
+
+
+def compile_template(
+    source: str,
+    env: jinja2.Environment | None = None,
+) -> jinja2.Template:
+    """
+    Return the compiled template of ``source``, from the cache when possible.
+
+    Parameters
+    ----------
+    source : str
+        The jinja source of the template.
+    env : jinja2.Environment, optional
+        The environment compiling the template, icclim's one by default.
+
+    Returns
+    -------
+    jinja2.Template
+        The compiled template.
+    """
+    env = jinja_env if env is None else env
+    if not template_cache_enabled():
+        profile_count("template_compilations")
+        return env.from_string(source)
+    return _compile_cached(env, source)
+
+
+def render_template(
+    source: str,
+    scope: dict[str, Any],
+    env: jinja2.Environment | None = None,
+) -> str:
+    """
+    Render the template ``source`` with the variables of ``scope``.
+
+    Parameters
+    ----------
+    source : str
+        The jinja source of the template.
+    scope : dict[str, Any]
+        The variables available to the template.
+    env : jinja2.Environment, optional
+        The environment compiling the template, icclim's one by default.
+
+    Returns
+    -------
+    str
+        The rendered template.
+    """
+    return compile_template(source, env).render(scope)
+
+
+def precompile_templates(env: jinja2.Environment | None = None) -> int:
+    """
+    Compile the metadata templates shipped with icclim into the cache.
+
+    Parameters
+    ----------
+    env : jinja2.Environment, optional
+        The environment compiling the templates, icclim's one by default.
+
+    Returns
+    -------
+    int
+        The number of distinct templates compiled.
+    """
+    from icclim._core.generic.generic_templates import (  # noqa: PLC0415
+        INDICATORS_TEMPLATES_EN,
+    )
+    from icclim._core.generic.threshold.threshold_templates import (  # noqa: PLC0415
+        EN_THRESHOLD_TEMPLATE,
+    )
+
+    sources = {
+        source
+        for templates in (
+            *EN_THRESHOLD_TEMPLATE.values(),
+            *INDICATORS_TEMPLATES_EN.values(),
+        )
+        for source in templates.values()
+    }
+    for source in sources:
+        compile_template(source, env)
+    return len(sources)
+
+
+def clear_template_cache() -> None:
+    """Drop the compiled templates from the cache."""
+    _compile_cached.cache_clear()
+
+
+@lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _compile_cached(env: jinja2.Environment, source: str) -> jinja2.Template:
+    profile_count("template_compilations")
+    return env.from_string(source)
@@ -12,6 +12,7 @@ from xarray import DataArray, Dataset
 from icclim._core.constants import (
     UNITS_KEY,
 )
+from icclim._core.generic.templating import render_template
 from icclim._core.generic.threshold.threshold_templates import (
     EN_THRESHOLD_TEMPLATE,
     ThresholdMetadata,
@@ -275,9 +276,7 @@ class BasicThreshold(Threshold):
         return cast(
             "ThresholdMetadata",
             {
-                k: cast(
-                    "str", jinja_env.from_string(cast("str", v), globals=conf).render()
-                )
+                k: render_template(cast("str", v), conf, jinja_env)
                 for k, v in templates.items()
             },
         )
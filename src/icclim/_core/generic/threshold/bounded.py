@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, cast
 
 from icclim._core.constants import EXPECTED_RANGE_LEN
+from icclim._core.generic.templating import render_template
 from icclim._core.generic.threshold.threshold_templates import (
     EN_THRESHOLD_TEMPLATE,
     ThresholdMetadata,
@@ -190,9 +191,7 @@ class BoundedThreshold(Threshold):
         return cast(
             "ThresholdMetadata",
             {
-                k: cast(
-                    "str", jinja_env.from_string(cast("str", v), globals=conf).render()
-                )
+                k: render_template(cast("str", v), conf, jinja_env)
                 for k, v in templates.items()
             },
         )
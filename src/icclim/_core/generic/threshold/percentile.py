@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
 import xarray as xr
 from xarray import DataArray, Dataset
 
@@ -14,6 +15,7 @@ from icclim._core.constants import (
     PERIOD_PERCENTILE_UNIT,
     UNITS_KEY,
 )
+from icclim._core.generic.templating import render_template
 from icclim._core.generic.threshold.threshold_templates import (
     EN_THRESHOLD_TEMPLATE,
     PercentileTemplateConfig,
@@ -32,6 +34,13 @@ from icclim._core.model.quantile_interpolation import (
     QuantileInterpolationRegistry,
 )
 from icclim._core.model.threshold import Threshold, ThresholdValueType
+from icclim._core.quantile_selection import select_quantiles
+from icclim._core.quantile_sketch import (
+    QUANTILE_METHODS,
+    QuantileMethod,
+    sketch_quantiles,
+)
+from icclim.exception import InvalidIcclimArgumentError
 
 if TYPE_CHECKING:
     # Standard library
@@ -66,6 +75,15 @@ class PercentileThreshold(Threshold):
       ``reference_period``.
       The resulting ``value`` is a DataArray with per grid cell values and no time axis.
 
+    ``quantile_method`` selects how period percentiles are computed: "exact"
+    (default) gives the exact percentiles of the reference period with
+    ``xclim.core.utils.calc_perc``, "radix" gives the same percentiles by radix
+    selection over the time chunks, without rechunking time, see
+    :py:mod:`icclim._core.quantile_selection`, while "sketch"
+    merges bounded-size quantile sketches built per chunk, see
+    :py:mod:`icclim._core.quantile_sketch` for its error guarantee.
+    Day of year percentiles are always exact.
+
     ``is_ready`` becomes True when `prepare` method has been called, the actual
     percentiles are then computed and accessible in ``value`` property.
     Once ``is_ready`` is True, ``unit`` property can be set and will attempt a pint unit
@@ -77,6 +95,7 @@ class PercentileThreshold(Threshold):
     doy_window_width: int
     only_leap_years: bool
     interpolation: QuantileInterpolation
+    quantile_method: QuantileMethod
     initial_value: list[float] | None
     is_doy_per_threshold: bool
 
@@ -145,6 +164,7 @@ class PercentileThreshold(Threshold):
         threshold_min_value: pint.Quantity | None = None,
         initial_query: str | None = None,
         threshold_var_name: str | None = None,
+        quantile_method: QuantileMethod | None = "exact",
         **kwargs,  # noqa: ARG002
     ) -> None:
         if is_dataset_path(cast("Any", value)) or isinstance(value, Dataset):
@@ -181,6 +201,7 @@ class PercentileThreshold(Threshold):
         self.doy_window_width = doy_window_width
         self.only_leap_years = only_leap_years
         self.interpolation = QuantileInterpolationRegistry.lookup(interpolation)
+        self.quantile_method = _read_quantile_method(quantile_method)
         self._prepare_output_unit = None
         self._prepare_source_data = None
         self.unit = unit
@@ -222,6 +243,7 @@ class PercentileThreshold(Threshold):
                 interpolation=self.interpolation,
                 only_leap_years=self.only_leap_years,
                 percentile_min_value=self.threshold_min_value,
+                quantile_method=self.quantile_method,
             )
         else:
             msg = f"Unknown percentile unit '{self._initial_unit}'."
@@ -305,6 +327,7 @@ class PercentileThreshold(Threshold):
             and self.doy_window_width == other.doy_window_width
             and self.only_leap_years == other.only_leap_years
             and self.interpolation == other.interpolation
+            and self.quantile_method == other.quantile_method
             and self.reference_period == other.reference_period
             and self.unit == other.unit
             and self.threshold_min_value == other.threshold_min_value
@@ -319,6 +342,7 @@ class PercentileThreshold(Threshold):
                 self.doy_window_width,
                 self.only_leap_years,
                 self.interpolation,
+                self.quantile_method,
                 tuple(self.reference_period) if self.reference_period else None,
                 self.unit,
                 self.threshold_min_value,
@@ -378,11 +402,8 @@ class PercentileThreshold(Threshold):
         return cast(
             "ThresholdMetadata",
             {
-                k: cast(
-                    "str",
-                    jinja_env.from_string(
-                        cast("str", v), globals=cast("dict[str, Any]", conf)
-                    ).render(),
+                k: render_template(
+                    cast("str", v), cast("dict[str, Any]", conf), jinja_env
                 )
                 for k, v in templates.items()
             },
@@ -499,14 +520,40 @@ class PercentileThreshold(Threshold):
 
 
 def _compute_per(
-    per_val: float | Sequence[float], alpha: float, beta: float, study: DataArray
+    per_val: float | Sequence[float],
+    alpha: float,
+    beta: float,
+    study: DataArray,
+    quantile_method: QuantileMethod = "exact",
 ) -> PercentileDataArray:
+    from xclim.core.calendar import build_climatology_bounds  # noqa: PLC0415
+
+    if quantile_method == "sketch":
+        computed_per = _compute_sketch_per(per_val, alpha, beta, study)
+    elif quantile_method == "radix":
+        computed_per = _compute_selection_per(per_val, alpha, beta, study)
+    else:
+        computed_per = _compute_exact_per(per_val, alpha, beta, study)
+    computed_per = computed_per.assign_coords(
+        percentiles=xr.DataArray(per_val, dims=("percentiles",)),
+    )
+    return PercentileDataArray.from_da(
+        source=computed_per,
+        climatology_bounds=build_climatology_bounds(study),
+    )
+
+
+def _compute_exact_per(
+    per_val: float | Sequence[float],
+    alpha: float,
+    beta: float,
+    study: DataArray,
+) -> DataArray:
     from collections.abc import Sequence  # noqa: PLC0415
 
-    from xclim.core.calendar import build_climatology_bounds  # noqa: PLC0415
     from xclim.core.utils import calc_perc  # noqa: PLC0415
 
-    computed_per = xr.apply_ufunc(
+    return xr.apply_ufunc(
         calc_perc,
         study,
         input_core_dims=[["time"]],
@@ -527,12 +574,61 @@ def _compute_per(
             "allow_rechunk": True,
         },
     )
-    computed_per = computed_per.assign_coords(
-        percentiles=xr.DataArray(per_val, dims=("percentiles",)),
+
+
+def _compute_selection_per(
+    per_val: float | Sequence[float],
+    alpha: float,
+    beta: float,
+    study: DataArray,
+) -> DataArray:
+    def _select_per(values: object) -> object:
+        per = select_quantiles(
+            values,
+            np.atleast_1d(per_val) / 100,
+            alpha,
+            beta,
+            axis=values.ndim - 1,
+        )
+        return per.astype(study.dtype)
+
+    # Exact, and the time axis is never rechunked into a single chunk.
+    return xr.apply_ufunc(
+        _select_per,
+        study,
+        input_core_dims=[["time"]],
+        output_core_dims=[["percentiles"]],
+        keep_attrs=True,
+        dask="allowed",
     )
-    return PercentileDataArray.from_da(
-        source=computed_per,
-        climatology_bounds=build_climatology_bounds(study),
+
+
+def _compute_sketch_per(
+    per_val: float | Sequence[float],
+    alpha: float,
+    beta: float,
+    study: DataArray,
+) -> DataArray:
+    def _sketch_per(values: np.ndarray) -> np.ndarray:
+        per = sketch_quantiles(
+            values,
+            np.array([values.shape[-1]]),
+            np.atleast_1d(per_val) / 100,
+            alpha,
+            beta,
+            axis=values.ndim - 1,
+        )
+        # Drop the single group axis, the percentiles axis comes last.
+        return per[..., 0, :].astype(study.dtype)
+
+    # The time axis is never rechunked: each chunk is summarised on its own.
+    return xr.apply_ufunc(
+        _sketch_per,
+        study,
+        input_core_dims=[["time"]],
+        output_core_dims=[["percentiles"]],
+        keep_attrs=True,
+        dask="allowed",
     )
 
 
@@ -543,6 +639,7 @@ def _build_period_per(
     interpolation: QuantileInterpolation,
     only_leap_years: bool,
     percentile_min_value: pint.Quantity | None,
+    quantile_method: QuantileMethod = "exact",
 ) -> PercentileDataArray:
     reference = build_reference_da(
         studied_data,
@@ -550,7 +647,26 @@ def _build_period_per(
         only_leap_years,
         percentile_min_value=percentile_min_value,
     )
-    return _compute_per(per_val, interpolation.alpha, interpolation.beta, reference)
+    return _compute_per(
+        per_val,
+        interpolation.alpha,
+        interpolation.beta,
+        reference,
+        quantile_method=quantile_method,
+    )
+
+
+def _read_quantile_method(quantile_method: str | None) -> QuantileMethod:
+    if quantile_method is None:
+        return "exact"
+    method = quantile_method.lower()
+    if method not in QUANTILE_METHODS:
+        msg = (
+            f"Unknown quantile_method '{quantile_method}',"
+            f" use one of {QUANTILE_METHODS}."
+        )
+        raise InvalidIcclimArgumentError(msg)
+    return cast("QuantileMethod", method)
 
 
 def _build_doy_per(
@@ -0,0 +1,314 @@
+"""Single-pass threshold sums for ``fraction_of_total``, ``excess`` and ``deficit``.
+
+These indicators compare every value with a threshold, mask the values with
+``where``, resample the masked series (and, for ``fraction_of_total``, the
+total series) and then divide. Each of these steps creates a full-size
+temporary array. Here one compiled pass per cell reads each value once,
+compares it with its threshold and accumulates, per resampling group, the sum
+of the exceeding values and the total, or the sum of the excesses or deficits.
+
+Thresholds are given as a table with one row per distinct threshold and a row
+index per time step: a single row for scalar, per grid cell and period
+percentile thresholds, one row per day of year for day of year percentiles.
+Dask inputs are rechunked so that no group straddles two time chunks and each
+chunk is reduced on its own. The kernel needs numba; without it the callers
+keep the xarray implementation.
+"""
+
+# ruff: noqa: ANN001, ANN202, PLR2004
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import xarray as xr
+
+from icclim._core.generic.numba_threads import start_numba_threads
+from icclim._core.resampling import _group_aligned_blocks
+
+if TYPE_CHECKING:
+    from xarray import DataArray
+
+    from icclim._core.model.threshold import Threshold
+    from icclim._core.resampling import ResampleGroups
+
+ThresholdSum = Literal["fraction", "excess", "deficit"]
+
+_THRESHOLD_SUM_CODES = {"fraction": 0, "excess": 1, "deficit": 2}
+
+try:
+    from numba import njit, prange
+except Exception:  # noqa: BLE001
+    njit = None
+    prange = range
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _compare(value, threshold, op_code):
+        # Operator codes of ``_bootstrap_operator_code``.
+        if op_code == 0:
+            return value > threshold
+        if op_code == 1:
+            return value >= threshold
+        if op_code == 2:
+            return value < threshold
+        return value <= threshold
+
+    @njit(parallel=True, cache=True)
+    def _threshold_sums_kernel(  # noqa: C901
+        values,
+        thresholds,
+        rows,
+        group_lengths,
+        how_code,
+        op_code,
+        min_value,
+        min_op_code,
+    ):
+        """Accumulate the thresholded and total sums of each group."""
+        n_time, n_cells = values.shape
+        n_groups = len(group_lengths)
+        out = np.zeros((2, n_groups, n_cells))
+        for cell in prange(n_cells):
+            group = 0
+            group_end = group_lengths[0] if n_groups > 0 else n_time
+            for i in range(n_time):
+                while i >= group_end:
+                    group += 1
+                    group_end += group_lengths[group]
+                value = values[i, cell]
+                if np.isnan(value):
+                    continue
+                threshold = thresholds[rows[i], cell] if rows[i] >= 0 else np.nan
+                if how_code == 0:
+                    if min_op_code < 0 or _compare(value, min_value, min_op_code):
+                        out[1, group, cell] += value
+                    if _compare(value, threshold, op_code):
+                        out[0, group, cell] += value
+                elif how_code == 1:
+                    if value > threshold:
+                        out[0, group, cell] += value - threshold
+                elif value < threshold:
+                    out[0, group, cell] += threshold - value
+        return out
+
+else:
+
+    def _threshold_sums_kernel(*args, **kwargs):  # noqa: ARG001
+        return None
+
+
+def threshold_sums_available() -> bool:
+    """Return whether the compiled threshold sums kernel can be used."""
+    return njit is not None
+
+
+def threshold_table(
+    threshold: Threshold,
+    study: DataArray,
+) -> tuple[object, np.ndarray] | None:
+    """
+    Build the threshold table of ``threshold`` and the row used by each time step.
+
+    Returns None for thresholds that cannot be tabulated, such as bounded
+    thresholds, thresholds varying along time or multiple percentiles.
+    """
+    from icclim._core.generic.threshold.basic import BasicThreshold  # noqa: PLC0415
+    from icclim._core.generic.threshold.percentile import (  # noqa: PLC0415
+        PercentileThreshold,
+    )
+
+    if isinstance(threshold, PercentileThreshold):
+        threshold.ensure_ready(study)
+        value = threshold.value
+        if "percentiles" in value.dims:
+            if value.sizes["percentiles"] != 1:
+                return None
+            value = value.squeeze("percentiles", drop=True)
+        if threshold.threshold_min_value is not None:
+            from xclim.core.units import convert_units_to  # noqa: PLC0415
+
+            minimum = convert_units_to(
+                threshold.threshold_min_value, value, context="hydro"
+            )
+            value = value.where(value > minimum, minimum)
+    elif isinstance(threshold, BasicThreshold) and threshold.is_ready:
+        value = threshold.value
+        if not isinstance(value, xr.DataArray):
+            value = xr.DataArray(value)
+    else:
+        return None
+    cell_dims = [dim for dim in study.dims if dim != "time"]
+    if "dayofyear" in value.dims:
+        from xclim.core.calendar import adjust_doy_calendar  # noqa: PLC0415
+
+        value = adjust_doy_calendar(value, study)
+        doy = study.indexes["time"].dayofyear
+        rows = value.indexes["dayofyear"].get_indexer(doy)
+    else:
+        value = value.expand_dims(dayofyear=1)
+        rows = np.zeros(study.sizes["time"], dtype=np.intp)
+    if not set(value.dims) <= {"dayofyear", *cell_dims}:
+        return None
+    value = value.drop_vars(
+        [name for name in value.coords if name not in value.dims],
+    )
+    template = study.isel(time=0, drop=True).drop_vars(
+        [name for name in study.coords if name != "time" and name not in cell_dims],
+    )
+    value = value.broadcast_like(template).transpose("dayofyear", *cell_dims)
+    return value.data, rows.astype(np.int64)
+
+
+def segmented_threshold_sum(
+    study: DataArray,
+    groups: ResampleGroups,
+    table: object,
+    rows: np.ndarray,
+    how: ThresholdSum,
+    op_code: int = -1,
+    min_value: float = np.nan,
+    min_op_code: int = -1,
+) -> DataArray:
+    """
+    Reduce ``study`` per group against its threshold table in one pass.
+
+    Parameters
+    ----------
+    study : DataArray
+        The studied data.
+    groups : ResampleGroups
+        The resampling groups of the time axis of ``study``.
+    table : np.ndarray | dask.array.Array
+        The thresholds, one row per distinct threshold followed by the
+        non-time dimensions of ``study``, as built by ``threshold_table``.
+    rows : np.ndarray
+        The row of ``table`` used by each time step, -1 for no threshold.
+    how : ThresholdSum
+        "fraction" divides the sum of the values exceeding the threshold, for
+        the ``op_code`` comparison, by the sum of all values (or of the values
+        passing the ``min_value`` comparison). "excess" and "deficit" sum the
+        positive differences between the values and the threshold.
+    op_code, min_op_code : int
+        Comparison codes, as given by ``_bootstrap_operator_code``.
+        ``min_op_code`` is -1 when there is no minimum value.
+    min_value : float
+        The minimum value a value must pass to count in the total.
+
+    Returns
+    -------
+    DataArray
+        The reduced data, with the dimensions, coordinates and attributes of
+        ``study`` and one time step per group.
+    """
+    axis = study.get_axis_num("time")
+    kernel_args = (_THRESHOLD_SUM_CODES[how], op_code, float(min_value), min_op_code)
+    if hasattr(study.data, "chunks"):
+        sums = _dask_threshold_sums(study.data, groups, table, rows, axis, kernel_args)
+    else:
+        sums = _threshold_sums_block(
+            np.asarray(study.data),
+            np.asarray(table),
+            rows,
+            groups.lengths,
+            axis,
+            kernel_args,
+        )
+    if how == "fraction":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = sums[..., 0] / sums[..., 1]
+    else:
+        values = sums[..., 0]
+    if np.issubdtype(study.dtype, np.floating):
+        values = values.astype(study.dtype, copy=False)
+    coords = {
+        name: coord for name, coord in study.coords.items() if "time" not in coord.dims
+    }
+    coords["time"] = groups.labels
+    return xr.DataArray(
+        values,
+        dims=study.dims,
+        coords=coords,
+        attrs=dict(study.attrs),
+        name=study.name,
+    )
+
+
+def _threshold_sums_block(
+    block: np.ndarray,
+    table: np.ndarray,
+    rows: np.ndarray,
+    lengths: np.ndarray,
+    axis: int,
+    kernel_args: tuple,
+) -> np.ndarray:
+    """Return the sums of each group, groups at ``axis`` and sums last."""
+    moved = np.moveaxis(block, axis, 0)
+    cell_shape = moved.shape[1:]
+    flat = np.ascontiguousarray(moved.reshape(moved.shape[0], -1), dtype=np.float64)
+    thresholds = np.ascontiguousarray(
+        table.reshape(table.shape[0], -1),
+        dtype=np.float64,
+    )
+    sums = _threshold_sums_kernel(
+        flat,
+        thresholds,
+        rows,
+        np.asarray(lengths, dtype=np.int64),
+        *kernel_args,
+    )
+    sums = sums.reshape(2, len(lengths), *cell_shape)
+    return np.moveaxis(np.moveaxis(sums, 1, axis + 1), 0, -1)
+
+
+def _dask_threshold_sums(
+    data: object,
+    groups: ResampleGroups,
+    table: object,
+    rows: np.ndarray,
+    axis: int,
+    kernel_args: tuple,
+) -> object:
+    import dask.array as dsa  # noqa: PLC0415
+
+    start_numba_threads()
+    block_lengths = _group_aligned_blocks(groups.lengths, max(data.chunks[axis]))
+    time_chunks = tuple(int(lengths.sum()) for lengths in block_lengths)
+    if data.chunks[axis] != time_chunks:
+        data = data.rechunk({axis: time_chunks})
+    block_starts = np.concatenate(([0], np.cumsum(time_chunks)[:-1]))
+    cell_chunks = tuple(c for i, c in enumerate(data.chunks) if i != axis)
+    table = dsa.asarray(table).rechunk((-1, *cell_chunks))
+    indices = tuple(f"d{i}" for i in range(data.ndim))
+    table_indices = ("row", *(index for i, index in enumerate(indices) if i != axis))
+
+    def _reduce_block(block, block_id, block_table):
+        location = int(block_id[0])
+        lengths = block_lengths[location]
+        start = block_starts[location]
+        block_rows = rows[start : start + block.shape[axis]]
+        return _threshold_sums_block(
+            block, block_table, block_rows, lengths, axis, kernel_args
+        )
+
+    return dsa.blockwise(
+        _reduce_block,
+        (*indices, "sums"),
+        data,
+        indices,
+        dsa.arange(len(block_lengths), chunks=1),
+        (indices[axis],),
+        table,
+        table_indices,
+        new_axes={"sums": 2},
+        adjust_chunks={
+            indices[axis]: tuple(len(lengths) for lengths in block_lengths),
+        },
+        align_arrays=False,
+        concatenate=True,
+        dtype=np.float64,
+        meta=np.empty((0,) * (data.ndim + 1), dtype=np.float64),
+    )
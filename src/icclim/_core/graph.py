@@ -0,0 +1,91 @@
+"""Optimization of the dask graph of a result before icclim computes it.
+
+When icclim computes a result itself, to write it or to profile the call, the
+graph of everything it computes, including the write tasks of ``out_file``,
+is optimized once and as a whole: elementwise stages are fused blockwise,
+tasks not needed by the result are culled and linear chains of tasks, such
+as a result chunk and its store, are fused. Optimizing the variables together
+keeps the input chunks shared by several indices of ``indices()`` read only
+once. The optimized graph is then computed with ``optimize_graph=False``, so
+that dask does not optimize it a second time.
+
+The task count before and after the pass is recorded in the active profile,
+as the ``graph_tasks_before`` and ``graph_tasks_after`` counters of the
+``optimize_graph`` phase.
+
+Results returned lazily are left untouched: the caller may combine them with
+other graphs, which dask optimizes as a whole when they are computed.
+
+Set ``ICCLIM_GRAPH_OPTIMIZATION=off`` to disable the pass, dask then
+optimizes the graph when it computes it.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, TypeVar
+
+from icclim._core.profiling import profile_count, profile_phase
+
+if TYPE_CHECKING:
+    from dask.typing import DaskCollection
+
+_GRAPH_OPTIMIZATION_ENV = "ICCLIM_GRAPH_OPTIMIZATION"
+
+_Collection = TypeVar("_Collection")
+
+
+def graph_optimization_enabled() -> bool:
+    """Return whether graphs are optimized before icclim computes them."""
+    return os.environ.get(_GRAPH_OPTIMIZATION_ENV, "on").lower() not in (
+        "off",
+        "false",
+        "0",
+    )
+
+
+def count_graph_tasks(collection: DaskCollection) -> int:
+    """Return the number of dask tasks of ``collection``, 0 when it is not lazy."""
+    graph = collection.__dask_graph__()
+    return 0 if graph is None else len(graph)
+
+
+def optimize_graph(collection: _Collection) -> _Collection:
+    """
+    Optimize the dask graph of ``collection`` before computing it.
+
+    Parameters
+    ----------
+    collection : Dataset | Delayed
+        The result to compute, or the delayed write of a result.
+
+    Returns
+    -------
+    Dataset | Delayed
+        The collection with an optimized graph, or ``collection`` when it is
+        not lazy or the pass is disabled.
+    """
+    if not graph_optimization_enabled() or collection.__dask_graph__() is None:
+        return collection
+    import dask  # noqa: PLC0415
+
+    with profile_phase("optimize_graph"):
+        profile_count("graph_tasks_before", count_graph_tasks(collection))
+        (optimized,) = dask.optimize(collection)
+        profile_count("graph_tasks_after", count_graph_tasks(optimized))
+    return optimized
+
+
+def compute_optimized(collection: _Collection) -> _Collection:
+    """
+    Compute a collection returned by ``optimize_graph``.
+
+    Its graph is not optimized again, unless the pass is disabled.
+    """
+    import dask  # noqa: PLC0415
+
+    (computed,) = dask.compute(
+        collection,
+        optimize_graph=not graph_optimization_enabled(),
+    )
+    return computed
@@ -15,15 +15,22 @@ from xarray.core.dataset import Dataset
 
 from icclim._core.constants import (
     EXPECTED_RANGE_LEN,
-    MAX_LEAP_YEAR_DAYS,
     UNITS_KEY,
     VALID_PERCENTILE_DIMENSION,
 )
+from icclim._core.memory import (
+    WORKING_COPIES,
+    active_memory_budget,
+    concurrent_working_set,
+    dask_worker_count,
+    parse_byte_size,
+)
 from icclim._core.model.cf_calendar import CfCalendarRegistry
 from icclim._core.model.standard_variable import (
     StandardVariable,
     StandardVariableRegistry,
 )
+from icclim._core.profiling import profile_phase
 from icclim._core.utils import read_date
 from icclim.exception import InvalidIcclimArgumentError
 
@@ -42,6 +49,8 @@ if TYPE_CHECKING:
 
 DEFAULT_INPUT_FREQUENCY = "days"
 PR_AMOUNT_STANDARD_NAME = "thickness_of_rainfall_amount"
+# Below this size, the scheduling overhead of a chunk outweighs its memory.
+_MIN_STREAMING_CHUNK_BYTES = 2**20
 
 
 class PercentileDataArray(xr.DataArray):
@@ -199,7 +208,7 @@ def read_dataset(
         # https://github.com/Unidata/netcdf4-python/issues/1192
         ds = xr.open_mfdataset(in_files, parallel=False, join="override")
     elif is_netcdf_path(in_files):
-        ds = xr.open_dataset(in_files)
+        ds = xr.open_dataset(in_files, chunks=_fused_read_chunks())
     elif is_zarr_path(in_files):
         ds = xr.open_zarr(in_files)
     elif isinstance(in_files, (list, tuple)):
@@ -215,6 +224,21 @@ def read_dataset(
     return update_to_standard_coords(ds)
 
 
+def _fused_read_chunks() -> dict | None:
+    """
+    Return the chunks of a netCDF file read while indices() fuses reductions.
+
+    chunks={} gives dask names based on the file, so that the reads of each
+    index build the same graph keys and can share a fused stage. Other reads
+    keep xarray's lazy loading.
+    """
+    from icclim._core.generic.fused_reducer import (  # noqa: PLC0415
+        get_active_fused_reducer,
+    )
+
+    return None if get_active_fused_reducer() is None else {}
+
+
 def update_to_standard_coords(ds: Dataset) -> Dataset:
     """Mutate input ds to use more icclim friendly coordinate names."""
     # TODO @bzah: see if cf-xarray could replace this
@@ -537,7 +561,33 @@ def build_studied_data(
     standard_var = standard_var or guess_standard_variable(studied_data)
     studied_data = _normalize_temperature_units(studied_data, standard_var)
     studied_data = _normalize_amount_and_rate_units(studied_data, standard_var)
-    return studied_data.chunk("auto")
+    return _chunk_within_memory_budget(studied_data)
+
+
+def _chunk_within_memory_budget(studied_data: DataArray) -> DataArray:
+    """Chunk the studied data, in smaller chunks when they exceed the budget."""
+    import dask  # noqa: PLC0415
+
+    budget = active_memory_budget()
+    if budget is None:
+        return studied_data.chunk("auto")
+    chunk_bytes = min(
+        parse_byte_size(str(dask.config.get("array.chunk-size"))),
+        studied_data.nbytes,
+    )
+    chunk_count = -(-studied_data.nbytes // max(1, chunk_bytes))
+    if not budget.exceeded_by(
+        "build_studied_data",
+        concurrent_working_set(chunk_bytes, chunk_count),
+        "streaming",
+    ):
+        return studied_data.chunk("auto")
+    # Each worker holds WORKING_COPIES copies of the chunk it processes.
+    streaming_bytes = budget.limit // (dask_worker_count() * WORKING_COPIES)
+    with dask.config.set(
+        {"array.chunk-size": max(_MIN_STREAMING_CHUNK_BYTES, streaming_bytes)}
+    ):
+        return studied_data.chunk("auto")
 
 
 def _subset_to_requested_time_range(
@@ -781,11 +831,12 @@ def _build_in_file_dict(
     standard_var = (
         standard_index.input_variables[0] if standard_index is not None else None
     )
-    input_dataset = read_dataset(
-        in_files=in_files,
-        standard_var=standard_var,
-        var_name=var_names,
-    )
+    with profile_phase("open_input"):
+        input_dataset = read_dataset(
+            in_files=in_files,
+            standard_var=standard_var,
+            var_name=var_names,
+        )
     var_names = guess_var_names(
         ds=input_dataset,
         standard_index=standard_index,
@@ -908,14 +959,16 @@ def _get_actual_name(ds: Dataset, alias: str) -> str:
 
 
 def _reduce_only_leap_years(da: DataArray) -> DataArray:
-    reduced_list = []
-    for _, val in da.groupby(da.time.dt.year):
-        if val.time.dt.dayofyear.max() == MAX_LEAP_YEAR_DAYS:
-            reduced_list.append(val)
-    if not reduced_list:
+    # The mask only reads the time coordinate, so dask inputs are never computed.
+    time_index = da.indexes["time"]
+    calendar = CfCalendarRegistry.lookup(
+        getattr(time_index, "calendar", CfCalendarRegistry.PROLEPTIC_GREGORIAN.name)
+    )
+    leap_year_mask = np.asarray(calendar.is_leap(da.time.dt.year), dtype=bool)
+    if not leap_year_mask.any():
         msg = "No leap year in current dataset. Do not use `only_leap_years` parameter."
         raise InvalidIcclimArgumentError(msg)
-    return xr.concat(reduced_list, "time")
+    return da.isel(time=np.flatnonzero(leap_year_mask))
 
 
 def _is_rate(u: pint.Unit) -> bool:
@@ -19,6 +19,7 @@ CalcOperationLike = Literal[
     "min",
     "sum",
     "mean",
+    "std",
     "nb_events",
     "max_nb_consecutive_events",
     "run_mean",
@@ -47,6 +48,7 @@ class CalcOperationRegistry(Registry[CalcOperation]):
     MIN = CalcOperation("min")
     SUM = CalcOperation("sum")
     MEAN = CalcOperation("mean")
+    STD = CalcOperation("std")
     EVENT_COUNT = CalcOperation("nb_events")
     MAX_NUMBER_OF_CONSECUTIVE_EVENTS = CalcOperation(
         "max_nb_consecutive_events",
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
     from icclim._core.legacy.user_index.model import UserIndexDict
     from icclim._core.model.indicator import Indicator
     from icclim._core.model.quantile_interpolation import QuantileInterpolation
+    from icclim._core.quantile_sketch import QuantileMethod
 
 
 def read_indicator(user_index: UserIndexDict) -> GenericIndicator:
@@ -72,6 +73,7 @@ def read_indicator(user_index: UserIndexDict) -> GenericIndicator:
         CalcOperationRegistry.MIN: GenericIndicatorRegistry.Minimum.clone(),
         CalcOperationRegistry.SUM: GenericIndicatorRegistry.Sum.clone(),
         CalcOperationRegistry.MEAN: GenericIndicatorRegistry.Average.clone(),
+        CalcOperationRegistry.STD: GenericIndicatorRegistry.StandardDeviation.clone(),
         CalcOperationRegistry.EVENT_COUNT: GenericIndicatorRegistry.CountOccurrences.clone(),
         CalcOperationRegistry.MAX_NUMBER_OF_CONSECUTIVE_EVENTS: GenericIndicatorRegistry.MaxConsecutiveOccurrence.clone(),
         CalcOperationRegistry.ANOMALY: GenericIndicatorRegistry.DifferenceOfMeans.clone(),
@@ -170,6 +172,7 @@ def read_thresholds(
     reference_period: Sequence[dt.datetime | str] | None,
     only_leap_years: bool,
     interpolation: QuantileInterpolation,
+    quantile_method: QuantileMethod = "exact",
 ) -> Threshold | list[Threshold] | None:
     """
     Read the thresholds from the user index dictionary.
@@ -186,6 +189,8 @@ def read_thresholds(
         Whether to consider only leap years when calculating the threshold.
     interpolation : QuantileInterpolation
         The interpolation method to use for calculating the threshold.
+    quantile_method : QuantileMethod
+        How period percentiles are computed, "exact", "radix" or "sketch".
 
     Returns
     -------
@@ -230,6 +235,7 @@ def read_thresholds(
                 reference_period=reference_period,
                 only_leap_years=only_leap_years,
                 interpolation=interpolation,
+                quantile_method=quantile_method,
             )
             for t in thresholds
         ]
@@ -250,6 +256,7 @@ def read_thresholds(
         reference_period=reference_period,
         only_leap_years=only_leap_years,
         interpolation=interpolation,
+        quantile_method=quantile_method,
     )
 
 
@@ -0,0 +1,312 @@
+"""Memory budget of an ``index()`` call and per stage high-water tracking.
+
+A ``MemoryBudget`` bounds the memory icclim plans each stage of a computation
+for. It is set with the ``memory_budget`` parameter of ``icclim.index`` and
+``icclim.indices`` or the ``ICCLIM_MEMORY_BUDGET`` environment variable, as a
+number of bytes or a size such as "4GB".
+
+While a budget is active, a ``MemorySampler`` thread samples the resident
+memory of the process every few milliseconds and records, for each stage, its
+high-water mark and its growth over the memory at the start of the stage. Every profiled
+phase (see ``icclim._core.profiling``) is a stage, along with the stages
+which may exceed the budget:
+
+- ``build_studied_data`` is streamed: the input is split in smaller chunks
+  when the chunks processed concurrently would exceed the budget.
+- ``bootstrap_tiles`` is tiled: the memory of a bootstrap tile is capped by
+  the budget.
+- ``combined_exceedance_mask`` and ``merge`` are compacted: exceedance masks
+  are converted to booleans before being combined, and the coordinates shared
+  by the results of ``indices()`` are taken from the first result instead of
+  being compared when they are merged.
+
+The variant chosen for a stage is recorded along with its estimated working
+set. Stages run by other threads, for instance dask workers, are not tracked,
+but the memory they allocate is part of the high-water mark of the enclosing
+stage, as the monitor samples the whole process.
+
+The active budget is held in a context variable. When no budget is set, the
+instrumentation costs one context variable lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_MEMORY_BUDGET_ENV = "ICCLIM_MEMORY_BUDGET"
+_SAMPLING_INTERVAL_SECONDS = 0.005
+# Number of copies of a chunk alive while an operation processes it: the
+# input, the intermediate mask or values and the output.
+WORKING_COPIES = 3
+_ACTIVE_BUDGET: ContextVar[MemoryBudget | None] = ContextVar(
+    "icclim_memory_budget",
+    default=None,
+)
+
+
+class MemoryBudget:
+    """
+    The memory budget of a computation and the high-water marks of its stages.
+
+    Parameters
+    ----------
+    limit : int
+        The budget, in bytes.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.stages: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._sampler = MemorySampler()
+
+    @contextmanager
+    def activate(self) -> Iterator[MemoryBudget]:
+        """Make this budget the active one and monitor the enclosed block."""
+        token = _ACTIVE_BUDGET.set(self)
+        try:
+            with self._sampler.running():
+                yield self
+        finally:
+            _ACTIVE_BUDGET.reset(token)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Track the high-water mark of the enclosed block as the stage ``name``."""
+        with self._sampler.track() as record:
+            yield
+        with self._lock:
+            stage = self.stages.setdefault(name, {})
+            if record.high_water is not None:
+                stage["high_water"] = max(
+                    stage.get("high_water", 0),
+                    record.high_water,
+                )
+                stage["growth"] = max(
+                    stage.get("growth", 0),
+                    record.high_water - (record.start or 0),
+                )
+
+    def exceeded_by(self, stage: str, working_set: int, variant: str) -> bool:
+        """
+        Return whether ``working_set`` exceeds the budget.
+
+        The variant run by ``stage`` is recorded: ``variant`` when the budget
+        is exceeded, "default" otherwise.
+        """
+        exceeded = working_set > self.limit
+        with self._lock:
+            record = self.stages.setdefault(stage, {})
+            record["working_set"] = max(record.get("working_set", 0), working_set)
+            if exceeded or "variant" not in record:
+                record["variant"] = variant if exceeded else "default"
+        return exceeded
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the budget and its stages as a JSON serializable dictionary."""
+        with self._lock:
+            return {
+                "memory_budget": self.limit,
+                "peak_memory": max(
+                    (stage.get("high_water", 0) for stage in self.stages.values()),
+                    default=None,
+                ),
+                "stages": {name: dict(stage) for name, stage in self.stages.items()},
+            }
+
+    def to_json(self) -> str:
+        """Export the budget and its stages as JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+
+class MemorySampler:
+    """
+    Sample the resident memory of the process into the tracked blocks.
+
+    While ``running``, a thread samples the memory every few milliseconds.
+    Each ``track`` block records its high-water mark, sampled at its start,
+    at its end and, when the sampler runs, in between.
+    """
+
+    def __init__(self) -> None:
+        self._open: list[TrackedMemory] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    @contextmanager
+    def running(self) -> Iterator[MemorySampler]:
+        """Sample the memory in a background thread within the enclosed block."""
+        self._stop.clear()
+        thread = threading.Thread(
+            target=self._sample_until_stopped,
+            name="icclim-memory-monitor",
+            daemon=True,
+        )
+        thread.start()
+        try:
+            yield self
+        finally:
+            self._stop.set()
+            thread.join()
+
+    @contextmanager
+    def track(self) -> Iterator[TrackedMemory]:
+        """Track the high-water mark of the enclosed block."""
+        record = TrackedMemory(current_memory())
+        with self._lock:
+            self._open.append(record)
+        try:
+            yield record
+        finally:
+            self.sample()
+            with self._lock:
+                self._open.remove(record)
+
+    def sample(self) -> None:
+        """Raise the high-water mark of the tracked blocks to the current memory."""
+        memory = current_memory()
+        if memory is None:
+            return
+        with self._lock:
+            for record in self._open:
+                record.high_water = max(record.high_water or 0, memory)
+
+    def _sample_until_stopped(self) -> None:
+        while not self._stop.wait(_SAMPLING_INTERVAL_SECONDS):
+            self.sample()
+
+
+class TrackedMemory:
+    """The memory at the start of a tracked block and its high-water mark."""
+
+    __slots__ = ("high_water", "start")
+
+    def __init__(self, start: int | None) -> None:
+        self.start = start
+        self.high_water = start
+
+
+def active_memory_budget() -> MemoryBudget | None:
+    """Return the memory budget of the current context, if any."""
+    return _ACTIVE_BUDGET.get()
+
+
+def resolve_memory_budget(memory_budget: int | str | None) -> MemoryBudget | None:
+    """
+    Build the budget of an ``index()`` call.
+
+    Parameters
+    ----------
+    memory_budget : int | str | None
+        The budget given to ``index``, in bytes or as a size such as "4GB".
+        When None, ``ICCLIM_MEMORY_BUDGET`` is used, if set.
+
+    Returns
+    -------
+    MemoryBudget | None
+        The budget, None when no budget is set.
+    """
+    if memory_budget is None:
+        memory_budget = os.environ.get(_MEMORY_BUDGET_ENV) or None
+    if memory_budget is None:
+        return None
+    if isinstance(memory_budget, str):
+        return MemoryBudget(parse_byte_size(memory_budget))
+    return MemoryBudget(max(1, int(memory_budget)))
+
+
+@contextmanager
+def memory_stage(name: str) -> Iterator[None]:
+    """Track the enclosed block as the stage ``name`` of the active budget."""
+    budget = _ACTIVE_BUDGET.get()
+    if budget is None:
+        yield
+        return
+    with budget.stage(name):
+        yield
+
+
+def exceeds_memory_budget(stage: str, working_set: int, variant: str) -> bool:
+    """
+    Return whether ``working_set`` exceeds the active budget.
+
+    Always False when no budget is active. Otherwise, the variant chosen for
+    ``stage`` is recorded, see ``MemoryBudget.exceeded_by``.
+    """
+    budget = _ACTIVE_BUDGET.get()
+    return budget is not None and budget.exceeded_by(stage, working_set, variant)
+
+
+def dask_worker_count() -> int:
+    """
+    Return the number of chunks the dask workers process concurrently.
+
+    It is dask ``num_workers`` setting, or the CPU count when it is unset.
+    """
+    import dask  # noqa: PLC0415
+
+    return dask.config.get("num_workers", None) or os.cpu_count() or 1
+
+
+def concurrent_working_set(chunk_bytes: int, chunk_count: int) -> int:
+    """
+    Return the memory of the chunks processed concurrently by the dask workers.
+
+    Each chunk is counted with ``WORKING_COPIES`` copies.
+    """
+    return chunk_bytes * min(dask_worker_count(), chunk_count) * WORKING_COPIES
+
+
+def current_memory() -> int | None:
+    """Return the current resident memory of the process, in bytes."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as statm:  # noqa: PTH123
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            pass
+    try:
+        import psutil  # noqa: PLC0415
+    except ImportError:
+        # The lifetime peak of the process bounds its current memory.
+        return _lifetime_peak_memory()
+    return int(psutil.Process().memory_info().rss)
+
+
+def _lifetime_peak_memory() -> int | None:
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:  # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def parse_byte_size(value: str) -> int:
+    """Parse a size in bytes such as "512MiB" or "2GB"; a bare number is bytes."""
+    normalized = value.strip().lower().replace(" ", "")
+    units = {
+        "b": 1,
+        "kb": 1000,
+        "kib": 1024,
+        "mb": 1000**2,
+        "mib": 1024**2,
+        "gb": 1000**3,
+        "gib": 1024**3,
+    }
+    for unit, multiplier in sorted(
+        units.items(), key=lambda item: len(item[0]), reverse=True
+    ):
+        if normalized.endswith(unit):
+            return max(1, int(float(normalized.removesuffix(unit)) * multiplier))
+    return max(1, int(float(normalized)))
@@ -99,15 +99,15 @@ class CfCalendarRegistry(Registry[CfCalendar]):
 
     NO_LEAP = CfCalendar(
         ["noleap", "no_leap", "days_365", "days365", "365_day", "365day"],
-        lambda da: np.full_like(da.shape, False, dtype=bool),
+        lambda da: np.full(da.shape, False, dtype=bool),
     )
     DAYS_360 = CfCalendar(
         ["360_day", "days_360", "360day", "days360"],
-        lambda da: np.full_like(da.shape, False, dtype=bool),
+        lambda da: np.full(da.shape, False, dtype=bool),
     )
     ALL_LEAP = CfCalendar(
         ["all_leap", "allleap", "days_366", "days366", "366_day", "366day"],
-        lambda da: np.full_like(da.shape, True, dtype=bool),
+        lambda da: np.full(da.shape, True, dtype=bool),
     )
     PROLEPTIC_GREGORIAN = CfCalendar(
         ["proleptic_gregorian", "prolepticgregorian"],
@@ -55,6 +55,7 @@ class ThresholdBuilderInput(TypedDict, total=False):
     doy_window_width: int | None
     only_leap_years: bool | None
     interpolation: str | QuantileInterpolation | None
+    quantile_method: str | None
     reference_period: Sequence[datetime | str] | None
     # bounded conf:
     thresholds: (
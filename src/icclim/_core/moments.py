@@ -0,0 +1,209 @@
+"""Mergeable central moments for segmented standard deviation and shape statistics.
+
+Each resampling group is summarised by its count, mean and central moment sums
+``M2 = sum((x - mean)**2)`` (and ``M3``, ``M4`` for skewness and kurtosis),
+accumulated in float64. Two summaries of disjoint samples are merged with the
+pairwise update of Chan et al. generalised by Pébay (2008), which is the
+batched form of Welford's online algorithm and stays stable on float32 inputs.
+
+On dask inputs, every time chunk is summarised separately for the groups it
+touches, without rechunking the input, so the data is read once. Groups split
+between chunks are then merged from these small partial summaries.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from icclim._core.resampling import ResampleGroups
+
+MomentReduction = Literal["std", "var", "skew", "kurtosis"]
+MOMENT_REDUCTIONS = ("std", "var", "skew", "kurtosis")
+
+_COUNT, _MEAN, _M2, _M3, _M4 = range(5)
+
+
+def moment_order(how: MomentReduction) -> int:
+    """Return the highest central moment needed to compute ``how``."""
+    return {"std": 2, "var": 2, "skew": 3, "kurtosis": 4}[how]
+
+
+def segment_moments(
+    values: np.ndarray,
+    lengths: np.ndarray,
+    order: int,
+) -> np.ndarray:
+    """
+    Summarise consecutive segments of ``lengths`` steps along the first axis.
+
+    Returns an array of shape ``(order + 1, len(lengths), *values.shape[1:])``
+    holding the count, mean and central moment sums of each segment. NaN are
+    skipped and empty segments have a zero count.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    moments = np.zeros((order + 1, len(lengths), *values.shape[1:]))
+    non_empty = lengths > 0
+    if not non_empty.any():
+        return moments
+    kept_lengths = lengths[non_empty]
+    starts = np.concatenate(([0], np.cumsum(kept_lengths)[:-1])).astype(np.intp)
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    count = np.add.reduceat(valid.astype(np.float64), starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.add.reduceat(filled, starts, axis=0) / count
+    mean = np.where(count > 0, mean, 0.0)
+    deviation = np.where(valid, values - np.repeat(mean, kept_lengths, axis=0), 0.0)
+    moments[_COUNT, non_empty] = count
+    moments[_MEAN, non_empty] = mean
+    power = deviation
+    for moment in range(2, order + 1):
+        power = power * deviation
+        moments[moment, non_empty] = np.add.reduceat(power, starts, axis=0)
+    return moments
+
+
+def merge_moments(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Merge the moment summaries of two disjoint samples of the same groups."""
+    order = len(left) - 1
+    n_a, n_b = left[_COUNT], right[_COUNT]
+    n = n_a + n_b
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = right[_MEAN] - left[_MEAN]
+        weight = np.where(n > 0, n_a * n_b / n, 0.0)
+        ratio = np.where(n > 0, delta / n, 0.0)
+        merged = np.empty_like(left)
+        merged[_COUNT] = n
+        merged[_MEAN] = left[_MEAN] + np.where(n > 0, n_b * ratio, 0.0)
+        merged[_M2] = left[_M2] + right[_M2] + delta * delta * weight
+        if order >= _M3:
+            merged[_M3] = (
+                left[_M3]
+                + right[_M3]
+                + delta * delta * ratio * weight * (n_a - n_b)
+                + 3.0 * ratio * (n_a * right[_M2] - n_b * left[_M2])
+            )
+        if order >= _M4:
+            merged[_M4] = (
+                left[_M4]
+                + right[_M4]
+                + delta**3 * ratio * weight * (n_a * n_a - n_a * n_b + n_b * n_b) / n
+                + 6.0 * ratio * ratio * (n_a * n_a * right[_M2] + n_b * n_b * left[_M2])
+                + 4.0 * ratio * (n_a * right[_M3] - n_b * left[_M3])
+            )
+    # A merge with an empty summary must give back the other summary exactly.
+    merged = np.where(n_a == 0, right, merged)
+    return np.where(n_b == 0, left, merged)
+
+
+def finalize_moments(moments: np.ndarray, how: MomentReduction) -> np.ndarray:
+    """Turn moment summaries into ``how``, NaN for groups without values."""
+    count = moments[_COUNT]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = moments[_M2] / count
+        if how == "var":
+            result = variance
+        elif how == "std":
+            result = np.sqrt(variance)
+        elif how == "skew":
+            result = moments[_M3] / count / variance**1.5
+        else:
+            result = moments[_M4] / count / (variance * variance) - 3.0
+    return np.where(count > 0, result, np.nan)
+
+
+def segmented_moment_reduce(
+    values: np.ndarray,
+    lengths: np.ndarray,
+    how: MomentReduction,
+) -> np.ndarray:
+    """Reduce consecutive segments of ``lengths`` steps along the first axis."""
+    return finalize_moments(
+        segment_moments(values, lengths, moment_order(how)),
+        how,
+    )
+
+
+def dask_moment_reduce(
+    data: object,
+    groups: ResampleGroups,
+    how: MomentReduction,
+    axis: int,
+    out_dtype: np.dtype,
+) -> object:
+    """
+    Reduce a dask array per group with a single read of each input chunk.
+
+    The time chunks of ``data`` are kept as they are. Each chunk yields one
+    partial summary per group it touches, then the partial summaries of each
+    group are merged.
+    """
+    from icclim._core.resampling import (  # noqa: PLC0415
+        _chunk_group_pieces,
+        _group_aligned_blocks,
+        _group_chunk_spans,
+    )
+
+    order = moment_order(how)
+    chunk_pieces = _chunk_group_pieces(groups.lengths, data.chunks[axis])
+
+    def _summarise_chunk(block: np.ndarray, block_info: dict) -> np.ndarray:
+        piece_lengths = chunk_pieces[block_info[0]["chunk-location"][axis]]
+        moments = segment_moments(np.moveaxis(block, axis, 0), piece_lengths, order)
+        return np.moveaxis(np.moveaxis(moments, 1, axis + 1), 0, -1)
+
+    partial_chunks = list(data.chunks)
+    partial_chunks[axis] = tuple(len(lengths) for lengths in chunk_pieces)
+    partials = data.map_blocks(
+        _summarise_chunk,
+        dtype=np.float64,
+        chunks=(*partial_chunks, (order + 1,)),
+        new_axis=data.ndim,
+        meta=np.empty((0,) * (data.ndim + 1), dtype=np.float64),
+    )
+    # Every group has one partial summary per chunk it touches, and empty
+    # groups have a single empty summary.
+    block_counts = _group_aligned_blocks(
+        _group_chunk_spans(groups.lengths, data.chunks[axis]),
+        max(*partials.chunks[axis], 1),
+    )
+    partial_time_chunks = tuple(int(counts.sum()) for counts in block_counts)
+    if partials.chunks[axis] != partial_time_chunks:
+        partials = partials.rechunk({axis: partial_time_chunks})
+
+    def _merge_block(block: np.ndarray, block_info: dict) -> np.ndarray:
+        counts = block_counts[block_info[0]["chunk-location"][axis]]
+        moments = np.moveaxis(np.moveaxis(block, -1, 0), axis + 1, 1)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            reduced = finalize_moments(_merge_group_partials(moments, counts), how)
+        return np.moveaxis(reduced, 0, axis).astype(out_dtype, copy=False)
+
+    out_chunks = list(data.chunks)
+    out_chunks[axis] = tuple(len(counts) for counts in block_counts)
+    return partials.map_blocks(
+        _merge_block,
+        dtype=out_dtype,
+        chunks=tuple(out_chunks),
+        drop_axis=data.ndim,
+        meta=np.empty((0,) * data.ndim, dtype=out_dtype),
+    )
+
+
+def _merge_group_partials(moments: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Merge the consecutive ``counts`` partial summaries of each group."""
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+    merged = moments[:, starts]
+    for k in range(1, int(counts.max(initial=1))):
+        has_more = counts > k
+        if not has_more.any():
+            break
+        merged[:, has_more] = merge_moments(
+            merged[:, has_more],
+            moments[:, starts[has_more] + k],
+        )
+    return merged
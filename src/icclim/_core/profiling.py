@@ -0,0 +1,316 @@
+"""Context scoped profiling of the phases of an ``index()`` call.
+
+A ``Profile`` records, for each phase of the computation (input opening,
+studied data building, threshold preparation, graph building, compute,
+missing values handling, metadata templating and output writing), its wall
+and CPU durations and the high-water mark of the resident memory of the
+process while it ran. The memory is sampled every few milliseconds while the
+profile is active. Phases can be nested. Counters, such as the size of the
+studied data in memory, and the execution path chosen at each step, such as the
+resampling backend, are recorded alongside.
+
+The active profile is held in a context variable, so concurrent ``index()``
+calls in different threads or tasks each fill their own profile, and
+instrumentation costs one context variable lookup when no profile is active.
+Work dispatched to other threads, for instance dask workers, is not
+attributed to the profile.
+
+A profile can be exported as JSON or in the Chrome trace event format, which
+can be opened with ``chrome://tracing`` or https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from icclim._core.memory import MemorySampler, active_memory_budget
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_ACTIVE_PROFILE: ContextVar[Profile | None] = ContextVar(
+    "icclim_profile",
+    default=None,
+)
+
+
+@dataclass
+class ProfiledPhase:
+    """
+    One timed phase of a profiled computation.
+
+    Parameters
+    ----------
+    name : str
+        The phase name.
+    start : float
+        The wall clock start, in seconds since the profile started.
+    wall_time : float
+        The wall clock duration, in seconds.
+    cpu_time : float
+        The CPU time of the process during the phase, in seconds.
+    peak_memory : int | None
+        The high-water mark of the resident memory of the process during the
+        phase, in bytes, None where it cannot be measured.
+    depth : int
+        The nesting level of the phase, 0 for top level phases.
+    thread_id : int
+        The identifier of the thread that ran the phase.
+    details : dict
+        Counters and notes recorded while the phase was the innermost one.
+    """
+
+    name: str
+    start: float
+    wall_time: float
+    cpu_time: float
+    peak_memory: int | None
+    depth: int
+    thread_id: int
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+class Profile:
+    """
+    Timings, counters and execution paths of one profiled computation.
+
+    Pass an instance as ``profile`` to ``icclim.index`` to fill it, or
+    ``activate`` it to profile any block of icclim calls.
+
+    The ``studied_data_bytes`` counter is the logical size of the studied
+    data, its ``nbytes``. It is not the amount of bytes read from storage,
+    which differs when the input is compressed, when chunks are read more
+    than once or when only part of the input is studied.
+
+    Examples
+    --------
+    >>> import icclim
+    >>> profile = icclim.Profile()
+    >>> ds = icclim.index(
+    ...     in_files=tas, index_name="TG", profile=profile
+    ... )  # doctest: +SKIP
+    >>> profile.to_chrome_trace("tg_trace.json")  # doctest: +SKIP
+    """
+
+    def __init__(self) -> None:
+        self.phases: list[ProfiledPhase] = []
+        self.counters: dict[str, float] = {}
+        self.execution_paths: dict[str, str] = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stack = threading.local()
+        self._sampler = MemorySampler()
+
+    @contextmanager
+    def activate(self) -> Iterator[Profile]:
+        """Make this profile the active one within the enclosed block."""
+        token = _ACTIVE_PROFILE.set(self)
+        try:
+            with self._sampler.running():
+                yield self
+        finally:
+            _ACTIVE_PROFILE.reset(token)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[dict[str, Any]]:
+        """
+        Time the enclosed block as the phase ``name``.
+
+        Yields
+        ------
+        dict
+            The details of the phase, that the block may fill.
+        """
+        stack = self._phase_stack()
+        details: dict[str, Any] = {}
+        stack.append(details)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            with self._sampler.track() as memory:
+                yield details
+        finally:
+            cpu_time = time.process_time() - cpu_start
+            wall_end = time.perf_counter()
+            stack.pop()
+            record = ProfiledPhase(
+                name=name,
+                start=wall_start - self._origin,
+                wall_time=wall_end - wall_start,
+                cpu_time=cpu_time,
+                peak_memory=memory.high_water,
+                depth=len(stack),
+                thread_id=threading.get_ident(),
+                details=details,
+            )
+            with self._lock:
+                self.phases.append(record)
+
+    def count(self, name: str, value: float = 1) -> None:
+        """Add ``value`` to the counter ``name`` and to the current phase."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        stack = self._phase_stack()
+        if stack:
+            stack[-1][name] = stack[-1].get(name, 0) + value
+
+    def set_value(self, name: str, value: float) -> None:
+        """Set the counter ``name`` to ``value``."""
+        with self._lock:
+            self.counters[name] = value
+
+    def note_path(self, step: str, path: str) -> None:
+        """Record that ``step`` ran through the execution ``path``."""
+        with self._lock:
+            self.execution_paths[step] = path
+        stack = self._phase_stack()
+        if stack:
+            stack[-1][f"path.{step}"] = path
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the profile as a JSON serializable dictionary."""
+        with self._lock:
+            return {
+                "phases": [asdict(phase) for phase in self.phases],
+                "counters": dict(self.counters),
+                "execution_paths": dict(self.execution_paths),
+                "peak_memory": max(
+                    (phase.peak_memory or 0 for phase in self.phases),
+                    default=None,
+                ),
+            }
+
+    def to_json(self, path: str | os.PathLike | None = None) -> str:
+        """
+        Export the profile as JSON.
+
+        Parameters
+        ----------
+        path : str | PathLike, optional
+            If given, the file the JSON is also written to.
+
+        Returns
+        -------
+        str
+            The JSON document.
+        """
+        document = json.dumps(self.to_dict(), indent=2, default=str)
+        if path is not None:
+            Path(path).write_text(document)
+        return document
+
+    def to_chrome_trace(
+        self,
+        path: str | os.PathLike | None = None,
+    ) -> dict[str, Any]:
+        """
+        Export the profile in the Chrome trace event format.
+
+        Each phase is a complete ("X") event, counters and execution paths are
+        metadata of the trace.
+
+        Parameters
+        ----------
+        path : str | PathLike, optional
+            If given, the file the trace is also written to, as JSON.
+
+        Returns
+        -------
+        dict
+            The trace document.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": phase.name,
+                "cat": "icclim",
+                "ph": "X",
+                "ts": phase.start * 1e6,
+                "dur": phase.wall_time * 1e6,
+                "pid": pid,
+                "tid": phase.thread_id,
+                "args": {
+                    "cpu_time": phase.cpu_time,
+                    "peak_memory": phase.peak_memory,
+                    **phase.details,
+                },
+            }
+            for phase in sorted(self.phases, key=lambda phase: phase.start)
+        ]
+        trace = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "counters": dict(self.counters),
+                "execution_paths": dict(self.execution_paths),
+            },
+        }
+        if path is not None:
+            Path(path).write_text(json.dumps(trace, default=str))
+        return trace
+
+    def _phase_stack(self) -> list[dict[str, Any]]:
+        stack = getattr(self._stack, "phases", None)
+        if stack is None:
+            stack = self._stack.phases = []
+        return stack
+
+
+def active_profile() -> Profile | None:
+    """Return the profile of the current context, if any."""
+    return _ACTIVE_PROFILE.get()
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[dict[str, Any] | None]:
+    """
+    Time the enclosed block as the phase ``name`` of the active profile.
+
+    The phase is also a stage of the active memory budget, if any.
+    Yields the details of the phase, or None when no profile is active.
+    """
+    profile = _ACTIVE_PROFILE.get()
+    budget = active_memory_budget()
+    if budget is not None:
+        with budget.stage(name), _phase_details(profile, name) as details:
+            yield details
+        return
+    if profile is None:
+        yield None
+        return
+    with profile.phase(name) as details:
+        yield details
+
+
+@contextmanager
+def _phase_details(
+    profile: Profile | None,
+    name: str,
+) -> Iterator[dict[str, Any] | None]:
+    if profile is None:
+        yield None
+        return
+    with profile.phase(name) as details:
+        yield details
+
+
+def profile_count(name: str, value: float = 1) -> None:
+    """Add ``value`` to the counter ``name`` of the active profile."""
+    profile = _ACTIVE_PROFILE.get()
+    if profile is not None:
+        profile.count(name, value)
+
+
+def profile_path(step: str, path: str) -> None:
+    """Record the execution path of ``step`` in the active profile."""
+    profile = _ACTIVE_PROFILE.get()
+    if profile is not None:
+        profile.note_path(step, path)
@@ -0,0 +1,300 @@
+"""Progress reporting of ``index()`` and ``indices()`` calls.
+
+A ``ProgressReporter`` maps the progress of the running stages onto the
+``callback(percent)`` of ``icclim.index``, and optionally forwards each step as
+a ``ProgressEvent`` to a structured callback. Progress comes from:
+
+- the completion of dask tasks, when icclim computes a dask graph with one of
+  the local dask schedulers,
+- the spatial tiles of the tiled bootstrap, with an estimated remaining time
+  derived from the duration of the finished tiles,
+- the indices of an ``indices()`` call.
+
+Stages are nested through spans: a span restricts the progress reported
+within it to a slice of its parent range, e.g. one index of ``indices()`` or
+one bootstrap tile, so that the dask tasks computing that tile move the
+percentage within the tile share only. The reported percentage never
+decreases, and the percent callback is only called when its integer value
+changes.
+
+The active reporter is held in a context variable, like the active profile,
+so the instrumentation costs one context variable lookup when nobody listens.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from dask.callbacks import Callback
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from xarray import DataArray
+
+_ACTIVE_PROGRESS: ContextVar[ProgressReporter | None] = ContextVar(
+    "icclim_progress",
+    default=None,
+)
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """
+    One progress step of an icclim computation.
+
+    Parameters
+    ----------
+    stage : str
+        What progressed: "start", "dask" for dask tasks, "bootstrap_tiles" for
+        the tiled bootstrap, "indices" for the indices of ``indices()`` or
+        "done".
+    percent : int
+        The overall percentage, within the range of the callback.
+    completed : float
+        The completed amount of the stage: tasks, spatial cells or indices.
+    total : float
+        The total amount of the stage.
+    eta : float | None
+        The estimated remaining time of the stage, in seconds, when known.
+    label : str | None
+        What the stage works on, e.g. the index name or the bootstrap path.
+    """
+
+    stage: str
+    percent: int
+    completed: float
+    total: float
+    eta: float | None = None
+    label: str | None = None
+
+
+class ProgressReporter:
+    """
+    Map the progress of nested stages onto a percentage callback.
+
+    Parameters
+    ----------
+    callback : Callable[[int], None] | None
+        Called with the overall percentage each time its integer value changes.
+    start : int
+        The percentage at the start of the computation.
+    end : int
+        The percentage at its end.
+    on_event : Callable[[ProgressEvent], None] | None
+        Called with every progress event. Dask task events are only forwarded
+        when the percentage changes.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[int], None] | None,
+        start: int = 0,
+        end: int = 100,
+        on_event: Callable[[ProgressEvent], None] | None = None,
+    ) -> None:
+        self.callback = callback
+        self.on_event = on_event
+        self._lock = threading.RLock()
+        self._spans = [(float(start), float(end))]
+        self._percent = float(start)
+        self._last_reported: int | None = None
+
+    @property
+    def percent(self) -> float:
+        """The overall percentage reached so far."""
+        return self._percent
+
+    @contextmanager
+    def activate(self) -> Iterator[ProgressReporter]:
+        """Make this reporter the active one within the enclosed block."""
+        token = _ACTIVE_PROGRESS.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_PROGRESS.reset(token)
+
+    @contextmanager
+    def span(self, start: float, end: float) -> Iterator[None]:
+        """
+        Restrict the progress reported in the enclosed block.
+
+        Parameters
+        ----------
+        start, end : float
+            The slice of the current range given to the block, as fractions
+            between 0 and 1.
+        """
+        with self._lock:
+            low, high = self._spans[-1]
+            self._spans.append(
+                (low + (high - low) * start, low + (high - low) * end),
+            )
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._spans.pop()
+
+    def report(
+        self,
+        stage: str,
+        completed: float,
+        total: float,
+        *,
+        eta: float | None = None,
+        label: str | None = None,
+        only_on_change: bool = False,
+    ) -> None:
+        """
+        Report that ``completed`` of ``total`` of the current span are done.
+
+        Parameters
+        ----------
+        stage : str
+            The progressing stage, see ``ProgressEvent``.
+        completed, total : float
+            The progress of the stage within the current span.
+        eta : float | None
+            The estimated remaining time of the stage, in seconds.
+        label : str | None
+            What the stage works on.
+        only_on_change : bool
+            Whether to skip the event when the integer percentage is unchanged.
+        """
+        with self._lock:
+            low, high = self._spans[-1]
+            fraction = min(max(completed / total, 0.0), 1.0) if total > 0 else 1.0
+            self._percent = max(self._percent, low + (high - low) * fraction)
+            percent = int(self._percent)
+            changed = percent != self._last_reported
+            self._last_reported = percent
+        if changed and self.callback is not None:
+            self.callback(percent)
+        if self.on_event is not None and (changed or not only_on_change):
+            self.on_event(
+                ProgressEvent(
+                    stage=stage,
+                    percent=percent,
+                    completed=completed,
+                    total=total,
+                    eta=eta,
+                    label=label,
+                ),
+            )
+
+    @contextmanager
+    def track_dask(self) -> Iterator[None]:
+        """Report the completion of the dask tasks computed in the block."""
+        with _DaskProgress(self):
+            yield
+
+
+class _DaskProgress(Callback):
+    """Dask local scheduler callback reporting finished tasks."""
+
+    def __init__(self, reporter: ProgressReporter) -> None:
+        super().__init__()
+        self._reporter = reporter
+
+    def _posttask(
+        self,
+        _key: object,
+        _result: object,
+        _dsk: object,
+        state: dict[str, Any],
+        _worker_id: object,
+    ) -> None:
+        done = len(state["finished"])
+        total = done + sum(len(state[name]) for name in ("ready", "waiting", "running"))
+        self._reporter.report("dask", done, total, only_on_change=True)
+
+
+def active_progress() -> ProgressReporter | None:
+    """Return the progress reporter of the current context, if any."""
+    return _ACTIVE_PROGRESS.get()
+
+
+def progress_span(start: float, end: float) -> AbstractContextManager[None]:
+    """Restrict the progress reported in the block, when a reporter is active."""
+    reporter = _ACTIVE_PROGRESS.get()
+    if reporter is None:
+        return nullcontext()
+    return reporter.span(start, end)
+
+
+def report_progress(
+    stage: str,
+    completed: float,
+    total: float,
+    *,
+    eta: float | None = None,
+    label: str | None = None,
+) -> None:
+    """Report progress to the active reporter, if any."""
+    reporter = _ACTIVE_PROGRESS.get()
+    if reporter is not None:
+        reporter.report(stage, completed, total, eta=eta, label=label)
+
+
+def track_dask_progress() -> AbstractContextManager[None]:
+    """Report the dask tasks computed in the block, when a reporter is active."""
+    reporter = _ACTIVE_PROGRESS.get()
+    if reporter is None:
+        return nullcontext()
+    return reporter.track_dask()
+
+
+class TileProgress:
+    """
+    Report the progress of a loop over the spatial tiles of ``study``.
+
+    The remaining time is estimated from the mean duration per cell of the
+    finished tiles, since adaptive tiles change size after the first one.
+
+    Parameters
+    ----------
+    study : DataArray
+        The tiled data.
+    label : str
+        What the tiles compute, e.g. the bootstrap path.
+    """
+
+    def __init__(self, study: DataArray, label: str) -> None:
+        self.label = label
+        self.total_cells = math.prod(
+            size for dim, size in study.sizes.items() if dim != "time"
+        )
+        self.done_cells = 0
+        self.seconds = 0.0
+
+    @contextmanager
+    def tile(self, tile_indexers: dict[str, slice]) -> Iterator[None]:
+        """Report the dask tasks of the tile computed in the block, then the tile."""
+        cells = math.prod(
+            indexer.stop - indexer.start for indexer in tile_indexers.values()
+        )
+        start = time.perf_counter()
+        with (
+            progress_span(
+                self.done_cells / self.total_cells,
+                (self.done_cells + cells) / self.total_cells,
+            ),
+            track_dask_progress(),
+        ):
+            yield
+        self.seconds += time.perf_counter() - start
+        self.done_cells += cells
+        report_progress(
+            "bootstrap_tiles",
+            self.done_cells,
+            self.total_cells,
+            eta=self.seconds / self.done_cells * (self.total_cells - self.done_cells),
+            label=self.label,
+        )
@@ -0,0 +1,463 @@
+"""Mergeable quantile sketches for approximate percentiles on large grids.
+
+Exact percentiles need either the whole sample of a cell at once or, with
+``quantile_method="radix"``, one pass over the input per byte of its dtype
+(see ``icclim._core.quantile_selection``). With ``quantile_method="sketch"``,
+every time chunk is instead summarised, per cell and per resampling group, by
+at most ``k`` weighted points, and the summaries of a group are merged by
+batches of ``_MERGE_FANOUT``. A summary has as many rows as the time steps it
+summarises, up to ``k``, so the short group pieces at chunk edges stay small. The input is read once,
+is never rechunked, and each cell holds at most ``_MERGE_FANOUT * k`` points
+at any time. ``k`` is read from ``ICCLIM_QUANTILE_SKETCH_SIZE`` (512 by
+default).
+
+A summary is a sorted list of points with a weight each. As long as a cell
+has at most ``k`` valid values, its summary holds them all with a unit
+weight, and percentiles are then exactly the ones of the exact method. Beyond
+``k`` values, a compaction keeps the ``k`` points found at evenly spaced
+cumulative weights, each with weight ``W / k`` for a total weight ``W``.
+
+Error guarantee: a compaction moves the rank of any value by at most
+``W / k``. The summaries of one merge level partition the sample, so each
+level adds at most ``n / k`` of rank error, ``n`` being the number of valid
+values of the cell in the group. A group spread over ``m`` time chunks goes
+through at most ``L = 1 + ceil(log_8(m))`` compaction levels, so the returned
+percentile is a value whose rank is within ``L * n / k`` of the requested rank
+(0.2 % of the sample for a single chunk with the default ``k``). The error is
+on ranks, so it is independent of the value distribution.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from typing import Literal
+
+import numpy as np
+
+QuantileMethod = Literal["exact", "radix", "sketch"]
+QUANTILE_METHODS = ("exact", "radix", "sketch")
+DEFAULT_SKETCH_SIZE = 512
+
+_SKETCH_SIZE_ENV = "ICCLIM_QUANTILE_SKETCH_SIZE"
+_MERGE_FANOUT = 8
+
+
+def get_sketch_size() -> int:
+    """Return the number of points ``k`` kept per cell by a sketch."""
+    value = os.environ.get(_SKETCH_SIZE_ENV)
+    if not value:
+        return DEFAULT_SKETCH_SIZE
+    return max(int(value), 2)
+
+
+def sketch_rank_error_bound(chunk_count: int, sketch_size: int | None = None) -> float:
+    """
+    Return the worst relative rank error of a sketch percentile.
+
+    Parameters
+    ----------
+    chunk_count : int
+        The number of time chunks a resampling group is spread over.
+    sketch_size : int | None
+        The number of points kept per cell, by default ``get_sketch_size()``.
+
+    Returns
+    -------
+    float
+        The bound, as a fraction of the number of valid values of a cell.
+    """
+    levels = 1 + math.ceil(math.log(max(chunk_count, 1), _MERGE_FANOUT))
+    return levels / (sketch_size or get_sketch_size())
+
+
+def sketch_quantiles(
+    data: object,
+    lengths: np.ndarray,
+    quantiles: np.ndarray,
+    alpha: float,
+    beta: float,
+    axis: int,
+    sketch_size: int | None = None,
+) -> object:
+    """
+    Compute approximate quantiles of consecutive groups of ``data`` along ``axis``.
+
+    Parameters
+    ----------
+    data : np.ndarray | dask.array.Array
+        The input values, NaN are skipped.
+    lengths : np.ndarray
+        The number of time steps of each group.
+    quantiles : np.ndarray
+        The quantiles to compute, between 0 and 1.
+    alpha, beta : float
+        The plotting positions of the quantile interpolation, as in
+        ``xclim.core.utils.calc_perc``.
+    axis : int
+        The position of the time axis.
+    sketch_size : int | None
+        The number of points kept per cell, by default ``get_sketch_size()``.
+
+    Returns
+    -------
+    np.ndarray | dask.array.Array
+        The quantiles, float64, with ``axis`` replaced by the groups and a new
+        trailing axis for ``quantiles``.
+    """
+    quantiles = np.atleast_1d(np.asarray(quantiles, dtype=np.float64))
+    lengths = np.asarray(lengths, dtype=np.int64)
+    size = int(sketch_size or get_sketch_size())
+    if hasattr(data, "chunks"):
+        return _dask_sketch_quantiles(data, lengths, quantiles, alpha, beta, axis, size)
+    values, cell_shape = _to_cells(np.asarray(data), axis)
+    sizes = _summary_sizes(lengths, size)
+    points, weights = _sketch_segments(values, lengths, sizes)
+    result = _segment_quantiles(points, weights, sizes, quantiles, alpha, beta)
+    return _quantiles_from_cells(result, cell_shape, axis)
+
+
+def _summary_sizes(lengths: np.ndarray, size: int) -> np.ndarray:
+    """Return the rows of the summaries of pieces of ``lengths`` time steps."""
+    return np.clip(np.asarray(lengths, dtype=np.int64), 1, size)
+
+
+def _dask_sketch_quantiles(
+    data: object,
+    lengths: np.ndarray,
+    quantiles: np.ndarray,
+    alpha: float,
+    beta: float,
+    axis: int,
+    size: int,
+) -> object:
+    from icclim._core.resampling import (  # noqa: PLC0415
+        _chunk_group_pieces,
+        _group_chunk_spans,
+    )
+
+    chunk_pieces = _chunk_group_pieces(lengths, data.chunks[axis])
+    chunk_sizes = [_summary_sizes(pieces, size) for pieces in chunk_pieces]
+
+    def _summarise_chunk(block: np.ndarray, block_info: dict) -> np.ndarray:
+        location = block_info[0]["chunk-location"][axis]
+        values, cell_shape = _to_cells(block, axis)
+        points, weights = _sketch_segments(
+            values, chunk_pieces[location], chunk_sizes[location]
+        )
+        return _stack_sketches(points, weights, cell_shape, axis)
+
+    sketch_chunks = list(data.chunks)
+    sketch_chunks[axis] = tuple(int(sizes.sum()) for sizes in chunk_sizes)
+    sketches = data.map_blocks(
+        _summarise_chunk,
+        dtype=np.float64,
+        chunks=(*sketch_chunks, (2,)),
+        new_axis=data.ndim,
+        meta=np.empty((0,) * (data.ndim + 1), dtype=np.float64),
+    )
+    summary_sizes = np.concatenate(chunk_sizes)
+    sketch_counts = _group_chunk_spans(lengths, data.chunks[axis])
+    while sketch_counts.max(initial=1) > 1:
+        batch_sizes = np.concatenate(
+            [_merge_batches_of(count) for count in sketch_counts]
+        )
+        sketch_counts = -(-sketch_counts // _MERGE_FANOUT)
+        sketches, summary_sizes = _merge_level(
+            sketches, summary_sizes, batch_sizes, axis, size
+        )
+    return _finalize_level(sketches, summary_sizes, quantiles, alpha, beta, axis, size)
+
+
+def _merge_batches_of(count: int) -> np.ndarray:
+    full, rest = divmod(int(count), _MERGE_FANOUT)
+    return np.array([_MERGE_FANOUT] * full + ([rest] if rest else []), dtype=np.int64)
+
+
+def _merge_level(
+    sketches: object,
+    summary_sizes: np.ndarray,
+    batch_sizes: np.ndarray,
+    axis: int,
+    size: int,
+) -> tuple[object, np.ndarray]:
+    from icclim._core.resampling import _group_aligned_blocks  # noqa: PLC0415
+
+    batch_starts = np.concatenate(([0], np.cumsum(batch_sizes)[:-1]))
+    merged_sizes = np.minimum(np.add.reduceat(summary_sizes, batch_starts), size)
+    block_batches = _group_aligned_blocks(
+        batch_sizes,
+        max(_MERGE_FANOUT, max(sketches.chunks[axis]) // size),
+    )
+    block_sizes = _split(summary_sizes, [int(b.sum()) for b in block_batches])
+    block_merged_sizes = _split(merged_sizes, [len(b) for b in block_batches])
+    sketches = _rechunk_sketches(
+        sketches,
+        axis,
+        tuple(int(sizes.sum()) for sizes in block_sizes),
+    )
+
+    def _merge_block(block: np.ndarray, block_info: dict) -> np.ndarray:
+        location = block_info[0]["chunk-location"][axis]
+        points, cell_shape = _to_cells(block[..., 0], axis)
+        weights, _ = _to_cells(block[..., 1], axis)
+        points, weights = _merge_batches(
+            points,
+            weights,
+            block_batches[location],
+            block_sizes[location],
+            size,
+        )
+        return _stack_sketches(points, weights, cell_shape, axis)
+
+    out_chunks = list(sketches.chunks)
+    out_chunks[axis] = tuple(int(sizes.sum()) for sizes in block_merged_sizes)
+    merged = sketches.map_blocks(
+        _merge_block,
+        dtype=np.float64,
+        chunks=tuple(out_chunks),
+        meta=np.empty((0,) * sketches.ndim, dtype=np.float64),
+    )
+    return merged, merged_sizes
+
+
+def _finalize_level(
+    sketches: object,
+    summary_sizes: np.ndarray,
+    quantiles: np.ndarray,
+    alpha: float,
+    beta: float,
+    axis: int,
+    size: int,
+) -> object:
+    from icclim._core.resampling import _group_aligned_blocks  # noqa: PLC0415
+
+    # One summary per group is left, blocks are packed by their rows.
+    block_sizes = _group_aligned_blocks(
+        summary_sizes,
+        max(size, *sketches.chunks[axis]),
+    )
+    sketches = _rechunk_sketches(
+        sketches,
+        axis,
+        tuple(int(sizes.sum()) for sizes in block_sizes),
+    )
+
+    def _finalize_block(block: np.ndarray, block_info: dict) -> np.ndarray:
+        sizes = block_sizes[block_info[0]["chunk-location"][axis]]
+        points, cell_shape = _to_cells(block[..., 0], axis)
+        weights, _ = _to_cells(block[..., 1], axis)
+        result = _segment_quantiles(points, weights, sizes, quantiles, alpha, beta)
+        return _quantiles_from_cells(result, cell_shape, axis)
+
+    out_chunks = list(sketches.chunks)
+    out_chunks[axis] = tuple(len(sizes) for sizes in block_sizes)
+    out_chunks[-1] = (len(quantiles),)
+    return sketches.map_blocks(
+        _finalize_block,
+        dtype=np.float64,
+        chunks=tuple(out_chunks),
+        meta=np.empty((0,) * sketches.ndim, dtype=np.float64),
+    )
+
+
+def _split(values: np.ndarray, counts: list[int]) -> list[np.ndarray]:
+    """Split ``values`` into consecutive pieces of ``counts`` items."""
+    return np.split(values, np.cumsum(counts)[:-1])
+
+
+def _rechunk_sketches(sketches: object, axis: int, time_chunks: tuple) -> object:
+    if sketches.chunks[axis] == time_chunks:
+        return sketches
+    return sketches.rechunk({axis: time_chunks})
+
+
+def _to_cells(block: np.ndarray, axis: int) -> tuple[np.ndarray, tuple[int, ...]]:
+    moved = np.moveaxis(block, axis, 0)
+    return moved.reshape(moved.shape[0], -1), moved.shape[1:]
+
+
+def _from_cells(
+    rows: np.ndarray,
+    cell_shape: tuple[int, ...],
+    axis: int,
+) -> np.ndarray:
+    return np.moveaxis(rows.reshape(rows.shape[0], *cell_shape), 0, axis)
+
+
+def _stack_sketches(
+    points: np.ndarray,
+    weights: np.ndarray,
+    cell_shape: tuple[int, ...],
+    axis: int,
+) -> np.ndarray:
+    return np.stack(
+        [_from_cells(points, cell_shape, axis), _from_cells(weights, cell_shape, axis)],
+        axis=-1,
+    )
+
+
+def _quantiles_from_cells(
+    result: np.ndarray,
+    cell_shape: tuple[int, ...],
+    axis: int,
+) -> np.ndarray:
+    """Move ``(groups, quantiles, cells)`` to the input layout plus quantiles."""
+    result = result.reshape(*result.shape[:2], *cell_shape)
+    return np.moveaxis(np.moveaxis(result, 1, -1), 0, axis)
+
+
+def _row_edges(sizes: np.ndarray) -> np.ndarray:
+    """Return the first row of each summary of ``sizes`` rows, then the end."""
+    return np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+
+
+def _sketch_segments(
+    values: np.ndarray,
+    lengths: np.ndarray,
+    sizes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Summarise each segment of ``lengths`` rows into ``sizes`` weighted points."""
+    edges = _row_edges(sizes)
+    points = np.full((edges[-1], values.shape[1]), np.nan)
+    weights = np.zeros_like(points)
+    start = 0
+    for i, length in enumerate(lengths):
+        segment = np.sort(values[start : start + length], axis=0).astype(np.float64)
+        segment_weights = (~np.isnan(segment)).astype(np.float64)
+        rows = slice(edges[i], edges[i + 1])
+        points[rows], weights[rows] = _compact(segment, segment_weights, sizes[i])
+        start += length
+    return points, weights
+
+
+def _merge_batches(
+    points: np.ndarray,
+    weights: np.ndarray,
+    batch_sizes: np.ndarray,
+    summary_sizes: np.ndarray,
+    size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge consecutive batches of ``batch_sizes`` sketches into one sketch each."""
+    edges = _row_edges(summary_sizes)
+    merged_points = []
+    merged_weights = []
+    for first, last in itertools.pairwise(_row_edges(batch_sizes)):
+        rows = slice(edges[first], edges[last])
+        batch_points, batch_weights = points[rows], weights[rows]
+        if last - first > 1:
+            order = np.argsort(batch_points, axis=0, kind="stable")
+            batch_points = np.take_along_axis(batch_points, order, axis=0)
+            batch_weights = np.take_along_axis(batch_weights, order, axis=0)
+            batch_points, batch_weights = _compact(
+                batch_points, batch_weights, min(size, len(batch_points))
+            )
+        merged_points.append(batch_points)
+        merged_weights.append(batch_weights)
+    return np.concatenate(merged_points), np.concatenate(merged_weights)
+
+
+def _compact(
+    points: np.ndarray,
+    weights: np.ndarray,
+    size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce sorted weighted points to ``size`` points per cell.
+
+    ``points`` must be sorted along the first axis with the zero-weight NaN
+    rows last. Cells with at most ``size`` valid points keep them unchanged.
+    """
+    row_count, cell_count = points.shape
+    if row_count <= size:
+        padding = size - row_count
+        return (
+            np.concatenate([points, np.full((padding, cell_count), np.nan)]),
+            np.concatenate([weights, np.zeros((padding, cell_count))]),
+        )
+    total = weights.sum(axis=0)
+    cumulative = np.cumsum(weights, axis=0)
+    targets = (np.arange(size)[:, np.newaxis] + 0.5) / size * total
+    picked = np.minimum(
+        _cellwise_searchsorted(cumulative, targets, total + 1),
+        row_count - 1,
+    )
+    is_exact = (weights > 0).sum(axis=0) <= size
+    return (
+        np.where(
+            is_exact,
+            points[:size],
+            np.take_along_axis(points, picked, axis=0),
+        ),
+        np.where(
+            is_exact,
+            weights[:size],
+            np.broadcast_to(total / size, (size, cell_count)),
+        ),
+    )
+
+
+def _segment_quantiles(
+    points: np.ndarray,
+    weights: np.ndarray,
+    sizes: np.ndarray,
+    quantiles: np.ndarray,
+    alpha: float,
+    beta: float,
+) -> np.ndarray:
+    """Interpolate ``quantiles`` of each sketch, returned as (groups, q, cells)."""
+    result = np.empty((len(sizes), len(quantiles), points.shape[1]))
+    q = quantiles[:, np.newaxis]
+    for i, (start, stop) in enumerate(itertools.pairwise(_row_edges(sizes))):
+        group_points, group_weights = points[start:stop], weights[start:stop]
+        total = group_weights.sum(axis=0)
+        valid_count = (group_weights > 0).sum(axis=0)
+        # Each point sits at the center of its weight, so unit weights give
+        # the usual 0..n-1 positions of the exact method.
+        positions = (
+            np.cumsum(group_weights, axis=0) - group_weights + (group_weights - 1) / 2
+        )
+        virtual = total * q + alpha + q * (1 - alpha - beta) - 1
+        virtual = np.clip(virtual, 0, np.maximum(total - 1, 0))
+        upper = np.minimum(
+            _cellwise_searchsorted(positions, virtual, total + 1),
+            np.maximum(valid_count - 1, 0),
+        )
+        lower = np.maximum(upper - 1, 0)
+        low_position = np.take_along_axis(positions, lower, axis=0)
+        high_position = np.take_along_axis(positions, upper, axis=0)
+        low_value = np.take_along_axis(group_points, lower, axis=0)
+        high_value = np.take_along_axis(group_points, upper, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = np.where(
+                high_position > low_position,
+                (virtual - low_position) / (high_position - low_position),
+                0.0,
+            )
+        fraction = np.clip(fraction, 0.0, 1.0)
+        interpolated = low_value + fraction * (high_value - low_value)
+        result[i] = np.where(valid_count > 0, interpolated, np.nan)
+    return result
+
+
+def _cellwise_searchsorted(
+    rows: np.ndarray,
+    targets: np.ndarray,
+    bound: np.ndarray,
+) -> np.ndarray:
+    """
+    Return, per cell, the first row index whose value is >= each target.
+
+    ``rows`` must be non-decreasing along the first axis and every row and
+    target of a cell must lie in ``[0, bound)``. The cells are laid end to end
+    on one sorted axis so that a single ``searchsorted`` serves all of them.
+    """
+    row_count, cell_count = rows.shape
+    offsets = 2.0 * np.arange(cell_count)
+    scale = np.where(bound > 0, bound, 1.0)
+    flat_rows = (rows / scale + offsets).T.ravel()
+    flat_targets = (targets / scale + offsets).T.ravel()
+    found = np.searchsorted(flat_rows, flat_targets, side="left")
+    found = found.reshape(cell_count, -1).T - (np.arange(cell_count) * row_count)
+    return np.clip(found, 0, row_count)
@@ -0,0 +1,141 @@
+"""Resampling plan shared by the steps computing one index on one variable.
+
+Within one ``index()`` call, the reducer, the missing values check and the
+unit handling each used to rediscover the resampling of the studied data: the
+source sampling frequency was inferred again from the time axis at every
+call, and xclim's missing value methods resampled a full boolean copy of the
+data. A ``ResamplePlan`` holds, for one studied variable and one frequency,
+the resampling groups, the inferred source frequency and the number of valid
+values per group, each computed once on first use.
+
+The ``any``, ``pct`` and ``at_least_n`` missing value methods are derived from
+these valid counts and xclim's expected counts, which only depend on the time
+axis. Other methods, and methods with a ``subfreq``, keep xclim's
+implementation.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from icclim._core.resampling import get_resample_groups, resample_reduce
+
+if TYPE_CHECKING:
+    from xarray import DataArray
+
+    from icclim._core.resampling import ResampleGroups
+
+
+@dataclass
+class ResamplePlan:
+    """
+    Lazily computed resampling facts of one studied variable at one frequency.
+
+    Parameters
+    ----------
+    data : DataArray
+        The studied data the plan describes.
+    freq : str
+        The pandas resampling frequency.
+    """
+
+    data: DataArray
+    freq: str
+    _valid_counts: dict[str, DataArray] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    @cached_property
+    def groups(self) -> ResampleGroups | None:
+        """The resampling groups of the time axis, None if it is not sorted."""
+        return get_resample_groups(self.data.indexes["time"], self.freq)
+
+    @cached_property
+    def source_frequency(self) -> str | None:
+        """The sampling frequency of the data, as given by ``check_freq``."""
+        from icclim._core.generic.functions import check_freq  # noqa: PLC0415
+
+        return check_freq(self.data, dim="time")
+
+    def valid_counts(self, indexer: dict[str, Any] | None = None) -> DataArray:
+        """
+        Return the number of valid values per group, NaN for empty groups.
+
+        Parameters
+        ----------
+        indexer : dict, optional
+            A ``xclim.core.calendar.select_time`` indexer restricting the
+            values taken into account.
+        """
+        key = json.dumps(indexer or {}, sort_keys=True, default=str)
+        counts = self._valid_counts.get(key)
+        if counts is None:
+            data = self.data
+            if indexer:
+                from xclim.core.calendar import select_time  # noqa: PLC0415
+
+                data = select_time(data, **indexer)
+            counts = resample_reduce(data, self.freq, "count")
+            self._valid_counts[key] = counts
+        return counts
+
+    def missing_mask(
+        self,
+        missing: object,
+        src_timestep: str | None,
+        indexer: dict[str, Any] | None = None,
+    ) -> DataArray | None:
+        """
+        Return the missing periods mask of ``missing``, from the valid counts.
+
+        Parameters
+        ----------
+        missing : xclim.core.missing.MissingBase
+            The missing values method, with its options.
+        src_timestep : str | None
+            The expected sampling frequency of the data.
+        indexer : dict, optional
+            A ``xclim.core.calendar.select_time`` indexer.
+
+        Returns
+        -------
+        DataArray | None
+            True on the periods to mask, as the xclim method would return it,
+            or None when the method cannot be derived from valid counts.
+        """
+        from xclim.core.missing import (  # noqa: PLC0415
+            AtLeastNValid,
+            MissingAny,
+            MissingPct,
+            expected_count,
+        )
+
+        options = getattr(missing, "options", {})
+        if options.get("subfreq") is not None:
+            return None
+        # Subclasses may redefine ``is_missing``, only the xclim methods are known.
+        method = type(missing)
+        if method not in (AtLeastNValid, MissingAny, MissingPct):
+            return None
+        if src_timestep is None or not missing._validate_src_timestep(src_timestep):  # noqa: SLF001
+            # Let xclim raise its own error.
+            return None
+        # xclim sums a validity mask, which gives 0 for empty groups.
+        valid = self.valid_counts(indexer).fillna(0)
+        if method is AtLeastNValid:
+            return valid < options["n"]
+        expected = expected_count(
+            self.data.time,
+            freq=self.freq,
+            src_timestep=src_timestep,
+            **(indexer or {}),
+        )
+        if method is MissingAny:
+            return valid != expected
+        missing_days = (expected - valid).fillna(expected)
+        return (missing_days / expected) >= options["tolerance"]
@@ -0,0 +1,431 @@
+"""Group-index resampling backend for the generic reducers.
+
+``DataArray.resample`` rebuilds its bins on every call and, on dask inputs,
+usually produces one task per group. This backend instead computes the start
+offset and length of every resampling group once per time index and
+frequency, caches them, and runs each reduction as a single segmented
+``ufunc.reduceat`` call per chunk.
+
+Dask inputs are first rechunked so that no group straddles two time chunks,
+then reduced with one ``map_blocks`` task per chunk. The graph size therefore
+depends on the number of chunks and not on the number of years.
+
+Results match ``DataArray.resample(time=freq).<how>(dim="time")``: NaN are
+skipped, empty groups give NaN and attributes are kept. Standard deviation,
+variance, skewness and kurtosis are computed from mergeable float64 moments
+(see ``icclim._core.moments``), which read each dask chunk once without
+rechunking the input.
+Set ``ICCLIM_RESAMPLE_BACKEND=xarray`` to always use xarray resampling.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from icclim._core.moments import (
+    MOMENT_REDUCTIONS,
+    dask_moment_reduce,
+    segmented_moment_reduce,
+)
+from icclim._core.profiling import profile_path
+
+if TYPE_CHECKING:
+    from xarray import DataArray
+
+ResampleReduction = Literal[
+    "sum",
+    "mean",
+    "max",
+    "min",
+    "std",
+    "var",
+    "skew",
+    "kurtosis",
+    "count",
+    "argmax",
+    "argmin",
+]
+
+_RESAMPLE_BACKEND_ENV = "ICCLIM_RESAMPLE_BACKEND"
+_MAX_CACHED_GROUPS = 64
+_RESAMPLE_GROUPS_CACHE: dict[tuple, ResampleGroups] = {}
+
+
+@dataclass(frozen=True)
+class ResampleGroups:
+    """
+    Contiguous resampling groups of a sorted time index.
+
+    Parameters
+    ----------
+    labels : pd.Index
+        The time label of each group, as produced by xarray resampling.
+    starts : np.ndarray
+        The offset of the first time step of each group.
+    lengths : np.ndarray
+        The number of time steps of each group, 0 for empty groups.
+    """
+
+    labels: pd.Index
+    starts: np.ndarray
+    lengths: np.ndarray
+
+    def __len__(self) -> int:
+        """Return the number of groups."""
+        return len(self.lengths)
+
+
+def resample_backend_enabled() -> bool:
+    """Return whether the group-index backend may replace xarray resampling."""
+    return os.environ.get(_RESAMPLE_BACKEND_ENV, "index").lower() != "xarray"
+
+
+def get_resample_groups(
+    time_index: pd.Index,
+    freq: str,
+) -> ResampleGroups | None:
+    """
+    Return the cached resampling groups of ``time_index`` at ``freq``.
+
+    ``None`` is returned when the index is not a sorted datetime index, in which
+    case the groups are not contiguous and xarray resampling must be used.
+    """
+    if not isinstance(time_index, (pd.DatetimeIndex, xr.CFTimeIndex)):
+        return None
+    if not time_index.is_monotonic_increasing:
+        return None
+    key = _resample_groups_key(time_index, freq)
+    groups = _RESAMPLE_GROUPS_CACHE.get(key)
+    if groups is None:
+        groups = _build_resample_groups(time_index, freq)
+        if len(_RESAMPLE_GROUPS_CACHE) >= _MAX_CACHED_GROUPS:
+            _RESAMPLE_GROUPS_CACHE.pop(next(iter(_RESAMPLE_GROUPS_CACHE)))
+        _RESAMPLE_GROUPS_CACHE[key] = groups
+    return groups
+
+
+def has_cached_resample_groups(time_index: pd.Index, freq: str) -> bool:
+    """Return whether the resampling groups of ``time_index`` at ``freq`` are cached."""
+    if not isinstance(time_index, (pd.DatetimeIndex, xr.CFTimeIndex)):
+        return False
+    return _resample_groups_key(time_index, freq) in _RESAMPLE_GROUPS_CACHE
+
+
+def clear_resample_groups_cache() -> None:
+    """Forget every cached resampling group."""
+    _RESAMPLE_GROUPS_CACHE.clear()
+
+
+def resample_reduce(
+    da: DataArray,
+    freq: str,
+    how: ResampleReduction,
+) -> DataArray:
+    """
+    Resample ``da`` along time at ``freq`` and reduce each group with ``how``.
+
+    Falls back to xarray resampling when the backend is disabled or when the
+    time index does not allow contiguous groups. ``argmax`` and ``argmin``
+    return the offset of the extremum within its group, and -1 for groups
+    without any valid value. ``std`` and ``var`` use ``ddof=0``, ``skew`` and
+    ``kurtosis`` are the biased sample skewness and excess kurtosis.
+    """
+    groups = (
+        get_resample_groups(da.indexes["time"], freq)
+        if resample_backend_enabled()
+        and "time" in da.indexes
+        and _is_reducible_dtype(da.dtype)
+        else None
+    )
+    if groups is None:
+        profile_path("resample", "xarray")
+        return _xarray_resample_reduce(da, freq, how)
+    profile_path("resample", "group_index")
+    axis = da.get_axis_num("time")
+    has_empty_groups = bool((groups.lengths == 0).any())
+    out_dtype = _result_dtype(da.dtype, how, has_empty_groups)
+    if hasattr(da.data, "chunks") and how in MOMENT_REDUCTIONS:
+        data = dask_moment_reduce(da.data, groups, how, axis, out_dtype)
+    elif hasattr(da.data, "chunks"):
+        data = _dask_segmented_reduce(da.data, groups, how, axis, out_dtype)
+    else:
+        data = _segmented_reduce(
+            np.asarray(da.data), groups.lengths, how, axis, out_dtype
+        )
+    coords = {
+        name: coord for name, coord in da.coords.items() if "time" not in coord.dims
+    }
+    coords["time"] = groups.labels
+    return xr.DataArray(
+        data,
+        dims=da.dims,
+        coords=coords,
+        attrs=dict(da.attrs),
+        name=da.name,
+    )
+
+
+def _resample_groups_key(time_index: pd.Index, freq: str) -> tuple:
+    digest = hashlib.blake2b(
+        np.ascontiguousarray(time_index.asi8).tobytes(),
+        digest_size=16,
+    ).hexdigest()
+    calendar = getattr(time_index, "calendar", None)
+    return (freq, type(time_index).__name__, calendar, len(time_index), digest)
+
+
+def _build_resample_groups(time_index: pd.Index, freq: str) -> ResampleGroups:
+    # Counting a cheap in-memory array gives both the labels and the lengths
+    # exactly as xarray bins them, empty groups included.
+    counts = (
+        xr.DataArray(
+            np.ones(len(time_index), dtype=np.int8),
+            coords={"time": time_index},
+            dims=["time"],
+        )
+        .resample(time=freq)
+        .count()
+    )
+    lengths = np.nan_to_num(counts.to_numpy()).astype(np.int64)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+    return ResampleGroups(
+        labels=counts.indexes["time"],
+        starts=starts,
+        lengths=lengths,
+    )
+
+
+def _is_reducible_dtype(dtype: np.dtype) -> bool:
+    return np.issubdtype(dtype, np.number) or np.issubdtype(dtype, np.bool_)
+
+
+def _result_dtype(
+    dtype: np.dtype,
+    how: ResampleReduction,
+    has_empty_groups: bool,
+) -> np.dtype:
+    if how in ("argmax", "argmin"):
+        return np.dtype(np.int64)
+    is_float = np.issubdtype(dtype, np.floating)
+    if how == "count":
+        result = np.dtype(np.int64)
+    elif how == "mean" or how in MOMENT_REDUCTIONS:
+        result = dtype if is_float else np.dtype(np.float64)
+    elif how == "sum" and not is_float:
+        result = np.dtype(np.int64)
+    else:
+        result = np.dtype(dtype)
+    if has_empty_groups and not np.issubdtype(result, np.floating):
+        return np.dtype(np.float64)
+    return result
+
+
+def _segmented_reduce(
+    values: np.ndarray,
+    lengths: np.ndarray,
+    how: ResampleReduction,
+    axis: int,
+    out_dtype: np.dtype,
+) -> np.ndarray:
+    """Reduce consecutive segments of ``lengths`` time steps along ``axis``."""
+    values = np.moveaxis(values, axis, 0)
+    non_empty = lengths > 0
+    reduced = _reduce_non_empty_segments(values, lengths[non_empty], how)
+    if non_empty.all():
+        result = reduced.astype(out_dtype, copy=False)
+    else:
+        fill = -1 if how in ("argmax", "argmin") else np.nan
+        result = np.full((len(lengths), *values.shape[1:]), fill, dtype=out_dtype)
+        result[non_empty] = reduced
+    return np.moveaxis(result, 0, axis)
+
+
+def _reduce_non_empty_segments(
+    values: np.ndarray,
+    lengths: np.ndarray,
+    how: ResampleReduction,
+) -> np.ndarray:
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.intp)
+    if len(starts) == 0:
+        return np.empty((0, *values.shape[1:]), dtype=values.dtype)
+    if how in ("max", "min", "argmax", "argmin"):
+        return _segment_extremum(values, starts, lengths, how)
+    if how in MOMENT_REDUCTIONS:
+        return segmented_moment_reduce(values, lengths, how)
+    valid = ~np.isnan(values) if np.issubdtype(values.dtype, np.floating) else None
+    if how == "count":
+        return _segment_count(valid, starts, lengths, values.shape)
+    summable = values.astype(np.int64) if valid is None else np.where(valid, values, 0)
+    total = np.add.reduceat(summable, starts, axis=0)
+    if how == "sum":
+        return total
+    count = _segment_count(valid, starts, lengths, values.shape)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return total / count
+
+
+def _segment_count(
+    valid: np.ndarray | None,
+    starts: np.ndarray,
+    lengths: np.ndarray,
+    shape: tuple[int, ...],
+) -> np.ndarray:
+    if valid is None:
+        return np.broadcast_to(
+            lengths.reshape((-1,) + (1,) * (len(shape) - 1)),
+            (len(lengths), *shape[1:]),
+        ).astype(np.int64)
+    return np.add.reduceat(valid.astype(np.int64), starts, axis=0)
+
+
+def _segment_extremum(
+    values: np.ndarray,
+    starts: np.ndarray,
+    lengths: np.ndarray,
+    how: ResampleReduction,
+) -> np.ndarray:
+    is_max = how in ("max", "argmax")
+    if np.issubdtype(values.dtype, np.floating):
+        # fmax and fmin skip NaN unless a whole segment is NaN.
+        extremum_ufunc = np.fmax if is_max else np.fmin
+    else:
+        extremum_ufunc = np.maximum if is_max else np.minimum
+    extremum = extremum_ufunc.reduceat(values, starts, axis=0)
+    if how in ("max", "min"):
+        return extremum
+    return _segment_first_match(values, extremum, starts, lengths)
+
+
+def _segment_first_match(
+    values: np.ndarray,
+    extremum: np.ndarray,
+    starts: np.ndarray,
+    lengths: np.ndarray,
+) -> np.ndarray:
+    offsets = np.arange(len(values)) - np.repeat(starts, lengths)
+    offsets = offsets.reshape((-1,) + (1,) * (values.ndim - 1))
+    is_match = values == np.repeat(extremum, lengths, axis=0)
+    candidates = np.where(is_match, offsets, np.iinfo(np.int64).max)
+    first = np.minimum.reduceat(candidates, starts, axis=0)
+    return np.where(first == np.iinfo(np.int64).max, -1, first)
+
+
+def _dask_segmented_reduce(
+    data: object,
+    groups: ResampleGroups,
+    how: ResampleReduction,
+    axis: int,
+    out_dtype: np.dtype,
+) -> object:
+    block_lengths = _group_aligned_blocks(groups.lengths, max(data.chunks[axis]))
+    time_chunks = tuple(int(lengths.sum()) for lengths in block_lengths)
+    if data.chunks[axis] != time_chunks:
+        data = data.rechunk({axis: time_chunks})
+
+    def _reduce_block(block: np.ndarray, block_info: dict) -> np.ndarray:
+        lengths = block_lengths[block_info[0]["chunk-location"][axis]]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return _segmented_reduce(block, lengths, how, axis, out_dtype)
+
+    out_chunks = list(data.chunks)
+    out_chunks[axis] = tuple(len(lengths) for lengths in block_lengths)
+    return data.map_blocks(
+        _reduce_block,
+        dtype=out_dtype,
+        chunks=tuple(out_chunks),
+        meta=np.empty((0,) * data.ndim, dtype=out_dtype),
+    )
+
+
+def _group_aligned_blocks(
+    lengths: np.ndarray,
+    target_length: int,
+) -> list[np.ndarray]:
+    """Pack whole consecutive groups into blocks of about ``target_length``."""
+    blocks: list[np.ndarray] = []
+    block_start = 0
+    block_length = 0
+    for i, length in enumerate(lengths):
+        if block_length > 0 and block_length + length > target_length:
+            blocks.append(lengths[block_start:i])
+            block_start = i
+            block_length = 0
+        block_length += length
+    blocks.append(lengths[block_start:])
+    return blocks
+
+
+def _group_chunk_range(
+    lengths: np.ndarray,
+    time_chunks: tuple[int, ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the first and last time chunk touched by each group."""
+    chunk_starts = np.cumsum((0, *time_chunks))[1:-1]
+    group_edges = np.concatenate(([0], np.cumsum(lengths)))
+    first = np.searchsorted(chunk_starts, group_edges[:-1], side="right")
+    last = np.searchsorted(
+        chunk_starts,
+        np.maximum(group_edges[1:] - 1, group_edges[:-1]),
+        side="right",
+    )
+    return first, last
+
+
+def _group_chunk_spans(
+    lengths: np.ndarray,
+    time_chunks: tuple[int, ...],
+) -> np.ndarray:
+    """Return the number of time chunks touched by each group, at least 1."""
+    first, last = _group_chunk_range(lengths, time_chunks)
+    return (last - first + 1).astype(np.int64)
+
+
+def _chunk_group_pieces(
+    lengths: np.ndarray,
+    time_chunks: tuple[int, ...],
+) -> list[np.ndarray]:
+    """Return, for each time chunk, the lengths of the group pieces it holds."""
+    first, last = _group_chunk_range(lengths, time_chunks)
+    group_edges = np.concatenate(([0], np.cumsum(lengths)))
+    chunk_edges = np.cumsum((0, *time_chunks))
+    pieces = []
+    for chunk, (start, stop) in enumerate(itertools.pairwise(chunk_edges)):
+        low = int(np.searchsorted(last, chunk, side="left"))
+        high = int(np.searchsorted(first, chunk, side="right"))
+        edges = np.clip(group_edges[low : high + 1], start, stop)
+        pieces.append(np.diff(edges).astype(np.int64))
+    return pieces
+
+
+def _xarray_resample_reduce(
+    da: DataArray,
+    freq: str,
+    how: ResampleReduction,
+) -> DataArray:
+    resampled = da.resample(time=freq)
+    if how in ("argmax", "argmin"):
+        reducer = np.nanargmax if how == "argmax" else np.nanargmin
+        return resampled.reduce(reducer, dim="time")
+    if how in ("skew", "kurtosis"):
+        return resampled.reduce(_whole_sample_moment, dim="time", how=how)
+    return getattr(resampled, how)(dim="time")
+
+
+def _whole_sample_moment(
+    values: np.ndarray,
+    axis: int,
+    how: ResampleReduction,
+) -> np.ndarray:
+    values = np.moveaxis(values, axis, 0)
+    lengths = np.array([len(values)])
+    return segmented_moment_reduce(values, lengths, how)[0]
@@ -0,0 +1,275 @@
+"""Shared monthly aggregation and cached gamma fits for SPI3 and SPI6.
+
+``xclim.atmos.standardized_precipitation_index`` resamples the daily
+precipitation to monthly means, rolls them over the accumulation window, fits
+a zero inflated gamma distribution per cell and calendar month over the
+reference period and only then standardizes the data. SPI3 and SPI6 computed
+independently repeat every step, and rerunning SPI repeats the fits even when
+the reference period did not change.
+
+Here the monthly means of an input, together with the missing values mask
+xclim derives from the daily data, are computed once and shared by every
+window. The fitted parameters are cached per reference data, window and
+reference period, and carry their provenance in their attributes. They are
+fitted with the approximate (APP) gamma estimator, ``floc=0``, as vectorized
+grouped reductions over every cell and month at once instead of one scipy
+call per cell. Set ``ICCLIM_SPI_PARAMS_DIR`` to also store the parameters as
+netCDF files in that directory and reuse them across sessions.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import xarray as xr
+
+if TYPE_CHECKING:
+    from xarray import DataArray
+
+_SPI_PARAMS_DIR_ENV = "ICCLIM_SPI_PARAMS_DIR"
+_MAX_CACHED_SPI = 16
+_SPI_MONTHLY_CACHE: dict[tuple, tuple[DataArray, DataArray | None]] = {}
+_SPI_PARAMS_CACHE: dict[tuple, DataArray] = {}
+_GAMMA_PARAMS = ["a", "loc", "scale"]
+_PROVENANCE_ATTRS = ("reference_period", "reference_data")
+
+
+def standardized_precipitation_index(
+    pr: DataArray,
+    window: int,
+    cal_start: str,
+    cal_end: str,
+) -> DataArray:
+    """
+    Compute the SPI of ``pr`` over ``window`` months, reusing cached steps.
+
+    Matches ``xclim.atmos.standardized_precipitation_index`` with
+    ``freq="MS"``, ``dist="gamma"``, ``method="APP"`` and
+    ``fitkwargs={"floc": 0}``.
+
+    Parameters
+    ----------
+    pr : DataArray
+        Daily precipitation.
+    window : int
+        The accumulation window, in months.
+    cal_start, cal_end : str
+        The bounds of the reference period, as "YYYY-MM-DD".
+
+    Returns
+    -------
+    DataArray
+        The standardized precipitation index, monthly.
+    """
+    import xclim  # noqa: PLC0415
+
+    monthly, mask = spi_monthly_precipitation(pr)
+    params = spi_fit_params(pr, window, cal_start, cal_end)
+    # ``params`` overrides the other options, they only fill the metadata.
+    spi = xclim.atmos.standardized_precipitation_index(
+        pr=monthly,
+        window=window,
+        dist="gamma",
+        method="APP",
+        fitkwargs={"floc": 0},
+        params=params,
+    )
+    for name in _PROVENANCE_ATTRS:
+        spi.attrs.pop(name, None)
+    if mask is not None:
+        spi = spi.where(~mask)
+    return spi
+
+
+def spi_monthly_precipitation(pr: DataArray) -> tuple[DataArray, DataArray | None]:
+    """
+    Return the cached monthly means of ``pr`` and its missing values mask.
+
+    The mask flags the months xclim would mask when computing SPI from the
+    daily data, it is None when missing values checks are disabled.
+    """
+    key, options = _monthly_key(pr)
+    cached = _SPI_MONTHLY_CACHE.get(key)
+    if cached is None:
+        cached = _build_monthly_precipitation(pr, key[1], options)
+        _bounded_insert(_SPI_MONTHLY_CACHE, key, cached)
+    return cached
+
+
+def has_cached_spi_monthly(pr: DataArray) -> bool:
+    """Return whether the monthly aggregation of ``pr`` is cached."""
+    return _monthly_key(pr)[0] in _SPI_MONTHLY_CACHE
+
+
+def spi_fit_params(
+    pr: DataArray,
+    window: int,
+    cal_start: str,
+    cal_end: str,
+) -> DataArray:
+    """
+    Return the cached gamma parameters of SPI over ``window`` months.
+
+    The parameters are fitted per cell and calendar month on the
+    ``window``-month rolling means of the reference period. They can be given
+    to ``xclim.indices.standardized_precipitation_index`` as ``params``. The
+    ``reference_period`` and ``reference_data`` attributes record the period
+    and the token of the data they were fitted on.
+    """
+    from dask.base import tokenize  # noqa: PLC0415
+
+    monthly, _ = spi_monthly_precipitation(pr)
+    accumulated = _rolling_accumulation(monthly, window)
+    reference = accumulated.sel(time=slice(cal_start, cal_end))
+    reference_data = tokenize(reference.variable)
+    key = (reference_data, window, cal_start, cal_end)
+    params = _SPI_PARAMS_CACHE.get(key)
+    if params is not None:
+        return params
+    store = _stored_params_path(key)
+    if store is not None and store.exists():
+        params = _load_params(store)
+    else:
+        params = fit_spi_gamma(reference)
+        params.attrs.update(
+            window=window,
+            reference_period=json.dumps([cal_start, cal_end]),
+            reference_data=reference_data,
+        )
+        if store is not None:
+            _save_params(params, store)
+    _bounded_insert(_SPI_PARAMS_CACHE, key, params)
+    return params
+
+
+def fit_spi_gamma(accumulated: DataArray) -> DataArray:
+    """
+    Fit a zero inflated gamma distribution per calendar month and cell.
+
+    Reproduces ``xclim.indices.stats.standardized_index_fit_params`` for
+    already accumulated data with ``dist="gamma"``, ``method="APP"``,
+    ``fitkwargs={"floc": 0}`` and ``zero_inflated=True``, as grouped
+    reductions vectorized over every cell.
+    """
+    months = accumulated.time.dt.month
+    non_zero = accumulated.where(accumulated != 0)
+    positive = accumulated.where(accumulated > 0)
+    # Thom's estimator of the shape from the mean and mean of logs.
+    mean = positive.groupby(months).mean("time")
+    mean_of_logs = np.log(positive).groupby(months).mean("time")
+    a = np.log(mean) - mean_of_logs
+    shape = (1 + np.sqrt(1 + 4 * a / 3)) / (4 * a)
+    scale = mean / shape
+    fitted = non_zero.notnull().groupby(months).sum("time") > 1
+    valid = fitted & shape.notnull() & scale.notnull()
+    params = xr.concat(
+        [shape.where(valid), xr.zeros_like(shape).where(valid), scale.where(valid)],
+        dim="dparams",
+    )
+    cell_dims = [dim for dim in params.dims if dim not in ("month", "dparams")]
+    params = params.assign_coords(dparams=_GAMMA_PARAMS).transpose(
+        "month",
+        *cell_dims,
+        "dparams",
+    )
+    number_of_zeros = (accumulated == 0).groupby(months).sum("time")
+    number_of_notnull = accumulated.notnull().groupby(months).sum("time")
+    params = params.assign_coords(
+        number_of_zeros=number_of_zeros,
+        number_of_notnull=number_of_notnull,
+        prob_of_zero=number_of_zeros / number_of_notnull,
+    )
+    params.attrs = {
+        "calibration_period": (
+            accumulated.time.min().dt.strftime("%Y-%m-%d").item(),
+            accumulated.time.max().dt.strftime("%Y-%m-%d").item(),
+        ),
+        "freq": "",
+        "window": 1,
+        "scipy_dist": "gamma",
+        "method": "APP",
+        "group": "time.month",
+        "units": "",
+        "time_indexer": json.dumps({}),
+    }
+    return params.rename(None)
+
+
+def clear_spi_cache() -> None:
+    """Forget every cached monthly aggregation and fitted parameter."""
+    _SPI_MONTHLY_CACHE.clear()
+    _SPI_PARAMS_CACHE.clear()
+
+
+def _monthly_key(pr: DataArray) -> tuple[tuple, dict]:
+    from dask.base import tokenize  # noqa: PLC0415
+    from xclim.core.options import (  # noqa: PLC0415
+        CHECK_MISSING,
+        MISSING_OPTIONS,
+        OPTIONS,
+    )
+
+    method = OPTIONS[CHECK_MISSING]
+    options = OPTIONS[MISSING_OPTIONS].get(method, {})
+    return (tokenize(pr), method, tokenize(options)), options
+
+
+def _build_monthly_precipitation(
+    pr: DataArray,
+    method: str,
+    options: dict,
+) -> tuple[DataArray, DataArray | None]:
+    from xclim.core.missing import MISSING_METHODS  # noqa: PLC0415
+
+    from icclim._core.resampling import resample_reduce  # noqa: PLC0415
+
+    monthly = resample_reduce(pr, "MS", "mean")
+    if monthly.chunks is not None:
+        # Monthly series are small and the rolling and fitting steps need
+        # the whole time axis.
+        monthly = monthly.chunk({"time": -1})
+    if method == "skip":
+        return monthly, None
+    misser = MISSING_METHODS[method](**options)
+    return monthly, misser(pr, "MS", None)
+
+
+def _rolling_accumulation(monthly: DataArray, window: int) -> DataArray:
+    if window > 1:
+        return monthly.rolling(time=window).mean(skipna=False, keep_attrs=True)
+    return monthly
+
+
+def _stored_params_path(key: tuple) -> Path | None:
+    directory = os.environ.get(_SPI_PARAMS_DIR_ENV)
+    if not directory:
+        return None
+    from dask.base import tokenize  # noqa: PLC0415
+
+    return Path(directory) / f"spi_params_{key[1]}_{tokenize(key)}.nc"
+
+
+def _save_params(params: DataArray, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stored = params.copy()
+    stored.attrs["calibration_period"] = json.dumps(params.attrs["calibration_period"])
+    stored.to_dataset(name="params").to_netcdf(path)
+
+
+def _load_params(path: Path) -> DataArray:
+    with xr.open_dataset(path) as stored:
+        params = stored["params"].load()
+    params.attrs["calibration_period"] = tuple(
+        json.loads(params.attrs["calibration_period"]),
+    )
+    return params.rename(None)
+
+
+def _bounded_insert(cache: dict, key: object, value: object) -> None:
+    if len(cache) >= _MAX_CACHED_SPI:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
@@ -0,0 +1,297 @@
+"""Warm-up of the compiled kernels of icclim and of their on-disk cache.
+
+The bootstrap, rolling window, threshold sum and season length kernels are
+compiled by numba on their first call, which takes tens of seconds for the
+bootstrap kernels alone. numba caches the compiled kernels on disk, by
+default next to the icclim sources, or in a user wide directory when the
+sources are not writable. On fresh batch nodes the cache is empty, and on
+read-only installs it may not be shared between jobs.
+
+``icclim.warmup`` compiles every kernel with the signatures icclim calls it
+with, by running small computations on synthetic data. With ``cache_dir``, or
+``ICCLIM_NUMBA_CACHE_DIR``, the kernels are cached in, and loaded from, that
+directory. Running ``python -m icclim warmup --cache-dir DIR`` once after
+installing icclim fills a cache that jobs setting ``ICCLIM_NUMBA_CACHE_DIR``
+load from, even when it is read-only for them. numba ties a cached kernel to
+the path and modification time of its source file and to the CPU it was
+compiled for, so the cache has to be built with the icclim install the jobs
+use, on the kind of node they run on.
+
+When a profile is active, the kernels compiled during an ``index()`` call are
+reported as the ``numba_cold_compiles`` counter, along with one
+``numba_cold_compile.<kernel>`` counter per kernel, and the kernels loaded
+from the cache as the ``numba_cache_loads`` counter. The numba statistics are
+global to the process, so kernels compiled by concurrent calls are reported
+by each of them.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from icclim._core.generic.templating import precompile_templates
+from icclim._core.profiling import active_profile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from numba.core.dispatcher import Dispatcher
+    from xarray import DataArray
+
+NUMBA_CACHE_DIR_ENV = "ICCLIM_NUMBA_CACHE_DIR"
+KERNEL_MODULES = (
+    "icclim._core.generic.bootstrap",
+    "icclim._core.generic.numba_threads",
+    "icclim._core.generic.rolling",
+    "icclim._core.generic.season_length",
+    "icclim._core.generic.threshold_sums",
+)
+# Indices running each family of kernels, with the variables they need.
+_WARMUP_INDICES = (
+    ("TX90p", ("tasmax",)),
+    ("WSDI", ("tasmax",)),
+    ("GSL", ("tas",)),
+    ("RX5day", ("pr",)),
+    ("R95pTOT", ("pr",)),
+)
+_WARMUP_DTYPES = ("float32", "float64")
+# Scalar bound, operator code (">=") and logical link code ("and") of the
+# bounded bootstrap kernels.
+_WARMUP_SCALAR_BOUND = (250.0, 1, 0)
+
+
+@dataclass(frozen=True)
+class KernelCompilation:
+    """
+    The compiled kernels of icclim compiled or loaded during a block.
+
+    Parameters
+    ----------
+    cold_compiled : dict[str, int]
+        The number of signatures compiled from scratch, per kernel.
+    cache_loaded : dict[str, int]
+        The number of signatures loaded from the numba cache, per kernel.
+    cache_dir : str | None
+        The numba cache directory, None for numba's default one.
+    """
+
+    cold_compiled: dict[str, int] = field(default_factory=dict)
+    cache_loaded: dict[str, int] = field(default_factory=dict)
+    cache_dir: str | None = None
+
+    def report(self) -> str:
+        """Describe the compilation as human readable text."""
+        cache = self.cache_dir or "numba's default directory"
+        lines = [
+            (
+                f"{sum(self.cold_compiled.values())} kernel signatures compiled and"
+                f" {sum(self.cache_loaded.values())} loaded from the cache"
+                f" ({cache})."
+            ),
+        ]
+        lines.extend(
+            f"  compiled {kernel}: {count}"
+            for kernel, count in sorted(self.cold_compiled.items())
+        )
+        return "\n".join(lines)
+
+
+def numba_available() -> bool:
+    """Return whether numba can be imported."""
+    try:
+        import numba  # noqa: F401, PLC0415
+    except Exception:  # noqa: BLE001
+        return False
+    return True
+
+
+def configure_numba_cache(cache_dir: str | os.PathLike | None = None) -> str | None:
+    """
+    Direct the numba cache of the kernels to ``cache_dir``.
+
+    Parameters
+    ----------
+    cache_dir : str | PathLike, optional
+        The cache directory. Defaults to ``ICCLIM_NUMBA_CACHE_DIR``, if set.
+
+    Returns
+    -------
+    str | None
+        The cache directory, None when numba's default one is kept.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(NUMBA_CACHE_DIR_ENV) or None
+    if cache_dir is None:
+        return None
+    cache_dir = os.fspath(cache_dir)
+    if "numba" not in sys.modules:
+        # numba reads its configuration when it is first imported.
+        os.environ["NUMBA_CACHE_DIR"] = cache_dir
+        return cache_dir
+    import numba  # noqa: PLC0415
+
+    if cache_dir != numba.config.CACHE_DIR:
+        numba.config.CACHE_DIR = cache_dir
+        # Kernels already compiled keep their cache unless it is rebuilt.
+        for dispatcher in kernel_dispatchers(import_modules=False).values():
+            dispatcher.enable_caching()
+    return cache_dir
+
+
+def kernel_dispatchers(*, import_modules: bool = True) -> dict[str, Dispatcher]:
+    """
+    Return the compiled kernels of icclim, by "<module>.<function>" name.
+
+    Parameters
+    ----------
+    import_modules : bool
+        Whether to import the kernel modules, rather than only listing the
+        kernels of the modules already imported.
+    """
+    if ("numba" not in sys.modules and not import_modules) or not numba_available():
+        return {}
+    from numba.core.dispatcher import Dispatcher  # noqa: PLC0415
+
+    dispatchers = {}
+    for module_name in KERNEL_MODULES:
+        module = (
+            import_module(module_name)
+            if import_modules
+            else sys.modules.get(module_name)
+        )
+        if module is None:
+            continue
+        short_name = module_name.rsplit(".", 1)[-1]
+        for name, value in vars(module).items():
+            if isinstance(value, Dispatcher):
+                dispatchers[f"{short_name}.{name}"] = value
+    return dispatchers
+
+
+@contextmanager
+def track_kernel_compilation() -> Iterator[None]:
+    """Report the kernels compiled in the enclosed block to the active profile."""
+    profile = active_profile()
+    if profile is None:
+        yield
+        return
+    before = _compile_stats()
+    try:
+        yield
+    finally:
+        compilation = _compilation_since(before)
+        profile.count("numba_cold_compiles", sum(compilation.cold_compiled.values()))
+        profile.count("numba_cache_loads", sum(compilation.cache_loaded.values()))
+        for kernel, count in compilation.cold_compiled.items():
+            profile.count(f"numba_cold_compile.{kernel}", count)
+
+
+def warmup(cache_dir: str | os.PathLike | None = None) -> KernelCompilation:
+    """
+    Compile the kernels of icclim before the first computation needs them.
+
+    Each kernel is compiled for the signatures icclim calls it with, by
+    running small computations on synthetic data. Kernels found in the numba
+    cache are loaded instead, and the newly compiled ones are written to it.
+    The metadata templates shipped with icclim are compiled as well, see
+    ``icclim._core.generic.templating``.
+
+    Parameters
+    ----------
+    cache_dir : str | PathLike, optional
+        The numba cache directory to fill and load from. Defaults to
+        ``ICCLIM_NUMBA_CACHE_DIR``, or else numba's default directory. Jobs
+        load the kernels from it when ``ICCLIM_NUMBA_CACHE_DIR`` is set to it.
+
+    Returns
+    -------
+    KernelCompilation
+        The kernels compiled and loaded from the cache.
+
+    Examples
+    --------
+    >>> import icclim
+    >>> print(icclim.warmup("/shared/icclim-cache").report())  # doctest: +SKIP
+    """
+    cache_dir = configure_numba_cache(cache_dir)
+    precompile_templates()
+    if not numba_available():
+        return KernelCompilation(cache_dir=cache_dir)
+    before = _compile_stats(import_modules=True)
+    _run_warmup_computations()
+    return _compilation_since(before, cache_dir)
+
+
+def _run_warmup_computations() -> None:
+    import icclim  # noqa: PLC0415
+    from icclim.bench.synthetic import BenchConfig, synthetic_dataset  # noqa: PLC0415
+
+    for dtype in _WARMUP_DTYPES:
+        config = BenchConfig.from_size("tiny", backend="dask", dtype=dtype)
+        for index_name, variables in _WARMUP_INDICES:
+            icclim.index(
+                in_files=synthetic_dataset(config, variables),
+                index_name=index_name,
+                base_period_time_range=config.base_period,
+                logs_verbosity="SILENT",
+            ).compute()
+        _run_bootstrap_aggregates(
+            synthetic_dataset(config, ["tasmax"]).tasmax,
+            config.base_period,
+        )
+
+
+def _run_bootstrap_aggregates(study: DataArray, base_period: list[str]) -> None:
+    from icclim._core.generic import bootstrap  # noqa: PLC0415
+    from icclim.threshold.factory import build_threshold  # noqa: PLC0415
+
+    threshold = build_threshold(">= 90 doy_per", reference_period=base_period)
+    for compute in (
+        bootstrap.compute_doy_percentile_bootstrap_exceedance_sum,
+        bootstrap.compute_doy_percentile_bootstrap_exceedance_average,
+        bootstrap.compute_doy_percentile_bootstrap_fraction_of_total,
+        bootstrap.compute_doy_percentile_bootstrap_union_exceedance_count,
+    ):
+        compute(study, threshold, "YS")
+    for compute in (
+        bootstrap.compute_doy_percentile_scalar_bounded_bootstrap_count,
+        bootstrap.compute_doy_percentile_scalar_bounded_bootstrap_exceedance_sum,
+        bootstrap.compute_doy_percentile_scalar_bounded_bootstrap_exceedance_average,
+        bootstrap.compute_doy_percentile_scalar_bounded_bootstrap_fraction_of_total,
+    ):
+        compute(study, threshold, "YS", *_WARMUP_SCALAR_BOUND)
+
+
+def _compile_stats(
+    *,
+    import_modules: bool = False,
+) -> dict[str, tuple[int, int]]:
+    return {
+        name: (
+            sum(dispatcher.stats.cache_misses.values()),
+            sum(dispatcher.stats.cache_hits.values()),
+        )
+        for name, dispatcher in kernel_dispatchers(
+            import_modules=import_modules,
+        ).items()
+    }
+
+
+def _compilation_since(
+    before: dict[str, tuple[int, int]],
+    cache_dir: str | None = None,
+) -> KernelCompilation:
+    cold_compiled = {}
+    cache_loaded = {}
+    for name, (misses, hits) in _compile_stats().items():
+        misses_before, hits_before = before.get(name, (0, 0))
+        if misses > misses_before:
+            cold_compiled[name] = misses - misses_before
+        if hits > hits_before:
+            cache_loaded[name] = hits - hits_before
+    return KernelCompilation(cold_compiled, cache_loaded, cache_dir)
@@ -18,7 +18,7 @@ from icclim.threshold.factory import build_threshold
 
 if TYPE_CHECKING:
     import datetime as dt
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from icclim.logger import Verbosity
     from icclim._core.model.icclim_types import (
@@ -29,7 +29,10 @@ if TYPE_CHECKING:
     from icclim.frequency import Frequency
     from icclim._core.model.netcdf_version import NetcdfVersion
     from icclim._core.model.quantile_interpolation import QuantileInterpolation
+    from icclim._core.quantile_sketch import QuantileMethod
     from icclim._core.legacy.user_index.model import UserIndexDict
+    from icclim._core.profiling import Profile
+    from icclim._core.progress import ProgressEvent
     from icclim._core.model.threshold import Threshold
 __all__ = [
     "tav",
@@ -80,6 +83,9 @@ def tav(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Moyenne de la température moyenne.
 
@@ -131,6 +137,13 @@ def tav(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -158,6 +171,40 @@ def tav(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -180,6 +227,9 @@ def tav(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -197,6 +247,9 @@ def txav(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Moyenne de la température maximale.
 
@@ -248,6 +301,13 @@ def txav(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -275,6 +335,40 @@ def txav(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -297,6 +391,9 @@ def txav(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -314,6 +411,9 @@ def trav(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Moyenne de l'amplitude thermique.
 
@@ -365,6 +465,13 @@ def trav(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -392,6 +499,40 @@ def trav(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -414,6 +555,9 @@ def trav(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -435,6 +579,10 @@ def tx10(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Extrême froid de la température maximale journalière (10e centile de la température maximale).
 
@@ -500,6 +648,13 @@ def tx10(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -537,6 +692,57 @@ def tx10(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -563,6 +769,10 @@ def tx10(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 10 doy_per",
             doy_window_width=5,
@@ -591,6 +801,10 @@ def tx90(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Extrême chaud de la température maximale journalière (90e centile de la température maximale).
 
@@ -656,6 +870,13 @@ def tx90(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -693,6 +914,57 @@ def tx90(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -719,6 +991,10 @@ def tx90(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 90 doy_per",
             doy_window_width=5,
@@ -747,6 +1023,10 @@ def tn10(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Extrême froid de la température minimale  journalière (10e centile de la température minimale).
 
@@ -812,6 +1092,13 @@ def tn10(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -849,6 +1136,57 @@ def tn10(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -875,6 +1213,10 @@ def tn10(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 10 doy_per",
             doy_window_width=5,
@@ -903,6 +1245,10 @@ def tn90(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Extrême chaud de la température minimale journalière (90e centile de la température minimale).
 
@@ -968,6 +1314,13 @@ def tn90(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1005,6 +1358,57 @@ def tn90(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1031,6 +1435,10 @@ def tn90(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 90 doy_per",
             doy_window_width=5,
@@ -1055,6 +1463,9 @@ def tnfd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de jours de gel (température minimale <= 0°C).
 
@@ -1106,6 +1517,13 @@ def tnfd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1133,6 +1551,40 @@ def tnfd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1155,6 +1607,9 @@ def tnfd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 0 degree_Celsius",
         ),
@@ -1175,6 +1630,9 @@ def txfd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de jours sans dégel (température maximale <= 0°C).
 
@@ -1226,6 +1684,13 @@ def txfd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1253,6 +1718,40 @@ def txfd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1275,6 +1774,9 @@ def txfd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 0 degree_Celsius",
         ),
@@ -1295,6 +1797,9 @@ def sd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de journées d'été (température maximale > 25°C).
 
@@ -1346,6 +1851,13 @@ def sd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1373,6 +1885,40 @@ def sd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1395,6 +1941,9 @@ def sd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 25 degree_Celsius",
         ),
@@ -1415,6 +1964,9 @@ def tx35(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de jours de forte chaleur (température maximale > 35°C).
 
@@ -1466,6 +2018,13 @@ def tx35(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1493,6 +2052,40 @@ def tx35(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1515,6 +2108,9 @@ def tx35(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 35 degree_Celsius",
         ),
@@ -1535,6 +2131,9 @@ def tr(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de nuits tropicales (température minimale > 20°C).
 
@@ -1586,6 +2185,13 @@ def tr(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1613,6 +2219,40 @@ def tr(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1635,6 +2275,9 @@ def tr(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 20 degree_Celsius",
         ),
@@ -1656,6 +2299,9 @@ def txnd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
     normal_var_name: str | None = None,
 ) -> Dataset:
     """Nombre de jours anormalement chauds (température maximale supérieure de plus de 5°C à la normale).
@@ -1708,6 +2354,13 @@ def txnd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1735,6 +2388,40 @@ def txnd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
     normal : Union[str, Sequence[str], Dataset, DataArray]
         The normal to be compared to.
         Typically, the expected normal dataset should have one value per `lat, lon` couple.
@@ -1770,6 +2457,9 @@ def txnd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -1788,6 +2478,9 @@ def tnht(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
     normal_var_name: str | None = None,
 ) -> Dataset:
     """Nombre de nuits anormalement chaudes (température minimale supérieure de plus de 5°C à la normale).
@@ -1840,6 +2533,13 @@ def tnht(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1867,6 +2567,40 @@ def tnht(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
     normal : Union[str, Sequence[str], Dataset, DataArray]
         The normal to be compared to.
         Typically, the expected normal dataset should have one value per `lat, lon` couple.
@@ -1902,6 +2636,9 @@ def tnht(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -1920,6 +2657,9 @@ def tnnd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
     normal_var_name: str | None = None,
 ) -> Dataset:
     """Nombre de jours anormalement froids (température minimale inférieure de plus de 5°C à la normale).
@@ -1972,6 +2712,13 @@ def tnnd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1999,6 +2746,40 @@ def tnnd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
     normal : Union[str, Sequence[str], Dataset, DataArray]
         The normal to be compared to.
         Typically, the expected normal dataset should have one value per `lat, lon` couple.
@@ -2034,6 +2815,9 @@ def tnnd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -2052,6 +2836,9 @@ def tncwd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
     normal_var_name: str | None = None,
 ) -> Dataset:
     """Nombre de jours d'une vague de froid (température min < de plus de 5°C à la normale pdt au moins 5j consécutifs).
@@ -2104,6 +2891,13 @@ def tncwd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2131,6 +2925,40 @@ def tncwd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
     normal : Union[str, Sequence[str], Dataset, DataArray]
         The normal to be compared to.
         Typically, the expected normal dataset should have one value per `lat, lon` couple.
@@ -2166,6 +2994,9 @@ def tncwd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -2184,6 +3015,9 @@ def txhwd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
     normal_var_name: str | None = None,
 ) -> Dataset:
     """Nombre de jours d'une vague de chaleur (température max > de plus de 5°C à la normale pdt au moins 5j consécutifs).
@@ -2236,6 +3070,13 @@ def txhwd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2263,6 +3104,40 @@ def txhwd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
     normal : Union[str, Sequence[str], Dataset, DataArray]
         The normal to be compared to.
         Typically, the expected normal dataset should have one value per `lat, lon` couple.
@@ -2298,6 +3173,9 @@ def txhwd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -2315,6 +3193,9 @@ def hdd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Degrés-jours de chauffage (Cumul sur la période des écarts négatifs au seuil de < 17°C par la température qt moyenne).
 
@@ -2366,6 +3247,13 @@ def hdd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2393,6 +3281,40 @@ def hdd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2415,6 +3337,9 @@ def hdd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="17 degree_Celsius",
         ),
@@ -2435,6 +3360,9 @@ def cdd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Degrés-jours de climatisation(Cumul sur la période des dépassements du seuil de > 18°C par la température qt moyenne).
 
@@ -2486,6 +3414,13 @@ def cdd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2513,6 +3448,40 @@ def cdd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2535,6 +3504,9 @@ def cdd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="18 degree_Celsius",
         ),
@@ -2555,6 +3527,9 @@ def pav(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Précipitations quotidiennes moyennes.
 
@@ -2606,6 +3581,13 @@ def pav(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2633,6 +3615,40 @@ def pav(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2655,6 +3671,9 @@ def pav(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="mm/day",
     )
 
@@ -2672,6 +3691,9 @@ def pint(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Précipitation moyenne des jours pluvieux (RR > 1 mm).
 
@@ -2723,6 +3745,13 @@ def pint(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2750,6 +3779,40 @@ def pint(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2772,6 +3835,9 @@ def pint(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 1 mm/day",
         ),
@@ -2792,6 +3858,9 @@ def rr(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Cumul de précipitation.
 
@@ -2843,6 +3912,13 @@ def rr(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2870,6 +3946,40 @@ def rr(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2892,6 +4002,9 @@ def rr(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="mm",
     )
 
@@ -2909,6 +4022,9 @@ def rr1mm(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de jours de pluie (précipitations >= 1 mm).
 
@@ -2960,6 +4076,13 @@ def rr1mm(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2987,6 +4110,40 @@ def rr1mm(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3009,6 +4166,9 @@ def rr1mm(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 1 mm/day",
         ),
@@ -3029,6 +4189,9 @@ def pn20mm(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de jours de fortes précipitations (précipitations >= 20 mm).
 
@@ -3080,6 +4243,13 @@ def pn20mm(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3107,6 +4277,40 @@ def pn20mm(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3129,6 +4333,9 @@ def pn20mm(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 20 mm/day",
         ),
@@ -3149,6 +4356,9 @@ def pxcdd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Période de sécheresse (Max [Nbj consécutifs RR < 1 mm]).
 
@@ -3200,6 +4410,13 @@ def pxcdd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3227,6 +4444,40 @@ def pxcdd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3249,6 +4500,9 @@ def pxcdd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 1 mm/day",
         ),
@@ -3269,6 +4523,9 @@ def pxcwd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre maximum de jours pluvieux consécutifs (Max [Nbj consécutifs RR > 1 mm]).
 
@@ -3320,6 +4577,13 @@ def pxcwd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3347,6 +4611,40 @@ def pxcwd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3369,6 +4667,9 @@ def pxcwd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 1 mm/day",
         ),
@@ -3393,6 +4694,10 @@ def r99(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de jours de précipitations extrêmes.
 
@@ -3458,6 +4763,13 @@ def r99(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3495,6 +4807,57 @@ def r99(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3521,6 +4884,10 @@ def r99(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 99 period_per",
             doy_window_width=5,
@@ -3550,6 +4917,10 @@ def pfl90(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Fraction des précipitations journalières intenses.
 
@@ -3615,6 +4986,13 @@ def pfl90(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3652,6 +5030,57 @@ def pfl90(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3678,6 +5107,10 @@ def pfl90(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 90 period_per",
             doy_window_width=5,
@@ -3707,6 +5140,10 @@ def pq90(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Précipitation quotidienne intense (90e centile des précipitations).
 
@@ -3772,6 +5209,13 @@ def pq90(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3809,6 +5253,57 @@ def pq90(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3835,6 +5330,10 @@ def pq90(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 90 doy_per",
             doy_window_width=5,
@@ -3864,6 +5363,10 @@ def pq99(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Précipitation quotidienne extrême (99e centile des précipitations).
 
@@ -3929,6 +5432,13 @@ def pq99(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3966,6 +5476,57 @@ def pq99(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3992,6 +5553,10 @@ def pq99(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 99 doy_per",
             doy_window_width=5,
@@ -4018,6 +5583,9 @@ def ffav(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Écart de la vitesse du vent moyenne journalière (par rapport à une periode de référence).
 
@@ -4083,6 +5651,13 @@ def ffav(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4110,6 +5685,40 @@ def ffav(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4133,6 +5742,9 @@ def ffav(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="m s-1",
     )
 
@@ -4154,6 +5766,10 @@ def ff98(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Nombre de jours de vent fort (vent ≥ 98e centile de la période de référence).
 
@@ -4219,6 +5835,13 @@ def ff98(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4256,6 +5879,57 @@ def ff98(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4282,6 +5956,10 @@ def ff98(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 98 period_per",
             doy_window_width=5,
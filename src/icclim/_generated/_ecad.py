@@ -18,7 +18,7 @@ from icclim.threshold.factory import build_threshold
 
 if TYPE_CHECKING:
     import datetime as dt
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from icclim.logger import Verbosity
     from icclim._core.model.icclim_types import (
@@ -29,7 +29,10 @@ if TYPE_CHECKING:
     from icclim.frequency import Frequency
     from icclim._core.model.netcdf_version import NetcdfVersion
     from icclim._core.model.quantile_interpolation import QuantileInterpolation
+    from icclim._core.quantile_sketch import QuantileMethod
     from icclim._core.legacy.user_index.model import UserIndexDict
+    from icclim._core.profiling import Profile
+    from icclim._core.progress import ProgressEvent
     from icclim._core.model.threshold import Threshold
 __all__ = [
     "tg",
@@ -112,6 +115,9 @@ def tg(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean of daily mean temperature.
 
@@ -163,6 +169,13 @@ def tg(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -190,6 +203,40 @@ def tg(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -212,6 +259,9 @@ def tg(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -229,6 +279,9 @@ def tn(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean of daily minimum temperature.
 
@@ -280,6 +333,13 @@ def tn(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -307,6 +367,40 @@ def tn(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -329,6 +423,9 @@ def tn(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -346,6 +443,9 @@ def tx(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean of daily maximum temperature.
 
@@ -397,6 +497,13 @@ def tx(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -424,6 +531,40 @@ def tx(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -446,6 +587,9 @@ def tx(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -463,6 +607,9 @@ def dtr(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean Diurnal Temperature Range.
 
@@ -514,6 +661,13 @@ def dtr(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -541,6 +695,40 @@ def dtr(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -563,6 +751,9 @@ def dtr(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -580,6 +771,9 @@ def etr(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Intra-period extreme temperature range.
 
@@ -631,6 +825,13 @@ def etr(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -658,6 +859,40 @@ def etr(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -680,6 +915,9 @@ def etr(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -697,6 +935,9 @@ def vdtr(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean day-to-day variation in Diurnal Temperature Range.
 
@@ -748,6 +989,13 @@ def vdtr(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -775,6 +1023,40 @@ def vdtr(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -797,6 +1079,9 @@ def vdtr(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -814,6 +1099,9 @@ def su(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of Summer Days (Tmax > 25C).
 
@@ -865,6 +1153,13 @@ def su(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -892,6 +1187,40 @@ def su(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -914,6 +1243,9 @@ def su(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 25 degree_Celsius",
         ),
@@ -934,6 +1266,9 @@ def tr(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of Tropical Nights (Tmin > 20C).
 
@@ -985,6 +1320,13 @@ def tr(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1012,6 +1354,40 @@ def tr(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1034,6 +1410,9 @@ def tr(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 20 degree_Celsius",
         ),
@@ -1058,6 +1437,10 @@ def wsdi(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Warm-spell duration index (days).
 
@@ -1123,6 +1506,13 @@ def wsdi(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1160,6 +1550,57 @@ def wsdi(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1186,6 +1627,10 @@ def wsdi(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 90 doy_per",
             doy_window_width=5,
@@ -1214,6 +1659,10 @@ def tg90p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days when Tmean > 90th percentile.
 
@@ -1279,6 +1728,13 @@ def tg90p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1316,6 +1772,57 @@ def tg90p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1342,6 +1849,10 @@ def tg90p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 90 doy_per",
             doy_window_width=5,
@@ -1370,6 +1881,10 @@ def tn90p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days when Tmin > 90th percentile.
 
@@ -1435,6 +1950,13 @@ def tn90p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1472,6 +1994,57 @@ def tn90p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1498,6 +2071,10 @@ def tn90p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 90 doy_per",
             doy_window_width=5,
@@ -1526,6 +2103,10 @@ def tx90p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days when Tmax > 90th daily percentile.
 
@@ -1591,6 +2172,13 @@ def tx90p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1628,6 +2216,57 @@ def tx90p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1654,6 +2293,10 @@ def tx90p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 90 doy_per",
             doy_window_width=5,
@@ -1678,6 +2321,9 @@ def txx(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum daily maximum temperature.
 
@@ -1729,6 +2375,13 @@ def txx(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1756,6 +2409,40 @@ def txx(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1778,6 +2465,9 @@ def txx(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -1795,6 +2485,9 @@ def tnx(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum daily minimum temperature.
 
@@ -1846,6 +2539,13 @@ def tnx(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1873,6 +2573,40 @@ def tnx(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1895,6 +2629,9 @@ def tnx(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -1912,6 +2649,9 @@ def csu(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum number of consecutive summer days (Tmax >25 C).
 
@@ -1963,6 +2703,13 @@ def csu(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1990,6 +2737,40 @@ def csu(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2012,6 +2793,9 @@ def csu(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 25 degree_Celsius",
         ),
@@ -2032,6 +2816,9 @@ def gd4(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Growing degree days (sum of Tmean > 4 C).
 
@@ -2083,6 +2870,13 @@ def gd4(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2110,6 +2904,40 @@ def gd4(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2132,6 +2960,9 @@ def gd4(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="4 degree_Celsius",
         ),
@@ -2152,6 +2983,9 @@ def fd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of Frost Days (Tmin < 0C).
 
@@ -2203,6 +3037,13 @@ def fd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2230,6 +3071,40 @@ def fd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2252,6 +3127,9 @@ def fd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 0 degree_Celsius",
         ),
@@ -2272,6 +3150,9 @@ def cfd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum number of consecutive frost days (Tmin < 0 C).
 
@@ -2323,6 +3204,13 @@ def cfd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2350,6 +3238,40 @@ def cfd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2372,6 +3294,9 @@ def cfd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 0 degree_Celsius",
         ),
@@ -2392,6 +3317,9 @@ def hd17(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Heating degree days (sum of Tmean < 17 C).
 
@@ -2443,6 +3371,13 @@ def hd17(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2470,6 +3405,40 @@ def hd17(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2492,6 +3461,9 @@ def hd17(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="17 degree_Celsius",
         ),
@@ -2512,6 +3484,9 @@ def id(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of sharp Ice Days (Tmax < 0C).
 
@@ -2563,6 +3538,13 @@ def id(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2590,6 +3572,40 @@ def id(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2612,6 +3628,9 @@ def id(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 0 degree_Celsius",
         ),
@@ -2636,6 +3655,10 @@ def tg10p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days when Tmean < 10th percentile.
 
@@ -2701,6 +3724,13 @@ def tg10p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2738,6 +3768,57 @@ def tg10p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2764,6 +3845,10 @@ def tg10p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 10 doy_per",
             doy_window_width=5,
@@ -2792,6 +3877,10 @@ def tn10p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days when Tmin < 10th percentile.
 
@@ -2857,6 +3946,13 @@ def tn10p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2894,6 +3990,57 @@ def tn10p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2920,6 +4067,10 @@ def tn10p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 10 doy_per",
             doy_window_width=5,
@@ -2948,6 +4099,10 @@ def tx10p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days when Tmax < 10th percentile.
 
@@ -3013,6 +4168,13 @@ def tx10p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3050,6 +4212,57 @@ def tx10p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3076,6 +4289,10 @@ def tx10p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 10 doy_per",
             doy_window_width=5,
@@ -3100,6 +4317,9 @@ def txn(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Minimum daily maximum temperature.
 
@@ -3151,6 +4371,13 @@ def txn(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3178,6 +4405,40 @@ def txn(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3200,6 +4461,9 @@ def txn(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -3217,6 +4481,9 @@ def tnn(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Minimum daily minimum temperature.
 
@@ -3268,6 +4535,13 @@ def tnn(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3295,6 +4569,40 @@ def tnn(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3317,6 +4625,9 @@ def tnn(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="degree_Celsius",
     )
 
@@ -3338,6 +4649,10 @@ def csdi(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Cold-spell duration index (days).
 
@@ -3403,6 +4718,13 @@ def csdi(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3440,6 +4762,57 @@ def csdi(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3466,6 +4839,10 @@ def csdi(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 10 doy_per",
             doy_window_width=5,
@@ -3490,6 +4867,9 @@ def cdd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum consecutive dry days (Precip < 1mm).
 
@@ -3541,6 +4921,13 @@ def cdd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3568,6 +4955,40 @@ def cdd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3590,6 +5011,9 @@ def cdd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="< 1 mm/day",
         ),
@@ -3610,6 +5034,9 @@ def prcptot(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Total precipitation during Wet Days.
 
@@ -3661,6 +5088,13 @@ def prcptot(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3688,6 +5122,40 @@ def prcptot(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3710,6 +5178,9 @@ def prcptot(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 1 mm/day",
         ),
@@ -3730,6 +5201,9 @@ def rr1(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of Wet Days (precip >= 1 mm).
 
@@ -3781,6 +5255,13 @@ def rr1(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3808,6 +5289,40 @@ def rr1(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3830,6 +5345,9 @@ def rr1(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 1 mm/day",
         ),
@@ -3850,6 +5368,9 @@ def sdii(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Average precipitation during Wet Days (SDII).
 
@@ -3901,6 +5422,13 @@ def sdii(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -3928,6 +5456,40 @@ def sdii(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -3950,6 +5512,9 @@ def sdii(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 1 mm/day",
         ),
@@ -3970,6 +5535,9 @@ def cwd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum consecutive wet days (Precip >= 1mm).
 
@@ -4021,6 +5589,13 @@ def cwd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4048,6 +5623,40 @@ def cwd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4070,6 +5679,9 @@ def cwd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 1 mm/day",
         ),
@@ -4090,6 +5702,9 @@ def rr(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Precipitation sum (mm).
 
@@ -4141,6 +5756,13 @@ def rr(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4168,6 +5790,40 @@ def rr(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4190,6 +5846,9 @@ def rr(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="mm",
     )
 
@@ -4207,6 +5866,9 @@ def r10mm(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of heavy precipitation days (Precip >=10mm).
 
@@ -4258,6 +5920,13 @@ def r10mm(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4285,6 +5954,40 @@ def r10mm(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4307,6 +6010,9 @@ def r10mm(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 10 mm/day",
         ),
@@ -4327,6 +6033,9 @@ def r20mm(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of very heavy precipitation days (Precip >= 20mm).
 
@@ -4378,6 +6087,13 @@ def r20mm(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4405,6 +6121,40 @@ def r20mm(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4427,6 +6177,9 @@ def r20mm(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 20 mm/day",
         ),
@@ -4447,6 +6200,9 @@ def rx1day(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum 1-day total precipitation.
 
@@ -4498,6 +6254,13 @@ def rx1day(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4525,6 +6288,40 @@ def rx1day(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4547,6 +6344,9 @@ def rx1day(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="mm/day",
     )
 
@@ -4564,6 +6364,9 @@ def rx5day(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum 5-day total precipitation.
 
@@ -4615,6 +6418,13 @@ def rx5day(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4642,6 +6452,40 @@ def rx5day(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4664,6 +6508,9 @@ def rx5day(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="mm",
     )
 
@@ -4685,6 +6532,10 @@ def r75p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with RR > 75th percentile of daily amounts (moderate wet days) (d).
 
@@ -4750,6 +6601,13 @@ def r75p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4787,6 +6645,57 @@ def r75p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4813,6 +6722,10 @@ def r75p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -4834,6 +6747,10 @@ def r75ptot(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Precipitation fraction due to moderate wet days (> 75th percentile).
 
@@ -4899,6 +6816,13 @@ def r75ptot(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -4936,6 +6860,57 @@ def r75ptot(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -4962,6 +6937,10 @@ def r75ptot(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="%",
     )
 
@@ -4983,6 +6962,10 @@ def r95p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with RR > 95th percentile of daily amounts (very wet days) (days).
 
@@ -5048,6 +7031,13 @@ def r95p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -5085,6 +7075,57 @@ def r95p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -5111,6 +7152,10 @@ def r95p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -5132,6 +7177,10 @@ def r95ptot(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Precipitation fraction due to very wet days (> 95th percentile).
 
@@ -5197,6 +7246,13 @@ def r95ptot(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -5234,6 +7290,57 @@ def r95ptot(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -5260,6 +7367,10 @@ def r95ptot(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="%",
     )
 
@@ -5281,6 +7392,10 @@ def r99p(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with RR > 99th percentile of daily amounts (extremely wet days).
 
@@ -5346,6 +7461,13 @@ def r99p(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -5383,6 +7505,57 @@ def r99p(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -5409,6 +7582,10 @@ def r99p(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -5430,6 +7607,10 @@ def r99ptot(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Precipitation fraction due to extremely wet days (> 99th percentile).
 
@@ -5495,6 +7676,13 @@ def r99ptot(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -5532,6 +7720,57 @@ def r99ptot(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -5558,6 +7797,10 @@ def r99ptot(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="%",
     )
 
@@ -5575,6 +7818,9 @@ def sd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean of daily snow depth.
 
@@ -5626,6 +7872,13 @@ def sd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -5653,6 +7906,40 @@ def sd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -5675,6 +7962,9 @@ def sd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="cm",
     )
 
@@ -5692,6 +7982,9 @@ def sd1(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Snow days (SD >= 1 cm).
 
@@ -5743,6 +8036,13 @@ def sd1(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -5770,6 +8070,40 @@ def sd1(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -5792,6 +8126,9 @@ def sd1(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 1 cm",
         ),
@@ -5812,6 +8149,9 @@ def sd5cm(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of days with snow depth >= 5 cm.
 
@@ -5863,6 +8203,13 @@ def sd5cm(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -5890,6 +8237,40 @@ def sd5cm(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -5912,6 +8293,9 @@ def sd5cm(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 5 cm",
         ),
@@ -5932,6 +8316,9 @@ def sd50cm(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Number of days with snow depth >= 50 cm.
 
@@ -5983,6 +8370,13 @@ def sd50cm(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -6010,6 +8404,40 @@ def sd50cm(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -6032,6 +8460,9 @@ def sd50cm(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 50 cm",
         ),
@@ -6056,6 +8487,10 @@ def cd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with TG < 25th percentile of daily mean temperature and RR <25th percentile of daily precipitation sum (cold/dry days).
 
@@ -6121,6 +8556,13 @@ def cd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -6158,6 +8600,57 @@ def cd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -6184,6 +8677,10 @@ def cd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=[
             build_threshold(
                 query="< 25 doy_per",
@@ -6218,6 +8715,10 @@ def cw(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with TG < 25th percentile of daily mean temperature and RR >75th percentile of daily precipitation sum (cold/wet days).
 
@@ -6283,6 +8784,13 @@ def cw(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -6320,6 +8828,57 @@ def cw(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -6346,6 +8905,10 @@ def cw(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=[
             build_threshold(
                 query="< 25 doy_per",
@@ -6380,6 +8943,10 @@ def wd(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with TG > 75th percentile of daily mean temperature and RR <25th percentile of daily precipitation sum (warm/dry days).
 
@@ -6445,6 +9012,13 @@ def wd(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -6482,6 +9056,57 @@ def wd(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -6508,6 +9133,10 @@ def wd(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=[
             build_threshold(
                 query="> 75 doy_per",
@@ -6542,6 +9171,10 @@ def ww(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with TG > 75th percentile of daily mean temperature and RR >75th percentile of daily precipitation sum (warm/wet days).
 
@@ -6607,6 +9240,13 @@ def ww(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -6644,6 +9284,57 @@ def ww(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -6670,6 +9361,10 @@ def ww(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=[
             build_threshold(
                 query="> 75 doy_per",
@@ -6700,6 +9395,9 @@ def fxx(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum value of daily maximum wind gust.
 
@@ -6751,6 +9449,13 @@ def fxx(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -6778,6 +9483,40 @@ def fxx(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -6800,6 +9539,9 @@ def fxx(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="m s-1",
     )
 
@@ -6817,6 +9559,9 @@ def fg6bft(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with daily averaged wind ≥ 6 Bft (10.8 m s-1).
 
@@ -6868,6 +9613,13 @@ def fg6bft(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -6895,6 +9647,40 @@ def fg6bft(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -6917,6 +9703,9 @@ def fg6bft(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query=">= 10.8 m s-1",
         ),
@@ -6937,6 +9726,9 @@ def fgcalm(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Calm days, days with daily averaged wind <= 2 m s-1.
 
@@ -6988,6 +9780,13 @@ def fgcalm(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7015,6 +9814,40 @@ def fgcalm(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -7037,6 +9870,9 @@ def fgcalm(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="<= 2 m s-1",
         ),
@@ -7057,6 +9893,9 @@ def fg(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean of daily mean wind strength.
 
@@ -7108,6 +9947,13 @@ def fg(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7135,6 +9981,40 @@ def fg(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -7157,6 +10037,9 @@ def fg(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="m s-1",
     )
 
@@ -7174,6 +10057,9 @@ def ddnorth(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with northerly winds (DD > 315° or DD ≤ 45°).
 
@@ -7225,6 +10111,13 @@ def ddnorth(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7252,6 +10145,40 @@ def ddnorth(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -7274,6 +10201,9 @@ def ddnorth(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 315 degree OR <= 45 degree",
         ),
@@ -7294,6 +10224,9 @@ def ddeast(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with easterly winds (45° < DD <= 135°).
 
@@ -7345,6 +10278,13 @@ def ddeast(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7372,6 +10312,40 @@ def ddeast(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -7394,6 +10368,9 @@ def ddeast(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 45 degree AND <= 135 degree",
         ),
@@ -7414,6 +10391,9 @@ def ddsouth(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with southerly winds (135° < DD <= 225°).
 
@@ -7465,6 +10445,13 @@ def ddsouth(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7492,6 +10479,40 @@ def ddsouth(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -7514,6 +10535,9 @@ def ddsouth(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 135 degree AND <= 225 degree",
         ),
@@ -7534,6 +10558,9 @@ def ddwest(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Days with westerly winds (225° < DD <= 315°).
 
@@ -7585,6 +10612,13 @@ def ddwest(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7612,6 +10646,40 @@ def ddwest(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -7634,6 +10702,9 @@ def ddwest(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         threshold=build_threshold(
             query="> 225 degree AND <= 315 degree",
         ),
@@ -7654,6 +10725,9 @@ def gsl(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Growing season length.
 
@@ -7705,6 +10779,13 @@ def gsl(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7732,6 +10813,40 @@ def gsl(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -7754,6 +10869,9 @@ def gsl(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="day",
     )
 
@@ -7772,6 +10890,9 @@ def spi6(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """6-Month Standardized Precipitation Index.
 
@@ -7837,6 +10958,13 @@ def spi6(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7864,6 +10992,40 @@ def spi6(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -7887,6 +11049,9 @@ def spi6(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="",
     )
 
@@ -7905,6 +11070,9 @@ def spi3(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """3-Month Standardized Precipitation Index.
 
@@ -7970,6 +11138,13 @@ def spi3(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -7997,6 +11172,40 @@ def spi3(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -8020,6 +11229,9 @@ def spi3(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="",
     )
 
@@ -8037,6 +11249,9 @@ def pp(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean of daily sea level pressure (hPa).
 
@@ -8088,6 +11303,13 @@ def pp(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -8115,6 +11337,40 @@ def pp(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -8137,6 +11393,9 @@ def pp(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="hPa",
     )
 
@@ -8154,6 +11413,9 @@ def ss(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Sunshine duration (hours).
 
@@ -8205,6 +11467,13 @@ def ss(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -8232,6 +11501,40 @@ def ss(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -8254,6 +11557,9 @@ def ss(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="hours",
     )
 
@@ -8271,6 +11577,9 @@ def rh(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Mean of daily relative humidity (%).
 
@@ -8322,6 +11631,13 @@ def rh(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -8349,6 +11665,40 @@ def rh(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -8371,5 +11721,8 @@ def rh(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
         out_unit="%",
     )
@@ -18,7 +18,7 @@ from icclim.threshold.factory import build_threshold
 
 if TYPE_CHECKING:
     import datetime as dt
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from icclim.logger import Verbosity
     from icclim._core.model.icclim_types import (
@@ -29,7 +29,10 @@ if TYPE_CHECKING:
     from icclim.frequency import Frequency
     from icclim._core.model.netcdf_version import NetcdfVersion
     from icclim._core.model.quantile_interpolation import QuantileInterpolation
+    from icclim._core.quantile_sketch import QuantileMethod
     from icclim._core.legacy.user_index.model import UserIndexDict
+    from icclim._core.profiling import Profile
+    from icclim._core.progress import ProgressEvent
     from icclim._core.model.threshold import Threshold
 __all__ = [
     "count_occurrences",
@@ -72,6 +75,10 @@ def count_occurrences(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Count occurrences when threshold(s) are met (e.g. SU, Tx90p, RR1).
 
@@ -127,6 +134,13 @@ def count_occurrences(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -160,6 +174,57 @@ def count_occurrences(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -185,6 +250,10 @@ def count_occurrences(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -204,6 +273,10 @@ def max_consecutive_occurrence(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Count the maximum number of consecutive occurrences when threshold(s) are met (e.g. CDD, CSU, CWD).
 
@@ -259,6 +332,13 @@ def max_consecutive_occurrence(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -292,6 +372,57 @@ def max_consecutive_occurrence(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -317,6 +448,10 @@ def max_consecutive_occurrence(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -337,6 +472,10 @@ def sum_of_spell_lengths(
     min_spell_length: int | None = 6,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Sum the lengths of each consecutive occurrence spell when threshold(s) are met. The minimum spell length is controlled by `min_spell_length` (e.g. WSDI, CSDI).
 
@@ -392,6 +531,13 @@ def sum_of_spell_lengths(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -428,6 +574,57 @@ def sum_of_spell_lengths(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -454,6 +651,10 @@ def sum_of_spell_lengths(
         min_spell_length=min_spell_length,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -473,6 +674,10 @@ def excess(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Compute the excess over the given threshold. The excess is `sum(x[x>t] - t)` where x is the studied variable and t the threshold (e.g. GD4).
 
@@ -528,6 +733,13 @@ def excess(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -561,6 +773,57 @@ def excess(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -586,6 +849,10 @@ def excess(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -605,6 +872,10 @@ def deficit(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Compute the deficit below the given threshold. The deficit is `sum(t - x[x<t])` where x is the studied variable and t the threshold (e.g. HD17).
 
@@ -660,6 +931,13 @@ def deficit(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -693,6 +971,57 @@ def deficit(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -718,6 +1047,10 @@ def deficit(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -737,6 +1070,10 @@ def fraction_of_total(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Compute the fraction of values meeting threshold(s) over the sum of every values (e.g. R75pTOT, R95pTOT).
 
@@ -792,6 +1129,13 @@ def fraction_of_total(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -825,6 +1169,57 @@ def fraction_of_total(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -850,6 +1245,10 @@ def fraction_of_total(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -869,6 +1268,10 @@ def maximum(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum of values that met threshold(s), if threshold(s) are given (e.g. Txx, Tnx).
 
@@ -924,6 +1327,13 @@ def maximum(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -957,6 +1367,57 @@ def maximum(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -982,6 +1443,10 @@ def maximum(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -1001,6 +1466,10 @@ def minimum(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Minimum of values that met threshold(s), if threshold(s) are given (e.g. Txn, Tnn).
 
@@ -1056,6 +1525,13 @@ def minimum(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1089,6 +1565,57 @@ def minimum(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1114,6 +1641,10 @@ def minimum(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -1133,6 +1664,10 @@ def average(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Average of values that met threshold(s), if threshold(s) are given (e.g. Tx, Tn).
 
@@ -1188,6 +1723,13 @@ def average(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1221,6 +1763,57 @@ def average(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1246,6 +1839,10 @@ def average(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -1265,6 +1862,10 @@ def sum(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Sum of values that met threshold(s), if threshold(s) are given (e.g. PRCPTOT, RR).
 
@@ -1320,6 +1921,13 @@ def sum(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1353,6 +1961,57 @@ def sum(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1378,6 +2037,10 @@ def sum(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -1397,6 +2060,10 @@ def standard_deviation(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Standard deviation of values that met threshold(s), if threshold(s) are given.
 
@@ -1452,6 +2119,13 @@ def standard_deviation(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1485,6 +2159,57 @@ def standard_deviation(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1510,6 +2235,10 @@ def standard_deviation(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -1530,6 +2259,10 @@ def max_of_rolling_sum(
     rolling_window_width: int | None = 5,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum of rolling sum over time dimension (e.g. RX5DAY: maximum 5 days window of precipitation accumulation).
 
@@ -1585,6 +2318,13 @@ def max_of_rolling_sum(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1621,6 +2361,57 @@ def max_of_rolling_sum(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1647,6 +2438,10 @@ def max_of_rolling_sum(
         rolling_window_width=rolling_window_width,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -1667,6 +2462,10 @@ def min_of_rolling_sum(
     rolling_window_width: int | None = 5,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Minimum of rolling sum over time dimension.
 
@@ -1722,6 +2521,13 @@ def min_of_rolling_sum(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1758,6 +2564,57 @@ def min_of_rolling_sum(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1784,6 +2641,10 @@ def min_of_rolling_sum(
         rolling_window_width=rolling_window_width,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -1804,6 +2665,10 @@ def max_of_rolling_average(
     rolling_window_width: int | None = 5,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Maximum of rolling average over time dimension.
 
@@ -1859,6 +2724,13 @@ def max_of_rolling_average(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -1895,6 +2767,57 @@ def max_of_rolling_average(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -1921,6 +2844,10 @@ def max_of_rolling_average(
         rolling_window_width=rolling_window_width,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -1941,6 +2868,10 @@ def min_of_rolling_average(
     rolling_window_width: int | None = 5,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Minimum of rolling average over time dimension.
 
@@ -1996,6 +2927,13 @@ def min_of_rolling_average(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2032,6 +2970,57 @@ def min_of_rolling_average(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2058,6 +3047,10 @@ def min_of_rolling_average(
         rolling_window_width=rolling_window_width,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -2077,6 +3070,10 @@ def mean_of_difference(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Average of the difference between two variables, or one variable and it's reference period values (e.g. DTR: `mean(tasmax - tasmin)`).
 
@@ -2132,6 +3129,13 @@ def mean_of_difference(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2165,6 +3169,57 @@ def mean_of_difference(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2190,6 +3245,10 @@ def mean_of_difference(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -2209,6 +3268,10 @@ def difference_of_extremes(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Difference of extremes between two variables, or one variable and it's reference period values. The extremes are always `maximum` for the first variable and `minimum` for the second variable (e.g. ETR: `max(tasmax) - min(tasmin)`).
 
@@ -2264,6 +3327,13 @@ def difference_of_extremes(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2297,6 +3367,57 @@ def difference_of_extremes(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2322,6 +3443,10 @@ def difference_of_extremes(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -2341,6 +3466,10 @@ def mean_of_absolute_one_time_step_difference(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Average of the absolute one time step by one time step difference between two variables, or one variable and it's reference period values (e.g. vDTR: `mean((tasmax[i] - tasmin[i]) - (tasmax[i-1] - tasmin[i-1])` ; where i is the day of measure).
 
@@ -2396,6 +3525,13 @@ def mean_of_absolute_one_time_step_difference(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2429,6 +3565,57 @@ def mean_of_absolute_one_time_step_difference(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2454,6 +3641,10 @@ def mean_of_absolute_one_time_step_difference(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -2474,6 +3665,10 @@ def difference_of_means(
     sampling_method: SamplingMethodLike = "resample",
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Difference of the average between two variables, or one variable and it's reference period values (e.g. anomaly: `mean(tasmax) - mean(tasmax_ref]))`.
 
@@ -2529,6 +3724,13 @@ def difference_of_means(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2570,6 +3772,57 @@ def difference_of_means(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2596,6 +3849,10 @@ def difference_of_means(
         sampling_method=sampling_method,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -2615,6 +3872,10 @@ def percentile(
     date_event: bool = False,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Percentile of a variable.
 
@@ -2670,6 +3931,13 @@ def percentile(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2703,6 +3971,57 @@ def percentile(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2728,6 +4047,10 @@ def percentile(
         date_event=date_event,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
 
 
@@ -2754,6 +4077,10 @@ def custom_index(
     sampling_method: SamplingMethodLike = "resample",
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
 ) -> Dataset:
     """Compute custom indices using simple operators.
 
@@ -2819,6 +4146,13 @@ def custom_index(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -2877,6 +4211,57 @@ def custom_index(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch", default="exact"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile, default=False
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None, optional
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None, optional
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Notes
     -----
@@ -2906,4 +4291,8 @@ def custom_index(
         sampling_method=sampling_method,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
+        profile=profile,
+        progress_callback=progress_callback,
+        memory_budget=memory_budget,
     )
@@ -0,0 +1,28 @@
+"""Offline benchmarks of icclim on deterministic synthetic data.
+
+The benchmarks time every ECA&D index, every generic indicator, each
+bootstrap execution path, ``icclim.indices("all")`` and the input/output paths
+on synthetic climate cubes, so that performance can be measured without access
+to real datasets. Run them with ``python -m icclim.bench run`` and check a run
+against the stored baseline of the machine with
+``python -m icclim.bench compare``; the ``benchmarks`` directory of the
+repository exposes the same cases to asv.
+"""
+
+from __future__ import annotations
+
+from icclim.bench.cases import BenchmarkCase, get_cases
+from icclim.bench.compare import Comparison, compare_runs
+from icclim.bench.runner import BenchmarkRun, run_benchmarks
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+
+__all__ = [
+    "BenchConfig",
+    "BenchmarkCase",
+    "BenchmarkRun",
+    "Comparison",
+    "compare_runs",
+    "get_cases",
+    "run_benchmarks",
+    "synthetic_dataset",
+]
@@ -0,0 +1,230 @@
+"""Command line interface of the benchmarks: ``python -m icclim.bench``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import TYPE_CHECKING
+
+from icclim.bench.cases import GROUPS, get_cases
+from icclim.bench.compare import (
+    DEFAULT_COMPARE_GROUPS,
+    DEFAULT_MEMORY_TOLERANCE,
+    DEFAULT_TIME_TOLERANCE,
+    baseline_path,
+    compare_runs,
+)
+from icclim.bench.runner import (
+    DEFAULT_RESULTS_DIR,
+    BenchmarkRun,
+    machine_fingerprint,
+    run_benchmarks,
+)
+from icclim.bench.synthetic import BENCH_SIZES, BenchConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from icclim.bench.runner import BenchmarkResult
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark command line, return its exit code."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    return args.command(args)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m icclim.bench",
+        description="Benchmark icclim on synthetic data.",
+    )
+    commands = parser.add_subparsers(required=True)
+    list_parser = commands.add_parser("list", help="List the benchmark cases.")
+    _add_selection_arguments(list_parser)
+    list_parser.set_defaults(command=_list)
+    run_parser = commands.add_parser("run", help="Run benchmark cases.")
+    _add_selection_arguments(run_parser)
+    _add_config_arguments(run_parser)
+    _add_results_dir_argument(run_parser)
+    run_parser.add_argument(
+        "--no-save",
+        action="store_true",
+        help="Do not store the results.",
+    )
+    run_parser.set_defaults(command=_run)
+    compare_parser = commands.add_parser(
+        "compare",
+        help="Run benchmark cases and compare them with the machine baseline.",
+        description=(
+            "Run benchmark cases, by default the groups"
+            f" {', '.join(DEFAULT_COMPARE_GROUPS)}, and fail when the wall time"
+            " or peak memory of a case regresses beyond the tolerances."
+        ),
+    )
+    _add_selection_arguments(compare_parser)
+    _add_config_arguments(compare_parser)
+    _add_results_dir_argument(compare_parser)
+    compare_parser.add_argument(
+        "--baseline",
+        help="Baseline JSON file (default: the baseline of this machine in the"
+        " results directory).",
+    )
+    compare_parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=DEFAULT_TIME_TOLERANCE,
+        help="Relative wall time growth tolerated (default: %(default)s).",
+    )
+    compare_parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=DEFAULT_MEMORY_TOLERANCE,
+        help="Relative peak memory growth tolerated (default: %(default)s).",
+    )
+    compare_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the run as the new baseline of this machine.",
+    )
+    compare_parser.set_defaults(command=_compare)
+    return parser
+
+
+def _add_selection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-k",
+        "--pattern",
+        help='Shell-style pattern of the case names, e.g. "ecad.TX*".',
+    )
+    parser.add_argument(
+        "--group",
+        action="append",
+        choices=GROUPS,
+        help="Group of cases to select, can be repeated.",
+    )
+
+
+def _add_results_dir_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--results-dir",
+        default=str(DEFAULT_RESULTS_DIR),
+        help="Directory the results are stored in (default: %(default)s).",
+    )
+
+
+def _add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--size", choices=list(BENCH_SIZES), default="small")
+    parser.add_argument("--backend", choices=["numpy", "dask"], default="numpy")
+    parser.add_argument("--calendar", default="standard")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of timed runs of each case (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the peak memory measure.",
+    )
+
+
+def _select(
+    args: argparse.Namespace,
+    default_groups: tuple[str, ...] | None = None,
+) -> list:
+    groups = tuple(args.group) if args.group else None
+    if groups is None and args.pattern is None:
+        groups = default_groups
+    return get_cases(pattern=args.pattern, groups=groups)
+
+
+def _config(args: argparse.Namespace) -> BenchConfig:
+    return BenchConfig.from_size(
+        args.size,
+        backend=args.backend,
+        calendar=args.calendar,
+    )
+
+
+def _list(args: argparse.Namespace) -> int:
+    for case in _select(args):
+        print(case.name)  # noqa: T201
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    cases = _select(args)
+    if not cases:
+        print("No benchmark case selected.", file=sys.stderr)  # noqa: T201
+        return 2
+    run = run_benchmarks(
+        _config(args),
+        cases,
+        repeat=args.repeat,
+        measure_memory=not args.no_memory,
+        progress=_print_result,
+    )
+    if not args.no_save:
+        path = run.save(args.results_dir)
+        print(f"Results stored in {path}")  # noqa: T201
+    return 1 if any(result.error for result in run.results) else 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    cases = _select(args, default_groups=DEFAULT_COMPARE_GROUPS)
+    if not cases:
+        print("No benchmark case selected.", file=sys.stderr)  # noqa: T201
+        return 2
+    config = _config(args)
+    machine_id = machine_fingerprint()["id"]
+    path = args.baseline or baseline_path(args.results_dir, machine_id, config.label)
+    try:
+        baseline = BenchmarkRun.load(path)
+    except FileNotFoundError:
+        if not args.update_baseline:
+            print(  # noqa: T201
+                f"No baseline found at {path}, create it with --update-baseline.",
+                file=sys.stderr,
+            )
+            return 2
+        baseline = None
+    run = run_benchmarks(
+        config,
+        cases,
+        repeat=args.repeat,
+        measure_memory=not args.no_memory,
+        progress=_print_result,
+    )
+    passed = True
+    if baseline is not None:
+        comparison = compare_runs(
+            baseline,
+            run,
+            time_tolerance=args.time_tolerance,
+            memory_tolerance=args.memory_tolerance,
+        )
+        print()  # noqa: T201
+        print(comparison.report())  # noqa: T201
+        passed = comparison.passed
+    if args.update_baseline:
+        stored = run.save(args.results_dir, name=f"baseline-{config.label}")
+        print(f"Baseline stored in {stored}")  # noqa: T201
+        return 1 if any(result.error for result in run.results) else 0
+    return 0 if passed else 1
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    if result.error is not None:
+        print(f"{result.name:<60} ERROR {result.error}")  # noqa: T201
+        return
+    memory = (
+        "" if result.peak_memory is None else f"{result.peak_memory / 2**20:10.1f} MiB"
+    )
+    print(f"{result.name:<60} {result.wall_time:10.4f} s {memory}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    sys.exit(main())
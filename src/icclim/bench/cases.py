@@ -0,0 +1,460 @@
+"""The benchmark cases: every ECA&D index, generic indicator and execution path.
+
+A case prepares, from the synthetic inputs of a configuration, a callable that
+runs one icclim computation to completion. Preparation, such as writing input
+files, is not timed.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    import xarray as xr
+
+    from icclim.bench.synthetic import BenchConfig
+
+GROUPS = ("ecad", "generic", "bootstrap", "indices", "graph", "io", "metadata")
+# The synthetic variable read for each standard variable of ECA&D indices.
+_SYNTHETIC_NAMES = {
+    "tg": "tas",
+    "tx": "tasmax",
+    "tn": "tasmin",
+    "pr": "pr",
+    "snd": "snd",
+    "sfcWind": "sfcWind",
+    "wsgs_max": "wsgsmax",
+    "DD": "dd",
+    "psl": "psl",
+    "sund": "sund",
+    "hurs": "hurs",
+}
+_SPI_INDICES = ("SPI3", "SPI6")
+# Variables and extra arguments of each generic indicator.
+_GENERIC_ARGS: dict[str, tuple[tuple[str, ...], dict[str, Any]]] = {
+    "count_occurrences": (("tas",), {"threshold": "> 15 degC"}),
+    "max_consecutive_occurrence": (("tas",), {"threshold": "> 15 degC"}),
+    "sum_of_spell_lengths": (("tas",), {"threshold": "> 15 degC"}),
+    "excess": (("tas",), {"threshold": "15 degC"}),
+    "deficit": (("tas",), {"threshold": "5 degC"}),
+    "fraction_of_total": (("pr",), {"threshold": "> 1 mm/day"}),
+    "maximum": (("tas",), {}),
+    "minimum": (("tas",), {}),
+    "average": (("tas",), {}),
+    "sum": (("pr",), {}),
+    "standard_deviation": (("tas",), {}),
+    "max_of_rolling_sum": (("pr",), {}),
+    "min_of_rolling_sum": (("pr",), {}),
+    "max_of_rolling_average": (("tas",), {}),
+    "min_of_rolling_average": (("tas",), {}),
+    "mean_of_difference": (("tasmax", "tasmin"), {}),
+    "difference_of_extremes": (("tasmax", "tasmin"), {}),
+    "mean_of_absolute_one_time_step_difference": (("tasmax", "tasmin"), {}),
+    "difference_of_means": (("tas",), {"sampling_method": "groupby"}),
+    "percentile": (("tas",), {"threshold": "90 period_per"}),
+}
+# ECA&D indices exercising the bootstrap reducers: exceedance counts and spells.
+_BOOTSTRAP_INDICES = ("TX90p", "WSDI")
+# ICCLIM_BOOTSTRAP_MODE and bootstrap argument selecting each execution kind,
+# for day of year percentiles of a dask input.
+_BOOTSTRAP_KINDS: dict[str, tuple[str | None, bool | None]] = {
+    "not_required": (None, False),
+    "reference_bootstrap": ("default", None),
+    "exact_tiled_bootstrap": ("safe", None),
+    "optimized_bootstrap": (None, None),
+}
+
+# Indices whose dask graphs are computed by icclim with and without the graph
+# optimization pass, best compared on the "scenario" size.
+_GRAPH_INDICES = ("SU", "TX90p", "WSDI")
+_GRAPH_OPTIMIZATION = {"optimized": "on", "unoptimized": "off"}
+# Indices whose lazy results are built with and without the compiled template
+# cache: a basic threshold, a percentile threshold and a bounded threshold.
+_METADATA_INDICES: dict[str, dict[str, Any]] = {
+    "SU": {"index_name": "SU"},
+    "TX90p": {"index_name": "TX90p", "bootstrap": False},
+    "count_occurrences": {
+        "index_name": "count_occurrences",
+        "threshold": "> 10 degC and < 25 degC",
+    },
+}
+_TEMPLATE_CACHE = {"cached": "on", "uncached": "off"}
+
+
+@dataclass(frozen=True)
+class BenchInputs:
+    """
+    The inputs shared by the cases of one benchmark configuration.
+
+    Parameters
+    ----------
+    config : BenchConfig
+        The configuration of the synthetic data.
+    dataset : Dataset
+        The synthetic variables.
+    workdir : Path
+        A directory the cases may write files to.
+    """
+
+    config: BenchConfig
+    dataset: xr.Dataset
+    workdir: Path
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    One timed icclim computation.
+
+    Parameters
+    ----------
+    name : str
+        The unique name of the case, "<group>.<name>".
+    group : str
+        The family of the case, one of ``GROUPS``.
+    variables : tuple[str, ...]
+        The synthetic variables the case reads.
+    prepare : Callable[[BenchInputs], Callable[[], object]]
+        Build, from the inputs, the callable to time.
+    env : dict[str, str]
+        Environment variables set while the case is prepared and run.
+    """
+
+    name: str
+    group: str
+    variables: tuple[str, ...]
+    prepare: Callable[[BenchInputs], Callable[[], object]]
+    env: dict[str, str] = field(default_factory=dict)
+
+    @contextmanager
+    def environment(self) -> Iterator[None]:
+        """Set the environment variables of the case."""
+        previous = {name: os.environ.get(name) for name in self.env}
+        os.environ.update(self.env)
+        try:
+            yield
+        finally:
+            for name, value in previous.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+def get_cases(
+    pattern: str | None = None,
+    groups: tuple[str, ...] | None = None,
+) -> list[BenchmarkCase]:
+    """
+    Return the benchmark cases, optionally filtered.
+
+    Parameters
+    ----------
+    pattern : str, optional
+        A shell-style pattern the case names must match, e.g. "ecad.TX*".
+    groups : tuple[str, ...], optional
+        The groups of cases to keep, see ``GROUPS``.
+
+    Returns
+    -------
+    list[BenchmarkCase]
+        The matching cases, grouped in the order of ``GROUPS``.
+    """
+    cases = [
+        *_ecad_cases(),
+        *_generic_cases(),
+        *_bootstrap_cases(),
+        *_indices_cases(),
+        *_graph_cases(),
+        *_io_cases(),
+        *_metadata_cases(),
+    ]
+    return [
+        case
+        for case in cases
+        if (groups is None or case.group in groups)
+        and (pattern is None or fnmatch.fnmatchcase(case.name, pattern))
+    ]
+
+
+def _compute(**kwargs: object) -> Callable[[], object]:
+    import icclim  # noqa: PLC0415
+
+    def _run() -> object:
+        return icclim.index(logs_verbosity="SILENT", **kwargs).load()
+
+    return _run
+
+
+def _ecad_cases() -> list[BenchmarkCase]:
+    from icclim.ecad.registry import EcadIndexRegistry  # noqa: PLC0415
+
+    cases = []
+    for index in EcadIndexRegistry.values():
+        variables = tuple(
+            _SYNTHETIC_NAMES[variable.short_name]
+            for variable in index.input_variables or []
+        )
+        if not variables:
+            continue
+
+        def _prepare(
+            inputs: BenchInputs,
+            name: str = index.short_name,
+            variables: tuple[str, ...] = variables,
+        ) -> Callable[[], object]:
+            kwargs = {}
+            if name in _SPI_INDICES or _uses_percentiles(name):
+                kwargs["base_period_time_range"] = inputs.config.base_period
+            return _compute(
+                index_name=name,
+                in_files=inputs.dataset[list(variables)],
+                **kwargs,
+            )
+
+        cases.append(
+            BenchmarkCase(
+                name=f"ecad.{index.short_name}",
+                group="ecad",
+                variables=variables,
+                prepare=_prepare,
+            ),
+        )
+    return cases
+
+
+def _uses_percentiles(index_name: str) -> bool:
+    from icclim.ecad.registry import EcadIndexRegistry  # noqa: PLC0415
+
+    threshold = EcadIndexRegistry.lookup(index_name).threshold
+    return "_per" in str(threshold)
+
+
+def _generic_cases() -> list[BenchmarkCase]:
+    cases = []
+    for name, (variables, extra) in _GENERIC_ARGS.items():
+
+        def _prepare(
+            inputs: BenchInputs,
+            name: str = name,
+            variables: tuple[str, ...] = variables,
+            extra: dict[str, Any] = extra,
+        ) -> Callable[[], object]:
+            kwargs = dict(extra)
+            if name == "difference_of_means":
+                kwargs["time_range"] = inputs.config.study_period
+                kwargs["base_period_time_range"] = inputs.config.base_period
+            return _compute(
+                index_name=name,
+                in_files=inputs.dataset[list(variables)],
+                var_name=list(variables),
+                **kwargs,
+            )
+
+        cases.append(
+            BenchmarkCase(
+                name=f"generic.{name}",
+                group="generic",
+                variables=variables,
+                prepare=_prepare,
+            ),
+        )
+    return cases
+
+
+def _bootstrap_cases() -> list[BenchmarkCase]:
+    cases = []
+    for index_name in _BOOTSTRAP_INDICES:
+        for kind, (mode, bootstrap) in _BOOTSTRAP_KINDS.items():
+
+            def _prepare(
+                inputs: BenchInputs,
+                index_name: str = index_name,
+                bootstrap: bool | None = bootstrap,
+            ) -> Callable[[], object]:
+                # Numpy inputs always run the reference bootstrap.
+                dataset = inputs.dataset[["tasmax"]].chunk(inputs.config.chunks)
+                return _compute(
+                    index_name=index_name,
+                    in_files=dataset,
+                    base_period_time_range=inputs.config.base_period,
+                    bootstrap=bootstrap,
+                )
+
+            cases.append(
+                BenchmarkCase(
+                    name=f"bootstrap.{index_name}.{kind}",
+                    group="bootstrap",
+                    variables=("tasmax",),
+                    prepare=_prepare,
+                    env={} if mode is None else {"ICCLIM_BOOTSTRAP_MODE": mode},
+                ),
+            )
+    return cases
+
+
+def _indices_cases() -> list[BenchmarkCase]:
+    def _prepare(inputs: BenchInputs) -> Callable[[], object]:
+        import icclim  # noqa: PLC0415
+
+        def _run() -> object:
+            return icclim.indices(
+                index_group="all",
+                in_files=inputs.dataset,
+                base_period_time_range=inputs.config.base_period,
+                logs_verbosity="SILENT",
+            ).load()
+
+        return _run
+
+    return [
+        BenchmarkCase(
+            name="indices.all",
+            group="indices",
+            variables=tuple(dict.fromkeys(_SYNTHETIC_NAMES.values())),
+            prepare=_prepare,
+        ),
+    ]
+
+
+def _graph_cases() -> list[BenchmarkCase]:
+    cases = []
+    for name, index_names in (
+        *((index_name, (index_name,)) for index_name in _GRAPH_INDICES),
+        ("indices", _GRAPH_INDICES),
+    ):
+        for kind, enabled in _GRAPH_OPTIMIZATION.items():
+
+            def _prepare(
+                inputs: BenchInputs,
+                index_names: tuple[str, ...] = index_names,
+            ) -> Callable[[], object]:
+                import icclim  # noqa: PLC0415
+
+                # icclim only optimizes the graphs it computes, e.g. to write.
+                kwargs = {
+                    "in_files": inputs.dataset[["tasmax"]].chunk(inputs.config.chunks),
+                    "base_period_time_range": inputs.config.base_period,
+                    "bootstrap": False,
+                    "out_file": str(inputs.workdir / "graph_out.nc"),
+                    "logs_verbosity": "SILENT",
+                }
+
+                def _run() -> object:
+                    if len(index_names) == 1:
+                        return icclim.index(index_name=index_names[0], **kwargs)
+                    return icclim.indices(index_group=list(index_names), **kwargs)
+
+                return _run
+
+            cases.append(
+                BenchmarkCase(
+                    name=f"graph.{name}.{kind}",
+                    group="graph",
+                    variables=("tasmax",),
+                    prepare=_prepare,
+                    env={"ICCLIM_GRAPH_OPTIMIZATION": enabled},
+                ),
+            )
+    return cases
+
+
+def _io_cases() -> list[BenchmarkCase]:
+    return [
+        BenchmarkCase(
+            name="io.read_netcdf",
+            group="io",
+            variables=("tas",),
+            prepare=_prepare_read_netcdf,
+        ),
+        BenchmarkCase(
+            name="io.read_multifile_netcdf",
+            group="io",
+            variables=("tas",),
+            prepare=_prepare_read_multifile_netcdf,
+        ),
+        BenchmarkCase(
+            name="io.read_zarr",
+            group="io",
+            variables=("tas",),
+            prepare=_prepare_read_zarr,
+        ),
+        BenchmarkCase(
+            name="io.write_netcdf",
+            group="io",
+            variables=("tas",),
+            prepare=_prepare_write_netcdf,
+        ),
+    ]
+
+
+def _prepare_read_netcdf(inputs: BenchInputs) -> Callable[[], object]:
+    path = inputs.workdir / "tas.nc"
+    inputs.dataset[["tas"]].to_netcdf(path)
+    return _compute(index_name="TG", in_files=str(path))
+
+
+def _prepare_read_multifile_netcdf(inputs: BenchInputs) -> Callable[[], object]:
+    tas = inputs.dataset[["tas"]]
+    paths = []
+    for year, yearly in tas.groupby("time.year"):
+        paths.append(str(inputs.workdir / f"tas_{year}.nc"))
+        yearly.to_netcdf(paths[-1])
+    return _compute(index_name="TG", in_files=paths)
+
+
+def _prepare_read_zarr(inputs: BenchInputs) -> Callable[[], object]:
+    path = inputs.workdir / "tas.zarr"
+    tas = inputs.dataset[["tas"]]
+    tas.chunk(inputs.config.chunks).to_zarr(path, mode="w")
+    return _compute(index_name="TG", in_files=str(path))
+
+
+def _prepare_write_netcdf(inputs: BenchInputs) -> Callable[[], object]:
+    out_file = str(inputs.workdir / "tg_out.nc")
+    return _compute(
+        index_name="TG", in_files=inputs.dataset[["tas"]], out_file=out_file
+    )
+
+
+def _metadata_cases() -> list[BenchmarkCase]:
+    cases = []
+    for name, index_kwargs in _METADATA_INDICES.items():
+        for kind, enabled in _TEMPLATE_CACHE.items():
+
+            def _prepare(
+                inputs: BenchInputs,
+                index_kwargs: dict[str, Any] = index_kwargs,
+            ) -> Callable[[], object]:
+                import icclim  # noqa: PLC0415
+
+                # Nothing is computed: the case times the overhead of index().
+                kwargs = {
+                    "in_files": inputs.dataset[["tasmax"]].chunk(inputs.config.chunks),
+                    "base_period_time_range": inputs.config.base_period,
+                    "logs_verbosity": "SILENT",
+                    **index_kwargs,
+                }
+
+                def _run() -> object:
+                    return icclim.index(**kwargs)
+
+                return _run
+
+            cases.append(
+                BenchmarkCase(
+                    name=f"metadata.{name}.{kind}",
+                    group="metadata",
+                    variables=("tasmax",),
+                    prepare=_prepare,
+                    env={"ICCLIM_TEMPLATE_CACHE": enabled},
+                ),
+            )
+    return cases
@@ -0,0 +1,310 @@
+"""Compare a benchmark run against a stored baseline.
+
+The baseline of a machine is a ``BenchmarkRun`` saved as
+``<results_dir>/<machine>/baseline-<config label>.json``, so that a run is only
+compared to measures taken on the same hardware and library versions. A case
+regresses when its median wall time or its peak memory grows beyond a relative
+tolerance; absolute floors keep the noise of very short cases from failing the
+comparison.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from icclim.exception import InvalidIcclimArgumentError
+
+if TYPE_CHECKING:
+    import os
+
+    from icclim.bench.runner import BenchmarkResult, BenchmarkRun
+
+# The cases compared when none is selected, whose performance swung the most
+# between releases.
+DEFAULT_COMPARE_GROUPS = ("bootstrap", "indices")
+DEFAULT_TIME_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.25
+# Smallest growth reported as a regression, in seconds and bytes.
+MIN_TIME_DELTA = 0.01
+MIN_MEMORY_DELTA = 2**20
+
+
+def baseline_path(
+    results_dir: str | os.PathLike,
+    machine_id: str,
+    label: str,
+) -> Path:
+    """Return the path of the baseline of a machine and configuration label."""
+    return Path(results_dir) / machine_id / f"baseline-{label}.json"
+
+
+@dataclass(frozen=True)
+class CaseComparison:
+    """
+    The comparison of one case with its baseline.
+
+    Parameters
+    ----------
+    name : str
+        The case name.
+    status : str
+        "ok", "regressed", "improved", "new" when the baseline has no measure
+        of the case, or "error" when the case failed.
+    baseline : BenchmarkResult | None
+        The baseline measures of the case.
+    current : BenchmarkResult
+        The current measures of the case.
+    reasons : tuple[str, ...]
+        A description of each regression or error.
+    """
+
+    name: str
+    status: str
+    baseline: BenchmarkResult | None
+    current: BenchmarkResult
+    reasons: tuple[str, ...] = ()
+
+    @property
+    def time_change(self) -> float | None:
+        """The relative change of the median wall time."""
+        if self.baseline is None:
+            return None
+        return _relative_change(self.baseline.wall_time, self.current.wall_time)
+
+    @property
+    def memory_change(self) -> float | None:
+        """The relative change of the peak memory."""
+        if self.baseline is None:
+            return None
+        return _relative_change(self.baseline.peak_memory, self.current.peak_memory)
+
+
+@dataclass
+class Comparison:
+    """
+    The comparison of a benchmark run with a baseline.
+
+    Parameters
+    ----------
+    baseline : BenchmarkRun
+        The reference run.
+    current : BenchmarkRun
+        The compared run.
+    time_tolerance : float
+        The relative wall time growth tolerated.
+    memory_tolerance : float
+        The relative peak memory growth tolerated.
+    cases : list[CaseComparison]
+        The comparison of each case of the current run.
+    """
+
+    baseline: BenchmarkRun
+    current: BenchmarkRun
+    time_tolerance: float
+    memory_tolerance: float
+    cases: list[CaseComparison] = field(default_factory=list)
+
+    @property
+    def failures(self) -> list[CaseComparison]:
+        """The cases which regressed or failed."""
+        return [case for case in self.cases if case.status in ("regressed", "error")]
+
+    @property
+    def passed(self) -> bool:
+        """Whether no case regressed nor failed."""
+        return not self.failures
+
+    def report(self) -> str:
+        """Describe the comparison as a human readable table."""
+        lines = [
+            (
+                f"Baseline {self.baseline.commit} ({self.baseline.timestamp}),"
+                f" current {self.current.commit} ({self.current.timestamp}),"
+                f" configuration {self.current.config['label']}."
+            ),
+            (
+                f"Tolerances: wall time +{self.time_tolerance:.0%},"
+                f" peak memory +{self.memory_tolerance:.0%}."
+            ),
+        ]
+        if self.baseline.machine.get("id") != self.current.machine.get("id"):
+            lines.append(
+                "Warning: the baseline was measured on another machine"
+                f" ({self.baseline.machine.get('id')}).",
+            )
+        width = max([len(case.name) for case in self.cases] + [4])
+        lines.append("")
+        lines.append(
+            f"{'case':<{width}}  {'time (s)':>9} {'baseline':>9} {'change':>8}"
+            f"  {'mem (MiB)':>9} {'baseline':>9} {'change':>8}  status",
+        )
+        for case in self.cases:
+            baseline = case.baseline
+            lines.append(
+                f"{case.name:<{width}}"
+                f"  {_format(case.current.wall_time, 1, '.4f')}"
+                f" {_format(baseline and baseline.wall_time, 1, '.4f')}"
+                f" {_format_change(case.time_change)}"
+                f"  {_format(case.current.peak_memory, 2**20, '.1f')}"
+                f" {_format(baseline and baseline.peak_memory, 2**20, '.1f')}"
+                f" {_format_change(case.memory_change)}"
+                f"  {case.status}",
+            )
+        failures = self.failures
+        lines.append("")
+        if not failures:
+            lines.append(f"OK: {len(self.cases)} cases within tolerances.")
+            return "\n".join(lines)
+        lines.append(f"FAILED: {len(failures)} of {len(self.cases)} cases.")
+        lines.extend(
+            f"  {case.name}: {reason}" for case in failures for reason in case.reasons
+        )
+        return "\n".join(lines)
+
+
+def compare_runs(
+    baseline: BenchmarkRun,
+    current: BenchmarkRun,
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+) -> Comparison:
+    """
+    Compare each case of ``current`` with its measures in ``baseline``.
+
+    Parameters
+    ----------
+    baseline : BenchmarkRun
+        The reference run.
+    current : BenchmarkRun
+        The compared run. Only its cases are compared, so that it may run a
+        subset of the baseline cases.
+    time_tolerance : float
+        The relative growth of the median wall time tolerated, e.g. 0.25 for
+        25 %.
+    memory_tolerance : float
+        The relative growth of the peak memory tolerated.
+
+    Returns
+    -------
+    Comparison
+        The comparison of every case of ``current``.
+
+    Raises
+    ------
+    InvalidIcclimArgumentError
+        When the runs use different synthetic data configurations.
+    """
+    if baseline.config.get("label") != current.config.get("label"):
+        msg = (
+            f"The baseline configuration {baseline.config.get('label')} differs"
+            f" from the current one {current.config.get('label')}."
+        )
+        raise InvalidIcclimArgumentError(msg)
+    baseline_results = {result.name: result for result in baseline.results}
+    comparison = Comparison(
+        baseline=baseline,
+        current=current,
+        time_tolerance=time_tolerance,
+        memory_tolerance=memory_tolerance,
+    )
+    for result in current.results:
+        comparison.cases.append(
+            _compare_case(
+                baseline_results.get(result.name),
+                result,
+                time_tolerance,
+                memory_tolerance,
+            ),
+        )
+    return comparison
+
+
+def _compare_case(
+    baseline: BenchmarkResult | None,
+    current: BenchmarkResult,
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> CaseComparison:
+    if current.error is not None:
+        return CaseComparison(
+            name=current.name,
+            status="error",
+            baseline=baseline,
+            current=current,
+            reasons=(current.error,),
+        )
+    if baseline is None or baseline.error is not None:
+        return CaseComparison(
+            name=current.name,
+            status="new",
+            baseline=None,
+            current=current,
+        )
+    reasons = []
+    if _regressed(
+        baseline.wall_time,
+        current.wall_time,
+        time_tolerance,
+        MIN_TIME_DELTA,
+    ):
+        reasons.append(
+            f"wall time {baseline.wall_time:.4f} s -> {current.wall_time:.4f} s"
+            f" ({_relative_change(baseline.wall_time, current.wall_time):+.1%},"
+            f" tolerance +{time_tolerance:.0%})",
+        )
+    if _regressed(
+        baseline.peak_memory,
+        current.peak_memory,
+        memory_tolerance,
+        MIN_MEMORY_DELTA,
+    ):
+        reasons.append(
+            f"peak memory {baseline.peak_memory / 2**20:.1f} MiB"
+            f" -> {current.peak_memory / 2**20:.1f} MiB"
+            f" ({_relative_change(baseline.peak_memory, current.peak_memory):+.1%},"
+            f" tolerance +{memory_tolerance:.0%})",
+        )
+    if reasons:
+        status = "regressed"
+    elif _regressed(current.wall_time, baseline.wall_time, time_tolerance, 0):
+        status = "improved"
+    else:
+        status = "ok"
+    return CaseComparison(
+        name=current.name,
+        status=status,
+        baseline=baseline,
+        current=current,
+        reasons=tuple(reasons),
+    )
+
+
+def _regressed(
+    baseline: float | None,
+    current: float | None,
+    tolerance: float,
+    min_delta: float,
+) -> bool:
+    if baseline is None or current is None:
+        return False
+    return current - baseline > max(tolerance * baseline, min_delta)
+
+
+def _relative_change(baseline: float | None, current: float | None) -> float | None:
+    if baseline is None or current is None or baseline == 0:
+        return None
+    return current / baseline - 1
+
+
+def _format(value: float | None, scale: float, spec: str) -> str:
+    if value is None:
+        return f"{'-':>9}"
+    return f"{value / scale:>9{spec}}"
+
+
+def _format_change(change: float | None) -> str:
+    if change is None:
+        return f"{'-':>8}"
+    return f"{change:>+8.1%}"
@@ -0,0 +1,292 @@
+"""Run benchmark cases and store their results.
+
+Each case is prepared once, run once untimed to compile kernels and warm
+caches up, then timed ``repeat`` times, with icclim's caches of intermediate
+results cleared before each run. Its peak memory is measured on an
+extra run with ``tracemalloc``, which traces the numpy buffers of every
+thread, so that the timed runs are not slowed down by tracing. That run is
+also profiled to record the execution paths icclim took.
+
+A ``BenchmarkRun`` is saved as JSON in
+``<results_dir>/<machine>/<commit>-<config label>.json``, the machine being a
+fingerprint of the hardware and library versions, so that runs of different
+commits on the same machine can be compared.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from icclim.bench.cases import BenchInputs, get_cases
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from icclim.bench.cases import BenchmarkCase
+
+DEFAULT_RESULTS_DIR = Path("benchmarks") / "results"
+_FINGERPRINT_PACKAGES = ("numpy", "xarray", "dask", "numba", "xclim")
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The measures of one benchmark case.
+
+    Parameters
+    ----------
+    name : str
+        The case name.
+    group : str
+        The case group.
+    wall_times : list[float]
+        The wall time of each timed run, in seconds.
+    cpu_times : list[float]
+        The CPU time of the process during each timed run, in seconds.
+    peak_memory : int | None
+        The peak memory traced during a run, in bytes, if measured.
+    execution_paths : dict[str, str]
+        The execution paths icclim took, if measured.
+    error : str | None
+        The error raised by the case, if any.
+    """
+
+    name: str
+    group: str
+    wall_times: list[float] = field(default_factory=list)
+    cpu_times: list[float] = field(default_factory=list)
+    peak_memory: int | None = None
+    execution_paths: dict[str, str] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def wall_time(self) -> float | None:
+        """The median wall time, in seconds."""
+        return statistics.median(self.wall_times) if self.wall_times else None
+
+
+@dataclass
+class BenchmarkRun:
+    """
+    The results of a benchmark run and the context they were measured in.
+
+    Parameters
+    ----------
+    config : dict
+        The synthetic data configuration.
+    machine : dict
+        The machine fingerprint, see ``machine_fingerprint``.
+    commit : str
+        The icclim commit, or version when not run from a git checkout.
+    timestamp : str
+        When the run started, in ISO format.
+    results : list[BenchmarkResult]
+        The measures of each case.
+    """
+
+    config: dict[str, Any]
+    machine: dict[str, Any]
+    commit: str
+    timestamp: str
+    results: list[BenchmarkResult] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the run as a JSON serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchmarkRun:
+        """Build a run from the output of ``to_dict``."""
+        results = [BenchmarkResult(**result) for result in data["results"]]
+        return cls(**{**data, "results": results})
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> BenchmarkRun:
+        """Load a run saved as JSON."""
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def save(
+        self,
+        results_dir: str | os.PathLike = DEFAULT_RESULTS_DIR,
+        name: str | None = None,
+    ) -> Path:
+        """
+        Save the run as JSON under ``results_dir``.
+
+        Parameters
+        ----------
+        results_dir : str | os.PathLike
+            The directory holding the results of every machine.
+        name : str, optional
+            The file name, without extension. Defaults to the commit and the
+            configuration label.
+
+        Returns
+        -------
+        Path
+            The path of the written file.
+        """
+        directory = Path(results_dir) / self.machine["id"]
+        directory.mkdir(parents=True, exist_ok=True)
+        name = name or f"{self.commit}-{self.config['label']}"
+        path = directory / f"{name}.json"
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return path
+
+
+def run_benchmarks(
+    config: BenchConfig,
+    cases: Sequence[BenchmarkCase] | None = None,
+    repeat: int = 3,
+    measure_memory: bool = True,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> BenchmarkRun:
+    """
+    Run benchmark cases on the synthetic data of ``config``.
+
+    Parameters
+    ----------
+    config : BenchConfig
+        The shape and layout of the synthetic data.
+    cases : list[BenchmarkCase], optional
+        The cases to run, all of them by default.
+    repeat : int
+        The number of timed runs of each case.
+    measure_memory : bool
+        Whether to measure the peak memory and execution paths of each case,
+        with one extra run.
+    progress : Callable[[BenchmarkResult], None], optional
+        Called with the result of each case once it is measured.
+
+    Returns
+    -------
+    BenchmarkRun
+        The results. A case raising an error gets its error recorded and the
+        run continues.
+    """
+    cases = get_cases() if cases is None else cases
+    run = BenchmarkRun(
+        config={**asdict(config), "label": config.label},
+        machine=machine_fingerprint(),
+        commit=current_commit(),
+        timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    )
+    variables = sorted({name for case in cases for name in case.variables})
+    dataset = synthetic_dataset(config, variables)
+    with tempfile.TemporaryDirectory(prefix="icclim-bench-") as workdir:
+        for index, case in enumerate(cases):
+            case_dir = Path(workdir) / str(index)
+            case_dir.mkdir()
+            inputs = BenchInputs(config=config, dataset=dataset, workdir=case_dir)
+            result = _run_case(case, inputs, repeat, measure_memory)
+            run.results.append(result)
+            if progress is not None:
+                progress(result)
+    return run
+
+
+def _run_case(
+    case: BenchmarkCase,
+    inputs: BenchInputs,
+    repeat: int,
+    measure_memory: bool,
+) -> BenchmarkResult:
+    from icclim._core.profiling import Profile  # noqa: PLC0415
+
+    result = BenchmarkResult(name=case.name, group=case.group)
+    try:
+        with case.environment():
+            func = case.prepare(inputs)
+            func()
+            for _ in range(repeat):
+                _clear_result_caches()
+                wall_start = time.perf_counter()
+                cpu_start = time.process_time()
+                func()
+                result.cpu_times.append(time.process_time() - cpu_start)
+                result.wall_times.append(time.perf_counter() - wall_start)
+            if measure_memory:
+                profile = Profile()
+                _clear_result_caches()
+                tracemalloc.start()
+                try:
+                    with profile.activate():
+                        func()
+                    result.peak_memory = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                result.execution_paths = profile.execution_paths
+    except Exception as error:  # noqa: BLE001
+        result.error = f"{type(error).__name__}: {error}"
+    return result
+
+
+def _clear_result_caches() -> None:
+    # Each timed run computes its result again, only the compiled kernels and
+    # resampling groups stay warm.
+    from icclim._core.spi import clear_spi_cache  # noqa: PLC0415
+
+    clear_spi_cache()
+
+
+def machine_fingerprint() -> dict[str, Any]:
+    """
+    Describe the machine and library versions results are measured with.
+
+    The ``id`` entry is a short hash of the other entries, naming the
+    directory results of this machine are stored in.
+    """
+    versions = {package: _package_version(package) for package in _FINGERPRINT_PACKAGES}
+    fingerprint = {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "system": platform.system(),
+        "python": platform.python_version(),
+        "packages": versions,
+    }
+    digest = hashlib.sha1(  # noqa: S324
+        json.dumps(fingerprint, sort_keys=True).encode(),
+    ).hexdigest()[:12]
+    return {"id": f"{platform.node() or 'machine'}-{digest}", **fingerprint}
+
+
+def _package_version(package: str) -> str | None:
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def current_commit() -> str:
+    """Return the git commit of the icclim checkout, or the icclim version."""
+    import icclim  # noqa: PLC0415
+
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            cwd=Path(icclim.__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return icclim.__version__
+    return completed.stdout.strip() or icclim.__version__
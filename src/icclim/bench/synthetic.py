@@ -0,0 +1,250 @@
+"""Deterministic synthetic climate cubes for the benchmarks.
+
+Each variable follows a seasonal cycle with a per cell offset and daily noise
+drawn from a generator seeded by the variable name, so that a cube only
+depends on its configuration. The values stay within physical ranges and
+precipitation has dry days, so that every index has meaningful work to do.
+"""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import xarray as xr
+
+from icclim.exception import InvalidIcclimArgumentError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+Backend = Literal["numpy", "dask"]
+
+# Number of latitudes, longitudes and years of each predefined size.
+BENCH_SIZES: dict[str, tuple[int, int, int]] = {
+    "tiny": (3, 4, 4),
+    "small": (16, 16, 10),
+    "medium": (64, 64, 30),
+    "large": (128, 128, 60),
+    # A 1950-2100 historical and scenario run.
+    "scenario": (16, 16, 151),
+}
+# First year of the predefined sizes not starting in 1991.
+BENCH_START_YEARS: dict[str, int] = {"scenario": 1950}
+# Name, units and standard name of each synthetic variable.
+SYNTHETIC_VARIABLES: dict[str, tuple[str, str]] = {
+    "tas": ("K", "air_temperature"),
+    "tasmax": ("K", "air_temperature"),
+    "tasmin": ("K", "air_temperature"),
+    "pr": ("kg m-2 s-1", "precipitation_flux"),
+    "snd": ("m", "surface_snow_thickness"),
+    "sfcWind": ("m s-1", "wind_speed"),
+    "wsgsmax": ("m s-1", "wind_speed_of_gust"),
+    "dd": ("degree", "wind_to_direction"),
+    "psl": ("Pa", "air_pressure_at_sea_level"),
+    "sund": ("s", "duration_of_sunshine"),
+    "hurs": ("%", "relative_humidity"),
+}
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    """
+    The shape and layout of the synthetic data of a benchmark run.
+
+    Parameters
+    ----------
+    n_lat, n_lon : int
+        The number of latitudes and longitudes.
+    years : int
+        The number of years, starting on ``start_year``.
+    backend : {"numpy", "dask"}
+        Whether the variables are numpy or dask arrays.
+    calendar : str
+        The calendar of the time axis, "standard" or a cftime calendar such as
+        "noleap".
+    start_year : int
+        The first year of data.
+    chunks : dict
+        The dask chunks of the variables, used with the "dask" backend.
+    dtype : str
+        The dtype of the variables.
+    seed : int
+        The seed of the random generators.
+    size : str | None
+        The name of the predefined size the configuration was built from.
+    """
+
+    n_lat: int
+    n_lon: int
+    years: int
+    backend: Backend = "numpy"
+    calendar: str = "standard"
+    start_year: int = 1991
+    chunks: dict[str, int] = field(
+        default_factory=lambda: {"time": 365 * 4, "lat": 32, "lon": 32},
+    )
+    dtype: str = "float32"
+    seed: int = 0
+    size: str | None = None
+
+    @classmethod
+    def from_size(
+        cls,
+        size: str,
+        backend: Backend = "numpy",
+        calendar: str = "standard",
+        **kwargs: object,
+    ) -> BenchConfig:
+        """Build the configuration of a predefined size, see ``BENCH_SIZES``."""
+        if size not in BENCH_SIZES:
+            msg = f"Unknown benchmark size {size}, expected one of {list(BENCH_SIZES)}."
+            raise InvalidIcclimArgumentError(msg)
+        n_lat, n_lon, years = BENCH_SIZES[size]
+        if size in BENCH_START_YEARS:
+            kwargs.setdefault("start_year", BENCH_START_YEARS[size])
+        return cls(
+            n_lat=n_lat,
+            n_lon=n_lon,
+            years=years,
+            backend=backend,
+            calendar=calendar,
+            size=size,
+            **kwargs,
+        )
+
+    @property
+    def label(self) -> str:
+        """A short name of the configuration, used to name results."""
+        shape = self.size or f"{self.n_lat}x{self.n_lon}x{self.years}y"
+        return f"{shape}-{self.backend}-{self.calendar}"
+
+    @property
+    def base_period(self) -> list[str]:
+        """The first half of the years, used as reference period."""
+        end = self.start_year + max(self.years // 2, 1) - 1
+        return [f"{self.start_year}-01-01", f"{end}-12-31"]
+
+    @property
+    def study_period(self) -> list[str]:
+        """The years following the reference period."""
+        start = self.start_year + max(self.years // 2, 1)
+        end = self.start_year + self.years - 1
+        return [f"{start}-01-01", f"{end}-12-31"]
+
+
+def synthetic_dataset(
+    config: BenchConfig,
+    variables: Sequence[str] | None = None,
+) -> xr.Dataset:
+    """
+    Build the synthetic daily variables of ``config``.
+
+    Parameters
+    ----------
+    config : BenchConfig
+        The shape and layout of the data.
+    variables : list[str], optional
+        The variables to build, see ``SYNTHETIC_VARIABLES``. All of them by
+        default.
+
+    Returns
+    -------
+    Dataset
+        The variables, with "time", "lat" and "lon" dimensions.
+    """
+    variables = list(SYNTHETIC_VARIABLES if variables is None else variables)
+    unknown = set(variables) - set(SYNTHETIC_VARIABLES)
+    if unknown:
+        msg = f"Unknown synthetic variables {sorted(unknown)}."
+        raise InvalidIcclimArgumentError(msg)
+    time = xr.date_range(
+        f"{config.start_year}-01-01",
+        f"{config.start_year + config.years - 1}-12-31",
+        freq="D",
+        calendar=config.calendar,
+        use_cftime=config.calendar not in ("standard", "gregorian"),
+    )
+    coords = {
+        "time": time,
+        "lat": np.linspace(-60, 60, config.n_lat),
+        "lon": np.linspace(-180, 180, config.n_lon, endpoint=False),
+    }
+    season = np.sin(2 * np.pi * (np.asarray(time.dayofyear) - 110) / 365.25)
+    shape = (len(time), config.n_lat, config.n_lon)
+    dataset = xr.Dataset(
+        {
+            name: xr.DataArray(
+                _generate(name, season, shape, config.seed).astype(config.dtype),
+                dims=("time", "lat", "lon"),
+                coords=coords,
+                attrs={
+                    "units": SYNTHETIC_VARIABLES[name][0],
+                    "standard_name": SYNTHETIC_VARIABLES[name][1],
+                },
+            )
+            for name in variables
+        },
+    )
+    if config.backend == "dask":
+        return dataset.chunk(config.chunks)
+    return dataset
+
+
+def _generate(
+    name: str,
+    season: np.ndarray,
+    shape: tuple[int, int, int],
+    seed: int,
+) -> np.ndarray:
+    rng = np.random.default_rng([seed, zlib.crc32(name.encode())])
+    cycle = season[:, None, None]
+    offset = rng.normal(0, 1, (1, *shape[1:]))
+    noise = rng.normal(0, 1, shape)
+    return _GENERATORS[name](rng, cycle, offset, noise)
+
+
+def _temperature(
+    cycle: np.ndarray, offset: np.ndarray, noise: np.ndarray
+) -> np.ndarray:
+    return 283.15 + 10 * cycle + 4 * offset + 3 * noise
+
+
+def _precipitation(
+    rng: np.random.Generator,
+    cycle: np.ndarray,
+    noise: np.ndarray,
+) -> np.ndarray:
+    wet = rng.random(noise.shape) < 0.4 - 0.1 * cycle
+    return np.where(wet, rng.gamma(0.8, 8 / 86400, noise.shape), 0.0)
+
+
+# Values of each variable from its generator, seasonal cycle, per cell offset
+# and standard normal daily noise.
+_GENERATORS = {
+    "tas": lambda _, cycle, offset, noise: _temperature(cycle, offset, noise),
+    "tasmax": lambda rng, cycle, offset, noise: (
+        _temperature(cycle, offset, noise) + 5 + np.abs(rng.normal(0, 2, noise.shape))
+    ),
+    "tasmin": lambda rng, cycle, offset, noise: (
+        _temperature(cycle, offset, noise) - 5 - np.abs(rng.normal(0, 2, noise.shape))
+    ),
+    "pr": lambda rng, cycle, _, noise: _precipitation(rng, cycle, noise),
+    "snd": lambda _, cycle, offset, noise: np.clip(
+        -0.4 * cycle + 0.1 * offset + 0.05 * noise, 0, None
+    ),
+    "sfcWind": lambda rng, _, offset, noise: (
+        4 * rng.weibull(2, noise.shape) + 0.5 * np.abs(offset)
+    ),
+    "wsgsmax": lambda rng, _, offset, noise: (
+        7 * rng.weibull(2, noise.shape) + np.abs(offset)
+    ),
+    "dd": lambda rng, _, __, noise: rng.uniform(0, 360, noise.shape),
+    "psl": lambda _, __, offset, noise: 101325 + 800 * noise + 300 * offset,
+    "sund": lambda _, cycle, __, noise: np.clip(
+        43200 * (0.5 + 0.3 * cycle + 0.2 * noise), 0, 86400
+    ),
+    "hurs": lambda _, __, offset, noise: np.clip(75 + 10 * offset + 10 * noise, 1, 100),
+}
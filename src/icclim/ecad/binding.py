@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 from pandas import to_datetime
 
 from icclim._core.generic.functions import get_single_var
 from icclim._core.generic.indicator import Indicator
+from icclim._core.profiling import profile_path
 from icclim.exception import InvalidIcclimArgumentError
 from icclim.frequency import FrequencyRegistry
 
@@ -15,6 +17,7 @@ if TYPE_CHECKING:
     import xarray
 
     from icclim._core.model.index_config import IndexConfig
+    from icclim.frequency import Frequency
 
 
 class GrowingSeasonLength(Indicator):
@@ -40,13 +43,18 @@ class GrowingSeasonLength(Indicator):
         import xclim  # noqa: PLC0415
 
         study, _ = get_single_var(config.climate_variables)
-        return xclim.atmos.growing_season_length(
-            tas=study,
-            thresh="5 degree_Celsius",
-            window=6,
-            mid_date="07-01",
-            freq=config.frequency.pandas_freq,
-        )
+        kwargs = {
+            "thresh": "5 degree_Celsius",
+            "window": 6,
+            "mid_date": "07-01",
+            "freq": config.frequency.pandas_freq,
+        }
+        compiled = _compiled_growing_season_length(study, config.frequency, kwargs)
+        if compiled is not None:
+            profile_path("growing_season_length", "compiled")
+            return compiled
+        profile_path("growing_season_length", "xclim")
+        return xclim.atmos.growing_season_length(tas=study, **kwargs)
 
     def preprocess(self, *args, **kwargs) -> list[xarray.DataArray]:
         """Not implemented as xclim indicator already handle pre/post processing."""
@@ -84,30 +92,7 @@ class StandardizedPrecipitationIndex3(Indicator):
 
     def __call__(self, config: IndexConfig) -> xarray.DataArray:
         """Compute the 3-Month Standardized Precipitation Index."""
-        import xclim  # noqa: PLC0415
-
-        if config.frequency is not FrequencyRegistry.YEAR:  # year is default freq
-            msg = "`slice_mode` cannot be configured when computing SPI3"
-            raise InvalidIcclimArgumentError(msg)
-        study, _ = get_single_var(config.climate_variables)
-        # Parse with correct format
-        study_cv = config.climate_variables[0]  # the ClimateVariable
-        if study_cv.reference_period is None:
-            msg = "reference_period is missing for SPI index"
-            raise ValueError(msg)
-        start, end = to_datetime(study_cv.reference_period, format="%m-%d-%Y")
-        # Convert back to YYYY-MM-DD
-        cal_start, cal_end = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
-        return xclim.atmos.standardized_precipitation_index(
-            pr=study,
-            freq="MS",
-            window=3,
-            cal_start=cal_start,
-            cal_end=cal_end,
-            dist="gamma",
-            method="APP",
-            fitkwargs={"floc": 0},
-        )
+        return _compute_spi(config, window=3)
 
     def preprocess(self, *args, **kwargs) -> list[xarray.DataArray]:
         """Not implemented as xclim indicator already handle pre/post processing."""
@@ -145,30 +130,7 @@ class StandardizedPrecipitationIndex6(Indicator):
 
     def __call__(self, config: IndexConfig) -> xarray.DataArray:
         """Compute the 6-Month Standardized Precipitation Index."""
-        import xclim  # noqa: PLC0415
-
-        if config.frequency is not FrequencyRegistry.YEAR:  # year is default freq
-            msg = "`slice_mode` cannot be configured when computing SPI6"
-            raise InvalidIcclimArgumentError(msg)
-        study, _ = get_single_var(config.climate_variables)
-        # Parse with correct format
-        study_cv = config.climate_variables[0]  # the ClimateVariable
-        if study_cv.reference_period is None:
-            msg = "reference_period is missing for SPI index"
-            raise ValueError(msg)
-        start, end = to_datetime(study_cv.reference_period, format="%m-%d-%Y")
-        # Convert back to YYYY-MM-DD
-        cal_start, cal_end = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
-        return xclim.atmos.standardized_precipitation_index(
-            pr=study,
-            freq="MS",
-            window=6,
-            cal_start=cal_start,
-            cal_end=cal_end,
-            dist="gamma",
-            method="APP",
-            fitkwargs={"floc": 0},
-        )
+        return _compute_spi(config, window=6)
 
     def preprocess(self, *args, **kwargs) -> list[xarray.DataArray]:
         """Not implemented as xclim indicator already handle pre/post processing."""
@@ -183,3 +145,80 @@ class StandardizedPrecipitationIndex6(Indicator):
     def __eq__(self, other: object) -> bool:
         """Check if the other object is a StandardizedPrecipitationIndex6 instance."""
         return isinstance(other, StandardizedPrecipitationIndex6)
+
+
+def _compute_spi(config: IndexConfig, window: int) -> xarray.DataArray:
+    """
+    Compute SPI over ``window`` months with a gamma fit on the reference period.
+
+    The monthly aggregation and the fitted parameters are cached, so SPI3 and
+    SPI6 of the same input share the aggregation and reruns reuse the fits.
+    """
+    from icclim._core.spi import standardized_precipitation_index  # noqa: PLC0415
+
+    if config.frequency is not FrequencyRegistry.YEAR:  # year is default freq
+        msg = f"`slice_mode` cannot be configured when computing SPI{window}"
+        raise InvalidIcclimArgumentError(msg)
+    study, _ = get_single_var(config.climate_variables)
+    # Parse with correct format
+    study_cv = config.climate_variables[0]  # the ClimateVariable
+    if study_cv.reference_period is None:
+        msg = "reference_period is missing for SPI index"
+        raise ValueError(msg)
+    start, end = to_datetime(study_cv.reference_period, format="%m-%d-%Y")
+    # Convert back to YYYY-MM-DD
+    cal_start, cal_end = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+    return standardized_precipitation_index(study, window, cal_start, cal_end)
+
+
+def _compiled_growing_season_length(
+    study: xarray.DataArray,
+    frequency: Frequency,
+    kwargs: dict,
+) -> xarray.DataArray | None:
+    """
+    Compute GSL with the compiled season kernel, as the xclim indicator would.
+
+    The metadata come from the xclim indicator applied to a single cell and
+    the missing values are masked with the xclim method in use. Returns None
+    when the kernel or the group-index resampling cannot be used.
+    """
+    import xclim  # noqa: PLC0415
+    from xclim.core.missing import MISSING_METHODS  # noqa: PLC0415
+    from xclim.core.options import (  # noqa: PLC0415
+        CHECK_MISSING,
+        MISSING_OPTIONS,
+        OPTIONS,
+    )
+    from xclim.core.units import convert_units_to  # noqa: PLC0415
+
+    from icclim._core.generic.season_length import (  # noqa: PLC0415
+        season_length,
+        season_length_available,
+    )
+    from icclim._core.resampling import resample_backend_enabled  # noqa: PLC0415
+
+    if not season_length_available() or not resample_backend_enabled():
+        return None
+    groups = frequency.resample_groups(study)
+    if groups is None:
+        return None
+    indicator = xclim.atmos.growing_season_length
+    cell = study.isel({dim: slice(0, 1) for dim in study.dims if dim != "time"})
+    template = indicator(tas=cell, **kwargs)
+    threshold = convert_units_to(kwargs["thresh"], study, context="infer")
+    # Compare in the precision xarray would use for ``study >= threshold``.
+    threshold = np.asarray(threshold, dtype=np.result_type(study.dtype, threshold))
+    result = season_length(
+        study,
+        groups,
+        float(threshold),
+        kwargs["window"],
+        kwargs["mid_date"],
+    )
+    method = OPTIONS[CHECK_MISSING]
+    if method != "skip":
+        misser = MISSING_METHODS[method](**OPTIONS[MISSING_OPTIONS].get(method, {}))
+        result = result.where(~misser(study, kwargs["freq"], indicator.src_freq))
+    result.attrs = dict(template.attrs)
+    return result.rename(template.name)
@@ -34,6 +34,7 @@ from icclim._core.constants import (
     SON_MONTHS,
 )
 from icclim._core.model.registry import Registry
+from icclim._core.resampling import get_resample_groups, resample_reduce
 from icclim._core.utils import read_date
 from icclim.exception import InvalidIcclimArgumentError
 
@@ -41,6 +42,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
     from icclim._core.model.icclim_types import FrequencyLike, Indexer
+    from icclim._core.resampling import ResampleGroups, ResampleReduction
 
 SEASON_ERR_MSG = (
     "A season created using `slice_mode` must be made of either"
@@ -328,6 +330,50 @@ class Frequency:
             kwargs.update(self.indexer)
         return kwargs
 
+    def resample_groups(self, da: DataArray) -> ResampleGroups | None:
+        """
+        Get the resampling groups of ``da`` time axis.
+
+        Group offsets are computed once per time index and frequency and then
+        cached. Because the seasonal indexer is applied to the data beforehand,
+        a filtered time index gets its own cache entry.
+
+        Parameters
+        ----------
+        da : DataArray
+            The data to resample.
+
+        Returns
+        -------
+        ResampleGroups | None
+            The group labels, start offsets and lengths, or None if the time
+            index is not sorted.
+        """
+        return get_resample_groups(da.indexes["time"], self.pandas_freq)
+
+    def reduce(self, da: DataArray, how: ResampleReduction) -> DataArray:
+        """
+        Resample ``da`` to this frequency and reduce each group.
+
+        This is equivalent to ``da.resample(time=self.pandas_freq).<how>()`` but
+        runs as a single segmented reduction per chunk, using the cached
+        resampling groups.
+
+        Parameters
+        ----------
+        da : DataArray
+            The data to resample.
+        how : str
+            One of {"sum", "mean", "max", "min", "std", "var", "skew",
+            "kurtosis", "count", "argmax", "argmin"}.
+
+        Returns
+        -------
+        DataArray
+            The reduced data, with one time step per group.
+        """
+        return resample_reduce(da, self.pandas_freq, how)
+
 
 _NO_RESAMPLE_FREQUENCY = object()
 
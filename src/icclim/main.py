@@ -12,9 +12,12 @@ A convenience function `indices` is also exposed to compute multiple indices at
 from __future__ import annotations
 
 import datetime as dt
+import inspect
 import operator
 import time
-from collections.abc import Callable, Sequence
+from collections import Counter
+from collections.abc import Callable, Hashable, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from functools import reduce
 from typing import TYPE_CHECKING, Any, Literal, Union
 from warnings import warn
@@ -31,8 +34,16 @@ from icclim._core.constants import (
     RESAMPLE_METHOD,
     UNITS_KEY,
 )
+from icclim._core.generic.fused_reducer import fused_reductions
 from icclim._core.generic.indicator import GenericIndicator
+from icclim._core.graph import compute_optimized, optimize_graph
 from icclim._core.input_parsing import build_input_dict
+from icclim._core.memory import (
+    active_memory_budget,
+    exceeds_memory_budget,
+    memory_stage,
+    resolve_memory_budget,
+)
 from icclim._core.model.index_config import IndexConfig
 from icclim._core.model.index_group import IndexGroup, IndexGroupRegistry
 from icclim._core.model.logical_link import LogicalLinkRegistry
@@ -43,7 +54,17 @@ from icclim._core.model.quantile_interpolation import (
 )
 from icclim._core.model.standard_index import StandardIndex
 from icclim._core.model.threshold import Threshold
+from icclim._core.profiling import Profile, active_profile, profile_phase
+from icclim._core.progress import (
+    ProgressEvent,
+    ProgressReporter,
+    active_progress,
+    progress_span,
+    report_progress,
+    track_dask_progress,
+)
 from icclim._core.utils import read_date
+from icclim._core.warmup import track_kernel_compilation
 from icclim.dcsc.registry import DcscIndexRegistry
 from icclim.ecad.binding import (
     StandardizedPrecipitationIndex3,
@@ -60,6 +81,7 @@ if TYPE_CHECKING:
     from xarray.core.dataarray import DataArray
     from xarray.core.dataset import Dataset
 
+    from icclim._core.explain import ExecutionPlan
     from icclim._core.legacy.user_index.model import UserIndexDict
     from icclim._core.model.icclim_types import (
         FrequencyLike,
@@ -69,6 +91,7 @@ if TYPE_CHECKING:
     from icclim._core.model.in_file_dictionary import InFileDictionary
     from icclim._core.model.indicator import Indicator
     from icclim._core.model.logical_link import LogicalLink
+    from icclim._core.quantile_sketch import QuantileMethod
 
 SliceMode = Union[str, Sequence[str], "Frequency", "FrequencyLike"]
 
@@ -181,38 +204,110 @@ def indices(
     -----
     If ``output_file`` is part of kwargs, the result is written in a single netCDF
     file, which will contain all the index results of this group.
+    The ``callback`` and ``progress_callback`` of kwargs report the progress of
+    the whole group, each index getting an equal share of it.
+    The ``memory_budget`` of kwargs applies to the whole group, the high-water
+    marks of its stages are attached to the merged result.
     """
     indices = _get_ecad_indices_of_group(index_group)
     out_file = kwargs.get("out_file")
     index_kwargs = _build_indices_call_kwargs(kwargs)
+    run_budget = (
+        None
+        if active_memory_budget() is not None
+        else resolve_memory_budget(index_kwargs.pop("memory_budget", None))
+    )
     acc = []
-    for standard_index in indices:
-        log.info("Computing index %s", standard_index.short_name)
-        try:
-            res = index(
-                **_with_requested_index_name(index_kwargs, standard_index.short_name)
-            )
-            res = _rename_coords(res, standard_index.short_name)
-            res = _drop_group_auxiliary_vars(res)
-            acc.append(res)
-        except Exception:
-            if ignore_error:
-                warn(f"Could not compute {standard_index.short_name}.", stacklevel=2)
-            else:
-                raise
-    ds: Dataset = xr.merge(acc, compat="no_conflicts", join="outer")
-    if out_file is not None:
-        _write_output_file(
-            result_ds=ds,
-            input_time_encoding=ds.time.encoding,
-            netcdf_version=index_kwargs.get(
-                "netcdf_version", NetcdfVersionRegistry.NETCDF4
-            ),
-            file_path=out_file,
-        )
+    with (
+        _progress_context(
+            kwargs.get("callback", log.callback),
+            kwargs.get("callback_percentage_start_value", 0),
+            kwargs.get("callback_percentage_total", 100),
+            kwargs.get("progress_callback"),
+        ),
+        run_budget.activate() if run_budget is not None else nullcontext(),
+    ):
+        # Indices reducing the same input share a single pass over its chunks.
+        with (
+            progress_span(0, 1 if out_file is None else 0.5),
+            fused_reductions(),
+        ):
+            for i, standard_index in enumerate(indices):
+                log.info("Computing index %s", standard_index.short_name)
+                try:
+                    with progress_span(i / len(indices), (i + 1) / len(indices)):
+                        res = index(
+                            **_with_requested_index_name(
+                                index_kwargs, standard_index.short_name
+                            )
+                        )
+                    res = _rename_coords(res, standard_index.short_name)
+                    res = _drop_group_auxiliary_vars(res)
+                    acc.append(res)
+                except Exception:
+                    if ignore_error:
+                        warn(
+                            f"Could not compute {standard_index.short_name}.",
+                            stacklevel=2,
+                        )
+                    else:
+                        raise
+                report_progress(
+                    "indices",
+                    i + 1,
+                    len(indices),
+                    label=standard_index.short_name,
+                )
+        ds = _merge_index_results(acc)
+        if out_file is not None:
+            with progress_span(0.5, 1), track_dask_progress():
+                _write_output_file(
+                    result_ds=ds,
+                    input_time_encoding=ds.time.encoding,
+                    netcdf_version=index_kwargs.get(
+                        "netcdf_version", NetcdfVersionRegistry.NETCDF4
+                    ),
+                    file_path=out_file,
+                )
+        report_progress("done", 1, 1)
+    if run_budget is not None:
+        ds.attrs["icclim_memory"] = run_budget.to_json()
     return ds
 
 
+def _merge_index_results(results: list[Dataset]) -> Dataset:
+    with memory_stage("merge"):
+        # "no_conflicts" loads and compares the variables found in several
+        # results, which all come from the same inputs.
+        shared = Counter(
+            name
+            for result in results
+            for name in result.variables
+            if name not in result.indexes
+        )
+        shared_bytes = sum(
+            variable.nbytes
+            for result in results
+            for name, variable in result.variables.items()
+            if shared[name] > 1 and name not in result.indexes
+        )
+        if exceeds_memory_budget("merge", shared_bytes, "compacted"):
+            results = _drop_repeated_coords(results)
+        return xr.merge(results, compat="no_conflicts", join="outer")
+
+
+def _drop_repeated_coords(results: list[Dataset]) -> list[Dataset]:
+    # The non-index coordinates, such as the time bounds, are kept from the
+    # first result holding them and are not compared; data variables still are.
+    seen: set[Hashable] = set()
+    compacted = []
+    for result in results:
+        coords = {name for name in result.coords if name not in result.indexes}
+        compacted.append(result.drop_vars(coords & seen))
+        seen |= coords
+    return compacted
+
+
 def _build_indices_call_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
     index_kwargs = dict(kwargs)
     index_kwargs.pop("out_file", None)
@@ -342,6 +437,10 @@ def index(
     sampling_method: SamplingMethodLike = RESAMPLE_METHOD,
     run_index: str | None = "first",
     allow_partial_seasons: bool | Literal["start", "end"] = False,
+    quantile_method: QuantileMethod = "exact",
+    profile: bool | Profile = False,
+    progress_callback: Callable[[ProgressEvent], None] | None = None,
+    memory_budget: int | str | None = None,
     *,
     # deprecated params are kwargs only
     window_width: int | None = None,
@@ -409,6 +508,11 @@ def index(
     callback: Callable[[int], None]
         ``optional`` Progress bar printing. If ``None``, progress bar will not be
         printed.
+        It is called with the percentage of completion each time it changes:
+        as dask tasks complete when icclim computes the result (when writing
+        ``out_file`` or profiling) with a local dask scheduler, after each
+        spatial tile of the tiled bootstrap and after each index of
+        ``icclim.indices``.
     callback_percentage_start_value: int
         ``optional`` Initial value of percentage of the progress bar (default: 0).
     callback_percentage_total: int
@@ -436,6 +540,13 @@ def index(
         strategy by trial and error. The safe path derives its spatial tile size from
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_MEMORY`` (default: ``2GB``), unless
         ``ICCLIM_BOOTSTRAP_SAFE_TILE_CELLS`` is set as an expert override.
+        The peak memory of the first tile is measured to resize the remaining
+        tiles; set ``ICCLIM_BOOTSTRAP_MEMORY_MODEL`` to a JSON file path to reuse
+        those measurements across runs.
+        When a ``dask.distributed`` client is active, the tiles run on its workers
+        (``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=local`` keeps them in the driver).
+        ``ICCLIM_BOOTSTRAP_TILE_EXECUTOR=lazy`` runs the tiles through
+        ``dask.array.map_blocks`` so the result of a dask input stays lazy.
         Set ``ICCLIM_BOOTSTRAP_MODE=default`` only for diagnostics to keep the reference bootstrap
         dask graph path. ``bootstrap=False`` should only be used as an explicit user
         shortcut for fast exploratory assessments, because disabling bootstrap removes
@@ -509,6 +620,57 @@ def index(
         - "start": Unmasks only the first period.
         - "end": Unmasks only the last period.
         Default is False.
+    quantile_method : "exact" | "radix" | "sketch"
+        ``optional`` How period percentiles ("period_per" thresholds and the
+        ``percentile`` generic index) are computed.
+        "exact" (default) computes exact percentiles.
+        "radix" computes the same exact period percentiles by radix selection,
+        without rechunking the time axis. The input is then read once per byte
+        of its dtype, which pays off when a single time chunk per cell does
+        not fit in memory. The ``percentile`` generic index computes it as
+        "exact".
+        "sketch" merges bounded-size quantile sketches computed per chunk,
+        without rechunking the time axis. It is meant for exploratory runs on
+        very large grids: the rank of each returned percentile is within
+        ``(1 + ceil(log8(m))) / k`` of the requested rank, for ``m`` time chunks
+        and ``k`` points per sketch (512, or ``ICCLIM_QUANTILE_SKETCH_SIZE``),
+        and results are exact for cells with at most ``k`` values.
+        Day of year percentiles are always exact.
+        Default is "exact".
+    profile : bool | Profile
+        ``optional`` Profile the phases of the computation: input opening,
+        studied data building, threshold preparation, graph building, compute,
+        missing values handling, metadata templating and output writing.
+        Each phase records its wall and CPU time and the peak memory of the
+        process, along with the in-memory size of the studied data (not the
+        bytes read from storage), the execution path chosen at each step and
+        the numba kernels compiled during the call.
+        When profiling, the result is computed within ``index`` so that the
+        compute phase is measured.
+        If True, the profile is attached to the result as JSON, in its
+        ``icclim_profile`` attribute. If an ``icclim.Profile`` is given, it is
+        filled instead and can be exported with its ``to_json`` and
+        ``to_chrome_trace`` methods.
+        Default is False.
+    progress_callback : Callable[[ProgressEvent], None] | None
+        ``optional`` Called with an ``icclim.ProgressEvent`` at each progress
+        step, along with ``callback``. Events give, besides the percentage, the
+        progressing stage ("dask", "bootstrap_tiles", "indices"...), its
+        completed and total amounts, its estimated remaining time when known
+        and what it works on.
+        Default is None.
+    memory_budget : int | str | None
+        ``optional`` The memory the computation should fit in, in bytes or as
+        a size such as "4GB". Defaults to ``ICCLIM_MEMORY_BUDGET`` when set.
+        Stages whose estimated working set exceeds the budget run a variant
+        using less memory: the input is split in smaller chunks, bootstrap
+        tiles are made smaller and exceedance masks are compacted to booleans.
+        The high-water mark of each stage run within ``index``, along with the
+        variant it ran, is attached to the result as JSON, in its
+        ``icclim_memory`` attribute. A lazy result is not computed by
+        ``index``, so its compute is not part of the report, unless it is
+        written to ``out_file`` or profiled.
+        Default is None, no budget.
 
     Examples
     --------
@@ -575,55 +737,246 @@ def index(
     >>> int(result["SU"].values[-1])
     61
     """
-    _setup(callback, callback_percentage_start_value, logs_verbosity)
+    _setup(logs_verbosity)
+    run_profile = Profile() if profile is True else profile or None
+    # Within ``indices``, the budget of the whole group is already active.
+    run_budget = (
+        None
+        if active_memory_budget() is not None
+        else resolve_memory_budget(memory_budget)
+    )
+    with (
+        _progress_context(
+            callback,
+            callback_percentage_start_value,
+            callback_percentage_total,
+            progress_callback,
+        ),
+        run_profile.activate() if run_profile is not None else nullcontext(),
+        run_budget.activate() if run_budget is not None else nullcontext(),
+        track_kernel_compilation(),
+    ):
+        result_ds = _profiled_index(
+            in_files=in_files,
+            index_name=index_name,
+            var_name=var_name,
+            slice_mode=slice_mode,
+            time_range=time_range,
+            out_file=out_file,
+            threshold=threshold,
+            callback=callback,
+            base_period_time_range=base_period_time_range,
+            bootstrap=bootstrap,
+            doy_window_width=doy_window_width,
+            only_leap_years=only_leap_years,
+            ignore_feb29th=ignore_Feb29th,
+            interpolation=interpolation,
+            out_unit=out_unit,
+            netcdf_version=netcdf_version,
+            user_index=user_index,
+            save_thresholds=save_thresholds,
+            date_event=date_event,
+            min_spell_length=min_spell_length,
+            rolling_window_width=rolling_window_width,
+            sampling_method=sampling_method,
+            run_index=run_index,
+            allow_partial_seasons=allow_partial_seasons,
+            quantile_method=quantile_method,
+            window_width=window_width,
+            save_percentile=save_percentile,
+            indice_name=indice_name,
+            user_indice=user_indice,
+            transfer_limit_mbytes=transfer_limit_Mbytes,
+        )
+    if profile is True:
+        result_ds.attrs["icclim_profile"] = run_profile.to_json()
+    if run_budget is not None:
+        result_ds.attrs["icclim_memory"] = run_budget.to_json()
+    log.ending_message(time.process_time())
+    return result_ds
+
+
+def explain(**index_kwargs) -> ExecutionPlan:
+    """
+    Describe how ``icclim.index`` would compute an index, without computing it.
+
+    The configuration is built as ``index`` does, which opens the inputs and
+    may read their time axis, but neither the index nor its thresholds are
+    computed. This helps sizing a batch job before submitting it.
+
+    Parameters
+    ----------
+    index_kwargs : dict
+        ``icclim.index`` keyword arguments. ``out_file`` and the progress and
+        profiling arguments are ignored.
+
+    Returns
+    -------
+    ExecutionPlan
+        The execution path and reason code of each threshold leaf, the
+        estimated bootstrap tiles, bytes to read and peak memory, the number
+        of dask tasks and the expected cache hits. ``plan.report()`` describes
+        it as text and ``plan.to_dict()`` as JSON serializable values.
+
+    Examples
+    --------
+    >>> import icclim
+    >>> plan = icclim.explain(  # doctest: +SKIP
+    ...     in_files="tasmax.nc",
+    ...     index_name="TX90p",
+    ...     base_period_time_range=["1991-01-01", "2000-12-31"],
+    ... )
+    >>> print(plan.report())  # doctest: +SKIP
+    """
+    from icclim._core.explain import build_execution_plan  # noqa: PLC0415
+
+    try:
+        bound = inspect.signature(index).bind(**index_kwargs)
+    except TypeError as e:
+        raise InvalidIcclimArgumentError(str(e)) from e
+    bound.apply_defaults()
+    args = bound.arguments
+    _setup(args["logs_verbosity"])
+    normalized_request = _normalize_index_request(
+        index_name=args["index_name"],
+        user_index=args["user_index"],
+        save_thresholds=args["save_thresholds"],
+        doy_window_width=args["doy_window_width"],
+        indice_name=args["indice_name"],
+        transfer_limit_mbytes=args["transfer_limit_Mbytes"],
+        user_indice=args["user_indice"],
+        save_percentile=args["save_percentile"],
+        window_width=args["window_width"],
+    )
+    config = _build_config_from_request(
+        in_files=args["in_files"],
+        var_name=args["var_name"],
+        slice_mode=args["slice_mode"],
+        time_range=args["time_range"],
+        threshold=args["threshold"],
+        callback=args["callback"],
+        base_period_time_range=args["base_period_time_range"],
+        bootstrap=args["bootstrap"],
+        only_leap_years=args["only_leap_years"],
+        ignore_feb29th=args["ignore_Feb29th"],
+        interpolation=args["interpolation"],
+        out_unit=args["out_unit"],
+        netcdf_version=args["netcdf_version"],
+        date_event=args["date_event"],
+        min_spell_length=args["min_spell_length"],
+        rolling_window_width=args["rolling_window_width"],
+        sampling_method=args["sampling_method"],
+        run_index=args["run_index"],
+        allow_partial_seasons=args["allow_partial_seasons"],
+        quantile_method=args["quantile_method"],
+        normalized_request=normalized_request,
+    )
+    return build_execution_plan(config, _build_index_result)
+
+
+def _profiled_index(
+    *,
+    in_files: InFileLike,
+    index_name: str | GenericIndicator | StandardIndex | None,
+    var_name: str | Sequence[str] | None,
+    slice_mode: FrequencyLike | Frequency,
+    time_range: Sequence[dt.datetime | str] | None,
+    out_file: str | None,
+    threshold: str | Threshold | Sequence[str | Threshold] | None,
+    callback: Callable[[int], None],
+    base_period_time_range: Sequence[dt.datetime] | Sequence[str] | None,
+    bootstrap: bool | None,
+    doy_window_width: int,
+    only_leap_years: bool,
+    ignore_feb29th: bool,
+    interpolation: str | QuantileInterpolation,
+    out_unit: str | None,
+    netcdf_version: str | NetcdfVersion,
+    user_index: UserIndexDict | None,
+    save_thresholds: bool,
+    date_event: bool,
+    min_spell_length: int | None,
+    rolling_window_width: int | None,
+    sampling_method: SamplingMethodLike,
+    run_index: str | None,
+    allow_partial_seasons: bool | Literal["start", "end"],
+    quantile_method: QuantileMethod,
+    window_width: int | None,
+    save_percentile: bool | None,
+    indice_name: str | None,
+    user_indice: UserIndexDict | None,
+    transfer_limit_mbytes: float | None,
+) -> Dataset:
+    """Run ``index`` within the active profile, if any."""
     normalized_request = _normalize_index_request(
         index_name=index_name,
         user_index=user_index,
         save_thresholds=save_thresholds,
         doy_window_width=doy_window_width,
         indice_name=indice_name,
-        transfer_limit_mbytes=transfer_limit_Mbytes,
+        transfer_limit_mbytes=transfer_limit_mbytes,
         user_indice=user_indice,
         save_percentile=save_percentile,
         window_width=window_width,
     )
-    config = _build_config_from_request(
-        in_files=in_files,
-        var_name=var_name,
-        slice_mode=slice_mode,
-        time_range=time_range,
-        threshold=threshold,
-        callback=callback,
-        base_period_time_range=base_period_time_range,
-        bootstrap=bootstrap,
-        only_leap_years=only_leap_years,
-        ignore_feb29th=ignore_Feb29th,
-        interpolation=interpolation,
-        out_unit=out_unit,
-        netcdf_version=netcdf_version,
-        date_event=date_event,
-        min_spell_length=min_spell_length,
-        rolling_window_width=rolling_window_width,
-        sampling_method=sampling_method,
-        run_index=run_index,
-        allow_partial_seasons=allow_partial_seasons,
-        normalized_request=normalized_request,
-    )
-    result_ds = _run_index_workflow(
-        config, out_file, callback_percentage_total, callback
-    )
-    log.ending_message(time.process_time())
-    return result_ds
+    with profile_phase("build_config"):
+        config = _build_config_from_request(
+            in_files=in_files,
+            var_name=var_name,
+            slice_mode=slice_mode,
+            time_range=time_range,
+            threshold=threshold,
+            callback=callback,
+            base_period_time_range=base_period_time_range,
+            bootstrap=bootstrap,
+            only_leap_years=only_leap_years,
+            ignore_feb29th=ignore_feb29th,
+            interpolation=interpolation,
+            out_unit=out_unit,
+            netcdf_version=netcdf_version,
+            date_event=date_event,
+            min_spell_length=min_spell_length,
+            rolling_window_width=rolling_window_width,
+            sampling_method=sampling_method,
+            run_index=run_index,
+            allow_partial_seasons=allow_partial_seasons,
+            quantile_method=quantile_method,
+            normalized_request=normalized_request,
+        )
+    return _run_index_workflow(config, out_file)
 
 
-def _run_index_workflow(
-    config: IndexConfig,
-    out_file: str | None,
-    callback_percentage_total: int,
-    callback: Callable[[int], None],
-) -> Dataset:
+def _run_index_workflow(config: IndexConfig, out_file: str | None) -> Dataset:
     """Compute, optionally write, and finalize one climate-index request."""
-    result_ds = _compute_climate_index(
+    profiled = active_profile() is not None
+    computes = profiled or out_file is not None
+    # Building the graph may already compute, e.g. the tiled bootstrap, so
+    # it gets half of the progress when the result is computed here too.
+    with progress_span(0, 0.5 if computes else 1):
+        result_ds = _build_index_result(config)
+    with progress_span(0.5, 1), track_dask_progress():
+        if profiled:
+            # Compute here, otherwise the compute would be attributed to the
+            # write phase or would happen after the profiled call.
+            lazy = any(v.chunks is not None for v in result_ds.values())
+            result_ds = optimize_graph(result_ds)
+            with profile_phase("compute") as details:
+                details["lazy"] = lazy
+                result_ds = compute_optimized(result_ds)
+        if out_file is not None:
+            with profile_phase("write"):
+                _write_output_file(
+                    result_ds,
+                    config.climate_variables[0].global_metadata["time_encoding"],
+                    config.netcdf_version,
+                    out_file,
+                )
+    report_progress("done", 1, 1)
+    return result_ds
+
+
+def _build_index_result(config: IndexConfig) -> Dataset:
+    return _compute_climate_index(
         climate_index=config.indicator,
         config=config,
         initial_history=config.climate_variables[0].global_metadata["history"],
@@ -631,15 +984,20 @@ def _run_index_workflow(
         rename=config.rename,
         reference=config.reference,
     )
-    if out_file is not None:
-        _write_output_file(
-            result_ds,
-            config.climate_variables[0].global_metadata["time_encoding"],
-            config.netcdf_version,
-            out_file,
-        )
-    callback(callback_percentage_total)
-    return result_ds
+
+
+def _progress_context(
+    callback: Callable[[int], None] | None,
+    start: int,
+    end: int,
+    on_event: Callable[[ProgressEvent], None] | None,
+) -> AbstractContextManager:
+    if active_progress() is not None:
+        # Nested in ``indices``, which reports the progress of each index.
+        return nullcontext()
+    reporter = ProgressReporter(callback, start, end, on_event=on_event)
+    reporter.report("start", 0, 1)
+    return reporter.activate()
 
 
 def _build_config_from_request(
@@ -663,6 +1021,7 @@ def _build_config_from_request(
     sampling_method: SamplingMethodLike,
     run_index: str | None,
     allow_partial_seasons: bool | Literal["start", "end"],
+    quantile_method: QuantileMethod,
     normalized_request: NormalizedIndexRequest,
 ) -> IndexConfig:
     """Build an IndexConfig from a normalized user request."""
@@ -690,6 +1049,7 @@ def _build_config_from_request(
         sampling_method=sampling_method,
         run_index=run_index,
         allow_partial_seasons=allow_partial_seasons,
+        quantile_method=quantile_method,
     )
 
 
@@ -717,6 +1077,7 @@ def _build_config(
     sampling_method: SamplingMethodLike,
     run_index: str | None,
     allow_partial_seasons: bool | Literal["start", "end"],
+    quantile_method: QuantileMethod = "exact",
 ) -> IndexConfig:
     if _uses_legacy_user_index_recipe(legacy_user_index, index_name):
         return _build_legacy_user_index_config(
@@ -741,6 +1102,7 @@ def _build_config(
             sampling_method=sampling_method,
             run_index=run_index,
             allow_partial_seasons=allow_partial_seasons,
+            quantile_method=quantile_method,
         )
     if index_name is not None:
         return _build_standard_index_config(
@@ -766,6 +1128,7 @@ def _build_config(
             sampling_method=sampling_method,
             run_index=run_index,
             allow_partial_seasons=allow_partial_seasons,
+            quantile_method=quantile_method,
         )
     msg = "You must fill either index_name or user_index to compute a climate index."
     raise InvalidIcclimArgumentError(msg)
@@ -796,6 +1159,7 @@ def _parse_threshold(
     reference_period: Sequence[dt.datetime | str] | None,
     only_leap_years: bool,
     interpolation: QuantileInterpolation,
+    quantile_method: QuantileMethod = "exact",
 ) -> Threshold | Sequence[Threshold] | None:
     if isinstance(threshold, Threshold):
         return threshold
@@ -806,6 +1170,7 @@ def _parse_threshold(
             reference_period=reference_period,
             only_leap_years=only_leap_years,
             interpolation=interpolation,
+            quantile_method=quantile_method,
         )
     if isinstance(threshold, Sequence):
         return [
@@ -815,6 +1180,7 @@ def _parse_threshold(
                 reference_period=reference_period,
                 only_leap_years=only_leap_years,
                 interpolation=interpolation,
+                quantile_method=quantile_method,
             )
             for t in threshold
         ]
@@ -843,6 +1209,7 @@ def _build_legacy_user_index_config(
     sampling_method: SamplingMethodLike,
     run_index: str | None,
     allow_partial_seasons: bool | Literal["start", "end"],
+    quantile_method: QuantileMethod = "exact",
 ) -> IndexConfig:
     interpolation = QuantileInterpolationRegistry.lookup(interpolation)
     sampling_frequency = FrequencyRegistry.lookup(slice_mode)  # type: ignore[arg-type]
@@ -855,6 +1222,7 @@ def _build_legacy_user_index_config(
         doy_window_width=doy_window_width,
         only_leap_years=only_leap_years,
         interpolation=interpolation,
+        quantile_method=quantile_method,
     )
     climate_variables, is_compared_to_ref = _build_index_climate_variables(
         in_files=in_files,
@@ -914,6 +1282,7 @@ def _build_standard_index_config(
     sampling_method: SamplingMethodLike,
     run_index: str | None,
     allow_partial_seasons: bool | Literal["start", "end"],
+    quantile_method: QuantileMethod = "exact",
 ) -> IndexConfig:
     interpolation = QuantileInterpolationRegistry.lookup(interpolation)
     # logical link here link two climate_variable computations as with user_index.
@@ -936,6 +1305,7 @@ def _build_standard_index_config(
         reference_period=reference_period,
         only_leap_years=only_leap_years,
         interpolation=interpolation,
+        quantile_method=quantile_method,
     )
     climate_variables, is_compared_to_ref = _build_index_climate_variables(
         in_files=in_files,
@@ -982,6 +1352,7 @@ def _parse_legacy_user_index_config(
     doy_window_width: int,
     only_leap_years: bool,
     interpolation: QuantileInterpolation,
+    quantile_method: QuantileMethod = "exact",
 ) -> ParsedLegacyUserIndexConfig:
     from icclim._core.legacy.user_index import parse  # noqa: PLC0415
 
@@ -993,6 +1364,7 @@ def _parse_legacy_user_index_config(
             reference_period=base_period_time_range,
             only_leap_years=only_leap_years,
             interpolation=interpolation,
+            quantile_method=quantile_method,
         ),
         logical_link=parse.read_logical_link(user_index),
         coef=parse.read_coef(user_index),
@@ -1121,11 +1493,15 @@ def _write_output_file(
             UNITS_KEY: "days since 1850-1-1",
             "dtype": np.float64,  # force float
         }
-    result_ds.to_netcdf(
+    write = result_ds.to_netcdf(
         file_path,
         format=netcdf_version.name,
         encoding={"time": time_encoding},
+        compute=result_ds.__dask_graph__() is None,
     )
+    if write is not None:
+        # The write tasks are optimized along with the result they store.
+        compute_optimized(optimize_graph(write))
 
 
 def _normalize_index_request(
@@ -1161,11 +1537,7 @@ def _normalize_index_request(
     )
 
 
-def _setup(
-    callback: Callable[[int], None],
-    callback_start_value: int,
-    logs_verbosity: Verbosity | str,
-) -> None:
+def _setup(logs_verbosity: Verbosity | str) -> None:
     import xclim  # noqa: PLC0415
 
     # make xclim input daily check a warning instead of an error
@@ -1177,7 +1549,6 @@ def _setup(
     xr.set_options(keep_attrs=True)
     log.set_verbosity(logs_verbosity)
     log.start_message()
-    callback(callback_start_value)
 
 
 def _get_unit(output_unit: str | None, da: DataArray) -> str | None:
@@ -1202,20 +1573,22 @@ def _compute_climate_index(
     reference: str,
     rename: str | None = None,
 ) -> Dataset:
-    result_da = climate_index(config)
-    result_da = _rename_result_dataarray(result_da, climate_index, rename)
-    result_da.attrs[UNITS_KEY] = _get_unit(config.out_unit, result_da)
-    result_ds = _build_result_dataset(result_da, config.frequency, climate_index)
-    if config.save_thresholds:
-        result_ds = _merge_exported_thresholds(result_ds, config.climate_variables)
-    history = _build_history(result_da, config, initial_history, climate_index)
-    return _add_result_metadata(
-        result_ds,
-        climate_index,
-        history,
-        initial_source,
-        reference,
-    )
+    with profile_phase("graph_build"):
+        result_da = climate_index(config)
+    with profile_phase("metadata"):
+        result_da = _rename_result_dataarray(result_da, climate_index, rename)
+        result_da.attrs[UNITS_KEY] = _get_unit(config.out_unit, result_da)
+        result_ds = _build_result_dataset(result_da, config.frequency, climate_index)
+        if config.save_thresholds:
+            result_ds = _merge_exported_thresholds(result_ds, config.climate_variables)
+        history = _build_history(result_da, config, initial_history, climate_index)
+        return _add_result_metadata(
+            result_ds,
+            climate_index,
+            history,
+            initial_source,
+            reference,
+        )
 
 
 def _rename_result_dataarray(
@@ -1332,6 +1705,7 @@ def _build_request_threshold(
     reference_period: Sequence[dt.datetime | str] | None,
     only_leap_years: bool,
     interpolation: QuantileInterpolation,
+    quantile_method: QuantileMethod = "exact",
 ) -> Threshold:
     if isinstance(threshold, Threshold):
         return threshold
@@ -1341,6 +1715,7 @@ def _build_request_threshold(
             "reference_period": reference_period,
             "only_leap_years": only_leap_years,
             "interpolation": interpolation,
+            "quantile_method": quantile_method,
             **threshold,
         }
         return build_threshold(**kwargs)
@@ -1350,6 +1725,7 @@ def _build_request_threshold(
         reference_period=reference_period,
         only_leap_years=only_leap_years,
         interpolation=interpolation,
+        quantile_method=quantile_method,
     )
 
 
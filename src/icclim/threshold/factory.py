@@ -335,6 +335,7 @@ def _shared_bounded_threshold_builder_kwargs(
         "doy_window_width",
         "only_leap_years",
         "interpolation",
+        "quantile_method",
     }
     shared_kwargs = {key: value for key, value in kwargs.items() if key in shared_keys}
     if threshold_min_value is not None:
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import xarray as xr
+
+from icclim.__main__ import main
+from icclim._core import batch
+from icclim._core.batch import BATCH_HASH_ATTR, load_jobs, run_batch
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+from icclim.exception import InvalidIcclimArgumentError
+
+CONFIG = BenchConfig.from_size("tiny")
+
+JOB_FILE = """
+defaults:
+  base_period_time_range: ["{start}", "{end}"]
+jobs:
+  - name: temperature
+    in_files: [tasmax.nc]
+    indices: [SU, TX90p]
+    slice_modes: [year, JJA]
+    bootstrap: false
+    out_file: "out/temperature_{{slice_mode}}.nc"
+  - name: txx
+    in_files: tasmax.nc
+    indices: TXx
+    slice_mode: year
+    bootstrap: false
+    out_file: out/txx.nc
+"""
+
+
+@pytest.fixture
+def job_file(tmp_path):
+    synthetic_dataset(CONFIG, ["tasmax"]).to_netcdf(tmp_path / "tasmax.nc")
+    path = tmp_path / "jobs.yaml"
+    start, end = CONFIG.base_period
+    path.write_text(JOB_FILE.format(start=start, end=end))
+    return path
+
+
+def test_load_jobs(job_file, tmp_path) -> None:
+    jobs = load_jobs(job_file)
+    assert [job.name for job in jobs] == [
+        "temperature[year]",
+        "temperature[JJA]",
+        "txx",
+    ]
+    assert jobs[0].indices == ("SU", "TX90p")
+    assert jobs[1].out_file == str(tmp_path / "out" / "temperature_JJA.nc")
+    assert jobs[1].parameters["slice_mode"] == "JJA"
+    assert jobs[2].in_files == (str(tmp_path / "tasmax.nc"),)
+    # The yearly jobs read the same inputs with the same parameters.
+    assert jobs[0].group_key() == jobs[2].group_key() != jobs[1].group_key()
+    assert jobs[0].parameter_hash() != jobs[2].parameter_hash()
+
+
+def test_load_jobs_errors(tmp_path) -> None:
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps([{"in_files": "a.nc", "indices": "SU"}]))
+    with pytest.raises(InvalidIcclimArgumentError, match="has no out_file"):
+        load_jobs(path)
+    job = {"in_files": "a.nc", "indices": "SU", "slice_modes": ["year", "JJA"]}
+    path.write_text(json.dumps([{**job, "out_file": "su.nc"}]))
+    with pytest.raises(InvalidIcclimArgumentError, match="slice_mode"):
+        load_jobs(path)
+    path.write_text(json.dumps({"jobs": [{**job, "out_file": "su_{slice_mode}.nc"}]}))
+    assert len(load_jobs(path)) == 2
+
+
+def test_run_batch_groups_jobs_and_skips_up_to_date_outputs(job_file) -> None:
+    jobs = load_jobs(job_file)
+    report = run_batch(jobs)
+    assert [job.status for job in report.jobs] == ["computed"] * 3
+    assert report.jobs[0].group == report.jobs[2].group != report.jobs[1].group
+    assert all(job.group_time > 0 for job in report.jobs)
+    with xr.open_dataset(jobs[0].out_file) as ds:
+        assert set(ds.data_vars) == {"SU", "TX90p"}
+        assert "time_bounds" in ds.coords
+        assert ds.attrs[BATCH_HASH_ATTR] == jobs[0].parameter_hash()
+    with xr.open_dataset(jobs[2].out_file) as ds:
+        assert set(ds.data_vars) == {"TXx"}
+    report = run_batch(jobs)
+    assert [job.status for job in report.jobs] == ["up_to_date"] * 3
+    # A newer input makes the outputs out of date.
+    input_path = jobs[0].input_paths()[0]
+    mtime = Path(jobs[0].out_file).stat().st_mtime + 10
+    os.utime(input_path, (mtime, mtime))
+    assert not jobs[0].is_up_to_date()
+    report = run_batch(jobs[2:], force=True)
+    assert report.jobs[0].status == "computed"
+    assert "1 computed" in report.report()
+
+
+def test_run_batch_over_processes(job_file) -> None:
+    report = run_batch(load_jobs(job_file), workers=4)
+    assert report.workers == 2
+    assert [job.status for job in report.jobs] == ["computed"] * 3
+
+
+def test_run_batch_reports_failures(job_file, monkeypatch) -> None:
+    def _fail(**_) -> None:
+        msg = "broken input"
+        raise ValueError(msg)
+
+    monkeypatch.setattr("icclim.indices", _fail)
+    report = run_batch(load_jobs(job_file)[2:])
+    assert report.failed[0].error == "ValueError('broken input')"
+
+
+def test_cli_batch(job_file, tmp_path, monkeypatch) -> None:
+    report_path = tmp_path / "report.json"
+    assert main(["batch", str(job_file), "--report", str(report_path)]) == 0
+    report = json.loads(report_path.read_text())
+    assert [job["status"] for job in report["jobs"]] == ["computed"] * 3
+    monkeypatch.setattr(batch, "run_batch", None)
+    assert main(["batch", str(tmp_path / "missing.yaml")]) == 2
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from icclim.bench.__main__ import main
+from icclim.bench.cases import BenchmarkCase, get_cases
+from icclim.bench.compare import baseline_path, compare_runs
+from icclim.bench.runner import (
+    BenchmarkResult,
+    BenchmarkRun,
+    machine_fingerprint,
+    run_benchmarks,
+)
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+from icclim.ecad.registry import EcadIndexRegistry
+from icclim.exception import InvalidIcclimArgumentError
+from icclim.generic.registry import GenericIndicatorRegistry
+
+TINY = BenchConfig.from_size("tiny")
+
+
+def test_synthetic_dataset_is_deterministic() -> None:
+    first = synthetic_dataset(TINY, ["tas", "pr"])
+    second = synthetic_dataset(TINY, ["pr", "tas"])
+    xr.testing.assert_identical(first, second[["tas", "pr"]])
+    assert first.tas.dtype == np.float32
+    assert first.tas.attrs["units"] == "K"
+    assert (first.pr >= 0).all()
+    assert (first.pr == 0).any()
+
+
+def test_synthetic_dataset_calendar_and_backend() -> None:
+    config = BenchConfig.from_size("tiny", backend="dask", calendar="noleap")
+    dataset = synthetic_dataset(config, ["tasmax"])
+    assert dataset.tasmax.chunks is not None
+    assert dataset.time.dt.calendar == "noleap"
+    assert dataset.sizes["time"] == 365 * TINY.years
+    assert config.label == "tiny-dask-noleap"
+
+
+def test_synthetic_dataset_unknown_variable() -> None:
+    with pytest.raises(InvalidIcclimArgumentError):
+        synthetic_dataset(TINY, ["tas", "foo"])
+    with pytest.raises(InvalidIcclimArgumentError):
+        BenchConfig.from_size("huge")
+
+
+def test_bench_config_periods() -> None:
+    assert TINY.base_period == ["1991-01-01", "1992-12-31"]
+    assert TINY.study_period == ["1993-01-01", "1994-12-31"]
+    scenario = BenchConfig.from_size("scenario")
+    assert scenario.base_period[0] == "1950-01-01"
+    assert scenario.study_period[1] == "2100-12-31"
+
+
+def test_get_cases_cover_every_index_and_path() -> None:
+    names = {case.name for case in get_cases()}
+    for index in EcadIndexRegistry.values():
+        if index.input_variables:
+            assert f"ecad.{index.short_name}" in names
+    for indicator in GenericIndicatorRegistry.values():
+        assert f"generic.{indicator.name}" in names
+    assert len(get_cases(groups=("bootstrap",))) == 8
+    assert [case.name for case in get_cases(groups=("indices",))] == ["indices.all"]
+    assert len(get_cases(groups=("graph",))) == 8
+    assert len(get_cases(groups=("metadata",))) == 6
+    assert {case.name for case in get_cases(groups=("io",))} == {
+        "io.read_netcdf",
+        "io.read_multifile_netcdf",
+        "io.read_zarr",
+        "io.write_netcdf",
+    }
+
+
+def test_get_cases_pattern() -> None:
+    cases = get_cases(pattern="ecad.TX*")
+    assert cases
+    assert all(case.name.startswith("ecad.TX") for case in cases)
+
+
+def test_run_benchmarks_and_round_trip(tmp_path) -> None:
+    cases = [
+        *get_cases(pattern="ecad.SU"),
+        *get_cases(pattern="io.read_netcdf"),
+    ]
+    run = run_benchmarks(TINY, cases, repeat=2)
+    assert [result.name for result in run.results] == ["ecad.SU", "io.read_netcdf"]
+    for result in run.results:
+        assert result.error is None
+        assert len(result.wall_times) == 2
+        assert result.peak_memory > 0
+    path = run.save(tmp_path)
+    assert path.parent.name == run.machine["id"]
+    assert BenchmarkRun.load(path) == run
+
+
+def test_run_benchmarks_records_errors() -> None:
+    def _prepare(_):
+        def _fail() -> None:
+            msg = "boom"
+            raise ValueError(msg)
+
+        return _fail
+
+    failing = BenchmarkCase(
+        name="ecad.failing",
+        group="ecad",
+        variables=("tas",),
+        prepare=_prepare,
+    )
+    run = run_benchmarks(
+        TINY,
+        [failing, *get_cases(pattern="ecad.TG")],
+        repeat=1,
+        measure_memory=False,
+    )
+    assert run.results[0].error == "ValueError: boom"
+    assert run.results[1].error is None
+    assert run.results[1].peak_memory is None
+
+
+def test_case_environment_is_restored(monkeypatch) -> None:
+    monkeypatch.delenv("ICCLIM_BOOTSTRAP_MODE", raising=False)
+    (case,) = get_cases(pattern="bootstrap.TX90p.exact_tiled_bootstrap")
+    with case.environment():
+        assert os.environ["ICCLIM_BOOTSTRAP_MODE"] == "safe"
+    assert "ICCLIM_BOOTSTRAP_MODE" not in os.environ
+
+
+def test_cli_list(capsys) -> None:
+    assert main(["list", "-k", "io.*"]) == 0
+    assert capsys.readouterr().out.split() == [
+        "io.read_netcdf",
+        "io.read_multifile_netcdf",
+        "io.read_zarr",
+        "io.write_netcdf",
+    ]
+
+
+def _run_of(*results: BenchmarkResult, label: str = "tiny-numpy-standard"):
+    return BenchmarkRun(
+        config={"label": label},
+        machine={"id": "machine"},
+        commit="abc",
+        timestamp="2024-01-01T00:00:00+00:00",
+        results=list(results),
+    )
+
+
+def test_compare_runs_detects_regressions() -> None:
+    baseline = _run_of(
+        BenchmarkResult("a", "ecad", wall_times=[1.0], peak_memory=100 * 2**20),
+        BenchmarkResult("b", "ecad", wall_times=[1.0], peak_memory=100 * 2**20),
+        BenchmarkResult("c", "ecad", wall_times=[1.0], peak_memory=100 * 2**20),
+        BenchmarkResult("d", "ecad", wall_times=[1.0], peak_memory=100 * 2**20),
+    )
+    current = _run_of(
+        BenchmarkResult("a", "ecad", wall_times=[1.1], peak_memory=110 * 2**20),
+        BenchmarkResult("b", "ecad", wall_times=[1.5], peak_memory=100 * 2**20),
+        BenchmarkResult("c", "ecad", wall_times=[0.5], peak_memory=200 * 2**20),
+        BenchmarkResult("d", "ecad", error="ValueError: boom"),
+        BenchmarkResult("e", "ecad", wall_times=[1.0]),
+    )
+    comparison = compare_runs(baseline, current, time_tolerance=0.2)
+    statuses = {case.name: case.status for case in comparison.cases}
+    assert statuses == {
+        "a": "ok",
+        "b": "regressed",
+        "c": "regressed",
+        "d": "error",
+        "e": "new",
+    }
+    assert not comparison.passed
+    report = comparison.report()
+    assert "FAILED: 3 of 5 cases." in report
+    assert "b: wall time 1.0000 s -> 1.5000 s (+50.0%, tolerance +20%)" in report
+    assert "c: peak memory 100.0 MiB -> 200.0 MiB (+100.0%, tolerance +25%)" in report
+
+
+def test_compare_runs_ignores_noise_of_short_cases() -> None:
+    baseline = _run_of(BenchmarkResult("a", "ecad", wall_times=[0.001]))
+    current = _run_of(BenchmarkResult("a", "ecad", wall_times=[0.005]))
+    comparison = compare_runs(baseline, current)
+    assert comparison.passed
+    assert "OK: 1 cases within tolerances." in comparison.report()
+
+
+def test_compare_runs_rejects_other_configuration() -> None:
+    with pytest.raises(InvalidIcclimArgumentError):
+        compare_runs(_run_of(), _run_of(label="small-numpy-standard"))
+
+
+def test_cli_compare(tmp_path, capsys) -> None:
+    args = ["compare", "-k", "ecad.SU", "--size", "tiny", "--repeat", "1"]
+    args += ["--results-dir", str(tmp_path), "--no-memory"]
+    assert main(args) == 2
+    assert "No baseline found" in capsys.readouterr().err
+    assert main([*args, "--update-baseline"]) == 0
+    path = baseline_path(tmp_path, machine_fingerprint()["id"], TINY.label)
+    assert [result.name for result in BenchmarkRun.load(path).results] == ["ecad.SU"]
+    assert main([*args, "--time-tolerance", "1000"]) == 0
+    assert "OK: 1 cases within tolerances." in capsys.readouterr().out
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core.generic import functions as generic_functions
+from icclim._core.generic.bootstrap_executor import (
+    FileBackedTileSource,
+    bootstrap_tile_source,
+    get_bootstrap_tile_executor,
+    map_bootstrap_blocks,
+)
+from tests.testing_utils import K2C, stub_tas
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def client():
+    distributed = pytest.importorskip("distributed")
+    with (
+        distributed.LocalCluster(
+            n_workers=2,
+            threads_per_worker=1,
+            processes=False,
+            dashboard_address=None,
+        ) as cluster,
+        distributed.Client(cluster) as active_client,
+    ):
+        yield active_client
+
+
+def _tas_file(tmp_path: Path) -> Path:
+    tas = stub_tas(tas_value=27 + K2C, lat_length=2, lon_length=2)
+    tas[5:10] = 0
+    path = tmp_path / "tas.nc"
+    tas.to_dataset(name="tas").to_netcdf(path)
+    return path
+
+
+def test_no_executor_without_client() -> None:
+    assert get_bootstrap_tile_executor() is None
+
+
+def test_executor_can_be_disabled(client, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_bootstrap_tile_executor() is not None
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_TILE_EXECUTOR", "local")
+    assert get_bootstrap_tile_executor() is None
+
+
+def test_file_backed_tile_source_reopens_its_own_slice(tmp_path: Path) -> None:
+    with xr.open_dataset(_tas_file(tmp_path), chunks={"time": 365}) as ds:
+        tile = ds.tas.isel(lat=slice(1, 2), lon=slice(0, 1))
+        source = bootstrap_tile_source(tile)
+        assert isinstance(source, FileBackedTileSource)
+        xr.testing.assert_identical(source.open().load(), tile.load())
+
+
+def test_in_memory_tile_is_sent_as_is() -> None:
+    tile = stub_tas(lat_length=1, lon_length=1)
+    assert bootstrap_tile_source(tile) is tile
+
+
+def test_tx90p_distributed_tiles_match_local_tiles(
+    client,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_FAST_TILE_CELLS", "1")
+    kwargs = {
+        "index_name": "tx90p",
+        "in_files": str(_tas_file(tmp_path)),
+        "var_name": "tas",
+        "doy_window_width": 1,
+        "time_range": ("2042-01-01", "2045-12-31"),
+        "base_period_time_range": ("2042-01-01", "2043-12-31"),
+        "out_file": str(tmp_path / "out.nc"),
+        "slice_mode": "year",
+    }
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_TILE_EXECUTOR", "local")
+    local = icclim.index(**kwargs).compute()
+    monkeypatch.delenv("ICCLIM_BOOTSTRAP_TILE_EXECUTOR")
+    generic_functions.reset_bootstrap_profile()
+
+    distributed_result = icclim.index(**kwargs).compute()
+    profile = generic_functions.get_bootstrap_profile()
+
+    assert profile["bootstrap_tile_executor"] == "distributed"
+    assert profile["bootstrap_optimized_tile_count"] == 4
+    xr.testing.assert_allclose(distributed_result.TX90p, local.TX90p)
+
+
+def test_tx90p_lazy_tiles_keep_the_result_lazy(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_FAST_TILE_CELLS", "1")
+    tas = stub_tas(tas_value=27 + K2C, lat_length=2, lon_length=2)
+    tas[5:10] = 0
+    kwargs = {
+        "index_name": "tx90p",
+        "in_files": tas.chunk({"time": 365, "lat": 1, "lon": 1}),
+        "doy_window_width": 1,
+        "time_range": ("2042-01-01", "2045-12-31"),
+        "base_period_time_range": ("2042-01-01", "2043-12-31"),
+        "slice_mode": "year",
+    }
+    local = icclim.index(**kwargs).compute()
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_TILE_EXECUTOR", "lazy")
+    generic_functions.reset_bootstrap_profile()
+
+    lazy = icclim.index(**kwargs)
+    profile = generic_functions.get_bootstrap_profile()
+
+    assert hasattr(lazy.TX90p.data, "__dask_graph__")
+    assert profile["bootstrap_tile_executor"] == "lazy"
+    assert profile["bootstrap_optimized_tile_count"] == 4
+    xr.testing.assert_allclose(lazy.TX90p.compute(), local.TX90p)
+
+
+def test_lazy_block_without_result_raises() -> None:
+    study = stub_tas(lat_length=2, lon_length=1).chunk({"lat": 1})
+
+    def _first_cell_only(tile, _threshold):
+        return tile.resample(time="YS").sum() if tile.lat[0] == study.lat[0] else None
+
+    result = map_bootstrap_blocks(
+        study,
+        None,
+        {"lat": 1, "lon": 1},
+        lambda threshold, _: threshold,
+        _first_cell_only,
+    )
+    assert np.isfinite(result.isel(lat=0).values).all()
+    with pytest.raises(RuntimeError, match="not supported by the lazy tile executor"):
+        result.compute()
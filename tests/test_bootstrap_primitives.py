@@ -31,6 +31,7 @@ from icclim._core.generic.bootstrap_primitives import (
     _block_slices,
     _materialize_bootstrap_study,
     _preferred_spatial_block_sizes,
+    bootstrap_time_blocks,
     build_bootstrap_array_inputs,
     build_bootstrap_output,
     build_bootstrap_prepared_inputs,
@@ -160,6 +161,55 @@ def test_block_slices_covers_full_axis() -> None:
     assert block_slices == [slice(0, 2), slice(2, 4), slice(4, 5)]
 
 
+def test_bootstrap_time_blocks_splits_in_base_and_out_of_base_years() -> None:
+    tas = stub_tas()
+    year_starts = [
+        int(np.argmax(tas.time.dt.year.values == year))
+        for year in (2042, 2043, 2044, 2045, 2046)
+    ]
+
+    blocks = bootstrap_time_blocks(tas, ("2043-01-01", "2044-12-31"), "YS")
+
+    assert [(block.time_slice, block.in_base) for block in blocks] == [
+        (slice(0, year_starts[1]), False),
+        (slice(year_starts[1], year_starts[3]), True),
+        (slice(year_starts[3], tas.sizes["time"]), False),
+    ]
+    assert bootstrap_time_blocks(tas, ("2042-01-01", "2046-12-31"), "YS") is None
+    assert bootstrap_time_blocks(tas, ("2043-01-01", "2044-12-31"), "YS-JUL") is None
+
+
+@pytest.mark.parametrize(
+    ("wrapper", "extra_args"),
+    [
+        (compute_doy_percentile_bootstrap_count, ()),
+        (compute_doy_percentile_bootstrap_exceedance_sum, ()),
+        (compute_doy_percentile_bootstrap_union_exceedance_mask, ()),
+        (compute_doy_percentile_scalar_bounded_bootstrap_count, (288.0, 0, 0)),
+    ],
+)
+@pytest.mark.parametrize("freq", ["YS", "MS"])
+def test_time_blocked_bootstrap_matches_whole_study(
+    wrapper,
+    extra_args,
+    freq,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tas = stub_tas(lat_length=2, lon_length=2)
+    tas[:] = np.random.default_rng(0).normal(290.0, 5.0, tas.shape)
+    threshold = build_threshold(
+        "> 90 doy_per",
+        reference_period=("2043-01-01", "2044-12-31"),
+    )
+
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_TIME_BLOCKS", "0")
+    whole_study = wrapper(tas, threshold, freq, *extra_args)
+    monkeypatch.delenv("ICCLIM_BOOTSTRAP_TIME_BLOCKS")
+    time_blocked = wrapper(tas, threshold, freq, *extra_args)
+
+    xr.testing.assert_identical(time_blocked, whole_study)
+
+
 def test_preferred_spatial_block_sizes_uses_backend_hints() -> None:
     tas = stub_tas(lat_length=3, lon_length=5)
     tas.encoding["preferred_chunks"] = {"lat": 10, "lon": 2}
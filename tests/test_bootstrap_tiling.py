@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from icclim._core.generic.bootstrap_tiling import (
+    BootstrapTileController,
+    _traced_peak_bytes,
+    get_learned_bytes_per_cell,
+    memory_model_key,
+    record_learned_bytes_per_cell,
+    reset_bootstrap_memory_model,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _clean_memory_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("ICCLIM_BOOTSTRAP_MEMORY_MODEL", raising=False)
+    monkeypatch.delenv("ICCLIM_BOOTSTRAP_ADAPTIVE_TILES", raising=False)
+    reset_bootstrap_memory_model()
+    yield
+    reset_bootstrap_memory_model()
+
+
+def _grid(lat: int, lon: int, time: int = 10) -> xr.DataArray:
+    return xr.DataArray(
+        np.zeros((time, lat, lon), dtype=np.float32),
+        dims=("time", "lat", "lon"),
+    )
+
+
+def _covered_cells(tiles: list[dict[str, slice]]) -> set[tuple[int, int]]:
+    return {
+        (lat, lon)
+        for tile in tiles
+        for lat in range(tile["lat"].start, tile["lat"].stop)
+        for lon in range(tile["lon"].start, tile["lon"].stop)
+    }
+
+
+def test_fixed_controller_covers_grid_once() -> None:
+    da = _grid(5, 3)
+    controller = BootstrapTileController(da, 4)
+    tiles = list(controller)
+    cells = _covered_cells(tiles)
+    assert len(cells) == 15
+    assert sum(
+        (t["lat"].stop - t["lat"].start) * (t["lon"].stop - t["lon"].start)
+        for t in tiles
+    ) == len(cells)
+    assert controller.tile_count == len(tiles)
+    assert controller.max_cells == 4
+
+
+def test_adaptive_controller_grows_bands_after_first_tile() -> None:
+    da = _grid(16, 4)
+    key = memory_model_key("optimized", da)
+    controller = BootstrapTileController(
+        da,
+        4,
+        memory_budget=8 * 1000,
+        model_key=key,
+    )
+    tiles = []
+    for tile in controller:
+        tiles.append(tile)
+        if controller.measured_peak_bytes is None:
+            controller._refit(tile, peak_bytes=4 * 1000)
+    assert controller.learned_bytes_per_cell == 1000
+    assert controller.max_cells == 8
+    # A single measured tile is not recorded in the memory model.
+    assert get_learned_bytes_per_cell(key) is None
+    # The first band keeps the initial height, later bands fill the budget.
+    assert [tile["lat"] for tile in tiles[::2]] == [
+        slice(0, 2),
+        slice(2, 6),
+        slice(6, 10),
+        slice(10, 14),
+        slice(14, 16),
+    ]
+    assert len(_covered_cells(tiles)) == 64
+
+
+def test_refit_growth_is_clamped() -> None:
+    da = _grid(64, 4)
+    controller = BootstrapTileController(da, 4, memory_budget=1024**3)
+    controller._refit({"lat": slice(0, 2), "lon": slice(0, 2)}, peak_bytes=4)
+    assert controller.max_cells == 16
+
+
+@pytest.mark.parametrize(
+    ("bytes_per_cell", "recorded"),
+    [((1000, 1100, 1050), 1100), ((1000, 1000, 10_000), None)],
+)
+def test_memory_model_records_agreeing_tiles(bytes_per_cell, recorded) -> None:
+    da = _grid(16, 4)
+    key = memory_model_key("optimized", da)
+    controller = BootstrapTileController(
+        da,
+        4,
+        memory_budget=8 * 1000,
+        model_key=key,
+    )
+    tiles = iter(controller)
+    for cell_bytes in bytes_per_cell:
+        tile = next(tiles)
+        cells = len(_covered_cells([tile]))
+        controller._refit(tile, peak_bytes=cell_bytes * cells)
+    assert get_learned_bytes_per_cell(key) == recorded
+    assert controller.learned_bytes_per_cell == max(bytes_per_cell)
+
+
+def test_measure_records_traced_peak() -> None:
+    da = _grid(2, 2)
+    controller = BootstrapTileController(
+        da,
+        4,
+        memory_budget=1024**3,
+        model_key=memory_model_key("safe", da),
+    )
+    for tile in controller:
+        with controller.measure(tile):
+            np.ones(1_000_000, dtype=np.float64).sum()
+    assert controller.measured_peak_bytes >= 8_000_000
+    assert controller.learned_bytes_per_cell >= 2_000_000
+
+
+def test_traced_peak_preserves_an_outer_tracer() -> None:
+    tracemalloc.start()
+    try:
+        np.ones(4_000_000, dtype=np.float64).sum()
+        outer_peak = tracemalloc.get_traced_memory()[1]
+        with _traced_peak_bytes() as small:
+            np.ones(1_000, dtype=np.float64).sum()
+        assert tracemalloc.get_traced_memory()[1] == outer_peak
+        # The small block stays below the outer peak, it cannot be measured.
+        assert small[0] is None
+        with _traced_peak_bytes() as large:
+            np.ones(8_000_000, dtype=np.float64).sum()
+        assert tracemalloc.get_traced_memory()[1] >= 64_000_000
+        assert large[0] >= 64_000_000
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_model_is_persisted(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    model_file = tmp_path / "memory_model.json"
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_MEMORY_MODEL", str(model_file))
+    key = memory_model_key("safe", _grid(2, 2, time=365))
+    record_learned_bytes_per_cell(key, 4321)
+    assert json.loads(model_file.read_text()) == [
+        {"kind": "safe", "time": 365, "dtype": "float32", "bytes_per_cell": 4321}
+    ]
+    reset_bootstrap_memory_model()
+    assert get_learned_bytes_per_cell(key) == 4321
+
+
+def test_memory_model_ignored_when_adaptive_tiles_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    key = memory_model_key("optimized", _grid(2, 2))
+    record_learned_bytes_per_cell(key, 10)
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_ADAPTIVE_TILES", "0")
+    assert get_learned_bytes_per_cell(key) is None
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import icclim
+from icclim._core.spi import clear_spi_cache
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+from icclim.exception import InvalidIcclimArgumentError
+
+CONFIG = BenchConfig.from_size("tiny", backend="dask")
+
+
+def _explain(index_name: str, variables: list[str], **kwargs) -> icclim.ExecutionPlan:
+    return icclim.explain(
+        in_files=synthetic_dataset(CONFIG, variables),
+        index_name=index_name,
+        base_period_time_range=CONFIG.base_period,
+        logs_verbosity="SILENT",
+        **kwargs,
+    )
+
+
+def test_explain_optimized_bootstrap_tiles(monkeypatch) -> None:
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_FAST_TILE_CELLS", "4")
+    plan = _explain("TX90p", ["tasmax"])
+    assert plan.execution_paths["bootstrap"] == "optimized_bootstrap"
+    (leaf,) = plan.leaves
+    assert leaf.variable == "tasmax"
+    assert leaf.bootstrap_required
+    assert leaf.reason_code == "optimized_bootstrap_supported"
+    tile = plan.tiles["tasmax"]
+    assert tile.kind == "optimized"
+    assert tile.max_tile_cells == 4
+    assert tile.tile_cells <= 4
+    assert tile.tile_count * tile.tile_cells == 12
+    assert tile.memory_model == "override"
+    assert plan.estimated_peak_memory >= tile.tile_peak_bytes
+    # Building the tiled bootstrap graph computes, so it is not counted.
+    assert plan.graph_tasks is None
+    assert plan.input_tasks > 0
+    json.dumps(plan.to_dict())
+    assert f"{tile.tile_count} optimized tiles" in plan.report()
+
+
+def test_explain_safe_and_reference_bootstrap(monkeypatch) -> None:
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_MODE", "safe")
+    plan = _explain("TX90p", ["tasmax"])
+    assert plan.leaves[0].execution_kind == "exact_tiled_bootstrap"
+    assert plan.tiles["tasmax"].kind == "safe"
+    monkeypatch.delenv("ICCLIM_BOOTSTRAP_MODE")
+    plan = _explain("TX90p", ["tasmax"], date_event=True)
+    assert plan.leaves[0].execution_kind == "reference_bootstrap"
+    assert plan.bootstrap_reason_code == "date_event_uses_reference_bootstrap_path"
+    assert not plan.tiles
+    assert plan.estimated_peak_memory > plan.bytes_to_read
+
+
+def test_explain_without_bootstrap_counts_graph_tasks() -> None:
+    plan = _explain("SU", ["tasmax"])
+    assert plan.execution_paths["bootstrap"] == "not_required"
+    assert plan.leaves[0].reason_code == "threshold_is_not_percentile"
+    assert plan.bytes_to_read == synthetic_dataset(CONFIG, ["tasmax"]).tasmax.nbytes
+    assert plan.graph_tasks > plan.input_tasks
+    assert "resample_groups" in plan.cache_hits
+
+
+def test_explain_reports_each_threshold_leaf() -> None:
+    plan = _explain("CD", ["tas", "pr"])
+    assert [(leaf.variable, leaf.bootstrap_required) for leaf in plan.leaves] == [
+        ("tas", True),
+        ("pr", False),
+    ]
+    assert plan.leaves[1].reason_code == "threshold_is_not_day_of_year_percentile"
+
+
+def test_explain_reports_cache_hits() -> None:
+    clear_spi_cache()
+    dataset = synthetic_dataset(CONFIG, ["pr"])
+    kwargs = {
+        "in_files": dataset,
+        "index_name": "SPI3",
+        "base_period_time_range": CONFIG.base_period,
+        "logs_verbosity": "SILENT",
+    }
+    assert not icclim.explain(**kwargs).cache_hits["spi_monthly"]
+    icclim.index(**kwargs)
+    assert icclim.explain(**kwargs).cache_hits["spi_monthly"]
+
+
+def test_explain_rejects_unknown_arguments() -> None:
+    with pytest.raises(InvalidIcclimArgumentError):
+        icclim.explain(index_name="SU", foo=1)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core.generic.fused_reducer import (
+    FusedReductionStage,
+    FusedStatistic,
+    fused_reductions,
+    fused_statistic,
+)
+from icclim._core.resampling import get_resample_groups, resample_reduce
+from tests.testing_utils import K2C, stub_tas
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _tasmax_file(tmp_path: Path) -> Path:
+    rng = np.random.default_rng(3)
+    tas = stub_tas(tas_value=20 + K2C, lat_length=2, lon_length=3)
+    tas[:] = 20 + K2C + rng.normal(0, 8, tas.shape)
+    path = tmp_path / "tasmax.nc"
+    tas.rename("tasmax").to_dataset().to_netcdf(path)
+    return path
+
+
+def test_stage_computes_every_statistic_in_one_pass() -> None:
+    rng = np.random.default_rng(0)
+    da = stub_tas(tas_value=300, lat_length=2, lon_length=2)
+    da = (da + rng.normal(0, 5, da.shape)).chunk({"time": 365})
+    groups = get_resample_groups(da.indexes["time"], "YS")
+    expected = {
+        FusedStatistic("mean"): resample_reduce(da, "YS", "mean"),
+        FusedStatistic("count", ">", 300.0): resample_reduce(da > 300, "YS", "sum"),
+        FusedStatistic("max", ">", 300.0): resample_reduce(
+            da.where(da > 300), "YS", "max"
+        ),
+    }
+    calls = []
+    with fused_reductions():
+        results = {
+            statistic: fused_statistic(reference, da, groups, "YS", statistic)
+            for statistic, reference in expected.items()
+        }
+        original_call = FusedReductionStage.__call__
+
+        def _spy(
+            stage: FusedReductionStage,
+            block: np.ndarray,
+            block_info: dict,
+        ) -> dict:
+            calls.append(len(stage.statistics))
+            return original_call(stage, block, block_info)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(FusedReductionStage, "__call__", _spy)
+            computed = xr.merge(
+                [result.rename(str(i)) for i, result in enumerate(results.values())]
+            ).compute()
+    block_count = len(next(iter(results.values())).data.chunks[0])
+    assert calls == [3] * block_count
+    for i, reference in enumerate(expected.values()):
+        xr.testing.assert_allclose(computed[str(i)], reference.compute().rename(None))
+
+
+def test_statistics_after_freeze_start_a_new_stage() -> None:
+    da = stub_tas(lat_length=2, lon_length=2).chunk({"time": 365})
+    groups = get_resample_groups(da.indexes["time"], "YS")
+    mean = FusedStatistic("mean")
+    maximum = FusedStatistic("max")
+    with fused_reductions() as reducer:
+        first = fused_statistic(
+            resample_reduce(da, "YS", "mean"), da, groups, "YS", mean
+        )
+        (stage,) = reducer.stages.values()
+        pickle.dumps(stage)
+        assert stage.frozen
+        second = fused_statistic(
+            resample_reduce(da, "YS", "max"), da, groups, "YS", maximum
+        )
+        (new_stage,) = reducer.stages.values()
+    assert new_stage is not stage
+    assert list(stage.statistics) == [mean]
+    assert list(new_stage.statistics) == [maximum]
+    assert new_stage.frozen
+    xr.testing.assert_allclose(first, resample_reduce(da, "YS", "mean"))
+    xr.testing.assert_allclose(second, resample_reduce(da, "YS", "max"))
+
+
+def test_fused_statistic_is_noop_outside_scope() -> None:
+    da = stub_tas().chunk()
+    result = resample_reduce(da, "YS", "max")
+    groups = get_resample_groups(da.indexes["time"], "YS")
+    assert fused_statistic(result, da, groups, "YS", FusedStatistic("max")) is result
+
+
+def test_indices_scan_shared_input_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    in_file = str(_tasmax_file(tmp_path))
+    names = ["TX", "TXx", "TXn", "SU"]
+    stage_calls = []
+    original_call = FusedReductionStage.__call__
+
+    def _spy(
+        stage: FusedReductionStage,
+        block: np.ndarray,
+        block_info: dict,
+    ) -> dict:
+        stage_calls.append(sorted(s.how for s in stage.statistics))
+        return original_call(stage, block, block_info)
+
+    monkeypatch.setattr(FusedReductionStage, "__call__", _spy)
+    fused = icclim.indices(index_group=names, in_files=in_file).compute()
+
+    assert stage_calls == [["count", "max", "mean", "min"]]
+    for name in names:
+        expected = icclim.index(index_name=name, in_files=in_file)[name].compute()
+        xr.testing.assert_allclose(fused[name], expected)
+        assert fused[name].attrs == expected.attrs
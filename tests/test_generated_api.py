@@ -40,6 +40,9 @@ DEFAULT_ARGS = {
     "date_event": False,
     "run_index": "first",
     "allow_partial_seasons": False,
+    "profile": False,
+    "progress_callback": None,
+    "memory_budget": None,
 }
 
 
@@ -64,6 +67,7 @@ def build_expected_args(  # noqa: C901
                 "only_leap_years": False,
                 "interpolation": QuantileInterpolationRegistry.MEDIAN_UNBIASED.name,
                 "save_thresholds": False,
+                "quantile_method": "exact",
             },
         )
     elif REFERENCE_PERIOD_INDEX in qualifiers:
@@ -147,6 +151,7 @@ def test_custom_index(index_fun_mock: MagicMock) -> None:
         "min_spell_length": 6,
         "rolling_window_width": 5,
         "interpolation": "median_unbiased",
+        "quantile_method": "exact",
         "user_index": {
             "index_name": "pouet",
             "calc_operation": "nb_events",
@@ -156,6 +161,9 @@ def test_custom_index(index_fun_mock: MagicMock) -> None:
         },
         "run_index": "first",
         "allow_partial_seasons": False,
+        "profile": False,
+        "progress_callback": None,
+        "memory_budget": None,
     }
     call_args = _filter_supported_kwargs(icclim.custom_index, user_index_args)
     icclim.custom_index(**call_args)
@@ -206,6 +214,7 @@ def test_txx__months_slice_mode() -> None:
         (CalcOperationRegistry.SUM, 303.15, 280.15),
         # values below 275 are filtered out
         (CalcOperationRegistry.MEAN, 303.15, 280.15),
+        (CalcOperationRegistry.STD, 0, 0),
         (CalcOperationRegistry.EVENT_COUNT, 1, 1),
         (CalcOperationRegistry.MAX_NUMBER_OF_CONSECUTIVE_EVENTS, 1, 1),
     ],
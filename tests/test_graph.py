@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import dask.array as da
+import xarray as xr
+
+import icclim
+from icclim._core.graph import compute_optimized, count_graph_tasks, optimize_graph
+from icclim._core.profiling import Profile
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+
+CONFIG = BenchConfig.from_size("tiny", backend="dask")
+
+
+def _su(**kwargs) -> xr.Dataset:
+    return icclim.index(
+        in_files=synthetic_dataset(CONFIG, ["tasmax"]),
+        index_name="SU",
+        logs_verbosity="SILENT",
+        **kwargs,
+    )
+
+
+def _count_optimizations(monkeypatch) -> list[None]:
+    calls = []
+    optimize = da.Array.__dask_optimize__
+
+    def _spy(*args, **kwargs):
+        calls.append(None)
+        return optimize(*args, **kwargs)
+
+    monkeypatch.setattr(da.Array, "__dask_optimize__", staticmethod(_spy))
+    return calls
+
+
+def test_optimize_graph_reduces_tasks() -> None:
+    result = _su()
+    profile = Profile()
+    with profile.activate():
+        optimized = optimize_graph(result)
+    before = profile.counters["graph_tasks_before"]
+    after = profile.counters["graph_tasks_after"]
+    assert before == count_graph_tasks(result)
+    assert after == count_graph_tasks(optimized)
+    assert after < before
+    (phase,) = profile.phases
+    assert phase.name == "optimize_graph"
+    assert phase.details["graph_tasks_after"] == after
+    xr.testing.assert_identical(compute_optimized(optimized), result.compute())
+
+
+def test_optimize_graph_skips_eager_results(monkeypatch) -> None:
+    result = _su().compute()
+    assert optimize_graph(result) is result
+    lazy = _su()
+    monkeypatch.setenv("ICCLIM_GRAPH_OPTIMIZATION", "off")
+    assert optimize_graph(lazy) is lazy
+
+
+def test_optimized_graphs_are_not_optimized_again(tmp_path, monkeypatch) -> None:
+    calls = _count_optimizations(monkeypatch)
+    _su(out_file=str(tmp_path / "su.nc"))
+    assert len(calls) == 1
+    calls.clear()
+    _su(profile=True)
+    assert len(calls) == 1
+
+
+def test_written_results_are_optimized(tmp_path, monkeypatch) -> None:
+    profile = Profile()
+    with profile.activate():
+        _su(out_file=str(tmp_path / "on.nc"))
+    assert profile.counters["graph_tasks_after"] > 0
+    assert (
+        profile.counters["graph_tasks_after"] < profile.counters["graph_tasks_before"]
+    )
+    monkeypatch.setenv("ICCLIM_GRAPH_OPTIMIZATION", "off")
+    profile = Profile()
+    _su(out_file=str(tmp_path / "off.nc"), profile=profile)
+    assert "graph_tasks_before" not in profile.counters
+    with (
+        xr.open_dataset(tmp_path / "on.nc") as on,
+        xr.open_dataset(tmp_path / "off.nc") as off,
+    ):
+        # The history attribute holds the time of each run.
+        xr.testing.assert_identical(
+            on.drop_attrs(deep=False), off.drop_attrs(deep=False)
+        )
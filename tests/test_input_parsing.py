@@ -10,8 +10,10 @@ import pytest
 import xarray as xr
 
 from icclim._core.constants import UNITS_KEY
+from icclim._core.generic.fused_reducer import fused_reductions
 from icclim._core.input_parsing import (
     PercentileDataArray,
+    _reduce_only_leap_years,
     guess_var_names,
     read_dataset,
     update_to_standard_coords,
@@ -43,6 +45,39 @@ def test_update_to_standard_coords() -> None:
     assert "time" in res.coords
 
 
+def test_reduce_only_leap_years() -> None:
+    da = xr.DataArray(
+        np.arange(4 * 365 + 1, dtype=float),
+        coords={"time": pd.date_range("2042-01-01", periods=4 * 365 + 1, freq="D")},
+        dims=["time"],
+    )
+    res = _reduce_only_leap_years(da)
+    assert np.all(res.time.dt.year == 2044)
+    assert len(res.time) == 366
+
+
+def test_reduce_only_leap_years__dask_stays_lazy() -> None:
+    da = xr.DataArray(
+        np.ones(8 * 365 + 2),
+        coords={"time": pd.date_range("2040-01-01", periods=8 * 365 + 2, freq="D")},
+        dims=["time"],
+    ).chunk({"time": 365})
+    res = _reduce_only_leap_years(da)
+    assert hasattr(res.data, "dask")
+    # One indexing layer is added, whatever the number of years.
+    assert len(res.data.dask.layers) == len(da.data.dask.layers) + 1
+    assert set(np.unique(res.time.dt.year)) == {2040, 2044}
+
+
+def test_reduce_only_leap_years__no_leap_calendar_error() -> None:
+    time = xr.date_range(
+        "2042-01-01", periods=4 * 365, freq="D", calendar="noleap", use_cftime=True
+    )
+    da = xr.DataArray(np.ones(len(time)), coords={"time": time}, dims=["time"])
+    with pytest.raises(InvalidIcclimArgumentError):
+        _reduce_only_leap_years(da)
+
+
 class TestReadDataset:
     OUTPUT_NC_FILE = Path("tmp.nc")
     OUTPUT_NC_FILE_2 = Path("tmp-2.nc")
@@ -116,6 +151,18 @@ class TestReadDataset:
         # THEN
         xr.testing.assert_equal(ds_res.pouet, ds.pouet)
 
+    def test_read_dataset__netcdf_chunked_only_when_fused(self) -> None:
+        # GIVEN
+        xr.Dataset({"pouet": self.pr_da}).to_netcdf(self.OUTPUT_NC_FILE)
+        # WHEN
+        lazy = read_dataset(str(self.OUTPUT_NC_FILE))
+        with fused_reductions():
+            first = read_dataset(str(self.OUTPUT_NC_FILE))
+            second = read_dataset(str(self.OUTPUT_NC_FILE))
+        # THEN
+        assert lazy.pouet.chunks is None
+        assert first.pouet.data.name == second.pouet.data.name
+
     def test_read_dataset__multi_netcdf_success(self) -> None:
         # GIVEN
         ds = xr.Dataset({"pouet": self.pr_da})
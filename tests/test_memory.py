@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+
+import dask
+import numpy as np
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core.input_parsing import _chunk_within_memory_budget
+from icclim._core.memory import (
+    MemoryBudget,
+    active_memory_budget,
+    exceeds_memory_budget,
+    memory_stage,
+    parse_byte_size,
+    resolve_memory_budget,
+)
+from icclim._core.profiling import Profile, profile_phase
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+from icclim.main import _merge_index_results
+
+CONFIG = BenchConfig.from_size("tiny", backend="dask")
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [("512", 512), ("2KB", 2000), ("1.5 MiB", 1572864), ("2GB", 2 * 1000**3)],
+)
+def test_parse_byte_size(size, expected) -> None:
+    assert parse_byte_size(size) == expected
+
+
+def test_resolve_memory_budget(monkeypatch) -> None:
+    monkeypatch.delenv("ICCLIM_MEMORY_BUDGET", raising=False)
+    assert resolve_memory_budget(None) is None
+    assert resolve_memory_budget(1024).limit == 1024
+    monkeypatch.setenv("ICCLIM_MEMORY_BUDGET", "1MiB")
+    assert resolve_memory_budget(None).limit == 2**20
+    assert resolve_memory_budget("2KB").limit == 2000
+
+
+def test_stages_record_high_water_marks() -> None:
+    budget = MemoryBudget(2**20)
+    with budget.activate():
+        assert active_memory_budget() is budget
+        with memory_stage("outer"):
+            with profile_phase("inner") as details:
+                assert details is None
+                block = np.ones(2**23, dtype=np.uint8)
+            del block
+        assert exceeds_memory_budget("outer", 2**21, "compacted")
+        assert not exceeds_memory_budget("inner", 2**10, "compacted")
+    assert active_memory_budget() is None
+    assert not exceeds_memory_budget("outer", 2**40, "compacted")
+    outer = budget.stages["outer"]
+    inner = budget.stages["inner"]
+    assert outer["high_water"] >= inner["high_water"] > 0
+    assert inner["growth"] >= 2**22
+    assert outer["variant"] == "compacted"
+    assert outer["working_set"] == 2**21
+    assert inner["variant"] == "default"
+    json.loads(budget.to_json())
+
+
+def test_profile_phases_are_stages() -> None:
+    profile = Profile()
+    budget = MemoryBudget(2**30)
+    with profile.activate(), budget.activate(), profile_phase("write") as details:
+        details["bytes"] = 1
+    assert profile.phases[0].details == {"bytes": 1}
+    assert "write" in budget.stages
+
+
+def test_streaming_chunks_fit_the_budget() -> None:
+    study = xr.DataArray(np.zeros((1000, 100, 100)), dims=("time", "lat", "lon"))
+    assert _chunk_within_memory_budget(study).data.npartitions == 1
+    budget = MemoryBudget(12 * 10**6)
+    with dask.config.set(num_workers=2), budget.activate():
+        streamed = _chunk_within_memory_budget(study)
+    assert budget.stages["build_studied_data"]["variant"] == "streaming"
+    chunk_bytes = np.prod([max(sizes) for sizes in streamed.chunks]) * 8
+    # Two workers, three working copies of their chunk each.
+    assert chunk_bytes * 2 * 3 <= budget.limit
+
+
+@pytest.mark.parametrize(("workers", "chunk_bytes"), [(2, 4 * 10**6), (4, 2 * 10**6)])
+def test_streaming_chunk_size_is_the_budget_share_of_a_worker(
+    workers: int,
+    chunk_bytes: int,
+) -> None:
+    study = xr.DataArray(np.zeros((1000, 100, 100)), dims=("time", "lat", "lon"))
+    captured = []
+
+    def _chunk(data: xr.DataArray, chunks: str) -> xr.DataArray:
+        captured.append(dask.config.get("array.chunk-size"))
+        return data
+
+    budget = MemoryBudget(24 * 10**6)
+    with (
+        dask.config.set(num_workers=workers),
+        budget.activate(),
+        pytest.MonkeyPatch.context() as monkeypatch,
+    ):
+        monkeypatch.setattr(xr.DataArray, "chunk", _chunk)
+        _chunk_within_memory_budget(study)
+    # Each worker holds three working copies of its chunk.
+    assert captured == [chunk_bytes]
+
+
+def test_index_reports_stage_high_water_marks(tmp_path) -> None:
+    kwargs = {
+        "in_files": synthetic_dataset(CONFIG, ["tasmax"]),
+        "index_name": "SU",
+        "memory_budget": "4GB",
+        "logs_verbosity": "SILENT",
+    }
+    # The budget does not force the compute of a lazy result.
+    lazy = icclim.index(**kwargs)
+    assert lazy.SU.chunks is not None
+    assert "compute" not in json.loads(lazy.attrs["icclim_memory"])["stages"]
+    result = icclim.index(**kwargs, out_file=str(tmp_path / "su.nc"))
+    report = json.loads(result.attrs["icclim_memory"])
+    assert report["memory_budget"] == 4 * 1000**3
+    stages = report["stages"]
+    assert {"build_studied_data", "graph_build", "write"} <= stages.keys()
+    assert stages["build_studied_data"]["variant"] == "default"
+    assert all(stage.get("high_water", 0) > 0 for stage in stages.values())
+
+
+def test_generated_index_takes_memory_budget() -> None:
+    result = icclim.su(
+        in_files=synthetic_dataset(CONFIG, ["tasmax"]),
+        memory_budget="4GB",
+        logs_verbosity="SILENT",
+    )
+    report = json.loads(result.attrs["icclim_memory"])
+    assert report["memory_budget"] == 4 * 1000**3
+
+
+def test_small_budget_streams_inputs_and_shrinks_tiles(monkeypatch) -> None:
+    monkeypatch.setenv("ICCLIM_MEMORY_BUDGET", "100KB")
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_FAST_TILE_MEMORY", "2GB")
+    kwargs = {
+        "in_files": synthetic_dataset(CONFIG, ["tasmax"]),
+        "index_name": "TX90p",
+        "base_period_time_range": CONFIG.base_period,
+        "logs_verbosity": "SILENT",
+    }
+    result = icclim.index(**kwargs)
+    stages = json.loads(result.attrs["icclim_memory"])["stages"]
+    assert stages["build_studied_data"]["variant"] == "streaming"
+    assert stages["bootstrap_tiles"]["variant"] == "tiled"
+    assert stages["bootstrap_tiles"]["high_water"] > 0
+    monkeypatch.delenv("ICCLIM_MEMORY_BUDGET")
+    expected = icclim.index(**kwargs)
+    assert "icclim_memory" not in expected.attrs
+    xr.testing.assert_allclose(result.TX90p, expected.TX90p.compute())
+
+
+def test_small_budget_compacts_combined_masks() -> None:
+    dataset = synthetic_dataset(CONFIG, ["tas", "pr"])
+    kwargs = {
+        "in_files": dataset,
+        "index_name": "CW",
+        "base_period_time_range": CONFIG.base_period,
+        "logs_verbosity": "SILENT",
+    }
+    result = icclim.index(**kwargs, memory_budget=1)
+    stages = json.loads(result.attrs["icclim_memory"])["stages"]
+    assert stages["combined_exceedance_mask"]["variant"] == "compacted"
+    expected = icclim.index(**kwargs)
+    xr.testing.assert_allclose(result.CW, expected.CW.compute())
+
+
+def test_indices_report_one_budget_and_compact_the_merge() -> None:
+    kwargs = {
+        "in_files": synthetic_dataset(CONFIG, ["tasmax", "tasmin"]),
+        "logs_verbosity": "SILENT",
+    }
+    result = icclim.indices(["SU", "TR"], **kwargs, memory_budget=1)
+    report = json.loads(result.attrs["icclim_memory"])
+    assert report["memory_budget"] == 1
+    assert report["stages"]["merge"]["variant"] == "compacted"
+    expected = icclim.indices(["SU", "TR"], **kwargs)
+    xr.testing.assert_identical(
+        result.compute().drop_attrs(deep=False),
+        expected.compute().drop_attrs(deep=False),
+    )
+
+
+def test_compacted_merge_still_compares_data_variables() -> None:
+    result = icclim.index(
+        in_files=synthetic_dataset(CONFIG, ["tasmax"]),
+        index_name="SU",
+        logs_verbosity="SILENT",
+    )
+    conflicting = result.copy(deep=True)
+    conflicting["SU"] = conflicting.SU + 1
+    budget = MemoryBudget(1)
+    with budget.activate(), pytest.raises(xr.MergeError):
+        _merge_index_results([result, conflicting])
+    assert budget.stages["merge"]["variant"] == "compacted"
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from icclim._core.moments import merge_moments, segment_moments
+from icclim._core.resampling import resample_reduce
+
+
+def _data(dtype: type = np.float64) -> xr.DataArray:
+    rng = np.random.default_rng(1)
+    time = pd.date_range("2000-01-01", periods=3 * 365, freq="D")
+    time = time[(time.year != 2001) | (time.month != 2)]
+    values = rng.gamma(2.0, 3.0, size=(len(time), 2, 2))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    return xr.DataArray(
+        values.astype(dtype),
+        dims=("time", "lat", "lon"),
+        coords={"time": time},
+        attrs={"units": "K"},
+    )
+
+
+def _expected(da: xr.DataArray, freq: str, how: str) -> xr.DataArray:
+    scipy_stats = pytest.importorskip("scipy.stats")
+    reducer = scipy_stats.skew if how == "skew" else scipy_stats.kurtosis
+    return da.resample(time=freq).reduce(
+        lambda values, axis: reducer(values, axis=axis, nan_policy="omit"),
+        dim="time",
+    )
+
+
+@pytest.mark.parametrize("order", [2, 3, 4])
+def test_merged_moments_equal_moments_of_the_union(order: int) -> None:
+    values = np.random.default_rng(0).normal(10, 3, size=(50, 3))
+    values[5, 0] = np.nan
+    whole = segment_moments(values, np.array([50]), order)
+    merged = merge_moments(
+        segment_moments(values[:17], np.array([17]), order),
+        segment_moments(values[17:], np.array([33]), order),
+    )
+    np.testing.assert_allclose(merged, whole)
+
+
+def test_merging_with_empty_moments_is_identity() -> None:
+    values = np.arange(6.0).reshape(6, 1)
+    moments = segment_moments(values, np.array([6]), 4)
+    empty = segment_moments(values[:0], np.array([0]), 4)
+    np.testing.assert_array_equal(merge_moments(empty, moments), moments)
+    np.testing.assert_array_equal(merge_moments(moments, empty), moments)
+
+
+@pytest.mark.parametrize("how", ["skew", "kurtosis"])
+@pytest.mark.parametrize("chunks", [None, {"time": 100}])
+def test_shape_statistics_match_scipy(how: str, chunks: dict | None) -> None:
+    da = _data()
+    expected = _expected(da, "MS", how)
+    if chunks is not None:
+        da = da.chunk(chunks)
+    result = resample_reduce(da, "MS", how).compute()
+    xr.testing.assert_allclose(result, expected)
+
+
+def test_std_is_stable_on_float32_with_a_large_offset() -> None:
+    da = _data(np.float32) + np.float32(1e4)
+    expected = (da.astype(np.float64) - 1e4).resample(time="YS").std()
+    result = resample_reduce(da.chunk({"time": 97}), "YS", "std").compute()
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, expected, rtol=1e-3)
+
+
+def test_dask_std_reads_unaligned_chunks_without_rechunking() -> None:
+    da = _data().chunk({"time": 97})
+    result = resample_reduce(da, "YS", "std")
+    graph = dict(result.data.__dask_graph__())
+    # Only the partial moments, which have an extra axis, may be rechunked.
+    assert not any(
+        key[0].startswith("rechunk") and len(key) == da.ndim + 1
+        for key in graph
+        if isinstance(key, tuple)
+    )
+    xr.testing.assert_allclose(result.compute(), da.compute().resample(time="YS").std())
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core.generic import functions as generic_functions
+from icclim._core.profiling import (
+    Profile,
+    active_profile,
+    profile_count,
+    profile_path,
+    profile_phase,
+)
+
+EXPECTED_PHASES = {
+    "build_config",
+    "open_input",
+    "build_studied_data",
+    "threshold_prepare",
+    "graph_build",
+    "metadata_templating",
+    "postprocess",
+    "metadata",
+    "compute",
+    "write",
+}
+
+
+def _stub_tas(chunks: dict | None = None) -> xr.DataArray:
+    time = pd.date_range("2000-01-01", periods=365 * 3, freq="D")
+    values = 280 + np.random.default_rng(0).normal(0, 5, (len(time), 2, 3))
+    tas = xr.DataArray(
+        values,
+        dims=("time", "lat", "lon"),
+        coords={"time": time, "lat": [0, 1], "lon": [0, 1, 2]},
+        attrs={"units": "K", "standard_name": "air_temperature"},
+        name="tas",
+    )
+    return tas.chunk(chunks) if chunks else tas
+
+
+def test_phases_are_nested_and_timed() -> None:
+    profile = Profile()
+    with profile.activate():
+        assert active_profile() is profile
+        with profile_phase("outer"):
+            profile_count("studied_data_bytes", 10)
+            with profile_phase("inner") as details:
+                profile_path("resample", "group_index")
+                details["note"] = "value"
+    assert active_profile() is None
+    inner, outer = profile.phases
+    assert (inner.name, inner.depth) == ("inner", 1)
+    assert (outer.name, outer.depth) == ("outer", 0)
+    assert outer.wall_time >= inner.wall_time >= 0
+    assert inner.details == {"path.resample": "group_index", "note": "value"}
+    assert outer.details == {"studied_data_bytes": 10}
+    assert profile.counters == {"studied_data_bytes": 10}
+    assert profile.execution_paths == {"resample": "group_index"}
+
+
+def test_phase_memory_is_its_own_high_water_mark() -> None:
+    profile = Profile()
+    with profile.activate():
+        with profile_phase("large"):
+            block = np.ones(2**25)  # 256 MiB
+            del block
+        with profile_phase("small"):
+            pass
+    large, small = profile.phases
+    if large.peak_memory is None:
+        pytest.skip("The resident memory cannot be measured here.")
+    # A lifetime peak would report the large block in the later phase too.
+    assert small.peak_memory < large.peak_memory - 2**27
+    assert profile.to_dict()["peak_memory"] == large.peak_memory
+
+
+def test_instrumentation_is_noop_without_profile() -> None:
+    with profile_phase("phase") as details:
+        profile_count("studied_data_bytes", 10)
+        profile_path("resample", "xarray")
+    assert details is None
+
+
+def test_profiles_are_scoped_per_thread() -> None:
+    profiles = [Profile(), Profile()]
+
+    def _run(profile: Profile, name: str) -> None:
+        with profile.activate(), profile_phase(name):
+            profile_count(name)
+
+    threads = [
+        threading.Thread(target=_run, args=(profile, f"phase_{i}"))
+        for i, profile in enumerate(profiles)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [phase.name for phase in profiles[0].phases] == ["phase_0"]
+    assert profiles[1].counters == {"phase_1": 1}
+
+
+def test_bootstrap_entries_are_forwarded_to_active_profile() -> None:
+    generic_functions.reset_bootstrap_profile()
+    profile = Profile()
+    with profile.activate():
+        generic_functions._profile_bootstrap_inc("tiles", 2)
+        generic_functions._profile_bootstrap_note("mode", "fast")
+    assert profile.counters == {"bootstrap.tiles": 2}
+    assert profile.execution_paths == {"bootstrap.mode": "fast"}
+    assert generic_functions.get_bootstrap_profile() == {"tiles": 2, "mode": "fast"}
+
+
+@pytest.mark.parametrize("chunks", [None, {"time": 365}])
+def test_index_profile_covers_every_phase(
+    tmp_path: object,
+    chunks: dict | None,
+) -> None:
+    profile = Profile()
+    result = icclim.index(
+        in_files=_stub_tas(chunks).to_dataset(),
+        index_name="TG90p",
+        slice_mode="DJF",
+        base_period_time_range=["2000-01-01", "2001-12-31"],
+        out_file=str(tmp_path / "tg90p.nc"),
+        profile=profile,
+    )
+    assert "icclim_profile" not in result.attrs
+    assert result.TG90p.chunks is None
+    assert {phase.name for phase in profile.phases} >= EXPECTED_PHASES
+    assert profile.counters["studied_data_bytes"] >= _stub_tas().nbytes
+    assert profile.execution_paths["resample"] == "group_index"
+    assert profile.execution_paths["missing_values"] == "valid_counts"
+    compute = next(phase for phase in profile.phases if phase.name == "compute")
+    assert compute.details["lazy"] or chunks is None
+    assert all(phase.cpu_time >= 0 for phase in profile.phases)
+
+
+def test_index_profile_true_attaches_json(tmp_path: object) -> None:
+    result = icclim.index(
+        in_files=_stub_tas().to_dataset(),
+        index_name="TG",
+        profile=True,
+    )
+    document = json.loads(result.attrs["icclim_profile"])
+    assert {"phases", "counters", "execution_paths", "peak_memory"} <= set(document)
+    assert "graph_build" in {phase["name"] for phase in document["phases"]}
+    result.to_netcdf(tmp_path / "tg.nc")
+
+
+def test_generated_index_takes_profile() -> None:
+    tasmax = _stub_tas().rename("tasmax")
+    result = icclim.su(in_files=tasmax.to_dataset(), profile=True)
+    document = json.loads(result.attrs["icclim_profile"])
+    assert "compute" in {phase["name"] for phase in document["phases"]}
+
+
+def test_chrome_trace_export(tmp_path: object) -> None:
+    profile = Profile()
+    with profile.activate(), profile_phase("outer"), profile_phase("inner"):
+        profile_path("resample", "xarray")
+    trace = profile.to_chrome_trace(tmp_path / "trace.json")
+    assert json.loads((tmp_path / "trace.json").read_text()) == trace
+    events = trace["traceEvents"]
+    assert [event["name"] for event in events] == ["outer", "inner"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["dur"] >= events[1]["dur"]
+    assert trace["otherData"]["execution_paths"] == {"resample": "xarray"}
+    profile.to_json(tmp_path / "profile.json")
+    assert json.loads((tmp_path / "profile.json").read_text())["phases"]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import dask.array as da
+import xarray as xr
+
+import icclim
+from icclim._core.progress import (
+    ProgressReporter,
+    TileProgress,
+    active_progress,
+    report_progress,
+    track_dask_progress,
+)
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+
+CONFIG = BenchConfig.from_size("tiny", backend="dask")
+
+
+def test_reporter_maps_spans_onto_the_callback_range() -> None:
+    percents = []
+    events = []
+    reporter = ProgressReporter(percents.append, 10, 50, on_event=events.append)
+    with reporter.activate():
+        assert active_progress() is reporter
+        report_progress("start", 0, 1)
+        with reporter.span(0.5, 1):
+            report_progress("indices", 1, 2, label="SU")
+            report_progress("indices", 2, 2, label="TR")
+        # The percentage never decreases.
+        report_progress("indices", 0, 2)
+    assert active_progress() is None
+    assert percents == [10, 40, 50]
+    assert [event.percent for event in events] == [10, 40, 50, 50]
+    assert events[1].label == "SU"
+    assert events[1].completed == 1
+    assert events[1].total == 2
+
+
+def test_reporter_skips_unchanged_dask_events() -> None:
+    percents = []
+    events = []
+    reporter = ProgressReporter(percents.append, on_event=events.append)
+    for done in range(1001):
+        reporter.report("dask", done, 1000, only_on_change=True)
+    assert percents == list(range(101))
+    assert len(events) == 101
+
+
+def test_dask_tasks_are_reported() -> None:
+    percents = []
+    reporter = ProgressReporter(percents.append)
+    array = da.ones((100,), chunks=10)
+    with reporter.activate(), track_dask_progress():
+        (array + 1).sum().compute(scheduler="sync")
+    assert percents[-1] == 100
+    assert len(percents) > 5
+    assert percents == sorted(percents)
+
+
+def test_tile_progress_reports_cells_and_eta() -> None:
+    events = []
+    study = xr.DataArray(
+        [[[0.0] * 4] * 3],
+        dims=("time", "lat", "lon"),
+    )
+    reporter = ProgressReporter(None, on_event=events.append)
+    with reporter.activate():
+        progress = TileProgress(study, "safe bootstrap")
+        for lat in range(3):
+            with progress.tile({"lat": slice(lat, lat + 1), "lon": slice(0, 4)}):
+                pass
+    assert [event.completed for event in events] == [4, 8, 12]
+    assert {event.total for event in events} == {12}
+    assert [event.percent for event in events] == [33, 66, 100]
+    assert events[-1].eta == 0
+    assert all(event.label == "safe bootstrap" for event in events)
+
+
+def test_index_reports_dask_progress_when_writing(tmp_path) -> None:
+    percents = []
+    events = []
+    icclim.index(
+        in_files=synthetic_dataset(CONFIG, ["tas"]),
+        index_name="TG",
+        out_file=str(tmp_path / "tg.nc"),
+        callback=percents.append,
+        callback_percentage_start_value=20,
+        callback_percentage_total=80,
+        progress_callback=events.append,
+        logs_verbosity="SILENT",
+    )
+    assert percents[0] == 20
+    assert percents[-1] == 80
+    assert percents == sorted(percents)
+    stages = [event.stage for event in events]
+    assert stages[0] == "start"
+    assert stages[-1] == "done"
+    assert "dask" in stages
+
+
+def test_generated_index_takes_progress_callback(tmp_path) -> None:
+    events = []
+    icclim.su(
+        in_files=synthetic_dataset(CONFIG, ["tasmax"]),
+        out_file=str(tmp_path / "su.nc"),
+        progress_callback=events.append,
+        logs_verbosity="SILENT",
+    )
+    stages = [event.stage for event in events]
+    assert stages[0] == "start"
+    assert stages[-1] == "done"
+
+
+def test_index_reports_bootstrap_tiles(monkeypatch) -> None:
+    monkeypatch.setenv("ICCLIM_BOOTSTRAP_FAST_TILE_CELLS", "4")
+    events = []
+    icclim.index(
+        in_files=synthetic_dataset(CONFIG, ["tasmax"]),
+        index_name="TX90p",
+        base_period_time_range=CONFIG.base_period,
+        callback=None,
+        progress_callback=events.append,
+        logs_verbosity="SILENT",
+    )
+    tiles = [event for event in events if event.stage == "bootstrap_tiles"]
+    assert len(tiles) > 1
+    completed = [event.completed for event in tiles]
+    assert completed == sorted(completed)
+    assert completed[-1] == 12
+    assert all(event.eta is not None for event in tiles)
+    assert events[-1].percent == 100
+
+
+def test_indices_report_each_index() -> None:
+    percents = []
+    events = []
+    icclim.indices(
+        ["SU", "TR"],
+        in_files=synthetic_dataset(CONFIG, ["tasmax", "tasmin"]),
+        callback=percents.append,
+        progress_callback=events.append,
+        logs_verbosity="SILENT",
+    )
+    indices_events = [event for event in events if event.stage == "indices"]
+    assert [(event.label, event.percent) for event in indices_events] == [
+        ("SU", 50),
+        ("TR", 100),
+    ]
+    assert percents == [0, 50, 100]
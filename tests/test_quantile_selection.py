@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import dask.array as dsa
+import numpy as np
+import pytest
+import xarray as xr
+from xclim.core.utils import calc_perc
+
+from icclim._core.quantile_selection import (
+    keys_to_values,
+    select_quantiles,
+    sortable_keys,
+)
+from icclim.threshold.factory import build_threshold
+from tests.testing_utils import stub_tas
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_sortable_keys_round_trip_and_order(dtype: type) -> None:
+    values = np.array([-np.inf, -3.5, -0.0, 0.0, 1e-30, 2.0, np.inf], dtype=dtype)
+    keys = sortable_keys(values)
+    assert np.all(np.diff(keys.astype(np.float64)) >= 0)
+    np.testing.assert_array_equal(keys_to_values(keys, dtype), values)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize(("alpha", "beta"), [(1, 1), (1 / 3, 1 / 3), (0, 0)])
+def test_selection_matches_calc_perc(dtype: type, alpha: float, beta: float) -> None:
+    rng = np.random.default_rng(0)
+    values = rng.gamma(0.5, 3, (3, 4, 500)).astype(dtype)
+    values[0, 0, :495] = np.nan
+    values[0, 1] = np.nan
+    values[0, 2, 1:] = np.nan
+    values[1, 1] = np.round(values[1, 1])
+    values[2, 3, ::2] *= -1
+    quantiles = np.array([0.0, 0.1, 0.5, 0.95, 0.99, 1.0])
+
+    result = select_quantiles(
+        dsa.from_array(np.moveaxis(values, -1, 0), chunks=(97, 2, 3)),
+        quantiles,
+        alpha,
+        beta,
+        axis=0,
+    )
+
+    expected = calc_perc(values, quantiles * 100, alpha, beta)
+    np.testing.assert_array_equal(result.compute(), expected)
+
+
+def test_radix_period_percentile_is_exact_without_time_rechunk() -> None:
+    rng = np.random.default_rng(2)
+    tas = stub_tas(tas_value=290.0, lat_length=2, lon_length=3)
+    tas[:] = 290 + rng.normal(0, 6, tas.shape)
+    expected = build_threshold(">= 95 period_per")
+    expected.prepare(tas)
+    threshold = build_threshold(">= 95 period_per", quantile_method="radix")
+    threshold.prepare(tas.chunk({"time": 200}))
+
+    graph = threshold.value.data.dask
+    assert not any(name.startswith("rechunk") for name in graph.layers)
+    xr.testing.assert_equal(threshold.value.compute(), expected.value)
+
+
+def test_exact_period_percentile_does_not_use_radix_selection() -> None:
+    tas = stub_tas(tas_value=290.0, lat_length=2, lon_length=3).chunk({"time": 200})
+    threshold = build_threshold(">= 95 period_per")
+    threshold.prepare(tas)
+    assert threshold.quantile_method == "exact"
+    layers = threshold.value.data.dask.layers
+    assert any(name.startswith("calc_perc") for name in layers)
+    assert not any(name.startswith("chunk_histogram") for name in layers)
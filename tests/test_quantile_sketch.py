@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import inspect
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core import quantile_sketch
+from icclim._core.generic.threshold import percentile as percentile_module
+from icclim._core.quantile_sketch import (
+    get_sketch_size,
+    sketch_quantiles,
+    sketch_rank_error_bound,
+)
+from icclim.exception import InvalidIcclimArgumentError
+from icclim.threshold.factory import build_threshold
+from tests.testing_utils import stub_tas
+
+
+def _noisy_tas(seed: int = 0) -> xr.DataArray:
+    rng = np.random.default_rng(seed)
+    tas = stub_tas(tas_value=290.0, lat_length=2, lon_length=3)
+    tas[:] = 290 + rng.normal(0, 6, tas.shape)
+    tas[5:12, 0, 0] = np.nan
+    return tas
+
+
+def test_sketch_size_is_read_from_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ICCLIM_QUANTILE_SKETCH_SIZE", "64")
+    assert get_sketch_size() == 64
+    assert sketch_rank_error_bound(1) == pytest.approx(1 / 64)
+
+
+def test_sketch_matches_exact_when_sample_fits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ICCLIM_QUANTILE_SKETCH_SIZE", "2048")
+    tas = _noisy_tas()
+    exact = build_threshold(">= 75 period_per")
+    sketch = build_threshold(">= 75 period_per", quantile_method="sketch")
+    assert sketch.quantile_method == "sketch"
+    assert exact != sketch
+    exact.prepare(tas)
+    sketch.prepare(tas.chunk({"time": 100}))
+    xr.testing.assert_allclose(sketch.value.compute(), exact.value)
+
+
+@pytest.mark.parametrize("chunk", [None, 97])
+def test_sketch_rank_error_is_bounded(chunk: int | None) -> None:
+    rng = np.random.default_rng(1)
+    values = rng.normal(0, 1, (1000, 4))
+    data = values if chunk is None else xr.DataArray(values).chunk({"dim_0": chunk})
+    data = getattr(data, "data", data)
+    size = 32
+    quantiles = np.array([0.1, 0.5, 0.9])
+    result = np.asarray(
+        sketch_quantiles(data, np.array([1000]), quantiles, 1, 1, 0, sketch_size=size)
+    )
+    chunk_count = 1 if chunk is None else -(-1000 // chunk)
+    bound = sketch_rank_error_bound(chunk_count, size) * 1000 + 1
+    for cell in range(values.shape[1]):
+        ordered = np.sort(values[:, cell])
+        for i, q in enumerate(quantiles):
+            rank = np.searchsorted(ordered, result[0, cell, i])
+            assert abs(rank - q * 999) <= bound
+
+
+def test_sketch_summaries_are_sized_by_their_piece(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    values = np.random.default_rng(2).normal(0, 1, (730, 3))
+    lengths = np.array([365, 365])
+    expected = sketch_quantiles(values, lengths, np.array([0.5]), 1, 1, 0)
+    rows = []
+    stack = quantile_sketch._stack_sketches
+
+    def _spy(points: np.ndarray, *args: object) -> np.ndarray:
+        rows.append(len(points))
+        return stack(points, *args)
+
+    monkeypatch.setattr(quantile_sketch, "_stack_sketches", _spy)
+    data = xr.DataArray(values).chunk({"dim_0": 10}).data
+    result = sketch_quantiles(data, lengths, np.array([0.5]), 1, 1, 0).compute()
+    np.testing.assert_allclose(result, expected)
+    # The 73 chunk summaries have 10 rows, as many as the time steps of a chunk.
+    assert rows.count(10) >= 73
+    assert sum(rows) <= 3 * len(values)
+
+
+def test_sketch_does_not_rechunk_time() -> None:
+    tas = _noisy_tas().chunk({"time": 100})
+    threshold = build_threshold(">= 90 period_per", quantile_method="sketch")
+    threshold.prepare(tas)
+    layers = threshold.value.data.dask.layers
+    rechunked = [
+        dependency
+        for name, dependencies in threshold.value.data.dask.dependencies.items()
+        if name.startswith("rechunk")
+        for dependency in dependencies
+    ]
+    # Only the small chunk summaries are rechunked, never the input itself.
+    assert all(
+        name.split("-")[0] in {"_summarise_chunk", "_merge_block"} for name in rechunked
+    )
+    assert any(name.startswith("_summarise_chunk") for name in layers)
+
+
+def test_generic_percentile_with_sketch_matches_exact() -> None:
+    tas = _noisy_tas()
+    kwargs = {
+        "index_name": "percentile",
+        "in_files": tas.rename("tas").to_dataset(),
+        "slice_mode": "YS",
+    }
+    exact = icclim.index(**kwargs, threshold=build_threshold("20 period_per"))
+    sketch = icclim.index(
+        **kwargs,
+        threshold=build_threshold("20 period_per", quantile_method="sketch"),
+    )
+    xr.testing.assert_allclose(sketch.percentile, exact.percentile)
+
+
+def test_index_threads_quantile_method(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ICCLIM_QUANTILE_SKETCH_SIZE", "2048")
+    tas = _noisy_tas()
+    kwargs = {
+        "index_name": "count_occurrences",
+        "in_files": tas.rename("tas").to_dataset(),
+        "threshold": ">= 80 period_per",
+        "slice_mode": "YS",
+    }
+    exact = icclim.index(**kwargs)
+    calls = []
+
+    def _spy(*args: object, **kwargs: object) -> object:
+        calls.append(args)
+        return sketch_quantiles(*args, **kwargs)
+
+    monkeypatch.setattr(percentile_module, "sketch_quantiles", _spy)
+    sketch = icclim.index(**kwargs, quantile_method="sketch")
+    assert calls
+    xr.testing.assert_equal(sketch.count_occurrences, exact.count_occurrences)
+
+
+def test_generated_percentile_index_threads_quantile_method(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rng = np.random.default_rng(1)
+    pr = stub_tas(tas_value=0.0, lat_length=2, lon_length=3)
+    pr[:] = rng.gamma(0.8, 5, pr.shape)
+    pr.attrs["units"] = "kg m-2 d-1"
+    calls = []
+
+    def _spy(*args: object, **kwargs: object) -> object:
+        calls.append(args)
+        return sketch_quantiles(*args, **kwargs)
+
+    monkeypatch.setattr(percentile_module, "sketch_quantiles", _spy)
+    icclim.r95p(in_files=pr.rename("pr").to_dataset(), quantile_method="sketch")
+    assert calls
+    assert "quantile_method" not in inspect.signature(icclim.su).parameters
+
+
+def test_unknown_quantile_method_raises() -> None:
+    with pytest.raises(InvalidIcclimArgumentError):
+        build_threshold(">= 75 period_per", quantile_method="tdigest")
@@ -578,8 +578,8 @@ def test_profile_main_writes_profile_json(
     fake_functions = ModuleType("icclim._core.generic.functions")
     result_ds = xr.Dataset({"foo": xr.DataArray([1, 2], dims=["time"])})
 
-    fake_bootstrap.build_bootstrap_temporal_indexing = lambda *args, **kwargs: None
-    fake_bootstrap.build_bootstrap_array_inputs = lambda *args, **kwargs: None
+    fake_primitives.build_bootstrap_temporal_indexing = lambda *args, **kwargs: None
+    fake_primitives.build_bootstrap_array_inputs = lambda *args, **kwargs: None
     fake_primitives.build_bootstrap_reference_sample = lambda *args, **kwargs: None
     fake_primitives.build_bootstrap_prepared_inputs = lambda *args, **kwargs: None
     fake_functions.reset_bootstrap_profile = lambda: None
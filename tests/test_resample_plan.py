@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from xclim.core.missing import (
+    AtLeastNValid,
+    MissingAny,
+    MissingPct,
+    MissingSomeButNotAll,
+)
+
+import icclim
+from icclim._core import resample_plan as resample_plan_module
+from icclim._core.resample_plan import ResamplePlan
+
+SEASON = {"month": [12, 1, 2]}
+
+
+def _stub_tas() -> xr.DataArray:
+    rng = np.random.default_rng(3)
+    time = pd.date_range("2000-01-15", "2004-10-20", freq="D")
+    values = 280 + rng.normal(0, 5, (len(time), 3, 2))
+    values[rng.random(values.shape) < 0.01] = np.nan
+    values[400:430, 0, 0] = np.nan
+    values[:, 2, 1] = np.nan
+    return xr.DataArray(
+        values,
+        dims=("time", "lat", "lon"),
+        coords={"time": time, "lat": np.arange(3), "lon": np.arange(2)},
+        attrs={"units": "K", "standard_name": "air_temperature"},
+        name="tas",
+    )
+
+
+@pytest.mark.parametrize("chunks", [None, {"time": 300}])
+@pytest.mark.parametrize("freq", ["YS", "MS", "QS-DEC"])
+@pytest.mark.parametrize(
+    "missing",
+    [MissingAny(), MissingPct(tolerance=0.05), AtLeastNValid(n=25)],
+    ids=["any", "pct", "at_least_n"],
+)
+def test_missing_mask_matches_xclim(
+    chunks: dict | None,
+    freq: str,
+    missing: object,
+) -> None:
+    tas = _stub_tas()
+    if chunks is not None:
+        tas = tas.chunk(chunks)
+    plan = ResamplePlan(tas, freq)
+    xr.testing.assert_equal(
+        plan.missing_mask(missing, "D"),
+        missing(tas, freq, "D"),
+    )
+
+
+@pytest.mark.parametrize(
+    "missing",
+    [MissingAny(), MissingPct(tolerance=0.05), AtLeastNValid(n=25)],
+    ids=["any", "pct", "at_least_n"],
+)
+def test_missing_mask_matches_xclim_with_indexer(missing: object) -> None:
+    tas = _stub_tas()
+    plan = ResamplePlan(tas, "YS")
+    xr.testing.assert_equal(
+        plan.missing_mask(missing, "D", SEASON),
+        missing(tas, "YS", "D", **SEASON),
+    )
+
+
+def test_unsupported_methods_fall_back_to_xclim() -> None:
+    plan = ResamplePlan(_stub_tas(), "YS")
+    assert plan.missing_mask(MissingSomeButNotAll(), "D") is None
+    assert plan.missing_mask(MissingPct(tolerance=0.05, subfreq="MS"), "D") is None
+    assert plan.missing_mask(MissingAny(), None) is None
+
+
+def test_valid_counts_are_computed_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    reduce = resample_plan_module.resample_reduce
+
+    def _spy(*args: object, **kwargs: object) -> xr.DataArray:
+        calls.append(args)
+        return reduce(*args, **kwargs)
+
+    monkeypatch.setattr(resample_plan_module, "resample_reduce", _spy)
+    plan = ResamplePlan(_stub_tas(), "YS")
+    plan.missing_mask(MissingAny(), "D")
+    plan.missing_mask(MissingPct(tolerance=0.05), "D")
+    plan.missing_mask(AtLeastNValid(n=25), "D")
+    assert len(calls) == 1
+    plan.missing_mask(MissingAny(), "D", SEASON)
+    assert len(calls) == 2
+
+
+def test_climate_variable_plan_is_reused_until_data_changes() -> None:
+    from icclim._core.climate_variable import ClimateVariable  # noqa: PLC0415
+    from icclim.frequency import FrequencyRegistry  # noqa: PLC0415
+
+    tas = _stub_tas()
+    climate_var = ClimateVariable(
+        name="tas",
+        standard_var=None,
+        studied_data=tas,
+        global_metadata={},
+        source_frequency=FrequencyRegistry.lookup("D"),
+    )
+    plan = climate_var.resample_plan("YS")
+    assert climate_var.resample_plan(FrequencyRegistry.lookup("YS")) is plan
+    assert plan.source_frequency == "D"
+    climate_var.studied_data = tas + 1
+    assert climate_var.resample_plan("YS") is not plan
+
+
+@pytest.mark.parametrize("chunks", [None, {"time": 300}])
+def test_seasonal_index_masks_match_xclim(
+    monkeypatch: pytest.MonkeyPatch,
+    chunks: dict | None,
+) -> None:
+    tas = _stub_tas()
+    if chunks is not None:
+        tas = tas.chunk(chunks)
+    kwargs = {"index_name": "TG", "in_files": tas.to_dataset(), "slice_mode": "DJF"}
+    derived = icclim.index(**kwargs).TG.load()
+    monkeypatch.setattr(ResamplePlan, "missing_mask", lambda *_, **__: None)
+    expected = icclim.index(**kwargs).TG.load()
+    assert derived.isnull().any()
+    assert derived.notnull().any()
+    xr.testing.assert_identical(derived, expected)
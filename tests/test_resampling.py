@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from icclim._core.resampling import (
+    clear_resample_groups_cache,
+    get_resample_groups,
+    resample_reduce,
+)
+from icclim.frequency import FrequencyRegistry
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache() -> None:
+    clear_resample_groups_cache()
+    yield
+    clear_resample_groups_cache()
+
+
+def _data(with_gap: bool = False) -> xr.DataArray:
+    rng = np.random.default_rng(42)
+    time = pd.date_range("2000-01-01", periods=3 * 365, freq="D")
+    if with_gap:
+        time = time[(time.year != 2000) | (time.month != 3)]
+    values = rng.normal(size=(len(time), 2, 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[40:50, 0, 0] = np.nan
+    return xr.DataArray(
+        values,
+        dims=("time", "lat", "lon"),
+        coords={"time": time, "lat": [10, 20], "lon": [0, 1, 2]},
+        attrs={"units": "K"},
+        name="tas",
+    )
+
+
+@pytest.mark.parametrize("how", ["sum", "mean", "max", "min", "std", "var", "count"])
+@pytest.mark.parametrize("freq", ["MS", "YS", "YS-DEC"])
+@pytest.mark.parametrize("chunked", [False, True])
+def test_resample_reduce_matches_xarray(how: str, freq: str, chunked: bool) -> None:
+    da = _data(with_gap=True)
+    if chunked:
+        da = da.chunk({"time": 100})
+    expected = getattr(da.resample(time=freq), how)(dim="time").compute()
+    result = resample_reduce(da, freq, how).compute()
+    xr.testing.assert_allclose(result, expected)
+    assert result.dtype == expected.dtype
+    assert result.attrs == expected.attrs
+
+
+def test_resample_reduce_boolean_sum() -> None:
+    mask = _data() > 0
+    expected = mask.resample(time="MS").sum(dim="time")
+    result = FrequencyRegistry.MONTH.reduce(mask, "sum")
+    xr.testing.assert_identical(result, expected)
+
+
+def test_resample_reduce_argmax_is_offset_in_group() -> None:
+    da = _data()
+    result = resample_reduce(da.chunk({"time": 50}), "YS", "argmax").compute()
+    expected = da.resample(time="YS").reduce(np.nanargmax, dim="time")
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_resample_reduce_graph_does_not_grow_with_groups() -> None:
+    da = _data().chunk({"time": -1, "lat": 1})
+    yearly = resample_reduce(da, "YS", "sum")
+    monthly = resample_reduce(da, "MS", "sum")
+    # One task per input chunk, whatever the number of groups.
+    assert len(yearly.data.dask) == len(monthly.data.dask) == 2 * len(da.data.dask)
+
+
+def test_resample_groups_are_cached() -> None:
+    da = _data()
+    groups = FrequencyRegistry.YEAR.resample_groups(da)
+    assert FrequencyRegistry.YEAR.resample_groups(da.copy()) is groups
+    np.testing.assert_array_equal(groups.lengths, [366, 365, 364])
+    np.testing.assert_array_equal(groups.starts, [0, 366, 731])
+
+
+def test_unsorted_time_has_no_groups() -> None:
+    da = _data().isel(time=slice(None, None, -1))
+    assert get_resample_groups(da.indexes["time"], "YS") is None
+
+
+def test_backend_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ICCLIM_RESAMPLE_BACKEND", "xarray")
+    da = _data().chunk({"time": 100})
+    xr.testing.assert_identical(
+        resample_reduce(da, "YS", "max"),
+        da.resample(time="YS").max(dim="time"),
+    )
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core.generic.rolling import rolling_window_extremum
+from icclim._core.resampling import get_resample_groups
+
+pytest.importorskip("numba")
+
+
+def _data() -> xr.DataArray:
+    rng = np.random.default_rng(7)
+    time = pd.date_range("2000-01-01", periods=4 * 365, freq="D")
+    values = rng.gamma(0.6, 4.0, size=(len(time), 2, 3))
+    values[rng.random(values.shape) < 0.05] = np.nan
+    values[100:400, 1, 2] = np.nan
+    return xr.DataArray(
+        values,
+        dims=("time", "lat", "lon"),
+        coords={"time": time, "lat": [10, 20], "lon": [0, 1, 2]},
+        attrs={"units": "mm/day"},
+        name="pr",
+    )
+
+
+@pytest.mark.parametrize("rolling_op", ["sum", "mean"])
+@pytest.mark.parametrize("extremum", ["max", "min"])
+@pytest.mark.parametrize("freq", ["MS", "YS"])
+@pytest.mark.parametrize("chunks", [None, {"time": 90}, {"time": 500, "lat": 1}])
+def test_rolling_extremum_matches_xarray(
+    rolling_op: str,
+    extremum: str,
+    freq: str,
+    chunks: dict | None,
+) -> None:
+    da = _data()
+    expected = getattr(
+        getattr(da.rolling(time=5), rolling_op)().resample(time=freq),
+        extremum,
+    )()
+    if chunks is not None:
+        da = da.chunk(chunks)
+    groups = get_resample_groups(da.indexes["time"], freq)
+    result = rolling_window_extremum(da, groups, 5, rolling_op, extremum)
+    assert hasattr(result.data, "chunks") == (chunks is not None)
+    xr.testing.assert_allclose(result.compute(), expected)
+    assert result.attrs == expected.attrs
+
+
+def test_rolling_extremum_dates_bound_the_window() -> None:
+    da = _data()
+    groups = get_resample_groups(da.indexes["time"], "YS")
+    result = rolling_window_extremum(
+        da.chunk({"time": 200}), groups, 5, "sum", "max", date_event=True
+    ).compute()
+    rolled = da.rolling(time=5).sum()
+    for year in range(4):
+        for lat in range(2):
+            for lon in range(3):
+                cell = result.isel(time=year, lat=lat, lon=lon)
+                end = cell.event_date_end.to_numpy()
+                if np.isnan(cell):
+                    assert np.isnat(end)
+                    continue
+                np.testing.assert_allclose(
+                    rolled.isel(lat=lat, lon=lon).sel(time=end), cell
+                )
+                window = da.isel(lat=lat, lon=lon).sel(
+                    time=slice(cell.event_date_start.to_numpy(), end)
+                )
+                assert window.sizes["time"] == 5
+                np.testing.assert_allclose(window.sum(), cell)
+
+
+def test_rx5day_stays_lazy_without_rolling_graph() -> None:
+    da = _data().chunk({"time": 365})
+    result = icclim.index(index_name="RX5day", in_files=da, slice_mode="year")
+    graph = dict(result.RX5day.data.__dask_graph__())
+    assert not any("sliding_window_view" in str(key) for key in graph)
+    expected = da.rolling(time=5).sum().resample(time="YS").max()
+    np.testing.assert_allclose(result.RX5day.compute(), expected)
+
+
+@pytest.mark.parametrize("backend", ["numba", "xarray"])
+def test_date_event_bounds_the_extreme_window(
+    backend: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # event_date_start is the first day of the window, event_date_end its last.
+    monkeypatch.setenv("ICCLIM_RESAMPLE_BACKEND", backend)
+    da = _data().isel(lat=0)
+    result = icclim.index(
+        index_name="max_of_rolling_sum",
+        in_files=da,
+        window_width=5,
+        date_event=True,
+        slice_mode="year",
+    ).max_of_rolling_sum.compute()
+    rolled = da.rolling(time=5).sum()
+    ends = rolled.resample(time="YS").map(lambda x: x.idxmax("time"))
+    np.testing.assert_array_equal(result.event_date_end, ends)
+    np.testing.assert_array_equal(result.event_date_start, ends - pd.Timedelta(days=4))
+    np.testing.assert_allclose(result, rolled.resample(time="YS").max())
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core.generic import season_length as season_length_module
+from icclim._core.generic.season_length import mid_date_offsets, season_length
+from icclim._core.resampling import get_resample_groups
+
+
+def _seasonal_tas(dtype: type = np.float64) -> xr.DataArray:
+    rng = np.random.default_rng(1)
+    time = pd.date_range("2000-03-15", "2009-10-20", freq="D")
+    phase = (time.dayofyear.to_numpy() - 100) / 365.25 * 2 * np.pi
+    values = 278.15 + 10 * np.sin(phase)[:, None, None]
+    values = values + rng.normal(0, 4, (len(time), 4, 5)) + rng.normal(0, 6, (1, 4, 5))
+    values[rng.random(values.shape) < 0.02] = np.nan
+    values[:, 0, 0] = 300
+    values[:, 0, 1] = 250
+    return xr.DataArray(
+        values.astype(dtype),
+        dims=("time", "lat", "lon"),
+        coords={"time": time, "lat": np.arange(4), "lon": np.arange(5)},
+        attrs={"units": "K", "standard_name": "air_temperature"},
+        name="tas",
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("chunks", [None, {"time": 500}])
+def test_season_length_matches_xclim(dtype: type, chunks: dict | None) -> None:
+    import xclim  # noqa: PLC0415
+
+    tas = _seasonal_tas(dtype)
+    if chunks is not None:
+        tas = tas.chunk(chunks)
+    expected = xclim.indices.growing_season_length(
+        tas, thresh="5 degC", window=6, mid_date="07-01", freq="YS"
+    )
+    groups = get_resample_groups(tas.indexes["time"], "YS")
+    threshold = np.asarray(278.15, dtype=np.result_type(tas.dtype, 278.15))
+    result = season_length(tas, groups, float(threshold), 6, "07-01")
+    np.testing.assert_array_equal(result.values, expected.values)
+
+
+def test_mid_date_offsets_are_missing_outside_groups() -> None:
+    time = pd.date_range("2000-08-01", "2002-06-30", freq="D")
+    groups = get_resample_groups(pd.DatetimeIndex(time), "YS")
+    offsets = mid_date_offsets(time, groups, "07-01")
+    np.testing.assert_array_equal(offsets, [-1, 181, -1])
+
+
+@pytest.mark.parametrize("chunks", [None, {"time": 400}])
+def test_gsl_index_matches_xclim_indicator(
+    monkeypatch: pytest.MonkeyPatch,
+    chunks: dict | None,
+) -> None:
+    tas = _seasonal_tas()
+    tas = tas.isel(time=slice(int(np.argmax(tas.time.dt.dayofyear.values == 1)), None))
+    if chunks is not None:
+        tas = tas.chunk(chunks)
+    kwargs = {"index_name": "GSL", "in_files": tas.to_dataset()}
+    calls = []
+    kernel = season_length_module.season_length
+
+    def _spy(*args: object, **kwargs: object) -> object:
+        calls.append(args)
+        return kernel(*args, **kwargs)
+
+    monkeypatch.setattr(season_length_module, "season_length", _spy)
+    compiled = icclim.index(**kwargs).GSL.load()
+    assert calls
+    monkeypatch.setenv("ICCLIM_RESAMPLE_BACKEND", "xarray")
+    expected = icclim.index(**kwargs).GSL.load()
+    assert len(calls) == 1
+    assert compiled.notnull().any()
+    xr.testing.assert_identical(
+        compiled.drop_attrs(deep=False),
+        expected.drop_attrs(deep=False),
+    )
+    compiled.attrs.pop("history")
+    expected.attrs.pop("history")
+    assert compiled.attrs == expected.attrs
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core import spi as spi_module
+from icclim._core.spi import (
+    clear_spi_cache,
+    spi_fit_params,
+    spi_monthly_precipitation,
+    standardized_precipitation_index,
+)
+
+CAL_START, CAL_END = "2000-01-01", "2003-12-31"
+
+
+@pytest.fixture(autouse=True)
+def _empty_spi_cache() -> None:
+    clear_spi_cache()
+
+
+def _stub_pr() -> xr.DataArray:
+    rng = np.random.default_rng(0)
+    time = pd.date_range("2000-01-01", periods=365 * 6, freq="D")
+    values = rng.gamma(0.5, 3e-5, (len(time), 2, 3))
+    values[rng.random(values.shape) < 0.3] = 0
+    values[:, 1, 2] = 0
+    values[100:200, 0, 0] = np.nan
+    return xr.DataArray(
+        values,
+        dims=("time", "lat", "lon"),
+        coords={"time": time, "lat": [0, 1], "lon": [0, 1, 2]},
+        attrs={"units": "kg m-2 s-1", "standard_name": "precipitation_flux"},
+        name="pr",
+    )
+
+
+@pytest.mark.parametrize("chunks", [None, {"time": 400}])
+@pytest.mark.parametrize("window", [3, 6])
+def test_spi_matches_xclim(chunks: dict | None, window: int) -> None:
+    import xclim  # noqa: PLC0415
+
+    pr = _stub_pr()
+    if chunks is not None:
+        pr = pr.chunk(chunks)
+    expected = xclim.atmos.standardized_precipitation_index(
+        pr=pr,
+        freq="MS",
+        window=window,
+        cal_start=CAL_START,
+        cal_end=CAL_END,
+        dist="gamma",
+        method="APP",
+        fitkwargs={"floc": 0},
+    )
+    result = standardized_precipitation_index(pr, window, CAL_START, CAL_END)
+    xr.testing.assert_allclose(result, expected)
+    expected.attrs.pop("history")
+    result.attrs.pop("history")
+    assert result.attrs == expected.attrs
+
+
+def test_spi3_and_spi6_share_monthly_aggregation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pr = _stub_pr()
+    builds = []
+    build = spi_module._build_monthly_precipitation
+
+    def _spy(*args: object) -> object:
+        builds.append(args)
+        return build(*args)
+
+    monkeypatch.setattr(spi_module, "_build_monthly_precipitation", _spy)
+    standardized_precipitation_index(pr, 3, CAL_START, CAL_END)
+    standardized_precipitation_index(pr, 6, CAL_START, CAL_END)
+    assert len(builds) == 1
+
+
+def test_params_are_reused_when_reference_period_is_unchanged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pr = _stub_pr()
+    fits = []
+    fit = spi_module.fit_spi_gamma
+
+    def _spy(accumulated: xr.DataArray) -> xr.DataArray:
+        fits.append(accumulated)
+        return fit(accumulated)
+
+    monkeypatch.setattr(spi_module, "fit_spi_gamma", _spy)
+    params = spi_fit_params(pr, 3, CAL_START, CAL_END)
+    # Updating data outside of the reference period keeps the fit.
+    updated = pr.copy()
+    updated[-30:] = 1e-5
+    assert spi_fit_params(updated, 3, CAL_START, CAL_END) is params
+    spi_fit_params(pr, 6, CAL_START, CAL_END)
+    assert len(fits) == 2
+    assert params.attrs["reference_period"] == f'["{CAL_START}", "{CAL_END}"]'
+    assert params.attrs["window"] == 3
+    assert "reference_data" in params.attrs
+
+
+def test_params_are_stored_in_params_dir(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: object,
+) -> None:
+    monkeypatch.setenv("ICCLIM_SPI_PARAMS_DIR", str(tmp_path))
+    pr = _stub_pr()
+    params = spi_fit_params(pr, 3, CAL_START, CAL_END)
+    assert len(list(tmp_path.glob("spi_params_3_*.nc"))) == 1
+    clear_spi_cache()
+    monkeypatch.setattr(spi_module, "fit_spi_gamma", None)
+    stored = spi_fit_params(pr, 3, CAL_START, CAL_END)
+    xr.testing.assert_allclose(stored, params)
+    assert stored.attrs == params.attrs
+
+
+def test_missing_values_mask_follows_daily_data() -> None:
+    pr = _stub_pr()
+    _, mask = spi_monthly_precipitation(pr)
+    # The last month of the stub is incomplete.
+    assert bool(mask.isel(time=-1).all())
+    assert not bool(mask.isel(time=-2).any())
+
+
+def test_index_spi3_and_spi6_share_cache() -> None:
+    dataset = _stub_pr().to_dataset()
+    kwargs = {
+        "in_files": dataset,
+        "base_period_time_range": [CAL_START, CAL_END],
+    }
+    spi3 = icclim.index(index_name="spi3", **kwargs)
+    spi6 = icclim.index(index_name="spi6", **kwargs)
+    assert len(spi_module._SPI_MONTHLY_CACHE) == 1
+    assert len(spi_module._SPI_PARAMS_CACHE) == 2
+    assert spi3.SPI3.notnull().any()
+    assert spi6.SPI6.notnull().any()
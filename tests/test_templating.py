@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import jinja2
+
+import icclim
+from icclim._core.generic.templating import (
+    clear_template_cache,
+    compile_template,
+    precompile_templates,
+    render_template,
+)
+from icclim._core.profiling import Profile
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+
+CONFIG = BenchConfig.from_size("tiny", backend="dask")
+
+
+def test_compiled_templates_are_cached(monkeypatch) -> None:
+    clear_template_cache()
+    source = "{{ name }} over {{ len(values) }} values"
+    profile = Profile()
+    with profile.activate():
+        template = compile_template(source)
+        assert compile_template(source) is template
+        assert (
+            compile_template(source, jinja2.Environment(autoescape=True))
+            is not template
+        )
+    assert profile.counters["template_compilations"] == 2
+    assert render_template(source, {"name": "TX", "len": len, "values": [1]}) == (
+        "TX over 1 values"
+    )
+    monkeypatch.setenv("ICCLIM_TEMPLATE_CACHE", "off")
+    assert compile_template(source) is not template
+
+
+def test_precompiled_templates_are_not_compiled_by_index() -> None:
+    clear_template_cache()
+    assert precompile_templates() > 0
+    profile = Profile()
+    icclim.index(
+        in_files=synthetic_dataset(CONFIG, ["tasmax"]),
+        index_name="TX90p",
+        base_period_time_range=CONFIG.base_period,
+        bootstrap=False,
+        profile=profile,
+        logs_verbosity="SILENT",
+    )
+    assert "template_compilations" not in profile.counters
+
+
+def test_cached_metadata_matches_uncached(monkeypatch) -> None:
+    kwargs = {
+        "in_files": synthetic_dataset(CONFIG, ["tasmax"]),
+        "index_name": "count_occurrences",
+        "threshold": "> 10 degC and < 25 degC",
+        "logs_verbosity": "SILENT",
+    }
+    cached = icclim.index(**kwargs).count_occurrences.attrs
+    monkeypatch.setenv("ICCLIM_TEMPLATE_CACHE", "off")
+    uncached = icclim.index(**kwargs).count_occurrences.attrs
+    assert cached["long_name"] == uncached["long_name"]
+    assert cached["standard_name"] == uncached["standard_name"]
+    assert "{{" not in cached["long_name"]
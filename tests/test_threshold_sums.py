@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+import icclim
+from icclim._core.generic import threshold_sums
+from icclim.threshold.factory import build_threshold
+
+pytest.importorskip("numba")
+
+
+def _dataset() -> xr.Dataset:
+    rng = np.random.default_rng(11)
+    time = pd.date_range("1991-01-01", periods=6 * 365, freq="D")
+    pr = rng.gamma(0.6, 4.0, size=(len(time), 2, 3)).astype(np.float32)
+    pr[rng.random(pr.shape) < 0.05] = np.nan
+    tas = 285 + 10 * np.sin(np.arange(len(time)) * 2 * np.pi / 365)[:, None, None]
+    tas = tas + rng.normal(0, 3, size=(len(time), 2, 3))
+    coords = {"time": time, "lat": [10, 20], "lon": [0, 1, 2]}
+    dims = ("time", "lat", "lon")
+    return xr.Dataset(
+        {
+            "pr": xr.DataArray(pr, dims=dims, coords=coords, attrs={"units": "mm/d"}),
+            "tas": xr.DataArray(tas, dims=dims, coords=coords, attrs={"units": "K"}),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "index_kwargs",
+    [
+        {"index_name": "R95pTOT", "base_period_time_range": ["1991", "1993"]},
+        {
+            "index_name": "fraction_of_total",
+            "threshold": build_threshold(
+                ">= 75 doy_per",
+                reference_period=["1991", "1993"],
+                threshold_min_value="1 mm/d",
+            ),
+            "var_name": "pr",
+        },
+        {
+            "index_name": "excess",
+            "threshold": "288 K",
+            "var_name": "tas",
+        },
+        {
+            "index_name": "deficit",
+            "threshold": build_threshold(
+                "10 doy_per", reference_period=["1991", "1993"]
+            ),
+            "var_name": "tas",
+        },
+    ],
+    ids=["R95pTOT", "fraction_of_total", "excess", "deficit"],
+)
+@pytest.mark.parametrize("chunks", [None, {"time": 400, "lat": 1}])
+def test_compiled_threshold_sums_match_xarray(
+    monkeypatch: pytest.MonkeyPatch,
+    index_kwargs: dict,
+    chunks: dict | None,
+) -> None:
+    ds = _dataset()
+    if chunks is not None:
+        ds = ds.chunk(chunks)
+    kwargs = {"in_files": ds, "slice_mode": "YS", "time_range": ["1994", "1996"]}
+    calls = []
+    original = threshold_sums.segmented_threshold_sum
+
+    def _spy(*args: object, **kwargs: object) -> xr.DataArray:
+        calls.append(args[4])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(threshold_sums, "segmented_threshold_sum", _spy)
+    result = icclim.index(**index_kwargs, **kwargs)
+    monkeypatch.setenv("ICCLIM_RESAMPLE_BACKEND", "xarray")
+    expected = icclim.index(**index_kwargs, **kwargs)
+
+    name = index_kwargs["index_name"]
+    assert len(calls) == 1
+    xr.testing.assert_allclose(result[name], expected[name], rtol=1e-5)
+    assert result[name].attrs == expected[name].attrs
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sys
+import types
+
+import numba
+import pytest
+
+import icclim
+from icclim.__main__ import main
+from icclim._core import warmup
+from icclim._core.profiling import Profile
+from icclim.bench.synthetic import BenchConfig, synthetic_dataset
+
+
+@pytest.fixture
+def kernel_module(monkeypatch) -> types.ModuleType:
+    module = types.ModuleType("icclim_test_kernels")
+    module.increment = numba.njit(lambda x: x + 1)
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setattr(warmup, "KERNEL_MODULES", (module.__name__,))
+    return module
+
+
+def test_profile_reports_cold_compiled_kernels(kernel_module) -> None:
+    profile = Profile()
+    with profile.activate(), warmup.track_kernel_compilation():
+        kernel_module.increment(1)
+        kernel_module.increment(1.0)
+    assert profile.counters["numba_cold_compiles"] == 2
+    assert profile.counters["numba_cold_compile.icclim_test_kernels.increment"] == 2
+    assert profile.counters["numba_cache_loads"] == 0
+    profile = Profile()
+    with profile.activate(), warmup.track_kernel_compilation():
+        kernel_module.increment(2)
+    assert profile.counters["numba_cold_compiles"] == 0
+
+
+def test_index_profile_counts_compiled_kernels() -> None:
+    profile = Profile()
+    icclim.index(
+        in_files=synthetic_dataset(BenchConfig.from_size("tiny"), ["tasmax"]),
+        index_name="SU",
+        profile=profile,
+        logs_verbosity="SILENT",
+    )
+    assert "numba_cold_compiles" in profile.counters
+    assert "numba_cache_loads" in profile.counters
+
+
+def test_configure_numba_cache_rebuilds_kernel_caches(
+    kernel_module,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    kernel_module.cached = numba.njit(cache=True)(lambda x: x * 2)
+    monkeypatch.setattr(numba.config, "CACHE_DIR", numba.config.CACHE_DIR)
+    monkeypatch.delenv("ICCLIM_NUMBA_CACHE_DIR", raising=False)
+    assert warmup.configure_numba_cache() is None
+    monkeypatch.setenv("ICCLIM_NUMBA_CACHE_DIR", str(tmp_path))
+    assert warmup.configure_numba_cache() == str(tmp_path)
+    assert str(tmp_path) == numba.config.CACHE_DIR
+    assert kernel_module.cached.stats.cache_path.startswith(str(tmp_path))
+
+
+def test_warmup_compiles_the_kernels(kernel_module, monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(
+        warmup,
+        "_run_warmup_computations",
+        lambda: calls.append(kernel_module.increment(1)),
+    )
+    compilation = warmup.warmup()
+    assert calls == [2]
+    assert compilation.cold_compiled == {"icclim_test_kernels.increment": 1}
+    assert "1 kernel signatures compiled" in compilation.report()
+    assert warmup.warmup().cold_compiled == {}
+
+
+def test_cli_warmup(capsys, monkeypatch) -> None:
+    monkeypatch.setattr(
+        warmup,
+        "warmup",
+        lambda cache_dir: warmup.KernelCompilation({"k": 1}, {}, cache_dir),
+    )
+    assert main(["warmup", "--cache-dir", "cache"]) == 0
+    assert "1 kernel signatures compiled" in capsys.readouterr().out
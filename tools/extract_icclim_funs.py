@@ -36,12 +36,14 @@ QUANTILE_INDEX_FIELDS = [
     "only_leap_years",
     "interpolation",
     "save_thresholds",
+    "quantile_method",
 ]
 
 NON_REFERENCE_FIELDS = [
     "only_leap_years",
     "interpolation",
     "save_thresholds",
+    "quantile_method",
 ]
 
 TAB = "    "
@@ -619,14 +621,17 @@ from icclim.threshold.factory import build_threshold
     header += """
 if TYPE_CHECKING:
     import datetime as dt
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from icclim.logger import Verbosity
     from icclim._core.model.icclim_types import FrequencyLike, InFileLike, SamplingMethodLike
     from icclim.frequency import Frequency
     from icclim._core.model.netcdf_version import NetcdfVersion
     from icclim._core.model.quantile_interpolation import QuantileInterpolation
+    from icclim._core.quantile_sketch import QuantileMethod
     from icclim._core.legacy.user_index.model import UserIndexDict
+    from icclim._core.profiling import Profile
+    from icclim._core.progress import ProgressEvent
     from icclim._core.model.threshold import Threshold
 """
 
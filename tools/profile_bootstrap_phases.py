@@ -222,9 +222,14 @@ def main() -> None:
             phase_stats,
         ),
         _timed_patch(
-            bootstrap_module, "build_bootstrap_temporal_indexing", phase_stats
+            primitives_module, "build_bootstrap_temporal_indexing", phase_stats
+        ),
+        _timed_patch(primitives_module, "build_bootstrap_array_inputs", phase_stats),
+        _timed_patch_if_present(
+            bootstrap_module,
+            "_bootstrap_reference_thresholds_kernel",
+            phase_stats,
         ),
-        _timed_patch(bootstrap_module, "build_bootstrap_array_inputs", phase_stats),
     ):
         ds = _build_workload(icclim, args.workload, chunks=chunk_profile).load()
     elapsed = time.perf_counter() - started